@@ -1,6 +1,29 @@
+import importlib
+
 # Expose all Contracts Language API 400 types at the top level
-from .versions.version_400.common.types import *
+from .versions.version_400.common import types as _types
 
 # Expose Smart and Supervisor Contracts 400 libs at the top level
-from .versions.version_400.smart_contracts import lib as smart_contracts_lib
-from .versions.version_400.supervisor_contracts import lib as supervisor_contracts_lib
+_LIBS = {
+    "smart_contracts_lib": ".versions.version_400.smart_contracts.lib",
+    "supervisor_contracts_lib": ".versions.version_400.supervisor_contracts.lib",
+}
+
+__all__ = [*_types.__all__, *_LIBS]
+
+
+def __getattr__(name: str):
+    # Types and libs are loaded on first access (PEP 562), so that importing a handful of types
+    # does not build the whole API
+    if name in _LIBS:
+        value = importlib.import_module(_LIBS[name], __name__)
+    elif name in _types.__all__:
+        value = getattr(_types, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,10 @@
 import importlib
-from types import FunctionType
+from functools import lru_cache
+from types import CodeType, FunctionType, MappingProxyType
 from typing import Any, Dict, List
 from unittest import mock, TestCase
 
-from .types_registry import make_contract_version_sandbox
+from .types_registry import get_frozen_contract_version_sandbox
 
 
 # For v3.x ONLY
@@ -11,6 +12,12 @@ from .types_registry import make_contract_version_sandbox
 # If you are targetting Contracts Language v4+, use the standard Python TestCase from unittest
 
 
+@lru_cache(maxsize=128)
+def _compile_contract_code(contract_code: str) -> CodeType:
+    # Suites run the same contract source many times, so each distinct source is only compiled once
+    return compile(contract_code, "<string>", "exec")
+
+
 class ContractsTestCase(TestCase):
     supported_hook_names: List[str] = []
 
@@ -19,8 +26,16 @@ class ContractsTestCase(TestCase):
         versions_package = ".".join(__package__.split(".")[:-1]) + ".versions"
         path = f".version_{cls.version}.{cls.executor_type}.lib"
         cls._contract_lib = importlib.import_module(path, versions_package)
-        cls._registry = make_contract_version_sandbox(cls._contract_lib)
+        # The registry is built once per version and shared by all test cases. Each sandbox is a
+        # copy of these read-only views, so tests can't affect each other through it
+        cls._registry = get_frozen_contract_version_sandbox(cls._contract_lib)
         cls.builtins = cls._contract_lib.ALLOWED_BUILTINS
+        cls._types = MappingProxyType(
+            {name: func for name, func in cls._registry.items() if name != "__builtins__"}
+        )
+        cls._allowed_builtins = MappingProxyType(
+            {name: cls._registry["__builtins__"][name] for name in cls.builtins}
+        )
 
     @staticmethod
     def load_contract_code(filepath: str) -> str:
@@ -29,21 +44,18 @@ class ContractsTestCase(TestCase):
         return contract_code
 
     def create_sandbox(self, types: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "__builtins__": {name: self._registry["__builtins__"][name] for name in self.builtins},
-            **types,
-        }
+        return {"__builtins__": dict(self._allowed_builtins), **types}
 
     def create_sandbox_with_imports(self, types: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         importBuiltin = {"__import__": __import__}
-        allowedBuiltins = {name: self._registry["__builtins__"][name] for name in self.builtins}
+        allowedBuiltins = self._allowed_builtins
         allowedNatives = {name: name for name in self._contract_lib.ALLOWED_NATIVES}
         return {"__builtins__": {**importBuiltin, **allowedBuiltins, **allowedNatives, **types}}
 
     def _execute_function_in_sandbox(
         self, contract_code: str, function_name: str, sandbox: Dict[str, Any], *args, **kwargs
     ) -> FunctionType:
-        exec(contract_code, sandbox, sandbox)
+        exec(_compile_contract_code(contract_code), sandbox, sandbox)
         func = sandbox.get(function_name)
         if func is None:
             raise ValueError(
@@ -61,8 +73,7 @@ class ContractsTestCase(TestCase):
     def run_contract_function(
         self, contract_code: str, function_name: str, *args, **kwargs
     ) -> FunctionType:
-        types = {name: func for name, func in self._registry.items() if name != "__builtins__"}
-        sandbox = self.create_sandbox(types)
+        sandbox = self.create_sandbox(self._types)
 
         return self._execute_function_in_sandbox(
             contract_code, function_name, sandbox, *args, **kwargs
@@ -71,8 +82,7 @@ class ContractsTestCase(TestCase):
     def run_contract_function_with_imports(
         self, contract_code: str, function_name: str, *args, **kwargs
     ) -> FunctionType:
-        types = {name: func for name, func in self._registry.items() if name != "__builtins__"}
-        sandbox = self.create_sandbox_with_imports(types)
+        sandbox = self.create_sandbox_with_imports(self._types)
 
         return self._execute_function_in_sandbox(
             contract_code, function_name, sandbox, *args, **kwargs
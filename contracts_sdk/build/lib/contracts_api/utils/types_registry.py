@@ -1,6 +1,8 @@
 import builtins
 from datetime import datetime
+from functools import lru_cache
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, Dict, Generic, List, Set, Tuple, TypeVar, Union, Optional
 
 from .exceptions import InvalidSmartContractError, StrongTypingError
@@ -26,8 +28,14 @@ class TypeRegistry(dict):
     It also contains the member _check_dict, which consists of the builtins, custom types,
     and the type annotation types that are needed to verify a type that any custom type
     or method may wish to assert.
+
+    A frozen TypeRegistry can no longer be modified, so that it can be shared between sandboxes.
+    Its builtins are read-only too, as copies of the registry still share them. Use a copy, e.g.
+    dict(type_registry), as the sandbox for contract execution instead.
     """
 
+    _frozen = False
+
     def __init__(
         self, *, builtins: Dict[str, Any], custom: List[Any], disable_type_checking: bool = False
     ):
@@ -73,6 +81,9 @@ class TypeRegistry(dict):
         self._check_dict["Tuple"] = _TypeCheckingTupleCls()
         self._check_dict["Union"] = _TypeCheckingUnionCls()
 
+        self.attach_to_types()
+
+    def attach_to_types(self):
         # Attach the type registry to every class in the check dict;
         # each class in there may need to check the registry for recursive types.
         for cls in self._check_dict.values():
@@ -81,6 +92,48 @@ class TypeRegistry(dict):
             except (AttributeError, TypeError):
                 pass
 
+    def freeze(self) -> "TypeRegistry":
+        read_only_builtins = MappingProxyType(self["__builtins__"])
+        self["__builtins__"] = self._check_dict["__builtins__"] = read_only_builtins
+        self._frozen = True
+        return self
+
+    def _check_not_frozen(self):
+        if self._frozen:
+            raise TypeError("TypeRegistry is frozen and cannot be modified")
+
+    def __setitem__(self, key, value):
+        self._check_not_frozen()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._check_not_frozen()
+        super().__delitem__(key)
+
+    def clear(self):
+        self._check_not_frozen()
+        super().clear()
+
+    def pop(self, *args):
+        self._check_not_frozen()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._check_not_frozen()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._check_not_frozen()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._check_not_frozen()
+        super().update(*args, **kwargs)
+
+    def __ior__(self, other):
+        self._check_not_frozen()
+        return super().__ior__(other)
+
     def assert_type_name(self, type_name: str, obj: Any, location: str):
         if self.disable_type_checking:
             return
@@ -290,7 +343,7 @@ def check_registry_specs_sanity(registry: TypeRegistry, prebuilt_instances: Dict
 
 def make_contract_version_sandbox(
     contract_lib: Any, disable_type_checking: bool = False
-) -> Dict[str, Any]:
+) -> TypeRegistry:
     # The _builtin_not_supported method provides a more accurate error message when unsupported
     # builtin methods are used, e.g. if python has a C implementation which is calling a Python
     # function such as `__import__`.
@@ -305,6 +358,26 @@ def make_contract_version_sandbox(
     return types_dict
 
 
+@lru_cache(maxsize=None)
+def _make_frozen_contract_version_sandbox(
+    contract_lib: Any, disable_type_checking: bool
+) -> TypeRegistry:
+    return make_contract_version_sandbox(contract_lib, disable_type_checking).freeze()
+
+
+def get_frozen_contract_version_sandbox(
+    contract_lib: Any, disable_type_checking: bool = False
+) -> TypeRegistry:
+    """
+    Build the TypeRegistry for a contract version once and share it between all callers. As the
+    registry is frozen, callers must copy it before adding anything to it.
+    """
+    registry = _make_frozen_contract_version_sandbox(contract_lib, disable_type_checking)
+    # Types shared between versions may have been attached to another version's registry since
+    registry.attach_to_types()
+    return registry
+
+
 def make_contract_version_sandbox_with_imports(
     contract_lib: Any,
     imported_native_modules: Optional[set] = None,
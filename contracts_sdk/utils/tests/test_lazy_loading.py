@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# The directory containing the contracts_sdk package
+REPO_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+TYPES_PACKAGE = "contracts_sdk.versions.version_400.common.types"
+# Generous, as this runs in a fresh interpreter. Eagerly importing the v400 API took ~190ms
+IMPORT_TIME_BUDGET_MS = 50
+
+
+def _run_cold(code: str) -> dict:
+    """
+    Run code in a fresh interpreter, so that nothing is imported already
+    :param code: python code that must print a json result as its last line of output
+    :return: the decoded result
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _get_loaded_modules(code: str) -> list[str]:
+    return _run_cold(
+        code
+        + "\nimport json, sys;"
+        + "print(json.dumps(sorted(m for m in sys.modules if m.startswith('contracts_sdk'))))"
+    )
+
+
+class LazyLoadingTest(unittest.TestCase):
+    def test_import_does_not_build_types(self):
+        modules = _get_loaded_modules("import contracts_sdk")
+
+        self.assertNotIn(f"{TYPES_PACKAGE}.postings", modules)
+        self.assertNotIn("contracts_sdk.versions.version_400.smart_contracts.lib", modules)
+        self.assertFalse([m for m in modules if m.startswith(f"{TYPES_PACKAGE}.")])
+
+    def test_only_accessed_types_are_built(self):
+        modules = _get_loaded_modules("from contracts_sdk import Tside, CalendarEvent")
+
+        self.assertIn(f"{TYPES_PACKAGE}.enums", modules)
+        self.assertIn(f"{TYPES_PACKAGE}.calendars", modules)
+        self.assertNotIn(f"{TYPES_PACKAGE}.hook_arguments", modules)
+        self.assertNotIn(f"{TYPES_PACKAGE}.postings", modules)
+
+    def test_only_requested_version_is_loaded(self):
+        modules = _get_loaded_modules(
+            "import contracts_sdk.versions as versions; versions.version_400;"
+            "import contracts_sdk.versions.version_400.smart_contracts.lib"
+        )
+
+        self.assertIn("contracts_sdk.versions.version_400.smart_contracts.lib", modules)
+        self.assertFalse(
+            [m for m in modules if m.startswith("contracts_sdk.versions.version_3")], modules
+        )
+
+    def test_all_types_available(self):
+        result = _run_cold(
+            "import json, contracts_sdk;"
+            "from contracts_sdk import *;"
+            "print(json.dumps({"
+            "'missing': [n for n in contracts_sdk.__all__ if n not in globals()],"
+            "'libs': [smart_contracts_lib.__name__, supervisor_contracts_lib.__name__],"
+            "'pi_types': str(contracts_sdk._types.postings.PITypes)"
+            "}))"
+        )
+
+        self.assertListEqual(result["missing"], [])
+        self.assertListEqual(
+            result["libs"],
+            [
+                "contracts_sdk.versions.version_400.smart_contracts.lib",
+                "contracts_sdk.versions.version_400.supervisor_contracts.lib",
+            ],
+        )
+        self.assertIn("CustomInstruction", result["pi_types"])
+
+    def test_unknown_attributes_raise_attribute_error(self):
+        import contracts_sdk
+        import contracts_sdk.versions
+
+        with self.assertRaises(AttributeError):
+            contracts_sdk.NotAType
+        with self.assertRaises(AttributeError):
+            contracts_sdk._types.not_a_module
+        with self.assertRaises(AttributeError):
+            contracts_sdk.versions.version_999
+
+    def test_cold_import_within_budget(self):
+        result = _run_cold(
+            "import time; start = time.perf_counter(); import contracts_sdk;"
+            "print((time.perf_counter() - start) * 1000)"
+        )
+
+        self.assertLess(result, IMPORT_TIME_BUDGET_MS)
@@ -0,0 +1,108 @@
+import builtins
+import unittest
+
+from .. import tools, types_registry
+from ..exceptions import StrongTypingError
+from ..types_utils import FixedValueSpec
+
+CONTRACT_CODE = """
+api = "3.12.0"
+counter = 0
+
+def increment():
+    global counter
+    counter += 1
+    return counter
+"""
+
+
+def _make_test_case(test_case_class: type) -> tools.ContractsTestCase:
+    test_case_class.setUpClass()
+    test_case = test_case_class()
+    test_case.setUp()
+    return test_case
+
+
+class FrozenTypeRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = types_registry.TypeRegistry(
+            builtins={"int": builtins.int, "len": builtins.len},
+            custom=[FixedValueSpec(name="answer", type="int", fixed_value=42, docstring="")],
+        ).freeze()
+
+    def test_frozen_registry_cannot_be_modified(self):
+        for modify in [
+            lambda: self.registry.__setitem__("answer", 43),
+            lambda: self.registry.__delitem__("answer"),
+            lambda: self.registry.pop("answer"),
+            lambda: self.registry.popitem(),
+            lambda: self.registry.setdefault("other", 1),
+            lambda: self.registry.update(other=1),
+            self.registry.clear,
+        ]:
+            with self.assertRaisesRegex(TypeError, "TypeRegistry is frozen"):
+                modify()
+        self.assertEqual(self.registry["answer"], 42)
+
+    def test_copies_of_frozen_registry_can_be_modified(self):
+        sandbox = dict(self.registry)
+        sandbox["answer"] = 43
+
+        self.assertEqual(self.registry["answer"], 42)
+
+    def test_frozen_registry_builtins_cannot_be_modified(self):
+        sandbox = dict(self.registry)
+
+        with self.assertRaises(TypeError):
+            exec("__builtins__['len'] = None", sandbox, sandbox)
+        exec("length = len([1, 2])", sandbox, sandbox)
+
+        self.assertEqual(sandbox["length"], 2)
+        self.assertIs(self.registry["__builtins__"]["len"], builtins.len)
+
+    def test_frozen_registry_still_checks_types(self):
+        with self.assertRaises(StrongTypingError):
+            self.registry.assert_type_name("int", "hello", "")
+
+
+class ContractsTestCaseTest(unittest.TestCase):
+    def test_registry_shared_between_test_cases_of_a_version(self):
+        class OtherSmartContracts3120TestCase(tools.SmartContractsTestCase):
+            version = "3120"
+
+        first = _make_test_case(tools.SmartContracts3120TestCase)
+        second = _make_test_case(OtherSmartContracts3120TestCase)
+
+        self.assertIs(first._registry, second._registry)
+        self.assertTrue(first._registry._frozen)
+
+    def test_shared_types_reattached_to_requested_version(self):
+        v390_test_case = _make_test_case(tools.SmartContracts390TestCase)
+        v3120_test_case = _make_test_case(tools.SmartContracts3120TestCase)
+        # Balance is the same class in both versions
+        balance = v390_test_case._registry["Balance"]
+        self.assertIs(balance, v3120_test_case._registry["Balance"])
+        self.assertIs(balance._registry, v3120_test_case._registry)
+
+        v390_test_case = _make_test_case(tools.SmartContracts390TestCase)
+
+        self.assertIs(balance._registry, v390_test_case._registry)
+
+    def test_sandboxes_are_isolated(self):
+        test_case = _make_test_case(tools.SmartContracts3120TestCase)
+
+        self.assertEqual(test_case.run_contract_function(CONTRACT_CODE, "increment"), 1)
+        self.assertEqual(test_case.run_contract_function(CONTRACT_CODE, "increment"), 1)
+        self.assertNotIn("counter", test_case._registry)
+        self.assertNotIn("counter", test_case._types)
+
+    def test_contract_code_compiled_once(self):
+        test_case = _make_test_case(tools.SmartContracts3120TestCase)
+        tools._compile_contract_code.cache_clear()
+
+        for _ in range(3):
+            test_case.run_contract_function(CONTRACT_CODE, "increment")
+
+        cache_info = tools._compile_contract_code.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 2)
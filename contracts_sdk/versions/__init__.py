@@ -0,0 +1,17 @@
+import importlib
+import re
+
+_VERSION_PACKAGE_PATTERN = re.compile(r"version_\d+")
+
+
+def __getattr__(name: str):
+    # Each API version is only imported when first accessed (PEP 562), so that using one version
+    # does not build the types of all the others
+    if not _VERSION_PACKAGE_PATTERN.fullmatch(name):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -1,134 +1,164 @@
-from .balances import (  # noqa: F401
-    AddressDetails,
-    Balance,
-    BalanceCoordinate,
-    BalanceDefaultDict,
-    BalancesObservation,
-)
-from .calendars import CalendarEvent, CalendarEvents  # noqa: F401
-from .constants import (  # noqa: F401
-    defaultAsset,
-    transaction_reference_field_name,
-    defaultAddress,
-    DEFAULT_ASSET,
-    TRANSACTION_REFERENCE_FIELD_NAME,
-    DEFAULT_ADDRESS,
-)
-from .enums import (  # noqa: F401
-    
-    Phase,
-    PostingInstructionType,
-    RejectionReason,
-    SupervisionExecutionMode,
-    Tside,
-)
-from .event_types import (  # noqa: F401
-    EventTypesGroup,
-    ScheduledEvent,
-    ScheduleExpression,
-    ScheduleSkip,
-    SmartContractEventType,
-    SupervisorContractEventType,
-)
+import importlib
 
+# Types are only imported from their submodule when first accessed (PEP 562), so that using a few
+# types does not build every type in the API
+_SUBMODULE_TYPES = {
+    "balances": (
+        "AddressDetails",
+        "Balance",
+        "BalanceCoordinate",
+        "BalanceDefaultDict",
+        "BalancesObservation",
+    ),
+    "calendars": (
+        "CalendarEvent",
+        "CalendarEvents",
+    ),
+    "constants": (
+        "defaultAsset",
+        "transaction_reference_field_name",
+        "defaultAddress",
+        "DEFAULT_ASSET",
+        "TRANSACTION_REFERENCE_FIELD_NAME",
+        "DEFAULT_ADDRESS",
+    ),
+    "enums": (
+        "Phase",
+        "PostingInstructionType",
+        "RejectionReason",
+        "SupervisionExecutionMode",
+        "Tside",
+    ),
+    "event_types": (
+        "EventTypesGroup",
+        "ScheduledEvent",
+        "ScheduleExpression",
+        "ScheduleSkip",
+        "SmartContractEventType",
+        "SupervisorContractEventType",
+    ),
+    "fetchers": (
+        "BalancesIntervalFetcher",
+        "BalancesObservationFetcher",
+        "fetch_account_data",
+        "PostingsIntervalFetcher",
+        "requires",
+    ),
+    "filters": ("BalancesFilter",),
+    "hook_arguments": (
+        "DeactivationHookArguments",
+        "DerivedParameterHookArguments",
+        "ActivationHookArguments",
+        "PostParameterChangeHookArguments",
+        "PostPostingHookArguments",
+        "PreParameterChangeHookArguments",
+        "PrePostingHookArguments",
+        "ScheduledEventHookArguments",
+        "SupervisorActivationHookArguments",
+        "SupervisorConversionHookArguments",
+        "SupervisorPostPostingHookArguments",
+        "SupervisorPrePostingHookArguments",
+        "SupervisorScheduledEventHookArguments",
+        "ConversionHookArguments",
+    ),
+    "hook_results": (
+        "DeactivationHookResult",
+        "DerivedParameterHookResult",
+        "PreParameterChangeHookResult",
+        "ActivationHookResult",
+        "PostParameterChangeHookResult",
+        "PostPostingHookResult",
+        "PrePostingHookResult",
+        "ScheduledEventHookResult",
+        "SupervisorActivationHookResult",
+        "SupervisorConversionHookResult",
+        "SupervisorPostPostingHookResult",
+        "SupervisorPrePostingHookResult",
+        "SupervisorScheduledEventHookResult",
+        "ConversionHookResult",
+    ),
+    "log": ("Logger",),
+    "account_notification_directive": ("AccountNotificationDirective",),
+    "parameters": (
+        "AccountIdShape",
+        "DateShape",
+        "DenominationShape",
+        "ParameterLevel",
+        "NumberShape",
+        "OptionalShape",
+        "OptionalValue",
+        "Parameter",
+        "StringShape",
+        "UnionItem",
+        "UnionItemValue",
+        "UnionShape",
+        "ParameterUpdatePermission",
+    ),
+    "plan_notification_directive": ("PlanNotificationDirective",),
+    "posting_instructions_directive": ("PostingInstructionsDirective",),
+    "postings": (
+        "AdjustmentAmount",
+        "AuthorisationAdjustment",
+        "ClientTransaction",
+        "ClientTransactionEffects",
+        "CustomInstruction",
+        "InboundAuthorisation",
+        "InboundHardSettlement",
+        "OutboundAuthorisation",
+        "OutboundHardSettlement",
+        "Posting",
+        "Release",
+        "Settlement",
+        "TransactionCode",
+        "Transfer",
+    ),
+    "rejection": ("Rejection",),
+    "schedules": (
+        "EndOfMonthSchedule",
+        "ScheduleFailover",
+    ),
+    "supervision": (
+        "SmartContractDescriptor",
+        "SupervisedHooks",
+    ),
+    "time_operations": (
+        "DefinedDateTime",
+        "Next",
+        "Override",
+        "Previous",
+        "RelativeDateTime",
+        "Shift",
+    ),
+    "timeseries": (
+        "TimeseriesItem",
+        "BalanceTimeseries",
+        "FlagTimeseries",
+        "ParameterTimeseries",
+    ),
+    "update_account_event_type_directive": ("UpdateAccountEventTypeDirective",),
+    "update_plan_event_type_directive": ("UpdatePlanEventTypeDirective",),
+}
+_TYPE_SUBMODULES = {
+    name: submodule for submodule, names in _SUBMODULE_TYPES.items() for name in names
+}
 
-from .fetchers import (  # noqa: F401
-    BalancesIntervalFetcher,
-    BalancesObservationFetcher,
-    fetch_account_data,
-    
-    PostingsIntervalFetcher,
-    requires,
-)
-from .filters import (  # noqa: F401
-    BalancesFilter,
-    
-)
-from .hook_arguments import (  # noqa: F401
-    DeactivationHookArguments,
-    DerivedParameterHookArguments,
-    ActivationHookArguments,
-    PostParameterChangeHookArguments,
-    PostPostingHookArguments,
-    PreParameterChangeHookArguments,
-    PrePostingHookArguments,
-    ScheduledEventHookArguments,
-    SupervisorActivationHookArguments,
-    SupervisorConversionHookArguments,
-    SupervisorPostPostingHookArguments,
-    SupervisorPrePostingHookArguments,
-    SupervisorScheduledEventHookArguments,
-    ConversionHookArguments,
-)
-from .hook_results import (  # noqa: F401
-    DeactivationHookResult,
-    DerivedParameterHookResult,
-    PreParameterChangeHookResult,
-    ActivationHookResult,
-    PostParameterChangeHookResult,
-    PostPostingHookResult,
-    PrePostingHookResult,
-    ScheduledEventHookResult,
-    SupervisorActivationHookResult,
-    SupervisorConversionHookResult,
-    SupervisorPostPostingHookResult,
-    SupervisorPrePostingHookResult,
-    SupervisorScheduledEventHookResult,
-    ConversionHookResult,
-)
-from .log import Logger  # noqa: F401
-from .account_notification_directive import AccountNotificationDirective  # noqa: F401
-from .parameters import (  # noqa: F401
-    AccountIdShape,
-    DateShape,
-    DenominationShape,
-    ParameterLevel,
-    NumberShape,
-    OptionalShape,
-    OptionalValue,
-    Parameter,
-    StringShape,
-    UnionItem,
-    UnionItemValue,
-    UnionShape,
-    ParameterUpdatePermission,
-)
+__all__ = list(_TYPE_SUBMODULES)
 
 
-from .plan_notification_directive import PlanNotificationDirective  # noqa: F401
-from .posting_instructions_directive import PostingInstructionsDirective  # noqa: F401
-from .postings import (  # noqa: F401
-    AdjustmentAmount,
-    AuthorisationAdjustment,
-    ClientTransaction,
-    ClientTransactionEffects,
-    CustomInstruction,
-    InboundAuthorisation,
-    InboundHardSettlement,
-    OutboundAuthorisation,
-    OutboundHardSettlement,
-    Posting,
-    Release,
-    Settlement,
-    TransactionCode,
-    Transfer,
-)
-from .rejection import Rejection  # noqa: F401
-from .schedules import EndOfMonthSchedule, ScheduleFailover  # noqa: F401
-from .supervision import SmartContractDescriptor, SupervisedHooks  # noqa: F401
-from .time_operations import (  # noqa: F401
-    DefinedDateTime,
-    Next,
-    Override,
-    Previous,
-    RelativeDateTime,
-    Shift,
-)
-from .timeseries import (  # noqa: F401
-    TimeseriesItem,
-    BalanceTimeseries,
-    FlagTimeseries,
-    ParameterTimeseries,
-)
-from .update_account_event_type_directive import UpdateAccountEventTypeDirective  # noqa: F401
-from .update_plan_event_type_directive import UpdatePlanEventTypeDirective  # noqa: F401
+def __getattr__(name: str):
+    if name in _TYPE_SUBMODULES:
+        value = getattr(importlib.import_module(f".{_TYPE_SUBMODULES[name]}", __name__), name)
+    else:
+        # submodules are also accessed as attributes, e.g. types.postings.PITypes
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
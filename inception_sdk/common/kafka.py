@@ -111,6 +111,7 @@ def wait_for_messages(
     unique_message_ids: dict[str, Any],
     inter_message_timeout: int = 30,
     matched_message_timeout: int = 30,
+    max_matched_messages: int = 0,
 ) -> dict[str, Any]:
     """
     Using the consumer, poll the topic for any matched messages.
@@ -128,6 +129,8 @@ def wait_for_messages(
     consumer (0 for no timeout)
     :param matched_message_timeout: a maximum time to wait between receiving matched messages from
     the consumer (0 for no timeout)
+    :param max_matched_messages: stop polling once this many messages have been matched, even if
+    some message ids are still unmatched (0 for no limit)
     :return: dict of message ids that failed to match. This is the exact same data structure
     as message_ids
     """
@@ -175,6 +178,8 @@ def wait_for_messages(
                         del unique_message_ids[event_id]
                     if callback:
                         callback(event_msg)
+                    if 0 < max_matched_messages <= len(seen_matched_message_requests):
+                        break
             elif msg.error().code() == KafkaError._PARTITION_EOF:
                 log.error("End of partition reached {0}/{1}".format(msg.topic(), msg.partition()))
             else:
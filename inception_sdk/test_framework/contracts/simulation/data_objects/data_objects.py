@@ -10,7 +10,8 @@ from inception_sdk.test_framework.contracts.simulation.data_objects.events.param
 )
 
 
-@dataclass
+# Scenarios can contain tens of thousands of events, so avoid a __dict__ per event
+@dataclass(slots=True)
 class SimulationEvent:
     time: datetime
     event: dict
@@ -114,6 +115,31 @@ class ExpectedContractNotification:
     resource_type: ContractNotificationResourceType
 
 
+@dataclass
+class HookBudget:
+    """
+    Upper bounds on the cost of a hook, checked separately for each account or plan the hook is
+    executed on. Bounds that are not set are not checked
+    :param hook: the scheduled event type (e.g. ACCRUE_INTEREST) or "post_posting_hook"
+    :param account_id: if set, only the hook's executions on this account or plan are checked
+    :param max_executions: maximum number of hook executions
+    :param max_batches_per_day: maximum number of contract batches per day, e.g. 2 for
+    "ACCRUE_INTEREST produces at most 2 PIBs per day"
+    :param max_batches_per_timestamp: maximum number of contract batches (i.e. posting
+    instructions directives) at a single timestamp
+    :param max_posting_instructions_per_batch: maximum number of posting instructions per batch
+    :param max_postings_per_execution: maximum number of committed postings per hook execution
+    """
+
+    hook: str
+    account_id: str | None = None
+    max_executions: int | None = None
+    max_batches_per_day: int | None = None
+    max_batches_per_timestamp: int | None = None
+    max_posting_instructions_per_batch: int | None = None
+    max_postings_per_execution: int | None = None
+
+
 @dataclass
 class SubTest:
     description: str
@@ -135,3 +161,4 @@ class SimulationTestScenario:
     supervisor_config: SupervisorConfig | None = None
     internal_accounts: dict | None = None
     debug: bool = False
+    hook_budgets: list[HookBudget] | None = None
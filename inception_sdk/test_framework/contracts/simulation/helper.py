@@ -9,8 +9,12 @@ Any more complex Posting Instruction Batches should be constructed by the
 test writer out of the base available objects.
 """
 # standard libs
+import uuid
 from datetime import datetime, timedelta
 from random import randrange
+from typing import Iterator
+
+from dateutil.relativedelta import relativedelta
 
 # contracts api
 from contracts_api import DateShape, DenominationShape, NumberShape, StringShape
@@ -64,7 +68,15 @@ from inception_sdk.test_framework.contracts.simulation.data_objects.events.plan_
     CreateAccountPlanAssocEvent,
     CreatePlanEvent,
 )
-from inception_sdk.vault.postings.posting_classes import Instruction
+from inception_sdk.vault.postings.posting_classes import (
+    DEFAULT_BATCH_DETAILS,
+    DEFAULT_CLIENT_ID,
+    InboundHardSettlement,
+    Instruction,
+    OutboundHardSettlement,
+    PostingInstruction,
+)
+from inception_sdk.vault.postings.posting_patterns import PostingPattern
 
 
 def account_to_simulate(
@@ -651,6 +663,165 @@ def create_posting_instruction_batch(
     )
 
 
+def create_repeated_posting_instruction_batches(
+    instructions: list[Instruction],
+    start: datetime,
+    occurrences: int,
+    frequency: timedelta | relativedelta = timedelta(days=1),
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    client_batch_id_prefix: str = "",
+) -> list[SimulationEvent]:
+    """
+    Returns SimulationEvents containing the same Posting Instruction Batch at regular intervals,
+    e.g. a daily spend. This is much cheaper than creating each event separately for large numbers
+    of occurrences, as the instructions are only converted once and their contents are shared
+    between the events. The events must therefore not be modified.
+    :param instructions: list of instructions to be included in each pib
+    :param start: the datetime of the first occurrence
+    :param occurrences: the number of occurrences
+    :param frequency: the interval between occurrences. Use a relativedelta for calendar intervals,
+    e.g. relativedelta(months=1) to repeat on the same day of each month
+    :param instruction_details: An optional mapping containing instruction-level metadata.
+    :param batch_details: A dictionary containing batch level metadata.
+    :param client_batch_id_prefix: prefix for each occurrence's client batch id, which is followed
+    by the occurrence's index. Client transaction ids are the client batch id followed by the
+    instruction's index. Defaults to a random uuid.
+    :return: SimulationEvents with a Posting Instruction Batch, in chronological order
+    """
+    client_batch_id_prefix = client_batch_id_prefix or str(uuid.uuid4())
+    batch_details = batch_details or DEFAULT_BATCH_DETAILS
+    posting_instructions = [
+        PostingInstruction(instruction, instruction_details=instruction_details).to_dict()
+        for instruction in instructions
+    ]
+    events = []
+    for occurrence in range(occurrences):
+        event_datetime = start + frequency * occurrence
+        client_batch_id = f"{client_batch_id_prefix}_{occurrence}"
+        events.append(
+            SimulationEvent(
+                event_datetime,
+                {
+                    "create_posting_instruction_batch": {
+                        "client_id": DEFAULT_CLIENT_ID,
+                        "client_batch_id": client_batch_id,
+                        "posting_instructions": [
+                            {
+                                **posting_instruction,
+                                "client_transaction_id": f"{client_batch_id}_{i}",
+                            }
+                            for i, posting_instruction in enumerate(posting_instructions)
+                        ],
+                        "batch_details": batch_details,
+                        "value_timestamp": event_datetime.isoformat(),
+                    }
+                },
+            )
+        )
+    return events
+
+
+def create_repeated_inbound_hard_settlement_instructions(
+    amount: str,
+    start: datetime,
+    occurrences: int,
+    frequency: timedelta | relativedelta = timedelta(days=1),
+    target_account_id: str | None = None,
+    internal_account_id: str | None = None,
+    denomination: str | None = None,
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+) -> list[SimulationEvent]:
+    """
+    Returns SimulationEvents containing the same Inbound Hard Settlement at regular intervals, e.g.
+    a monthly salary deposit. See create_repeated_posting_instruction_batches for details.
+    :param amount: string representation of the amount to be sent.
+    :param start: the datetime of the first occurrence
+    :param occurrences: the number of occurrences
+    :param frequency: the interval between occurrences
+    :param target_account_id: Target customer account id for posting instruction
+    :param internal_account_id: internal account id for posting instruction
+    :param denomination: the denomination the posting instruction will be in.
+    :param instruction_details: An optional mapping containing instruction-level metadata.
+    :param batch_details: A dictionary containing batch level metadata.
+    :return: SimulationEvents with an InboundHardSettlement Posting Instruction Batch
+    """
+    return create_repeated_posting_instruction_batches(
+        [
+            InboundHardSettlement(
+                target_account_id=target_account_id,
+                internal_account_id=internal_account_id,
+                amount=amount,
+                denomination=denomination,
+            )
+        ],
+        start,
+        occurrences,
+        frequency,
+        instruction_details=instruction_details,
+        batch_details=batch_details,
+    )
+
+
+def create_repeated_outbound_hard_settlement_instructions(
+    amount: str,
+    start: datetime,
+    occurrences: int,
+    frequency: timedelta | relativedelta = timedelta(days=1),
+    target_account_id: str | None = None,
+    internal_account_id: str | None = None,
+    denomination: str | None = None,
+    instruction_details: dict[str, str] | None = None,
+    batch_details: dict[str, str] | None = None,
+    advice: bool | None = None,
+) -> list[SimulationEvent]:
+    """
+    Returns SimulationEvents containing the same Outbound Hard Settlement at regular intervals,
+    e.g. a daily spend. See create_repeated_posting_instruction_batches for details.
+    :param amount: string representation of the amount to be sent.
+    :param start: the datetime of the first occurrence
+    :param occurrences: the number of occurrences
+    :param frequency: the interval between occurrences
+    :param target_account_id: Target customer account id for posting instruction
+    :param internal_account_id: internal account id for posting instruction
+    :param denomination: the denomination the posting instruction will be in.
+    :param instruction_details: An optional mapping containing instruction-level metadata.
+    :param batch_details: A dictionary containing batch level metadata.
+    :param advice: if true, the amount will be authorised regardless of balance check
+    :return: SimulationEvents with an OutboundHardSettlement Posting Instruction Batch
+    """
+    return create_repeated_posting_instruction_batches(
+        [
+            OutboundHardSettlement(
+                target_account_id=target_account_id,
+                internal_account_id=internal_account_id,
+                amount=amount,
+                denomination=denomination,
+                advice=advice,
+            )
+        ],
+        start,
+        occurrences,
+        frequency,
+        instruction_details=instruction_details,
+        batch_details=batch_details,
+    )
+
+
+def create_posting_pattern_events(pattern: PostingPattern) -> Iterator[SimulationEvent]:
+    """
+    Lazily yields SimulationEvents for the Posting Instruction Batches of a bulk posting pattern,
+    e.g. 100 accounts with 1000 transactions each over a month. See PostingPattern for details.
+    The events are in chronological order. Use list() to include them in a SubTest, or pass the
+    iterator directly to simulate_smart_contract.
+    :param pattern: the posting pattern to generate events for
+    :return: SimulationEvents with a Posting Instruction Batch
+    """
+    for batch in pattern.generate():
+        yield SimulationEvent(batch.timestamp, {"create_posting_instruction_batch": batch.pib})
+
+
 def create_instance_parameter_change_event(
     timestamp: datetime, account_id: str, **kwargs: str
 ) -> SimulationEvent:
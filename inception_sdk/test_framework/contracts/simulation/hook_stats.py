@@ -0,0 +1,259 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import logging
+import os
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterable
+
+# third party
+from dateutil import parser
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import HookBudget
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# client_id of posting instruction batches instructed by contracts
+CONTRACT_CLIENT_ID = "CoreContracts"
+POST_POSTING_HOOK = "post_posting_hook"
+# used for contract batches that cannot be linked to a hook execution
+UNATTRIBUTED = "unattributed"
+
+PROCESSED_SCHEDULED_EVENT_PATTERN = re.compile(
+    r'processed scheduled event "(?P<event_type>[^"]+)" '
+    r'for (?:account|plan) "(?P<resource_id>[^"]+)"'
+)
+
+# HookBudget limit to the corresponding HookStats attribute
+BUDGET_LIMITS = {
+    "max_executions": "executions",
+    "max_batches_per_day": "max_batches_per_day",
+    "max_batches_per_timestamp": "max_batches_per_timestamp",
+    "max_posting_instructions_per_batch": "max_posting_instructions_per_batch",
+    "max_postings_per_execution": "max_postings_per_execution",
+}
+
+
+@dataclass
+class HookStats:
+    """
+    Cost statistics for a hook, derived from a simulation result stream
+    :param hook: the scheduled event type (e.g. ACCRUE_INTEREST) or POST_POSTING_HOOK
+    :param executions: number of times the hook was executed
+    :param posting_instruction_batches: number of contract batches instructed by the hook. Each
+    posting instructions directive results in a separate batch
+    :param posting_instructions: number of posting instructions across these batches
+    :param postings: number of committed postings across these batches
+    :param max_posting_instructions_per_batch: the largest number of posting instructions in a
+    single batch
+    :param max_postings_per_execution: the largest number of committed postings from a single
+    hook execution
+    :param max_batches_per_timestamp: the largest number of batches at a single timestamp
+    :param max_batches_per_day: the largest number of batches on a single day
+    """
+
+    hook: str
+    executions: int = 0
+    posting_instruction_batches: int = 0
+    posting_instructions: int = 0
+    postings: int = 0
+    max_posting_instructions_per_batch: int = 0
+    max_postings_per_execution: int = 0
+    max_batches_per_timestamp: int = 0
+    max_batches_per_day: int = 0
+
+    def merge(self, other: "HookStats") -> None:
+        """
+        Add another set of stats for the same hook (e.g. from another account or scenario) to
+        these stats. Totals are summed and maximums are kept
+        """
+        self.executions += other.executions
+        self.posting_instruction_batches += other.posting_instruction_batches
+        self.posting_instructions += other.posting_instructions
+        self.postings += other.postings
+        self.max_posting_instructions_per_batch = max(
+            self.max_posting_instructions_per_batch, other.max_posting_instructions_per_batch
+        )
+        self.max_postings_per_execution = max(
+            self.max_postings_per_execution, other.max_postings_per_execution
+        )
+        self.max_batches_per_timestamp = max(
+            self.max_batches_per_timestamp, other.max_batches_per_timestamp
+        )
+        self.max_batches_per_day = max(self.max_batches_per_day, other.max_batches_per_day)
+
+
+@dataclass
+class _HookExecution:
+    key: tuple[str, str]
+    postings: int = 0
+
+
+def _get_originating_account_id(pib: dict[str, Any]) -> str | None:
+    for posting_instruction in pib["posting_instructions"]:
+        instruction_details = posting_instruction.get("instruction_details") or {}
+        if "originating_account_id" in instruction_details:
+            return instruction_details["originating_account_id"]
+    return None
+
+
+def get_hook_stats(
+    res: list[dict[str, Any]], internal_account_ids: Iterable[str] | None = None
+) -> dict[tuple[str, str], HookStats]:
+    """
+    Collects per-hook cost statistics from a simulation result stream in a single pass.
+    Scheduled event executions are identified from the processed scheduled event logs, and each
+    client (i.e. non-contract) batch counts as a post-posting hook execution on each non-internal
+    account it affects. Contract batches are attributed to the latest hook execution at the same
+    timestamp for their originating account, falling back to the latest hook execution at that
+    timestamp for any account
+    :param res: output from simulation endpoint
+    :param internal_account_ids: ids of internal accounts, which do not execute hooks
+    :return: (account or plan id, hook) to the hook's stats
+    """
+    internal_account_ids = set(internal_account_ids or [])
+    stats: dict[tuple[str, str], HookStats] = {}
+    batches_per_timestamp: defaultdict[tuple[str, str], defaultdict[datetime, int]] = defaultdict(
+        lambda: defaultdict(int)
+    )
+    # account or plan id to its latest hook execution at the current timestamp
+    executions: dict[str, _HookExecution] = {}
+    latest_execution: _HookExecution | None = None
+    current_timestamp: datetime | None = None
+
+    def _execute(resource_id: str, hook: str) -> _HookExecution:
+        key = (resource_id, hook)
+        stats.setdefault(key, HookStats(hook=hook)).executions += 1
+        executions[resource_id] = _HookExecution(key=key)
+        return executions[resource_id]
+
+    for response in res:
+        result = response["result"]
+        timestamp = parser.parse(result["timestamp"])
+        if timestamp != current_timestamp:
+            current_timestamp = timestamp
+            executions.clear()
+            latest_execution = None
+
+        for log_line in result["logs"]:
+            match = PROCESSED_SCHEDULED_EVENT_PATTERN.search(log_line)
+            if match:
+                latest_execution = _execute(match["resource_id"], match["event_type"])
+
+        for pib in result["posting_instruction_batches"]:
+            if pib["client_id"] != CONTRACT_CLIENT_ID:
+                affected_account_ids = {
+                    posting["account_id"]
+                    for posting_instruction in pib["posting_instructions"]
+                    for posting in posting_instruction["committed_postings"]
+                }
+                for account_id in sorted(affected_account_ids - internal_account_ids):
+                    latest_execution = _execute(account_id, POST_POSTING_HOOK)
+                continue
+
+            originating_account_id = _get_originating_account_id(pib)
+            execution = executions.get(originating_account_id or "", latest_execution)
+            key = execution.key if execution else (originating_account_id or "", UNATTRIBUTED)
+            hook_stats = stats.setdefault(key, HookStats(hook=key[1]))
+
+            num_posting_instructions = len(pib["posting_instructions"])
+            num_postings = sum(
+                len(posting_instruction["committed_postings"])
+                for posting_instruction in pib["posting_instructions"]
+            )
+            hook_stats.posting_instruction_batches += 1
+            hook_stats.posting_instructions += num_posting_instructions
+            hook_stats.postings += num_postings
+            hook_stats.max_posting_instructions_per_batch = max(
+                hook_stats.max_posting_instructions_per_batch, num_posting_instructions
+            )
+            if execution:
+                execution.postings += num_postings
+                hook_stats.max_postings_per_execution = max(
+                    hook_stats.max_postings_per_execution, execution.postings
+                )
+            batches_per_timestamp[key][timestamp] += 1
+
+    for key, timestamp_batches in batches_per_timestamp.items():
+        day_batches: defaultdict[date, int] = defaultdict(int)
+        for timestamp, batches in timestamp_batches.items():
+            day_batches[timestamp.date()] += batches
+        stats[key].max_batches_per_timestamp = max(timestamp_batches.values())
+        stats[key].max_batches_per_day = max(day_batches.values())
+
+    return stats
+
+
+def get_hook_budget_violations(
+    budgets: list[HookBudget], hook_stats: dict[tuple[str, str], HookStats]
+) -> list[str]:
+    """
+    Checks hook stats against budgets. Can be used as a `SimulationTestCase.assertExpectations`
+    comparator
+    :param budgets: the hook budgets to check
+    :param hook_stats: (account or plan id, hook) to the hook's stats, as per `get_hook_stats`
+    :return: a description of each exceeded budget limit
+    """
+    violations = []
+    for budget in budgets:
+        for (resource_id, hook), stats in hook_stats.items():
+            if hook != budget.hook or (budget.account_id and resource_id != budget.account_id):
+                continue
+            for limit_name, stat_name in BUDGET_LIMITS.items():
+                limit = getattr(budget, limit_name)
+                actual = getattr(stats, stat_name)
+                if limit is not None and actual > limit:
+                    violations.append(
+                        f"{hook} on {resource_id}: {stat_name} is {actual}, "
+                        f"exceeding budget of {limit}"
+                    )
+    return violations
+
+
+def merge_hook_stats(
+    hook_stats: dict[tuple[str, str], HookStats], product_hook_stats: dict[str, HookStats]
+) -> None:
+    """
+    Aggregates per-account hook stats into per-hook stats for a product, e.g. across all
+    scenarios in a test suite
+    :param hook_stats: (account or plan id, hook) to the hook's stats, as per `get_hook_stats`
+    :param product_hook_stats: hook to the aggregated stats, updated in place
+    """
+    for (_, hook), stats in hook_stats.items():
+        product_hook_stats.setdefault(hook, HookStats(hook=hook)).merge(stats)
+
+
+def format_hook_stats_report(suite_hook_stats: dict[str, dict[str, HookStats]]) -> str:
+    """
+    :param suite_hook_stats: product name to hook to the aggregated stats
+    :return: a table of hook stats per product
+    """
+    columns = [
+        ("executions", "execs"),
+        ("posting_instruction_batches", "batches"),
+        ("posting_instructions", "instrs"),
+        ("postings", "postings"),
+        ("max_posting_instructions_per_batch", "max instrs/batch"),
+        ("max_postings_per_execution", "max postings/exec"),
+        ("max_batches_per_timestamp", "max batches/ts"),
+        ("max_batches_per_day", "max batches/day"),
+    ]
+    lines = []
+    for product, product_hook_stats in sorted(suite_hook_stats.items()):
+        hook_width = max([len("hook")] + [len(hook) for hook in product_hook_stats])
+        lines.append(f"Hook stats for {product}:")
+        lines.append(f"  {'hook':<{hook_width}}" + "".join(f" {header}" for _, header in columns))
+        for hook, stats in sorted(product_hook_stats.items()):
+            lines.append(
+                f"  {hook:<{hook_width}}"
+                + "".join(f" {getattr(stats, name):>{len(header)}}" for name, header in columns)
+            )
+    return "\n".join(lines)
@@ -0,0 +1,348 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+"""
+Splits a simulation test scenario into segments at sub-test boundaries, so that a long scenario
+can be simulated as a sequence of shorter timelines. Each segment re-creates the accounts with the
+parameters, flags and other definitions in effect at its start, and the balances at the end of the
+previous segment are carried forward with checkpoint postings against CHECKPOINT_ACCOUNT_ID.
+
+Contract state that is not held in balances, parameters or flags (e.g. schedules that depend on
+the account creation date or on the last execution of an event) restarts at each segment, so
+sharding is only suitable for scenarios where this state does not affect the assertions.
+
+The checkpoint postings are ordinary postings to the simulator. force_override only skips the
+pre_posting_hook, so the post_posting_hook still runs for them and the contract may react as it
+would to a real deposit or withdrawal (e.g. by making repayments, charging fees or sending
+notifications). There is no way to seed balances without running the hooks, so sharded results can
+differ from a single simulation for contracts whose post_posting_hook acts on postings. Such
+contracts can ignore the checkpoints by their CHECKPOINT_INSTRUCTION_DETAILS event_type, otherwise
+they should not be sharded.
+"""
+# standard libs
+import logging
+import os
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+# third party
+from dateutil import parser
+
+# inception sdk
+from inception_sdk.test_framework.common.constants import DEFAULT_POSTING_PHASE, LIABILITY
+from inception_sdk.test_framework.common.timeseries import TimeSeries
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    SimulationEvent,
+    SimulationTestScenario,
+    SubTest,
+)
+from inception_sdk.test_framework.contracts.simulation.helper import (
+    create_posting_instruction_batch,
+)
+from inception_sdk.vault.postings.posting_classes import CustomInstruction, Posting
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+CHECKPOINT_ACCOUNT_ID = "SEGMENT_CHECKPOINT"
+CHECKPOINT_CLIENT_BATCH_ID = "SEGMENT_CHECKPOINT"
+CHECKPOINT_INSTRUCTION_DETAILS = {"force_override": "true", "event_type": "SEGMENT_CHECKPOINT"}
+# segments start this long before their first event or assertion. The accounts and carried
+# definitions are created at the segment start, and the checkpoint postings are made one offset
+# later
+CHECKPOINT_OFFSET = timedelta(seconds=1)
+
+# events that define state rather than change it, which are re-created at the start of a segment
+CARRIED_EVENT_TYPES = {
+    "create_calendar",
+    "create_calendar_event",
+    "create_flag_definition",
+    "create_global_parameter",
+    "create_global_parameter_value",
+}
+
+
+@dataclass
+class ScenarioSegment:
+    """
+    A group of consecutive sub-tests from a scenario, which is simulated separately
+    :param description: identifies the segment in failure messages
+    :param test_scenario: the scenario for this segment's sub-tests only. For all but the first
+    segment, its setup is derived from the events of the previous segments. Balances must be added
+    with `with_checkpoint` once the previous segment has been simulated
+    :param boundary: the timestamp of the segment's first event or assertion
+    """
+
+    description: str
+    test_scenario: SimulationTestScenario
+    boundary: datetime
+
+    @property
+    def checkpoint_datetime(self) -> datetime:
+        return self.test_scenario.start + CHECKPOINT_OFFSET
+
+    def with_checkpoint(self, balances: dict[str, TimeSeries]) -> SimulationTestScenario:
+        """
+        :param balances: account id to balance timeseries from the previous segment, as per
+        `get_balances`
+        :return: the segment's scenario, starting with postings that bring its accounts to the
+        latest balances of the previous segment
+        """
+        checkpoint_events = get_checkpoint_events(balances, self.checkpoint_datetime)
+        if not checkpoint_events:
+            return self.test_scenario
+        checkpoint_sub_test = SubTest(
+            description=f"{self.description} checkpoint", events=checkpoint_events
+        )
+        return replace(
+            self.test_scenario, sub_tests=[checkpoint_sub_test] + self.test_scenario.sub_tests
+        )
+
+
+def _get_event_type(event: SimulationEvent) -> str:
+    return next(iter(event.event))
+
+
+def _get_sub_test_timestamps(sub_test: SubTest) -> list[datetime]:
+    timestamps = [event.time for event in sub_test.events or []]
+    timestamps.extend((sub_test.expected_balances_at_ts or {}).keys())
+    timestamps.extend(
+        expected.timestamp
+        for expected in (sub_test.expected_posting_rejections or [])
+        + (sub_test.expected_parameter_change_rejections or [])
+        + (sub_test.expected_derived_parameters or [])
+        + (sub_test.expected_contract_notifications or [])
+    )
+    timestamps.extend(
+        run_time
+        for expected_schedule in sub_test.expected_schedules or []
+        for run_time in expected_schedule.run_times
+    )
+    return timestamps
+
+
+def _get_setup_events(
+    test_scenario: SimulationTestScenario, previous_events: list[SimulationEvent], start: datetime
+) -> tuple[dict[str, Any], dict[str, Any], list[SimulationEvent]]:
+    """
+    Replays the events before a segment to determine the state it should start with
+    :param test_scenario: the full scenario
+    :param previous_events: events from the sub-tests of all previous segments
+    :param start: the start of the segment
+    :return: the template parameters, the main account's instance parameters and the events to
+    re-create any other accounts, flags and definitions at the start of the segment
+    """
+    contract_config = test_scenario.contract_config
+    template_params = dict(contract_config.template_params)
+    main_account_id = contract_config.account_configs[0].account_id_base
+    # account id to its create_account event payload
+    accounts = {
+        main_account_id: {
+            "instance_param_vals": dict(contract_config.account_configs[0].instance_params)
+        }
+    }
+    flags = []
+    carried_events = []
+    uncarried_event_types = set()
+
+    for event in previous_events:
+        event_type = _get_event_type(event)
+        payload = event.event[event_type]
+        if event_type in CARRIED_EVENT_TYPES:
+            carried_events.append(SimulationEvent(start, deepcopy(event.event)))
+        elif event_type == "create_account":
+            accounts[payload["id"]] = deepcopy(payload)
+        elif (
+            event_type == "create_account_update"
+            and "instance_param_vals_update" in payload
+            and payload["account_id"] in accounts
+        ):
+            accounts[payload["account_id"]]["instance_param_vals"].update(
+                payload["instance_param_vals_update"]["instance_param_vals"]
+            )
+        elif event_type == "update_smart_contract_param":
+            if payload["smart_contract_version_id"] == contract_config.smart_contract_version_id:
+                template_params[payload["parameter_name"]] = payload["new_parameter_value"]
+        elif event_type == "create_flag":
+            if not payload["expiry_timestamp"] or parser.parse(payload["expiry_timestamp"]) > start:
+                flags.append(SimulationEvent(start, deepcopy(event.event)))
+        elif event_type != "create_posting_instruction_batch":
+            uncarried_event_types.add(event_type)
+
+    if uncarried_event_types:
+        log.warning(
+            f"Events of type {sorted(uncarried_event_types)} are not carried forward to the "
+            f"segment starting at {start}"
+        )
+
+    account_events = [
+        SimulationEvent(start, {"create_account": payload})
+        for account_id, payload in accounts.items()
+        if account_id != main_account_id
+    ]
+    # flag definitions must exist before the flags are created
+    return (
+        template_params,
+        accounts[main_account_id]["instance_param_vals"],
+        carried_events + account_events + flags,
+    )
+
+
+def split_test_scenario(
+    test_scenario: SimulationTestScenario, sub_tests_per_segment: int = 1
+) -> list[ScenarioSegment]:
+    """
+    Splits a contract scenario into segments at sub-test boundaries. Sub-tests without any events
+    or assertions are kept with the previous segment
+    :param test_scenario: the scenario to split. Its sub-tests must be in chronological order
+    :param sub_tests_per_segment: the number of sub-tests in each segment
+    :return: the segments, in chronological order
+    """
+    if test_scenario.supervisor_config or not test_scenario.contract_config:
+        raise ValueError("Only contract scenarios can be split into segments")
+    if sub_tests_per_segment < 1:
+        raise ValueError("sub_tests_per_segment must be at least 1")
+
+    groups: list[list[SubTest]] = []
+    for i in range(0, len(test_scenario.sub_tests), sub_tests_per_segment):
+        group = test_scenario.sub_tests[i : i + sub_tests_per_segment]
+        if groups and not any(_get_sub_test_timestamps(sub_test) for sub_test in group):
+            groups[-1].extend(group)
+        else:
+            groups.append(list(group))
+
+    boundaries = [test_scenario.start]
+    previous_timestamps: list[datetime] = []
+    for previous_group, group in zip(groups, groups[1:]):
+        previous_timestamps.extend(
+            timestamp
+            for sub_test in previous_group
+            for timestamp in _get_sub_test_timestamps(sub_test)
+        )
+        boundary = min(
+            timestamp for sub_test in group for timestamp in _get_sub_test_timestamps(sub_test)
+        )
+        if previous_timestamps and max(previous_timestamps) >= boundary - 2 * CHECKPOINT_OFFSET:
+            raise ValueError(
+                f'Sub-test "{group[0].description}" starts at {boundary}, which does not leave '
+                f"time to checkpoint after the previous events and assertions"
+            )
+        boundaries.append(boundary)
+
+    segments = []
+    previous_events: list[SimulationEvent] = []
+    for index, (group, boundary) in enumerate(zip(groups, boundaries)):
+        start = test_scenario.start if index == 0 else boundary - 2 * CHECKPOINT_OFFSET
+        end = (
+            boundaries[index + 1] - 2 * CHECKPOINT_OFFSET
+            if index + 1 < len(boundaries)
+            else test_scenario.end
+        )
+        description = f"segment {index + 1} of {len(groups)} ({start} to {end})"
+        if index == 0:
+            segment_scenario = replace(test_scenario, sub_tests=group, end=end)
+        else:
+            template_params, instance_params, setup_events = _get_setup_events(
+                test_scenario, previous_events, start
+            )
+            account_configs = test_scenario.contract_config.account_configs
+            contract_config = replace(
+                test_scenario.contract_config,
+                template_params=template_params,
+                account_configs=[replace(account_configs[0], instance_params=instance_params)]
+                + account_configs[1:],
+            )
+            sub_tests = group
+            if setup_events:
+                sub_tests = [
+                    SubTest(description=f"{description} setup", events=setup_events)
+                ] + group
+            segment_scenario = replace(
+                test_scenario,
+                sub_tests=sub_tests,
+                start=start,
+                end=end,
+                contract_config=contract_config,
+                internal_accounts=_with_checkpoint_account(test_scenario.internal_accounts),
+            )
+        segments.append(
+            ScenarioSegment(
+                description=description, test_scenario=segment_scenario, boundary=boundary
+            )
+        )
+        previous_events.extend(event for sub_test in group for event in sub_test.events or [])
+
+    return segments
+
+
+def _with_checkpoint_account(internal_accounts: list[str] | dict[str, str] | None) -> dict:
+    if isinstance(internal_accounts, dict):
+        internal_accounts = dict(internal_accounts)
+    else:
+        internal_accounts = {account_id: LIABILITY for account_id in internal_accounts or []}
+    internal_accounts[CHECKPOINT_ACCOUNT_ID] = LIABILITY
+    return internal_accounts
+
+
+def get_checkpoint_events(
+    balances: dict[str, TimeSeries], checkpoint_datetime: datetime
+) -> list[SimulationEvent]:
+    """
+    Creates the postings to bring re-created accounts to the latest balances of a previous
+    simulation. The total credits and debits of each committed balance are posted separately, so
+    that both the net balance and the credit/debit split are preserved regardless of tside
+    :param balances: account id to balance timeseries, as per `get_balances`
+    :param checkpoint_datetime: when to make the postings
+    :return: a single posting instruction batch event, or no events if there are no balances
+    """
+    instructions = []
+    for account_id, balance_timeseries in sorted(balances.items()):
+        if account_id == CHECKPOINT_ACCOUNT_ID:
+            continue
+        for dimensions, balance in balance_timeseries.latest().items():
+            if dimensions.phase != DEFAULT_POSTING_PHASE:
+                if balance.net:
+                    log.warning(
+                        f"{dimensions.phase} balance {balance.net} at {dimensions.address} on "
+                        f"{account_id} is not carried forward"
+                    )
+                continue
+            postings = []
+            for amount, credit in ((balance.credit, True), (balance.debit, False)):
+                if not amount:
+                    continue
+                postings.extend(
+                    Posting(
+                        account_id=posting_account_id,
+                        amount=str(amount),
+                        credit=posting_credit,
+                        denomination=dimensions.denomination,
+                        asset=dimensions.asset,
+                        account_address=address,
+                    )
+                    for posting_account_id, address, posting_credit in (
+                        (account_id, dimensions.address, credit),
+                        (CHECKPOINT_ACCOUNT_ID, "DEFAULT", not credit),
+                    )
+                )
+            if postings:
+                instructions.append(
+                    CustomInstruction(
+                        postings=postings, instruction_details=CHECKPOINT_INSTRUCTION_DETAILS
+                    )
+                )
+
+    if not instructions:
+        return []
+    return [
+        create_posting_instruction_batch(
+            instructions=instructions,
+            event_datetime=checkpoint_datetime,
+            instruction_details=CHECKPOINT_INSTRUCTION_DETAILS,
+            client_batch_id=CHECKPOINT_CLIENT_BATCH_ID,
+        )
+    ]
@@ -0,0 +1,206 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from typing import Any, DefaultDict
+
+# third party
+from dateutil import parser
+
+# inception sdk
+from inception_sdk.test_framework.common.timeseries import TimeSeries
+
+PROCESSED_SCHEDULED_EVENT_PATTERN = re.compile(
+    r'processed scheduled event "(?P<event_id>[^"]*)" '
+    r'for (?P<resource_type>account|plan) "(?P<resource_id>[^"]*)"'
+)
+POSTING_REJECTION_PATTERN = re.compile(
+    r'account "(?P<account_id>[^"]*)" rejected with rejection type "(?P<rejection_type>[^"]*)" '
+    r'and reason "(?P<rejection_reason>.*)'
+)
+PARAMETER_CHANGE_REJECTION_PREFIX = "account parameters update rejected: "
+
+
+@dataclass(frozen=True)
+class PostingRejection:
+    """
+    A posting rejection parsed from the simulation logs
+    :param account_id: the account that rejected the posting
+    :param rejection_type: e.g. InsufficientFunds
+    :param rejection_reason: the rejection reason, followed by anything else in the log line
+    """
+
+    account_id: str
+    rejection_type: str
+    rejection_reason: str
+
+
+def parse_posting_rejections(
+    logs_with_timestamp: dict[datetime, list[str]]
+) -> dict[datetime, list[PostingRejection]]:
+    """
+    :param logs_with_timestamp: logs grouped by timestamp, as per `get_logs_with_timestamp`
+    :return: posting rejections grouped by timestamp
+    """
+    rejections: DefaultDict[datetime, list[PostingRejection]] = defaultdict(list)
+    for timestamp, logs in logs_with_timestamp.items():
+        for log in logs:
+            match = POSTING_REJECTION_PATTERN.search(log)
+            if match:
+                rejections[timestamp].append(
+                    PostingRejection(
+                        account_id=match["account_id"],
+                        rejection_type=match["rejection_type"],
+                        rejection_reason=match["rejection_reason"],
+                    )
+                )
+    return rejections
+
+
+def parse_parameter_change_rejections(
+    logs_with_timestamp: dict[datetime, list[str]]
+) -> dict[datetime, list[str]]:
+    """
+    :param logs_with_timestamp: logs grouped by timestamp, as per `get_logs_with_timestamp`
+    :return: parameter change rejection reasons, followed by anything else in the log line,
+    grouped by timestamp
+    """
+    rejections: DefaultDict[datetime, list[str]] = defaultdict(list)
+    for timestamp, logs in logs_with_timestamp.items():
+        for log in logs:
+            _, prefix, reason = log.partition(PARAMETER_CHANGE_REJECTION_PREFIX)
+            if prefix:
+                rejections[timestamp].append(reason)
+    return rejections
+
+
+class SimulationResult(list):
+    """
+    The output from the simulation endpoint, with indexes for assertions. As this is a list of the
+    raw results, it can be used anywhere the raw output is expected. Each index is built in a
+    single pass over the results the first time it is used, so the results must not be modified
+    once indexes have been used
+    """
+
+    @cached_property
+    def timestamps(self) -> list[datetime]:
+        """
+        The parsed timestamp of each result
+        """
+        return [parser.parse(result["result"]["timestamp"]) for result in self]
+
+    @cached_property
+    def logs_with_timestamp(self) -> DefaultDict[datetime, list[str]]:
+        """
+        All logs grouped by timestamp
+        """
+        logs_with_timestamp: DefaultDict[datetime, list[str]] = defaultdict(list)
+        for timestamp, result in zip(self.timestamps, self):
+            if result["result"]["logs"]:
+                logs_with_timestamp[timestamp] += result["result"]["logs"]
+        return logs_with_timestamp
+
+    @cached_property
+    def processed_scheduled_events(self) -> dict[tuple[str, str, str], list[str]]:
+        """
+        (event id, account id, plan id) to the raw timestamps of the results in which the event
+        was processed. Only one of account id and plan id is populated
+        """
+        processed_scheduled_events: DefaultDict[tuple[str, str, str], list[str]] = defaultdict(list)
+        for result in self:
+            result_keys = set()
+            for log in result["result"]["logs"]:
+                match = PROCESSED_SCHEDULED_EVENT_PATTERN.fullmatch(log)
+                if not match:
+                    continue
+                if match["resource_type"] == "account":
+                    key = (match["event_id"], match["resource_id"], "")
+                else:
+                    key = (match["event_id"], "", match["resource_id"])
+                # an event is only reported once per result, regardless of duplicate logs
+                if key not in result_keys:
+                    result_keys.add(key)
+                    processed_scheduled_events[key].append(result["result"]["timestamp"])
+        return processed_scheduled_events
+
+    @cached_property
+    def posting_rejections(self) -> dict[datetime, list[PostingRejection]]:
+        return parse_posting_rejections(self.logs_with_timestamp)
+
+    @cached_property
+    def parameter_change_rejections(self) -> dict[datetime, list[str]]:
+        return parse_parameter_change_rejections(self.logs_with_timestamp)
+
+    @cached_property
+    def posting_instruction_batches_by_client_batch_id(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Posting instruction batches grouped by client batch id, in result order
+        """
+        pibs: DefaultDict[str, list[dict[str, Any]]] = defaultdict(list)
+        for result in self:
+            for pib in result["result"]["posting_instruction_batches"]:
+                pibs[pib["client_batch_id"]].append(pib)
+        return pibs
+
+    @cached_property
+    def committed_postings(self) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """
+        (account id, account address) to the committed postings, in result order
+        """
+        committed_postings: DefaultDict[tuple[str, str], list[dict[str, Any]]] = defaultdict(list)
+        for result in self:
+            for pib in result["result"]["posting_instruction_batches"]:
+                for posting_instruction in pib["posting_instructions"]:
+                    for posting in posting_instruction["committed_postings"]:
+                        committed_postings[
+                            (posting["account_id"], posting["account_address"])
+                        ].append(posting)
+        return committed_postings
+
+    @cached_property
+    def _posting_instructions_by_type(self) -> dict[str, DefaultDict[str, TimeSeries]]:
+        return {}
+
+    def get_posting_instructions_by_type(
+        self, instruction_type: str
+    ) -> DefaultDict[str, TimeSeries]:
+        """
+        :param instruction_type: the posting instruction type, e.g. outbound_hard_settlement
+        :return: target account id to a timeseries of the posting instructions of this type
+        """
+        if instruction_type not in self._posting_instructions_by_type:
+            # this stores target_account_id -> timestamp -> posting instruction records
+            posting_instructions: DefaultDict[
+                str, DefaultDict[datetime, list[dict[str, Any]]]
+            ] = defaultdict(lambda: defaultdict(list))
+            for timestamp, result in zip(self.timestamps, self):
+                for pib in result["result"]["posting_instruction_batches"]:
+                    for posting_instruction in pib["posting_instructions"]:
+                        if instruction_type not in posting_instruction:
+                            continue
+                        instruction = posting_instruction[instruction_type]
+                        posting_instructions[instruction["target_account_id"]][timestamp].append(
+                            instruction
+                        )
+
+            posting_instructions_timeseries: DefaultDict[str, TimeSeries] = defaultdict(
+                lambda: TimeSeries([])
+            )
+            for account_id, timeseries in posting_instructions.items():
+                posting_instructions_timeseries[account_id] = TimeSeries(
+                    list(timeseries.items()), return_on_empty={}
+                )
+            self._posting_instructions_by_type[instruction_type] = posting_instructions_timeseries
+
+        return self._posting_instructions_by_type[instruction_type]
+
+
+def as_simulation_result(res: list[dict[str, Any]]) -> SimulationResult:
+    """
+    :param res: output from simulation endpoint, which may already be a SimulationResult
+    :return: the output as a SimulationResult, so that its indexes are reused where possible
+    """
+    return res if isinstance(res, SimulationResult) else SimulationResult(res)
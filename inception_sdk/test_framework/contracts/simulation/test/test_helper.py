@@ -1,8 +1,16 @@
 # standard libs
+from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 
+from dateutil.relativedelta import relativedelta
+
 # inception sdk
 import inception_sdk.test_framework.contracts.simulation.helper as simulation_helper
+from inception_sdk.test_framework.contracts.simulation.vault_caller import _event_to_json
+from inception_sdk.vault.postings.posting_classes import CustomInstruction, Posting
+from inception_sdk.vault.postings.posting_patterns import PostingPattern, TransactionPattern
+
+START = datetime(2023, 1, 31, tzinfo=timezone.utc)
 
 
 class SimulationHelperTest(TestCase):
@@ -72,3 +80,117 @@ class SimulationHelperTest(TestCase):
                 self.assertDictEqual(
                     result.event, test_case["expected_event"], test_case["description"]
                 )
+
+
+class RepeatedPostingInstructionBatchesTest(TestCase):
+    @staticmethod
+    def _without_ids(event: dict) -> dict:
+        batch = event["create_posting_instruction_batch"]
+        return {
+            "create_posting_instruction_batch": {
+                **batch,
+                "client_batch_id": None,
+                "posting_instructions": [
+                    {**instruction, "client_transaction_id": None}
+                    for instruction in batch["posting_instructions"]
+                ],
+            }
+        }
+
+    def test_events_match_individually_created_events(self):
+        kwargs = {
+            "target_account_id": "Main account",
+            "internal_account_id": "1",
+            "denomination": "GBP",
+            "batch_details": {"key": "value"},
+        }
+
+        events = simulation_helper.create_repeated_outbound_hard_settlement_instructions(
+            "10", START, occurrences=3, **kwargs
+        )
+
+        self.assertListEqual(
+            [event.time for event in events], [START + timedelta(days=i) for i in range(3)]
+        )
+        for event in events:
+            expected = simulation_helper.create_outbound_hard_settlement_instruction(
+                "10", event.time, **kwargs
+            )
+            self.assertDictEqual(self._without_ids(event.event), self._without_ids(expected.event))
+
+    def test_ids_unique_per_occurrence_and_instruction(self):
+        postings = [
+            Posting(account_id="Main account", amount="1", credit=True),
+            Posting(account_id="1", amount="1", credit=False),
+        ]
+
+        events = simulation_helper.create_repeated_posting_instruction_batches(
+            [CustomInstruction(postings), CustomInstruction(postings)],
+            START,
+            occurrences=2,
+            client_batch_id_prefix="spend",
+        )
+
+        batches = [event.event["create_posting_instruction_batch"] for event in events]
+        self.assertListEqual(
+            [batch["client_batch_id"] for batch in batches], ["spend_0", "spend_1"]
+        )
+        self.assertListEqual(
+            [
+                instruction["client_transaction_id"]
+                for batch in batches
+                for instruction in batch["posting_instructions"]
+            ],
+            ["spend_0_0", "spend_0_1", "spend_1_0", "spend_1_1"],
+        )
+
+    def test_calendar_frequency(self):
+        events = simulation_helper.create_repeated_inbound_hard_settlement_instructions(
+            "1000", START, occurrences=3, frequency=relativedelta(months=1)
+        )
+
+        self.assertListEqual(
+            [event.time.date().isoformat() for event in events],
+            ["2023-01-31", "2023-02-28", "2023-03-31"],
+        )
+        self.assertEqual(
+            events[1].event["create_posting_instruction_batch"]["value_timestamp"],
+            "2023-02-28T00:00:00+00:00",
+        )
+
+    def test_events_serialised_with_timestamp(self):
+        event = simulation_helper.create_repeated_inbound_hard_settlement_instructions(
+            "1000", START, occurrences=1
+        )[0]
+
+        serialised = _event_to_json(event)
+
+        self.assertEqual(serialised.pop("timestamp"), START.astimezone().isoformat())
+        self.assertDictEqual(serialised, event.event)
+        self.assertFalse(hasattr(event, "__dict__"))
+
+
+class PostingPatternEventsTest(TestCase):
+    def test_events_created_lazily_from_pattern(self):
+        pattern = PostingPattern(
+            account_ids=["Main account"],
+            transactions_per_account=10,
+            start=START,
+            end=START + timedelta(days=30),
+            transactions=[TransactionPattern("outbound_hard_settlement", "10")],
+        )
+
+        events = simulation_helper.create_posting_pattern_events(pattern)
+
+        self.assertNotIsInstance(events, list)
+        events = list(events)
+        self.assertListEqual(
+            [event.time for event in events], [batch.timestamp for batch in pattern.generate()]
+        )
+        self.assertDictEqual(
+            _event_to_json(events[0]),
+            {
+                "timestamp": events[0].time.astimezone().isoformat(),
+                "create_posting_instruction_batch": next(pattern.generate()).pib,
+            },
+        )
@@ -0,0 +1,279 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+# TODO: we eval responses containing json statements. Should check why
+import json  # noqa: F401
+from decimal import Decimal  # noqa: F401
+from unittest import TestCase
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import HookBudget
+from inception_sdk.test_framework.contracts.simulation.hook_stats import (
+    CONTRACT_CLIENT_ID,
+    POST_POSTING_HOOK,
+    UNATTRIBUTED,
+    HookStats,
+    format_hook_stats_report,
+    get_hook_budget_violations,
+    get_hook_stats,
+    merge_hook_stats,
+)
+
+SUPERVISOR_RESPONSE_FILE = (
+    "inception_sdk/test_framework/contracts/simulation/test/sample_supervisor_response"
+)
+
+
+def _posting_instruction(account_ids: list[str], originating_account_id: str = "") -> dict:
+    return {
+        "instruction_details": (
+            {"originating_account_id": originating_account_id} if originating_account_id else {}
+        ),
+        "committed_postings": [{"account_id": account_id} for account_id in account_ids],
+    }
+
+
+def _pib(client_id: str, posting_instructions: list[dict]) -> dict:
+    return {"client_id": client_id, "posting_instructions": posting_instructions}
+
+
+def _result(timestamp: str, logs: list[str] | None = None, pibs: list[dict] | None = None) -> dict:
+    return {
+        "result": {
+            "timestamp": timestamp,
+            "logs": logs or [],
+            "posting_instruction_batches": pibs or [],
+        }
+    }
+
+
+def _processed(event_type: str, account_id: str) -> str:
+    return f'processed scheduled event "{event_type}" for account "{account_id}"'
+
+
+class GetHookStatsTest(TestCase):
+    def test_scheduled_event_batches_attributed_to_event(self):
+        res = [
+            _result("2023-01-01T00:00:00Z", logs=[_processed("ACCRUE_INTEREST", "account_1")]),
+            _result(
+                "2023-01-01T00:00:00Z",
+                pibs=[
+                    _pib(
+                        CONTRACT_CLIENT_ID,
+                        [
+                            _posting_instruction(["account_1", "internal"], "account_1"),
+                            _posting_instruction(["account_1", "internal"], "account_1"),
+                        ],
+                    ),
+                    _pib(
+                        CONTRACT_CLIENT_ID,
+                        [_posting_instruction(["account_1", "internal"], "account_1")],
+                    ),
+                ],
+            ),
+            _result("2023-01-02T00:00:00Z", logs=[_processed("ACCRUE_INTEREST", "account_1")]),
+            _result(
+                "2023-01-02T00:00:00Z",
+                pibs=[
+                    _pib(
+                        CONTRACT_CLIENT_ID,
+                        [_posting_instruction(["account_1", "internal"], "account_1")],
+                    ),
+                ],
+            ),
+        ]
+
+        hook_stats = get_hook_stats(res)
+
+        self.assertDictEqual(
+            hook_stats,
+            {
+                ("account_1", "ACCRUE_INTEREST"): HookStats(
+                    hook="ACCRUE_INTEREST",
+                    executions=2,
+                    posting_instruction_batches=3,
+                    posting_instructions=4,
+                    postings=8,
+                    max_posting_instructions_per_batch=2,
+                    max_postings_per_execution=6,
+                    max_batches_per_timestamp=2,
+                    max_batches_per_day=2,
+                )
+            },
+        )
+
+    def test_client_batches_count_as_post_posting_executions(self):
+        res = [
+            _result(
+                "2023-01-01T10:00:00Z",
+                pibs=[
+                    _pib(
+                        "AsyncCreatePostingInstructionBatch",
+                        [_posting_instruction(["account_1", "internal"])],
+                    )
+                ],
+            ),
+            _result(
+                "2023-01-01T10:00:00Z",
+                pibs=[_pib(CONTRACT_CLIENT_ID, [_posting_instruction(["account_1", "internal"])])],
+            ),
+        ]
+
+        hook_stats = get_hook_stats(res, internal_account_ids=["internal"])
+
+        self.assertListEqual(list(hook_stats), [("account_1", POST_POSTING_HOOK)])
+        self.assertEqual(hook_stats[("account_1", POST_POSTING_HOOK)].executions, 1)
+        self.assertEqual(hook_stats[("account_1", POST_POSTING_HOOK)].postings, 2)
+
+    def test_batches_attributed_to_originating_account_execution(self):
+        res = [
+            _result(
+                "2023-01-01T00:00:00Z",
+                logs=[
+                    _processed("ACCRUE_INTEREST", "account_1"),
+                    _processed("ACCRUE_INTEREST", "account_2"),
+                ],
+            ),
+            _result(
+                "2023-01-01T00:00:00Z",
+                pibs=[_pib(CONTRACT_CLIENT_ID, [_posting_instruction(["account_1"], "account_1")])],
+            ),
+        ]
+
+        hook_stats = get_hook_stats(res)
+
+        self.assertEqual(hook_stats[("account_1", "ACCRUE_INTEREST")].posting_instructions, 1)
+        self.assertEqual(hook_stats[("account_2", "ACCRUE_INTEREST")].posting_instructions, 0)
+
+    def test_batches_without_execution_at_timestamp_are_unattributed(self):
+        res = [
+            _result("2023-01-01T00:00:00Z", logs=[_processed("ACCRUE_INTEREST", "account_1")]),
+            _result(
+                "2023-01-01T00:01:00Z",
+                pibs=[_pib(CONTRACT_CLIENT_ID, [_posting_instruction(["account_1"], "account_1")])],
+            ),
+        ]
+
+        hook_stats = get_hook_stats(res)
+
+        self.assertEqual(hook_stats[("account_1", "ACCRUE_INTEREST")].posting_instructions, 0)
+        self.assertEqual(hook_stats[("account_1", UNATTRIBUTED)].posting_instructions, 1)
+
+    def test_supervisor_response(self):
+        with open(SUPERVISOR_RESPONSE_FILE, "r", encoding="utf-8") as simulator_response_file:
+            res = eval(simulator_response_file.read())
+
+        hook_stats = get_hook_stats(res, internal_account_ids=["1"])
+
+        self.assertEqual(
+            hook_stats[("Savings Account", "ACCRUE_INTEREST")],
+            HookStats(
+                hook="ACCRUE_INTEREST",
+                executions=62,
+                posting_instruction_batches=51,
+                posting_instructions=51,
+                postings=102,
+                max_posting_instructions_per_batch=1,
+                max_postings_per_execution=2,
+                max_batches_per_timestamp=1,
+                max_batches_per_day=1,
+            ),
+        )
+        self.assertEqual(hook_stats[("1", "APPLY_MAINTENANCE_FEE")].executions, 50)
+
+
+class HookBudgetTest(TestCase):
+    hook_stats = {
+        ("account_1", "ACCRUE_INTEREST"): HookStats(
+            hook="ACCRUE_INTEREST", executions=2, max_batches_per_day=3
+        ),
+        ("account_2", "ACCRUE_INTEREST"): HookStats(
+            hook="ACCRUE_INTEREST", executions=2, max_batches_per_day=1
+        ),
+        ("account_1", POST_POSTING_HOOK): HookStats(
+            hook=POST_POSTING_HOOK, executions=5, max_postings_per_execution=4
+        ),
+    }
+
+    def test_budgets_within_limits(self):
+        budgets = [
+            HookBudget(hook="ACCRUE_INTEREST", max_executions=2, max_batches_per_day=3),
+            HookBudget(hook=POST_POSTING_HOOK, max_postings_per_execution=4),
+        ]
+
+        self.assertListEqual(get_hook_budget_violations(budgets, self.hook_stats), [])
+
+    def test_budgets_exceeded(self):
+        budgets = [
+            HookBudget(hook="ACCRUE_INTEREST", max_batches_per_day=2),
+            HookBudget(hook=POST_POSTING_HOOK, max_executions=4),
+        ]
+
+        self.assertListEqual(
+            get_hook_budget_violations(budgets, self.hook_stats),
+            [
+                "ACCRUE_INTEREST on account_1: max_batches_per_day is 3, exceeding budget of 2",
+                "post_posting_hook on account_1: executions is 5, exceeding budget of 4",
+            ],
+        )
+
+    def test_budget_for_account(self):
+        budgets = [HookBudget(hook="ACCRUE_INTEREST", account_id="account_2", max_executions=1)]
+
+        self.assertListEqual(
+            get_hook_budget_violations(budgets, self.hook_stats),
+            ["ACCRUE_INTEREST on account_2: executions is 2, exceeding budget of 1"],
+        )
+
+
+class HookStatsReportTest(TestCase):
+    def test_merge_hook_stats(self):
+        product_hook_stats: dict[str, HookStats] = {}
+
+        merge_hook_stats(
+            {
+                ("account_1", "ACCRUE_INTEREST"): HookStats(
+                    hook="ACCRUE_INTEREST", executions=2, postings=4, max_batches_per_day=1
+                ),
+                ("account_2", "ACCRUE_INTEREST"): HookStats(
+                    hook="ACCRUE_INTEREST", executions=3, postings=2, max_batches_per_day=2
+                ),
+            },
+            product_hook_stats,
+        )
+
+        self.assertDictEqual(
+            product_hook_stats,
+            {
+                "ACCRUE_INTEREST": HookStats(
+                    hook="ACCRUE_INTEREST", executions=5, postings=6, max_batches_per_day=2
+                )
+            },
+        )
+
+    def test_format_hook_stats_report(self):
+        report = format_hook_stats_report(
+            {
+                "loan": {
+                    "ACCRUE_INTEREST": HookStats(
+                        hook="ACCRUE_INTEREST",
+                        executions=10,
+                        posting_instruction_batches=10,
+                        posting_instructions=20,
+                        postings=40,
+                        max_posting_instructions_per_batch=2,
+                        max_postings_per_execution=4,
+                        max_batches_per_timestamp=1,
+                        max_batches_per_day=1,
+                    )
+                }
+            }
+        )
+
+        self.assertEqual(
+            report,
+            "Hook stats for loan:\n"
+            "  hook            execs batches instrs postings max instrs/batch max postings/exec "
+            "max batches/ts max batches/day\n"
+            "  ACCRUE_INTEREST    10      10     20       40                2                 4 "
+            "             1               1",
+        )
@@ -0,0 +1,276 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest import TestCase
+
+# inception sdk
+from inception_sdk.test_framework.common.balance_helpers import Balance, BalanceDimensions
+from inception_sdk.test_framework.common.timeseries import TimeSeries
+from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects import (
+    AccountConfig,
+    ContractConfig,
+    SimulationTestScenario,
+    SubTest,
+    SupervisorConfig,
+)
+from inception_sdk.test_framework.contracts.simulation.helper import (
+    create_account_instruction,
+    create_flag_definition_event,
+    create_flag_event,
+    create_inbound_hard_settlement_instruction,
+    create_instance_parameter_change_event,
+    create_template_parameter_change_event,
+    update_account_status_pending_closure,
+)
+from inception_sdk.test_framework.contracts.simulation.sharding import (
+    CHECKPOINT_ACCOUNT_ID,
+    CHECKPOINT_CLIENT_BATCH_ID,
+    CHECKPOINT_OFFSET,
+    get_checkpoint_events,
+    split_test_scenario,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+END = datetime(2023, 12, 31, tzinfo=timezone.utc)
+
+
+def _get_scenario(sub_tests: list[SubTest], **kwargs) -> SimulationTestScenario:
+    return SimulationTestScenario(
+        sub_tests=sub_tests,
+        start=START,
+        end=END,
+        contract_config=ContractConfig(
+            contract_content="contract",
+            template_params={"fee": "1"},
+            account_configs=[AccountConfig(instance_params={"day": "1"})],
+        ),
+        **kwargs,
+    )
+
+
+class SplitTestScenarioTest(TestCase):
+    def test_split_at_sub_test_boundaries(self):
+        sub_tests = [
+            SubTest(
+                description="deposit",
+                events=[
+                    create_inbound_hard_settlement_instruction("100", START + timedelta(days=1))
+                ],
+            ),
+            SubTest(
+                description="check balances",
+                expected_balances_at_ts={START + timedelta(days=40): {}},
+            ),
+            SubTest(
+                description="withdraw",
+                events=[
+                    create_inbound_hard_settlement_instruction("10", START + timedelta(days=50))
+                ],
+            ),
+        ]
+
+        segments = split_test_scenario(_get_scenario(sub_tests), sub_tests_per_segment=1)
+
+        self.assertEqual(len(segments), 3)
+        self.assertListEqual(
+            [segment.boundary for segment in segments],
+            [START, START + timedelta(days=40), START + timedelta(days=50)],
+        )
+        self.assertEqual(segments[0].test_scenario.start, START)
+        self.assertEqual(
+            segments[0].test_scenario.end, START + timedelta(days=40) - 2 * CHECKPOINT_OFFSET
+        )
+        self.assertEqual(
+            segments[1].test_scenario.start, START + timedelta(days=40) - 2 * CHECKPOINT_OFFSET
+        )
+        self.assertEqual(segments[2].test_scenario.end, END)
+        self.assertEqual(segments[1].description.split(" (")[0], "segment 2 of 3")
+        self.assertListEqual(
+            [sub_test.description for sub_test in segments[1].test_scenario.sub_tests],
+            ["check balances"],
+        )
+        self.assertIn(CHECKPOINT_ACCOUNT_ID, segments[1].test_scenario.internal_accounts)
+        self.assertIsNone(segments[0].test_scenario.internal_accounts)
+
+    def test_sub_tests_per_segment(self):
+        sub_tests = [
+            SubTest(
+                description=f"deposit {i}",
+                events=[create_inbound_hard_settlement_instruction("1", START + timedelta(days=i))],
+            )
+            for i in range(1, 6)
+        ]
+
+        segments = split_test_scenario(_get_scenario(sub_tests), sub_tests_per_segment=2)
+
+        self.assertListEqual(
+            [len(segment.test_scenario.sub_tests) for segment in segments], [2, 2, 1]
+        )
+
+    def test_sub_tests_without_timestamps_kept_with_previous_segment(self):
+        sub_tests = [
+            SubTest(
+                description="deposit",
+                events=[create_inbound_hard_settlement_instruction("1", START + timedelta(days=1))],
+            ),
+            SubTest(description="nothing"),
+        ]
+
+        segments = split_test_scenario(_get_scenario(sub_tests))
+
+        self.assertEqual(len(segments), 1)
+        self.assertEqual(len(segments[0].test_scenario.sub_tests), 2)
+
+    def test_parameters_and_flags_carried_forward(self):
+        sub_tests = [
+            SubTest(
+                description="changes",
+                events=[
+                    create_instance_parameter_change_event(
+                        START + timedelta(days=1), "Main account", day="5"
+                    ),
+                    create_template_parameter_change_event(START + timedelta(days=1), fee="2"),
+                    create_flag_definition_event(START + timedelta(days=1), "DORMANT"),
+                    create_flag_event(START + timedelta(days=1), "DORMANT", "Main account"),
+                    create_flag_event(
+                        START + timedelta(days=1),
+                        "DORMANT",
+                        "Main account",
+                        expiry_timestamp=START + timedelta(days=2),
+                    ),
+                    create_account_instruction(
+                        START + timedelta(days=1), "Other account", "0", instance_param_vals={}
+                    ),
+                    create_instance_parameter_change_event(
+                        START + timedelta(days=2), "Other account", day="10"
+                    ),
+                ],
+            ),
+            SubTest(
+                description="later",
+                events=[
+                    create_inbound_hard_settlement_instruction("1", START + timedelta(days=10))
+                ],
+            ),
+        ]
+
+        segment = split_test_scenario(_get_scenario(sub_tests))[1]
+        segment_start = START + timedelta(days=10) - 2 * CHECKPOINT_OFFSET
+
+        contract_config = segment.test_scenario.contract_config
+        self.assertDictEqual(contract_config.template_params, {"fee": "2"})
+        self.assertDictEqual(contract_config.account_configs[0].instance_params, {"day": "5"})
+        setup_sub_test = segment.test_scenario.sub_tests[0]
+        self.assertTrue(all(event.time == segment_start for event in setup_sub_test.events))
+        self.assertListEqual(
+            [next(iter(event.event)) for event in setup_sub_test.events],
+            ["create_flag_definition", "create_account", "create_flag"],
+        )
+        self.assertDictEqual(
+            setup_sub_test.events[1].event["create_account"]["instance_param_vals"], {"day": "10"}
+        )
+        # the original scenario is unchanged
+        self.assertDictEqual(
+            sub_tests[0].events[5].event["create_account"]["instance_param_vals"], {}
+        )
+
+    def test_uncarried_events_logged(self):
+        sub_tests = [
+            SubTest(
+                description="close",
+                events=[
+                    update_account_status_pending_closure(START + timedelta(days=1), "Main account")
+                ],
+            ),
+            SubTest(
+                description="later",
+                events=[
+                    create_inbound_hard_settlement_instruction("1", START + timedelta(days=10))
+                ],
+            ),
+        ]
+
+        with self.assertLogs(level="WARNING") as logs:
+            split_test_scenario(_get_scenario(sub_tests))
+
+        self.assertIn("update_account", logs.output[0])
+
+    def test_overlapping_sub_tests_rejected(self):
+        sub_tests = [
+            SubTest(
+                description="check balances",
+                expected_balances_at_ts={START + timedelta(days=10): {}},
+            ),
+            SubTest(
+                description="deposit",
+                events=[create_inbound_hard_settlement_instruction("1", START + timedelta(days=5))],
+            ),
+        ]
+
+        with self.assertRaisesRegex(ValueError, 'Sub-test "deposit" starts at'):
+            split_test_scenario(_get_scenario(sub_tests))
+
+    def test_supervisor_scenario_rejected(self):
+        scenario = SimulationTestScenario(
+            sub_tests=[],
+            start=START,
+            end=END,
+            supervisor_config=SupervisorConfig(
+                supervisor_contract="supervisor", supervisee_contracts=[]
+            ),
+        )
+
+        with self.assertRaisesRegex(ValueError, "Only contract scenarios"):
+            split_test_scenario(scenario)
+
+
+class GetCheckpointEventsTest(TestCase):
+    def test_checkpoint_postings_preserve_credits_and_debits(self):
+        balances = defaultdict(lambda: TimeSeries([]))
+        balances["Main account"] = TimeSeries(
+            [
+                (
+                    START,
+                    {
+                        BalanceDimensions(address="DEFAULT"): Balance(
+                            credit=Decimal("100"), debit=Decimal("30"), net=Decimal("70")
+                        ),
+                        BalanceDimensions(address="EMPTY"): Balance(),
+                        BalanceDimensions(
+                            address="DEFAULT", phase="POSTING_PHASE_PENDING_OUTGOING"
+                        ): Balance(debit=Decimal("5"), net=Decimal("-5")),
+                    },
+                )
+            ]
+        )
+        balances[CHECKPOINT_ACCOUNT_ID] = TimeSeries(
+            [(START, {BalanceDimensions(): Balance(credit=Decimal("1"), net=Decimal("1"))})]
+        )
+
+        with self.assertLogs(level="WARNING") as logs:
+            events = get_checkpoint_events(balances, START)
+
+        self.assertIn("POSTING_PHASE_PENDING_OUTGOING", logs.output[0])
+        self.assertEqual(len(events), 1)
+        pib = events[0].event["create_posting_instruction_batch"]
+        self.assertEqual(pib["client_batch_id"], CHECKPOINT_CLIENT_BATCH_ID)
+        self.assertEqual(len(pib["posting_instructions"]), 1)
+        instruction = pib["posting_instructions"][0]
+        self.assertEqual(instruction["instruction_details"]["force_override"], "true")
+        self.assertListEqual(
+            [
+                (posting["account_id"], posting["amount"], posting["credit"])
+                for posting in instruction["custom_instruction"]["postings"]
+            ],
+            [
+                ("Main account", "100", True),
+                (CHECKPOINT_ACCOUNT_ID, "100", False),
+                ("Main account", "30", False),
+                (CHECKPOINT_ACCOUNT_ID, "30", True),
+            ],
+        )
+
+    def test_no_checkpoint_events_without_balances(self):
+        self.assertListEqual(get_checkpoint_events({}, START), [])
@@ -0,0 +1,127 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+# TODO: we eval responses containing json statements. Should check why
+import json  # noqa: F401
+from datetime import datetime, timezone
+from decimal import Decimal  # noqa: F401
+from unittest import TestCase
+from unittest.mock import patch
+
+# inception sdk
+from inception_sdk.test_framework.contracts.simulation import simulation_result
+from inception_sdk.test_framework.contracts.simulation.simulation_result import (
+    PostingRejection,
+    SimulationResult,
+    as_simulation_result,
+    parse_parameter_change_rejections,
+    parse_posting_rejections,
+)
+
+SIMULATOR_RESPONSE_FILE = (
+    "inception_sdk/test_framework/contracts/simulation/test/sample_simulator_response"
+)
+
+
+class SimulationResultTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(SIMULATOR_RESPONSE_FILE, "r", encoding="utf-8") as simulator_response_file:
+            cls.sample_res = eval(simulator_response_file.read())
+
+    def setUp(self):
+        self.res = SimulationResult(self.sample_res)
+
+    def test_simulation_result_is_raw_output(self):
+        self.assertListEqual(self.res, self.sample_res)
+        self.assertIs(as_simulation_result(self.res), self.res)
+        self.assertIsInstance(as_simulation_result(self.sample_res), SimulationResult)
+
+    def test_timestamps_parsed_once(self):
+        with patch.object(simulation_result.parser, "parse") as mock_parse:
+            self.res.timestamps
+            self.res.logs_with_timestamp
+            self.res.get_posting_instructions_by_type("release")
+
+        self.assertEqual(mock_parse.call_count, len(self.sample_res))
+
+    def test_processed_scheduled_events(self):
+        processed_scheduled_events = self.res.processed_scheduled_events
+
+        self.assertEqual(len(processed_scheduled_events[("ACCRUE_INTEREST", "1", "")]), 61)
+        self.assertListEqual(
+            processed_scheduled_events[("APPLY_ACCRUED_INTEREST", "Main account", "")],
+            ["2019-01-01T00:01:00Z", "2019-02-01T00:01:00Z", "2019-03-01T00:01:00Z"],
+        )
+
+    def test_posting_rejections(self):
+        self.assertListEqual(
+            self.res.posting_rejections[datetime(2019, 1, 21, tzinfo=timezone.utc)],
+            [
+                PostingRejection(
+                    account_id="Main account",
+                    rejection_type="WrongDenomination",
+                    rejection_reason="Cannot make transactions in given denomination; "
+                    'transactions must be in GBP"',
+                )
+            ],
+        )
+
+    def test_posting_instruction_batches_by_client_batch_id(self):
+        pibs = self.res.posting_instruction_batches_by_client_batch_id["123"]
+
+        self.assertEqual(len(pibs), 1)
+        self.assertEqual(pibs[0]["id"], "564c3bcc-7825-42b2-96e4-e94df6a97a80")
+
+    def test_committed_postings(self):
+        postings = self.res.committed_postings[("Main account", "DEFAULT")]
+
+        self.assertEqual(len(postings), 4)
+        self.assertTrue(all(posting["account_id"] == "Main account" for posting in postings))
+
+    def test_posting_instructions_by_type_cached(self):
+        self.assertIs(
+            self.res.get_posting_instructions_by_type("release"),
+            self.res.get_posting_instructions_by_type("release"),
+        )
+
+
+class ParseRejectionsTest(TestCase):
+    def test_parse_posting_rejections(self):
+        timestamp = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+        rejections = parse_posting_rejections(
+            {
+                timestamp: [
+                    'rejected posting instruction batch "id"',
+                    'account "account_1" rejected with rejection type "InsufficientFunds" and '
+                    'reason "Insufficient funds"',
+                ]
+            }
+        )
+
+        self.assertDictEqual(
+            rejections,
+            {
+                timestamp: [
+                    PostingRejection(
+                        account_id="account_1",
+                        rejection_type="InsufficientFunds",
+                        rejection_reason='Insufficient funds"',
+                    )
+                ]
+            },
+        )
+
+    def test_parse_parameter_change_rejections(self):
+        timestamp = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+        rejections = parse_parameter_change_rejections(
+            {
+                timestamp: [
+                    'set account parameter "interest_payment_day" value to "1"',
+                    "account parameters update rejected: Invalid day",
+                ]
+            }
+        )
+
+        self.assertDictEqual(rejections, {timestamp: ["Invalid day"]})
@@ -20,11 +20,21 @@ from inception_sdk.test_framework.contracts.simulation.data_objects.data_objects
     ContractNotificationResourceType,
     ExpectedContractNotification,
     ExpectedRejection,
+    ExpectedSchedule,
+    HookBudget,
     SimulationTestScenario,
     SubTest,
     SuperviseeConfig,
     SupervisorConfig,
 )
+from inception_sdk.test_framework.contracts.simulation.helper import (
+    create_inbound_hard_settlement_instruction,
+)
+from inception_sdk.test_framework.contracts.simulation.sharding import (
+    CHECKPOINT_ACCOUNT_ID,
+    CHECKPOINT_CLIENT_BATCH_ID,
+)
+from inception_sdk.test_framework.contracts.simulation.simulation_result import SimulationResult
 from inception_sdk.test_framework.contracts.simulation.utils import (
     SimulationTestCase,
     create_supervisor_config,
@@ -41,6 +51,7 @@ from inception_sdk.test_framework.contracts.simulation.utils import (
     get_plan_created,
     get_plan_logs,
     get_posting_instruction_batch,
+    get_posting_instruction_batches_by_client_batch_id,
     get_postings,
     get_processed_scheduled_events,
     print_json,
@@ -550,6 +561,59 @@ class UtilsTest(SimulationTestCase):
             str(ctx.exception),
         )
 
+    def test_check_posting_rejections_with_simulation_result(self):
+        self.assertIsNone(
+            self.check_posting_rejections(
+                expected_rejections=[
+                    ExpectedRejection(
+                        timestamp=datetime(2019, 1, 21, tzinfo=timezone.utc),
+                        rejection_type="WrongDenomination",
+                        rejection_reason="Cannot make transactions in given denomination",
+                    )
+                ],
+                logs_with_timestamp=SimulationResult(self.sample_res),
+            )
+        )
+
+    def test_check_posting_rejections_with_logs_no_match(self):
+        test_rejection = ExpectedRejection(
+            timestamp=datetime(2019, 1, 21, tzinfo=timezone.utc),
+            rejection_type="InsufficientFunds",
+            rejection_reason="Cannot make transactions in given denomination",
+        )
+        with self.assertRaises(AssertionError) as ctx:
+            self.check_posting_rejections(
+                expected_rejections=[test_rejection],
+                logs_with_timestamp=get_logs_with_timestamp(self.sample_res),
+            )
+        self.assertEqual(ctx.exception.args[0], f"expected values not found: {[test_rejection]}")
+
+    def test_check_schedule_processed(self):
+        expected_schedule = ExpectedSchedule(
+            run_times=[
+                datetime(2019, 1, 1, 0, 1, tzinfo=timezone.utc),
+                datetime(2019, 2, 1, 0, 1, tzinfo=timezone.utc),
+                datetime(2019, 2, 2, 0, 1, tzinfo=timezone.utc),
+            ],
+            event_id="APPLY_ACCRUED_INTEREST",
+            account_id="Main account",
+        )
+        with self.assertRaises(AssertionError) as ctx:
+            self.check_schedule_processed([expected_schedule], self.sample_res)
+        self.assertEqual(
+            ctx.exception.args[0],
+            f"expected values not found: {[datetime(2019, 2, 2, 0, 1, tzinfo=timezone.utc)]}",
+        )
+
+    def test_get_posting_instruction_batches_by_client_batch_id(self):
+        pibs = get_posting_instruction_batches_by_client_batch_id(self.sample_res, "1232")
+
+        self.assertEqual(len(pibs), 1)
+        self.assertEqual(pibs[0]["client_batch_id"], "1232")
+        self.assertListEqual(
+            get_posting_instruction_batches_by_client_batch_id(self.sample_res, "unknown"), []
+        )
+
     def test_check_parameter_change_rejections_match(self):
         self.assertIsNone(
             self.check_parameter_change_rejections(
@@ -707,6 +771,99 @@ class UtilsTest(SimulationTestCase):
             debug=False,
         )
 
+    @mock.patch.object(utils, "compile_chrono_events")
+    @mock.patch.object(utils, "load_file_contents")
+    def test_run_test_scenario_hook_budgets(
+        self, load_file_contents_mock, compile_chrono_events_mock
+    ):
+        compile_chrono_events_mock.return_value = [], []
+        load_file_contents_mock.side_effect = lambda x: x + "_contents"
+        scenario = SimulationTestScenario(
+            sub_tests=[],
+            start=datetime(2019, 1, 1, tzinfo=timezone.utc),
+            end=datetime(2019, 3, 1, tzinfo=timezone.utc),
+            contract_config=ContractConfig(
+                contract_file_path="contract_file_1",
+                template_params={},
+                account_configs=[AccountConfig(instance_params={})],
+            ),
+            hook_budgets=[HookBudget(hook="ACCRUE_INTEREST", max_executions=61)],
+        )
+
+        with mock.patch.object(self, "client") as client_mock:
+            client_mock.simulate_smart_contract.return_value = self.sample_res
+            with self.assertRaises(AssertionError) as ctx:
+                self.run_test_scenario(scenario)
+
+        self.assertEqual(
+            ctx.exception.args[0],
+            "hook budgets exceeded: ['ACCRUE_INTEREST on Main account: executions is 62, "
+            "exceeding budget of 61']",
+        )
+        self.assertEqual(
+            self.suite_hook_stats[self.get_product_name()]["ACCRUE_INTEREST"].executions, 123
+        )
+
+    @mock.patch.object(utils, "load_file_contents")
+    def test_run_sharded_test_scenario(self, load_file_contents_mock):
+        load_file_contents_mock.side_effect = lambda x: x + "_contents"
+        scenario = SimulationTestScenario(
+            sub_tests=[
+                SubTest(
+                    description="deposit",
+                    events=[
+                        create_inbound_hard_settlement_instruction(
+                            "100", datetime(2019, 1, 2, tzinfo=timezone.utc)
+                        )
+                    ],
+                ),
+                SubTest(
+                    description="check balances",
+                    expected_balances_at_ts={
+                        datetime(2019, 2, 1, tzinfo=timezone.utc): {
+                            "Main account": [(BalanceDimensions(), "-1")]
+                        }
+                    },
+                ),
+            ],
+            start=datetime(2019, 1, 1, tzinfo=timezone.utc),
+            end=datetime(2019, 3, 1, tzinfo=timezone.utc),
+            contract_config=ContractConfig(
+                contract_file_path="contract_file_1",
+                template_params={},
+                account_configs=[AccountConfig(instance_params={})],
+            ),
+        )
+
+        # the suite hook stats are patched so that other tests' stats are unaffected
+        with mock.patch.object(self, "client") as client_mock, mock.patch.object(
+            self, "suite_hook_stats", {}
+        ):
+            client_mock.simulate_smart_contract.return_value = self.sample_res
+            with self.assertRaises(AssertionError) as ctx:
+                self.run_sharded_test_scenario(scenario)
+
+        self.assertTrue(
+            ctx.exception.args[0].startswith(
+                "segment 2 of 2 (2019-01-31 23:59:58+00:00 to 2019-03-01 00:00:00+00:00): "
+                "check balances"
+            )
+        )
+        self.assertEqual(client_mock.simulate_smart_contract.call_count, 2)
+        first_call, second_call = client_mock.simulate_smart_contract.call_args_list
+        self.assertEqual(
+            first_call.kwargs["end_timestamp"],
+            datetime(2019, 1, 31, 23, 59, 58, tzinfo=timezone.utc),
+        )
+        self.assertIn(CHECKPOINT_ACCOUNT_ID, second_call.kwargs["internal_account_ids"])
+        # the second segment starts with the balances at the end of the first
+        self.assertEqual(
+            second_call.kwargs["events"][1].event["create_posting_instruction_batch"][
+                "client_batch_id"
+            ],
+            CHECKPOINT_CLIENT_BATCH_ID,
+        )
+
     @mock.patch.object(utils, "compile_chrono_events")
     @mock.patch.object(utils, "load_file_contents")
     def test_run_test_scenario_error_expectation(
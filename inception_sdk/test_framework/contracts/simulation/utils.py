@@ -6,6 +6,7 @@ import logging
 import os
 from collections import defaultdict
 from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime, timezone
 from dateutil import parser
 from decimal import Decimal
@@ -52,6 +53,20 @@ from inception_sdk.test_framework.contracts.simulation.helper import (
     get_contract_setup_events,
     get_supervisor_setup_events,
 )
+from inception_sdk.test_framework.contracts.simulation.hook_stats import (
+    HookStats,
+    format_hook_stats_report,
+    get_hook_budget_violations,
+    get_hook_stats,
+    merge_hook_stats,
+)
+from inception_sdk.test_framework.contracts.simulation.sharding import split_test_scenario
+from inception_sdk.test_framework.contracts.simulation.simulation_result import (
+    SimulationResult,
+    as_simulation_result,
+    parse_parameter_change_rejections,
+    parse_posting_rejections,
+)
 from inception_sdk.tools.renderer.render_utils import is_file_renderable
 from inception_sdk.tools.renderer.renderer import RendererConfig, SmartContractRenderer
 
@@ -94,6 +109,11 @@ class SimulationTestCase(TestCase):
     default_template_params = None
     internal_accounts = None
     smart_contract_path_to_content: dict[str, str] = {}
+    # name used to aggregate hook stats across test classes. Defaults to the name of the first
+    # contract file, or the test class name if there are none
+    product_name: str = ""
+    # product name to hook to the hook stats aggregated across all scenarios run in the suite
+    suite_hook_stats: dict[str, dict[str, HookStats]] = {}
 
     @classmethod
     def load_contract_from_file(cls):
@@ -164,6 +184,20 @@ class SimulationTestCase(TestCase):
 
         cls.load_output_data()
 
+    @classmethod
+    def tearDownClass(cls):
+        product_name = cls.get_product_name()
+        if product_name in cls.suite_hook_stats:
+            log.info(format_hook_stats_report({product_name: cls.suite_hook_stats[product_name]}))
+
+    @classmethod
+    def get_product_name(cls) -> str:
+        if cls.product_name:
+            return cls.product_name
+        if cls.contract_filepaths:
+            return Path(cls.contract_filepaths[0]).stem
+        return cls.__name__
+
     def setUp(self):
         self._started_at = time()
 
@@ -329,18 +363,34 @@ class SimulationTestCase(TestCase):
     def check_posting_rejections(
         self,
         expected_rejections: list[ExpectedRejection],
-        logs_with_timestamp: dict,
+        logs_with_timestamp: dict | SimulationResult,
         description: str = "",
     ) -> None:
+        """
+        Validates that all expected posting rejections are present in the log of the response to
+        the simulate API
+
+        :param expected_rejections: rejections that should be generated during the simulation
+        :param logs_with_timestamp: the SimulationResult, or logs grouped by timestamp as per
+        `get_logs_with_timestamp`
+        :param description: description of the subtest used to identify the subtest in case the
+        assertion fails
+        """
+
         def get_missing_rejections(expected_rejections, logs_with_timestamp):
+            posting_rejections = (
+                logs_with_timestamp.posting_rejections
+                if isinstance(logs_with_timestamp, SimulationResult)
+                else parse_posting_rejections(logs_with_timestamp)
+            )
             return [
                 expected_rejection
                 for expected_rejection in expected_rejections
                 if not any(
-                    f'account "{expected_rejection.account_id}" rejected with '
-                    f'rejection type "{expected_rejection.rejection_type}" and '
-                    f'reason "{expected_rejection.rejection_reason}' in log
-                    for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
+                    rejection.account_id == expected_rejection.account_id
+                    and rejection.rejection_type == expected_rejection.rejection_type
+                    and rejection.rejection_reason.startswith(expected_rejection.rejection_reason)
+                    for rejection in posting_rejections.get(expected_rejection.timestamp, [])
                 )
             ]
 
@@ -354,7 +404,7 @@ class SimulationTestCase(TestCase):
     def check_parameter_change_rejections(
         self,
         expected_rejections: list[ExpectedRejection],
-        logs_with_timestamp: dict,
+        logs_with_timestamp: dict | SimulationResult,
         description: str = "",
     ) -> None:
         """
@@ -362,19 +412,26 @@ class SimulationTestCase(TestCase):
         response to the simulate API
 
         :param expected_rejections: rejections that should be generated during the simulation
-        :param logs_with_timestamp: logs retrieved from the result of calling the API
+        :param logs_with_timestamp: the SimulationResult, or logs grouped by timestamp as per
+        `get_logs_with_timestamp`
         :param description: description of the subtest used to identify the subtest in case the
         assertion fails
         """
 
         def get_missing_rejections(expected_rejections, logs_with_timestamp):
+            parameter_change_rejections = (
+                logs_with_timestamp.parameter_change_rejections
+                if isinstance(logs_with_timestamp, SimulationResult)
+                else parse_parameter_change_rejections(logs_with_timestamp)
+            )
             return [
                 expected_rejection
                 for expected_rejection in expected_rejections
                 if not any(
-                    f"account parameters update rejected: {expected_rejection.rejection_reason}"
-                    in log
-                    for log in logs_with_timestamp.get(expected_rejection.timestamp, [])
+                    rejection_reason.startswith(expected_rejection.rejection_reason)
+                    for rejection_reason in parameter_change_rejections.get(
+                        expected_rejection.timestamp, []
+                    )
                 )
             ]
 
@@ -483,19 +540,25 @@ class SimulationTestCase(TestCase):
                 if expected_schedule.count is not None:
                     self.assertEqual(expected_schedule.count, len(processed_schedules), description)
 
+                processed_schedule_set = set(processed_schedules)
                 missing_schedule_runs.extend(
                     (
                         expected_schedule_run
                         for expected_schedule_run in expected_schedule.run_times
                         if (
                             expected_schedule_run.strftime("%Y-%m-%dT%H:%M:%SZ")
-                            not in processed_schedules
+                            not in processed_schedule_set
                         )
                     )
                 )
             return missing_schedule_runs
 
-        self.assertExpectations(expected_schedule_runs, res, get_missing_schedule_runs, description)
+        self.assertExpectations(
+            expected_schedule_runs,
+            as_simulation_result(res),
+            get_missing_schedule_runs,
+            description,
+        )
 
     def check_contract_notifications(
         self,
@@ -608,7 +671,7 @@ class SimulationTestCase(TestCase):
         events, derived_param_outputs = compile_chrono_events(test_scenario, setup_events)
 
         contract_codes = get_contract_contents(smart_contracts)
-        
+
         received_error: Exception | None = None
         try:
             res = self.client.simulate_smart_contract(
@@ -638,10 +701,12 @@ class SimulationTestCase(TestCase):
             if expected_simulation_error:
                 return
 
+        res = SimulationResult(res)
         actual_balances = get_balances(res)
-        logs_with_timestamp = get_logs_with_timestamp(res)
         derived_parameters = get_derived_parameters(res)
         contract_notifications = get_contract_notifications(res)
+        hook_stats = get_hook_stats(res, internal_account_ids=internal_accounts)
+        merge_hook_stats(hook_stats, self.suite_hook_stats.setdefault(self.get_product_name(), {}))
 
         for sub_test in test_scenario.sub_tests:
             if sub_test.expected_balances_at_ts:
@@ -657,13 +722,13 @@ class SimulationTestCase(TestCase):
             if sub_test.expected_posting_rejections:
                 self.check_posting_rejections(
                     sub_test.expected_posting_rejections,
-                    logs_with_timestamp,
+                    res,
                     sub_test.description,
                 )
             if sub_test.expected_parameter_change_rejections:
                 self.check_parameter_change_rejections(
                     sub_test.expected_parameter_change_rejections,
-                    logs_with_timestamp,
+                    res,
                     sub_test.description,
                 )
             if sub_test.expected_derived_parameters:
@@ -679,8 +744,50 @@ class SimulationTestCase(TestCase):
                     sub_test.description,
                 )
 
+        if test_scenario.hook_budgets:
+            self.assertExpectations(
+                test_scenario.hook_budgets,
+                hook_stats,
+                get_hook_budget_violations,
+                "hook budgets exceeded",
+            )
+
         return res
 
+    def run_sharded_test_scenario(
+        self, test_scenario: SimulationTestScenario, sub_tests_per_segment: int = 1
+    ) -> list[SimulationResult]:
+        """
+        Runs a contract scenario as a sequence of shorter simulations, split at sub-test boundaries
+        as per `sharding.split_test_scenario`. Each segment starts from the parameters and flags
+        set by the previous segments' events and the balances at the end of the previous segment.
+        The sub-test expectations and hook budgets are checked for each segment separately, and
+        failures identify the segment they occurred in.
+        The balances are carried forward with postings, which run the contract's post_posting_hook.
+        Results may differ from `run_test_scenario` for contracts whose post_posting_hook acts on
+        postings. See `sharding` for details
+
+        :param test_scenario: the scenario to run
+        :param sub_tests_per_segment: the number of sub-tests in each segment
+        :return: the result of each segment's simulation
+        """
+        test_scenario = replace(
+            test_scenario,
+            internal_accounts=test_scenario.internal_accounts or self.internal_accounts,
+        )
+        results: list[SimulationResult] = []
+        for segment in split_test_scenario(test_scenario, sub_tests_per_segment):
+            segment_scenario = (
+                segment.with_checkpoint(get_balances(results[-1]))
+                if results
+                else segment.test_scenario
+            )
+            try:
+                results.append(self.run_test_scenario(segment_scenario))
+            except AssertionError as e:
+                raise AssertionError(f"{segment.description}: {e}") from e
+        return results
+
     def get_vault_version(self) -> Version:
         data: list[dict[str, Any]] = self.client.get_vault_version()
         version: dict[str, Any] = data[0]["version"]
@@ -837,15 +944,15 @@ def get_balances(res: list[dict[str, Any]]) -> DefaultDict[str, TimeSeries]:
         lambda: TimeSeries([], return_on_empty=defaultdict(lambda: Balance()))
     )
 
+    res = as_simulation_result(res)
     # result data structure for balances is 'balances' -> account_id -> 'balances' -> list[balance]
-    for result in res:
+    for event_timestamp, result in zip(res.timestamps, res):
         result_inner = result["result"]
         for balances in result_inner["balances"].values():
             balances_inner = balances["balances"]
             for sim_balance in balances_inner:
                 # results are ordered by event_timestamp so if there are multiple per
                 #  value_timestamp we don't need to worry about ordering them
-                event_timestamp = parser.parse(result_inner["timestamp"])
                 value_timestamp = parser.parse(sim_balance["value_time"])
                 dimensions, balance = convert_sim_balance(sim_balance)
                 account_balance_updates[sim_balance["account_id"]][value_timestamp][
@@ -957,23 +1064,12 @@ def get_postings(
     :return: committed postings
     """
     balance_dimensions = balance_dimensions or BalanceDimensions()
-    pibs = (
-        pibs
-        for response in res
-        for pibs in response["result"]["posting_instruction_batches"]
-        if response["result"]["posting_instruction_batches"]
+    return list(
+        as_simulation_result(res).committed_postings.get(
+            (account_id, balance_dimensions.address), []
+        )
     )
 
-    posting_instructions = (pi for pib in pibs for pi in pib["posting_instructions"])
-
-    return [
-        committed_posting
-        for pi in posting_instructions
-        for committed_posting in pi["committed_postings"]
-        if committed_posting["account_address"] == balance_dimensions.address
-        and committed_posting["account_id"] == account_id
-    ]
-
 
 def get_posting_instruction_batch(
     res: list[dict[str, Any]], event_type: str
@@ -984,30 +1080,23 @@ def get_posting_instruction_batch(
     :param event_type: event type
     :return: list of posting instruction events
     """
-    # this stores target_account_id -> timestamp -> posting instruction records
-    posting_instructions = defaultdict(lambda: defaultdict(lambda: []))
-    for result in res:
-        result_data = result["result"]
-        event_timestamp = parser.parse(result_data["timestamp"])
+    return as_simulation_result(res).get_posting_instructions_by_type(event_type)
 
-        for pibs in result_data["posting_instruction_batches"]:
-            for pis in pibs["posting_instructions"]:
-                if event_type not in pis:
-                    continue
 
-                posting_instructions[pis[event_type]["target_account_id"]][event_timestamp].append(
-                    pis[event_type]
-                )
-
-    # this stores target_account_id -> (timestamp, posting instruction records)
-    posting_instructions_timeseries = defaultdict(lambda: TimeSeries([]))
-    for account, timeseries in posting_instructions.items():
-        posting_instructions_timeseries[account] = TimeSeries(
-            [(timestamp, pi) for timestamp, pi in timeseries.items()],
-            return_on_empty={},
+def get_posting_instruction_batches_by_client_batch_id(
+    res: list[dict[str, Any]], client_batch_id: str
+) -> list[dict[str, Any]]:
+    """
+    Returns the posting instruction batches with the given client batch id
+    :param res: output from simulation endpoint
+    :param client_batch_id: client batch id of the posting instruction batches
+    :return: posting instruction batches in the order they were processed
+    """
+    return list(
+        as_simulation_result(res).posting_instruction_batches_by_client_batch_id.get(
+            client_batch_id, []
         )
-
-    return posting_instructions_timeseries
+    )
 
 
 def get_num_postings(
@@ -1159,18 +1248,7 @@ def get_logs_with_timestamp(res: list[dict[str, Any]]) -> dict[datetime, list[st
     :param res: output from simulation endpoint
     :return: logs grouped by timestamp
     """
-
-    list_of_logs = (
-        {log["result"]["timestamp"]: log["result"]["logs"]} for log in res if log["result"]["logs"]
-    )
-
-    logs_with_timestamp = defaultdict(list)
-
-    for result in list_of_logs:
-        k, v = list(result.items())[0]
-        logs_with_timestamp[parser.parse(k)] += v
-
-    return logs_with_timestamp
+    return as_simulation_result(res).logs_with_timestamp
 
 
 def has_matching_processed_scheduled_event(
@@ -1201,13 +1279,13 @@ def get_processed_scheduled_events(
     :param plan_id: account plan association id
     :return: list of timestamps
     """
-    return [
-        result["result"]["timestamp"]
-        for result in res
-        if has_matching_processed_scheduled_event(
-            result["result"]["logs"], event_id, account_id, plan_id
-        )
-    ]
+    if account_id:
+        key = (event_id, account_id, "")
+    elif plan_id:
+        key = (event_id, "", plan_id)
+    else:
+        raise ValueError("account_id or plan_id must be provided")
+    return list(as_simulation_result(res).processed_scheduled_events.get(key, []))
 
 
 def print_json(print_identifier: str, json_obj: Any) -> None:
@@ -6,7 +6,8 @@ import logging
 import os
 import uuid
 from datetime import datetime
-from typing import Any
+from itertools import chain
+from typing import Any, Iterable
 
 # third party
 import requests
@@ -89,13 +90,16 @@ class Client:
     def _api_post(
         self, url: str, payload: dict[str, Any], timeout: str, debug=False
     ) -> list[dict[str, Any]]:
+        # serialise once for both the request body and the request log, as simulation payloads can
+        # contain tens of thousands of events
+        body = json.dumps(payload, allow_nan=False)
+        request_logger.debug(body)
         response: requests.Response = self._session.post(
             self._core_api_url + url,
-            headers={"grpc-timeout": timeout},
-            json=payload,
+            headers={"grpc-timeout": timeout, "Content-Type": "application/json"},
+            data=body.encode("utf-8"),
             stream=debug,
         )
-        request_logger.debug(json.dumps(payload))
         return self._handle_response(response, debug)
 
     def _handle_response(self, response: requests.Response, debug=False) -> list[dict[str, Any]]:
@@ -154,7 +158,7 @@ class Client:
         self,
         start_timestamp: datetime,
         end_timestamp: datetime,
-        events: list[SimulationEvent],
+        events: Iterable[SimulationEvent],
         timeout: str = "360S",
         supervisor_contract_code: str | None = None,
         supervisor_contract_version_id: str | None = None,
@@ -265,7 +269,7 @@ class Client:
                     supervisor_contract_code, supervisor_contract_version_id
                 ),
                 "contract_modules": contract_modules_to_simulate,
-                "instructions": [_event_to_json(event) for event in default_events + events],
+                "instructions": [_event_to_json(event) for event in chain(default_events, events)],
                 "outputs": create_derived_parameters_instructions(
                     output_account_ids, output_timestamps
                 ),
@@ -285,15 +289,9 @@ def _datetime_to_rfc_3339(dt):
     return dt.astimezone().isoformat()
 
 
-def _event_to_json(event):
-    instruction = {
-        "timestamp": _datetime_to_rfc_3339(event.time),
-    }
-
-    for key in event.event:
-        instruction[key] = event.event[key]
-
-    return instruction
+def _event_to_json(event: SimulationEvent) -> dict[str, Any]:
+    # the event's contents are already in the wire format, so they are shared rather than copied
+    return {"timestamp": _datetime_to_rfc_3339(event.time), **event.event}
 
 
 def _smart_contract_to_json(
@@ -305,7 +303,7 @@ def _smart_contract_to_json(
         {
             "code": code,
             "smart_contract_param_vals": template_parameter,
-            "smart_contract_version_id": smart_contract_version_id
+            "smart_contract_version_id": smart_contract_version_id,
         }
         for code, template_parameter, smart_contract_version_id in zip(
             contract_codes, templates_parameters, smart_contract_version_ids
@@ -5,6 +5,7 @@ import os
 from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 from unittest import TestCase
 from unittest.mock import Mock
 from zoneinfo import ZoneInfo
@@ -46,6 +47,12 @@ from contracts_api import (
     UnionItemValue,
 )
 
+# inception sdk
+if TYPE_CHECKING:
+    # the profiler is only imported when a hook is profiled, as it pulls in tracemalloc, which
+    # most tests never use
+    from inception_sdk.test_framework.contracts.unit.profiler import HookProfile
+
 PostingInstruction = (
     AuthorisationAdjustment
     | CustomInstruction
@@ -360,6 +367,35 @@ class ContractTest(TestCase):
 
         return mock_vault
 
+    def profile_hook(
+        self,
+        hook: Callable,
+        vault: Mock,
+        hook_arguments: Any,
+        include_paths: Iterable[str] | None = None,
+        trace_allocations: bool = True,
+    ) -> tuple[Any, "HookProfile"]:
+        """
+        Run a hook against a mock vault and profile it. See `profiler.profile_hook` for details
+
+        :param hook: the hook function from the template or rendered contract module
+        :param vault: mock vault, typically from `create_mock`
+        :param hook_arguments: the hook arguments to pass to the hook
+        :param include_paths: directories or files whose functions are profiled
+        :param trace_allocations: if True, memory allocations made during the hook are traced
+        :return: the hook result and its profile
+        """
+        # inception sdk
+        from inception_sdk.test_framework.contracts.unit.profiler import profile_hook
+
+        return profile_hook(
+            hook=hook,
+            vault=vault,
+            hook_arguments=hook_arguments,
+            include_paths=include_paths,
+            trace_allocations=trace_allocations,
+        )
+
     # Posting Instruction types
     def inbound_auth(
         self,
@@ -0,0 +1,282 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import inspect
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any, Callable, Iterable
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Vault object methods that fetch data. Calls to these are counted while a hook is profiled
+VAULT_FETCH_METHODS = [
+    "get_account_creation_datetime",
+    "get_balances_observation",
+    "get_balances_timeseries",
+    "get_calendar_events",
+    "get_client_transactions",
+    "get_flag_timeseries",
+    "get_hook_result",
+    "get_last_execution_datetime",
+    "get_parameter_timeseries",
+    "get_permitted_denominations",
+    "get_posting_instructions",
+]
+
+
+@dataclass
+class FunctionStats:
+    """
+    Timings for a single contract function across a profiled hook execution
+    :param name: fully qualified function name
+    :param calls: number of times the function was called
+    :param total_time: time spent in the function and its callees, in seconds
+    :param self_time: time spent in the function itself, in seconds
+    """
+
+    name: str
+    calls: int = 0
+    total_time: float = 0
+    self_time: float = 0
+
+
+@dataclass
+class HookProfile:
+    """
+    The result of profiling a single hook execution
+    :param hook_name: name of the profiled hook
+    :param wall_time: duration of the hook execution, in seconds. This includes the profiler's
+    own overhead, so should only be compared against other profiled executions
+    :param function_stats: function name to its timings
+    :param folded_stacks: semicolon-separated call stack to self time in seconds
+    :param vault_fetches: vault method name to the number of calls made during the hook
+    :param posting_instructions: number of posting instructions in the hook result
+    :param postings: number of postings across the posting instructions in the hook result
+    :param allocated_blocks: number of memory blocks allocated and not yet freed by the end of
+    the hook. Only populated if allocations were traced
+    :param allocated_size: size in bytes of allocated_blocks
+    """
+
+    hook_name: str
+    wall_time: float = 0
+    function_stats: dict[str, FunctionStats] = field(default_factory=dict)
+    folded_stacks: dict[str, float] = field(default_factory=dict)
+    vault_fetches: dict[str, int] = field(default_factory=dict)
+    posting_instructions: int = 0
+    postings: int = 0
+    allocated_blocks: int | None = None
+    allocated_size: int | None = None
+
+    def to_folded(self) -> str:
+        """
+        Render the call stacks in the folded format consumed by flame graph tools (e.g.
+        flamegraph.pl or speedscope). Values are self times in microseconds
+        """
+        return "\n".join(
+            f"{stack} {round(self_time * 1_000_000)}"
+            for stack, self_time in sorted(self.folded_stacks.items())
+        )
+
+    def write_folded(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as folded_file:
+            folded_file.write(self.to_folded() + "\n")
+
+    def summary(self, limit: int = 20) -> str:
+        """
+        Human-readable summary of the profile, with functions sorted by descending total time
+        :param limit: maximum number of functions to include
+        """
+        lines = [
+            f"Hook {self.hook_name} took {self.wall_time * 1000:.2f}ms",
+            f"Vault fetches: {sum(self.vault_fetches.values())} {self.vault_fetches}",
+            f"Posting instructions: {self.posting_instructions}, postings: {self.postings}",
+        ]
+        if self.allocated_blocks is not None:
+            lines.append(
+                f"Allocated blocks: {self.allocated_blocks}, size: {self.allocated_size} bytes"
+            )
+        lines.append(f"{'calls':>8} {'total ms':>10} {'self ms':>10}  function")
+        for stats in sorted(
+            self.function_stats.values(), key=lambda stats: stats.total_time, reverse=True
+        )[:limit]:
+            lines.append(
+                f"{stats.calls:>8} {stats.total_time * 1000:>10.3f} "
+                f"{stats.self_time * 1000:>10.3f}  {stats.name}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class _StackEntry:
+    frame: FrameType
+    name: str
+    stack: str
+    start: float
+    child_time: float = 0
+
+
+class _CallRecorder:
+    """
+    A sys.setprofile callback that records the timings of functions defined in files under the
+    included paths. Calls to other functions (e.g. mocks, contracts_api) are attributed to the
+    closest included caller
+    """
+
+    def __init__(self, include_paths: Iterable[str], profile: HookProfile):
+        self.include_paths = tuple(os.path.abspath(path) for path in include_paths)
+        self.profile = profile
+        self.stack: list[_StackEntry] = []
+        # code object to whether it is included, to avoid repeated path checks
+        self._included_code: dict[Any, bool] = {}
+
+    def _is_included(self, frame: FrameType) -> bool:
+        code = frame.f_code
+        if code not in self._included_code:
+            self._included_code[code] = os.path.abspath(code.co_filename).startswith(
+                self.include_paths
+            )
+        return self._included_code[code]
+
+    def __call__(self, frame: FrameType, event: str, arg: Any) -> None:
+        if event == "call" and self._is_included(frame):
+            code = frame.f_code
+            qualname = getattr(code, "co_qualname", code.co_name)
+            name = f"{frame.f_globals.get('__name__')}.{qualname}"
+            parent_stack = self.stack[-1].stack + ";" if self.stack else ""
+            self.stack.append(
+                _StackEntry(
+                    frame=frame,
+                    name=name,
+                    stack=parent_stack + name,
+                    start=time.perf_counter(),
+                )
+            )
+        elif event == "return" and self.stack and self.stack[-1].frame is frame:
+            entry = self.stack.pop()
+            duration = time.perf_counter() - entry.start
+            self_time = duration - entry.child_time
+            if self.stack:
+                self.stack[-1].child_time += duration
+
+            stats = self.profile.function_stats.setdefault(
+                entry.name, FunctionStats(name=entry.name)
+            )
+            stats.calls += 1
+            stats.self_time += self_time
+            # recursive calls would otherwise be counted once per level
+            if not any(parent.name == entry.name for parent in self.stack):
+                stats.total_time += duration
+            self.profile.folded_stacks[entry.stack] = (
+                self.profile.folded_stacks.get(entry.stack, 0) + self_time
+            )
+
+
+def _default_include_paths(hook: Callable) -> list[str]:
+    """
+    Profile all functions in the hook's top-level package (e.g. `library` for templates and
+    features), or the hook's file if it is not part of a package (e.g. a rendered contract loaded
+    from its path)
+    """
+    top_level_package = sys.modules.get(hook.__module__.split(".")[0])
+    package_paths = getattr(top_level_package, "__path__", None)
+    if package_paths:
+        return list(dict.fromkeys(package_paths))
+    return [inspect.getfile(hook)]
+
+
+def _count_posting_instructions(hook_result: Any) -> tuple[int, int]:
+    """
+    :return: the number of posting instructions and postings in a hook result
+    """
+    directives = list(getattr(hook_result, "posting_instructions_directives", None) or [])
+    for supervisee_directives in (
+        getattr(hook_result, "supervisee_posting_instructions_directives", None) or {}
+    ).values():
+        directives.extend(supervisee_directives)
+
+    posting_instructions = 0
+    postings = 0
+    for directive in directives:
+        for posting_instruction in directive.posting_instructions:
+            posting_instructions += 1
+            postings += len(getattr(posting_instruction, "postings", None) or [])
+    return posting_instructions, postings
+
+
+def profile_hook(
+    hook: Callable,
+    vault: Any,
+    hook_arguments: Any,
+    include_paths: Iterable[str] | None = None,
+    trace_allocations: bool = True,
+) -> tuple[Any, HookProfile]:
+    """
+    Run a contract hook and profile it. This works for template and rendered contracts alike, as
+    the hook is just a python function either way.
+    :param hook: the hook function, e.g. `loan.scheduled_event_hook`
+    :param vault: the vault object to pass to the hook, typically from `ContractTest.create_mock`
+    :param hook_arguments: the hook arguments to pass to the hook
+    :param include_paths: directories or files whose functions are profiled. Defaults to the
+    hook's top-level package, or the hook's file if it is not part of a package
+    :param trace_allocations: if True, memory allocations made during the hook are traced. This
+    significantly slows the hook down, which inflates the timings
+    :return: the hook result and its profile
+    """
+    profile = HookProfile(hook_name=getattr(hook, "__qualname__", str(hook)))
+    recorder = _CallRecorder(include_paths or _default_include_paths(hook), profile)
+
+    # wrap the vault's fetch methods to count calls without affecting any mock assertions
+    original_methods: dict[str, Any] = {}
+    for method_name in VAULT_FETCH_METHODS:
+        original_method = getattr(vault, method_name, None)
+        if original_method is None:
+            continue
+        original_methods[method_name] = original_method
+        profile.vault_fetches[method_name] = 0
+
+        def _counted(*args, _method_name=method_name, _original=original_method, **kwargs):
+            profile.vault_fetches[_method_name] += 1
+            return _original(*args, **kwargs)
+
+        setattr(vault, method_name, _counted)
+
+    # allocations may already be traced by the caller, in which case we leave tracing running
+    stop_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if trace_allocations:
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+
+    previous_profile_function = sys.getprofile()
+    start = time.perf_counter()
+    sys.setprofile(recorder)
+    try:
+        result = hook(vault, hook_arguments)
+    finally:
+        sys.setprofile(previous_profile_function)
+        profile.wall_time = time.perf_counter() - start
+        for method_name, original_method in original_methods.items():
+            setattr(vault, method_name, original_method)
+        if trace_allocations:
+            allocations = tracemalloc.take_snapshot().compare_to(snapshot_before, "filename")
+            if stop_tracing:
+                tracemalloc.stop()
+            profile.allocated_blocks = sum(
+                max(allocation.count_diff, 0) for allocation in allocations
+            )
+            profile.allocated_size = sum(max(allocation.size_diff, 0) for allocation in allocations)
+
+    profile.vault_fetches = {
+        method_name: count for method_name, count in profile.vault_fetches.items() if count
+    }
+    profile.posting_instructions, profile.postings = _count_posting_instructions(result)
+    log.debug(profile.summary())
+    return result, profile
@@ -0,0 +1,74 @@
+# standard libs
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# The directory containing the inception_sdk package
+REPO_ROOT = Path(__file__).resolve().parents[5]
+COMMON_MODULE = "inception_sdk.test_framework.contracts.unit.common"
+# Standard library modules that every unit test module imports anyway, so are imported before the
+# import is timed
+TEST_MODULE_IMPORTS = ["logging", "unittest", "unittest.mock"]
+# Generous, as timings in a fresh interpreter are noisy. Importing the unit test framework took
+# ~35ms on top of the standard library test modules, and ~55ms when it eagerly imported the API
+IMPORT_TIME_BUDGET_MS = 100
+TIMED_RUNS = 3
+
+
+class CommonImportTest(unittest.TestCase):
+    """
+    Checks the cost of importing the unit test framework, which every unit test module pays
+    """
+
+    def setUp(self) -> None:
+        pycache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(pycache_dir.cleanup)
+        # bytecode is cached in a temporary directory, so that compiling the modules isn't timed
+        self.env = {
+            **{key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"},
+            "PYTHONPYCACHEPREFIX": pycache_dir.name,
+        }
+
+    def _import_cold(self) -> dict:
+        """
+        Import the common module in a fresh interpreter, after the standard library test modules
+        :return: the import duration in ms and the names of all modules it imported
+        """
+        code = (
+            f"import json, sys, time, {', '.join(TEST_MODULE_IMPORTS)};"
+            "loaded = set(sys.modules); start = time.perf_counter();"
+            f"import {COMMON_MODULE};"
+            "duration = (time.perf_counter() - start) * 1000;"
+            "modules = sorted(set(sys.modules) - loaded);"
+            "print(json.dumps({'duration': duration, 'modules': modules}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_ROOT,
+            env=self.env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return json.loads(result.stdout.splitlines()[-1])
+
+    def test_import_within_budget(self):
+        # the first import populates the bytecode cache
+        self._import_cold()
+        duration = min(self._import_cold()["duration"] for _ in range(TIMED_RUNS))
+
+        self.assertLess(duration, IMPORT_TIME_BUDGET_MS)
+
+    def test_import_only_loads_used_modules(self):
+        modules = self._import_cold()["modules"]
+
+        self.assertIn(COMMON_MODULE, modules)
+        self.assertNotIn("inception_sdk.test_framework.contracts.unit.profiler", modules)
+        self.assertNotIn("tracemalloc", modules)
+        self.assertFalse(
+            [module for module in modules if module.endswith("_contracts.lib")], modules
+        )
@@ -0,0 +1,252 @@
+# standard libs
+import os
+import tempfile
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+# contracts api
+from contracts_api import (
+    DEFAULT_ADDRESS,
+    DEFAULT_ASSET,
+    BalanceDefaultDict,
+    CustomInstruction,
+    Phase,
+    Posting,
+    PostingInstructionsDirective,
+    ScheduledEventHookArguments,
+    ScheduledEventHookResult,
+    Tside,
+)
+
+# inception sdk
+from inception_sdk.test_framework.contracts.unit.common import ContractTest
+from inception_sdk.test_framework.contracts.unit.profiler import (
+    FunctionStats,
+    HookProfile,
+    profile_hook,
+)
+
+DEFAULT_DATETIME = datetime(2023, 1, 1, tzinfo=ZoneInfo("UTC"))
+
+
+def _postings(amount: Decimal) -> list[Posting]:
+    return [
+        Posting(
+            credit=True,
+            amount=amount,
+            denomination="GBP",
+            account_id="account_1",
+            account_address=DEFAULT_ADDRESS,
+            asset=DEFAULT_ASSET,
+            phase=Phase.COMMITTED,
+        ),
+        Posting(
+            credit=False,
+            amount=amount,
+            denomination="GBP",
+            account_id="account_2",
+            account_address=DEFAULT_ADDRESS,
+            asset=DEFAULT_ASSET,
+            phase=Phase.COMMITTED,
+        ),
+    ]
+
+
+def _fibonacci(n: int) -> int:
+    return n if n < 2 else _fibonacci(n - 1) + _fibonacci(n - 2)
+
+
+def _fetch_balances(vault) -> None:
+    vault.get_balances_observation(fetcher_id="live_balances")
+    vault.get_balances_observation(fetcher_id="live_balances")
+
+
+def _scheduled_event_hook(vault, hook_arguments: ScheduledEventHookArguments):
+    _fetch_balances(vault)
+    vault.get_last_execution_datetime(event_type="DUMMY")
+    _fibonacci(5)
+    return ScheduledEventHookResult(
+        posting_instructions_directives=[
+            PostingInstructionsDirective(
+                posting_instructions=[
+                    CustomInstruction(postings=_postings(Decimal("1"))),
+                    CustomInstruction(postings=_postings(Decimal("2"))),
+                ],
+                value_datetime=hook_arguments.effective_datetime,
+            )
+        ]
+    )
+
+
+def _failing_hook(vault, hook_arguments: ScheduledEventHookArguments):
+    vault.get_balances_observation(fetcher_id="live_balances")
+    raise ValueError("hook failed")
+
+
+class ProfileHookTest(ContractTest):
+    tside = Tside.LIABILITY
+
+    def setUp(self) -> None:
+        self.mock_vault = self.create_mock(
+            balances_observation_fetchers_mapping={},
+            last_execution_datetimes={"DUMMY": DEFAULT_DATETIME},
+        )
+        self.mock_vault.get_balances_observation = Mock(
+            return_value=Mock(balances=BalanceDefaultDict())
+        )
+        self.hook_arguments = ScheduledEventHookArguments(
+            effective_datetime=DEFAULT_DATETIME, event_type="DUMMY"
+        )
+
+    def test_profile_hook_returns_hook_result(self):
+        result, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertIsInstance(result, ScheduledEventHookResult)
+        self.assertIsInstance(profile, HookProfile)
+        self.assertEqual(profile.hook_name, "_scheduled_event_hook")
+        self.assertGreater(profile.wall_time, 0)
+
+    def test_profile_hook_records_function_calls(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        calls = {
+            name.rsplit(".", 1)[-1]: stats.calls for name, stats in profile.function_stats.items()
+        }
+        self.assertEqual(calls["_scheduled_event_hook"], 1)
+        self.assertEqual(calls["_fetch_balances"], 1)
+        self.assertEqual(calls["_postings"], 2)
+        # fib(5) makes 15 calls in total
+        self.assertEqual(calls["_fibonacci"], 15)
+        # functions outside the included paths (e.g. contracts_api) are not recorded
+        self.assertFalse(any("contracts_api" in name for name in profile.function_stats))
+
+    def test_profile_hook_recursive_total_time_not_double_counted(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        stats = {name.rsplit(".", 1)[-1]: stats for name, stats in profile.function_stats.items()}
+        self.assertLessEqual(
+            stats["_fibonacci"].total_time, stats["_scheduled_event_hook"].total_time
+        )
+        self.assertLessEqual(stats["_fibonacci"].self_time, stats["_fibonacci"].total_time)
+
+    def test_profile_hook_folded_stacks(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        folded_lines = profile.to_folded().splitlines()
+        hook_name = f"{__name__}._scheduled_event_hook"
+        self.assertIn(hook_name, [line.rsplit(" ", 1)[0] for line in folded_lines])
+        self.assertIn(
+            f"{hook_name};{__name__}._fetch_balances",
+            [line.rsplit(" ", 1)[0] for line in folded_lines],
+        )
+        for line in folded_lines:
+            stack, value = line.rsplit(" ", 1)
+            self.assertTrue(stack.startswith(hook_name))
+            self.assertTrue(value.isdigit())
+
+    def test_write_folded(self):
+        profile = HookProfile(hook_name="hook", folded_stacks={"a;b": 0.000002, "a": 0.000001})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "hook.folded")
+            profile.write_folded(path)
+            with open(path, encoding="utf-8") as folded_file:
+                self.assertEqual(folded_file.read(), "a 1\na;b 2\n")
+
+    def test_profile_hook_counts_vault_fetches(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertDictEqual(
+            profile.vault_fetches,
+            {"get_balances_observation": 2, "get_last_execution_datetime": 1},
+        )
+
+    def test_profile_hook_restores_vault_methods(self):
+        original_method = self.mock_vault.get_balances_observation
+
+        profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertIs(self.mock_vault.get_balances_observation, original_method)
+        self.assertEqual(original_method.call_count, 2)
+
+    def test_profile_hook_restores_vault_methods_if_hook_raises(self):
+        original_method = self.mock_vault.get_balances_observation
+
+        with self.assertRaisesRegex(ValueError, "hook failed"):
+            profile_hook(
+                _failing_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+            )
+
+        self.assertIs(self.mock_vault.get_balances_observation, original_method)
+
+    def test_profile_hook_counts_postings(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertEqual(profile.posting_instructions, 2)
+        self.assertEqual(profile.postings, 4)
+
+    def test_profile_hook_traces_allocations(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertIsNotNone(profile.allocated_blocks)
+        self.assertIsNotNone(profile.allocated_size)
+
+    def test_profile_hook_without_allocation_tracing(self):
+        _, profile = profile_hook(
+            _scheduled_event_hook,
+            self.mock_vault,
+            self.hook_arguments,
+            include_paths=[__file__],
+            trace_allocations=False,
+        )
+
+        self.assertIsNone(profile.allocated_blocks)
+        self.assertIsNone(profile.allocated_size)
+
+    def test_contract_test_profile_hook(self):
+        result, profile = self.profile_hook(
+            _scheduled_event_hook, self.mock_vault, self.hook_arguments, include_paths=[__file__]
+        )
+
+        self.assertIsInstance(result, ScheduledEventHookResult)
+        self.assertEqual(profile.posting_instructions, 2)
+
+    def test_summary(self):
+        profile = HookProfile(
+            hook_name="hook",
+            wall_time=0.002,
+            function_stats={
+                "a": FunctionStats(name="a", calls=1, total_time=0.002, self_time=0.001),
+                "b": FunctionStats(name="b", calls=3, total_time=0.001, self_time=0.001),
+            },
+            vault_fetches={"get_balances_observation": 2},
+            posting_instructions=1,
+            postings=2,
+        )
+
+        self.assertEqual(
+            profile.summary(limit=1),
+            "Hook hook took 2.00ms\n"
+            "Vault fetches: 2 {'get_balances_observation': 2}\n"
+            "Posting instructions: 1, postings: 2\n"
+            "   calls   total ms    self ms  function\n"
+            "       1      2.000      1.000  a",
+        )
@@ -26,10 +26,12 @@ import inception_sdk.test_framework.endtoend.kafka_helper as kafka_helper
 import inception_sdk.test_framework.endtoend.postings as postings_helper
 import inception_sdk.test_framework.endtoend.schedule_helper as schedule_helper
 import inception_sdk.test_framework.endtoend.supervisors_helper as supervisors_helper
+import inception_sdk.test_framework.endtoend.teardown_helper as teardown_helper
 import inception_sdk.test_framework.endtoend.workflows_api_helper as workflows_api_helper
 import inception_sdk.test_framework.endtoend.workflows_helper as workflows_helper
 from inception_sdk.test_framework.common.config import FLAGS, EnvironmentPurpose, flags
 from inception_sdk.test_framework.common.utils import safe_merge_dicts
+from inception_sdk.test_framework.endtoend.setup_planner import SetupPlanner
 
 log = logging.getLogger(__name__)
 logging.basicConfig(
@@ -104,19 +106,20 @@ def kafka_setup(
 def standard_setup(environment_purpose: EnvironmentPurpose = EnvironmentPurpose.E2E):
     try:
         endtoend.helper.setup_environments(environment_purpose)
-        endtoend.contracts_helper.create_account_schedule_tags(
-            endtoend.testhandle.CONTROLLED_SCHEDULES
-        )
-        endtoend.contracts_helper.create_flag_definitions(testhandle.FLAG_DEFINITIONS)
-        endtoend.contracts_helper.create_calendars(testhandle.CALENDARS)
-        # There is a circular dependency between workflows and contracts/supervisors due to our
-        # e2e id replacement approach, but we can generate the workflow definition ids before
-        # uploading them
-        endtoend.workflows_helper.create_workflow_definition_id_mapping()
-        endtoend.contracts_helper.create_required_internal_accounts(
-            testhandle.TSIDE_TO_INTERNAL_ACCOUNT_ID
-        )
+        build_setup_plan().run()
+    except:
+        # tearDown/tearDownClass isn't called if setUp/setUpClass fails, respectively
+        endtoend.helper.teardown_shared_resources()
+        raise
+
+
+def build_setup_plan() -> SetupPlanner:
+    """
+    Builds the dependency graph of e2e resources required by the test class. Resources that don't
+    depend on each other (e.g. flag definitions and calendars) are created concurrently
+    """
 
+    def _upload_contracts() -> None:
         # At this point we know the resource ids used in CLU references for contracts, so
         # we create a merged dictionary for CLU replacement later on. This excludes supervisors
         endtoend.testhandle.clu_reference_mappings = safe_merge_dicts(
@@ -128,6 +131,7 @@ def standard_setup(environment_purpose: EnvironmentPurpose = EnvironmentPurpose.
         )
         endtoend.contracts_helper.upload_contracts(testhandle.CONTRACTS)
 
+    def _upload_supervisor_contracts() -> None:
         # This cannot be merged with the similar step above as Core API doesn't let us provide
         # product version ids
         endtoend.testhandle.clu_reference_mappings = safe_merge_dicts(
@@ -139,8 +143,8 @@ def standard_setup(environment_purpose: EnvironmentPurpose = EnvironmentPurpose.
         endtoend.supervisors_helper.upload_supervisor_contracts(
             supervisor_contracts=testhandle.SUPERVISORCONTRACTS
         )
-        endtoend.contract_modules_helper.upload_contract_modules(testhandle.CONTRACT_MODULES)
 
+    def _upload_workflows() -> None:
         # Our CLU ids are like `offset_mortgage_supervisor_contract_version` but within our tests
         # it is much nicer to use `offset_mortgage` as the supervisor contract's id. This interim
         # step gives us implicit support for the former and the latter
@@ -162,16 +166,75 @@ def standard_setup(environment_purpose: EnvironmentPurpose = EnvironmentPurpose.
                 supervisor_contract_version_id_mapping,
             )
         )
-
         endtoend.workflows_helper.update_and_upload_workflows()
-        endtoend.core_api_helper.init_postings_api_client(
+
+    planner = SetupPlanner(max_workers=endtoend.testhandle.setup_max_workers)
+    # Steps that run alongside others return their results, which the planner stores on the
+    # testhandle in the main thread
+    planner.add_step(
+        "account_schedule_tags",
+        lambda: endtoend.contracts_helper.upload_account_schedule_tags(
+            endtoend.testhandle.CONTROLLED_SCHEDULES
+        ),
+        merge=endtoend.contracts_helper.store_account_schedule_tags,
+    )
+    planner.add_step(
+        "flag_definitions",
+        lambda: endtoend.contracts_helper.upload_flag_definitions(testhandle.FLAG_DEFINITIONS),
+        merge=endtoend.contracts_helper.store_flag_definitions,
+    )
+    planner.add_step(
+        "calendars",
+        lambda: endtoend.contracts_helper.upload_calendars(testhandle.CALENDARS),
+        merge=endtoend.contracts_helper.store_calendars,
+    )
+    # There is a circular dependency between workflows and contracts/supervisors due to our
+    # e2e id replacement approach, but we can generate the workflow definition ids before
+    # uploading them
+    planner.add_step(
+        "workflow_definition_ids",
+        endtoend.workflows_helper.generate_workflow_definition_id_mapping,
+        merge=endtoend.workflows_helper.store_workflow_definition_id_mapping,
+    )
+    # the internal products are prepared with the default paused tag, as all contracts are
+    planner.add_step(
+        "internal_accounts",
+        lambda: endtoend.contracts_helper.upload_required_internal_accounts(
+            testhandle.TSIDE_TO_INTERNAL_ACCOUNT_ID
+        ),
+        depends_on=["account_schedule_tags"],
+        merge=endtoend.contracts_helper.store_required_internal_accounts,
+    )
+    # The remaining steps each depend on the previous one, so only run alongside the postings API
+    # client, which doesn't modify the testhandle
+    planner.add_step(
+        "contracts",
+        _upload_contracts,
+        depends_on=[
+            "account_schedule_tags",
+            "flag_definitions",
+            "calendars",
+            "workflow_definition_ids",
+            "internal_accounts",
+        ],
+    )
+    planner.add_step("supervisor_contracts", _upload_supervisor_contracts, depends_on=["contracts"])
+    planner.add_step(
+        "contract_modules",
+        lambda: endtoend.contract_modules_helper.upload_contract_modules(
+            testhandle.CONTRACT_MODULES
+        ),
+        depends_on=["supervisor_contracts"],
+    )
+    planner.add_step("workflows", _upload_workflows, depends_on=["contract_modules"])
+    planner.add_step(
+        "postings_api_client",
+        lambda: endtoend.core_api_helper.init_postings_api_client(
             client_id=postings_helper.POSTINGS_API_CLIENT_ID,
             response_topic=postings_helper.POSTINGS_API_RESPONSE_TOPIC,
-        )
-    except:
-        # tearDown/tearDownClass isn't called if setUp/setUpClass fails, respectively
-        endtoend.helper.teardown_shared_resources()
-        raise
+        ),
+    )
+    return planner
 
 
 def skipForVaultVersion(callback: Callable[[Version], bool] | None = None, reason=None):
@@ -12,6 +12,7 @@ import re
 import string
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from decimal import Decimal
@@ -47,6 +48,7 @@ from inception_sdk.test_framework.endtoend.kafka_helper import kafka_only_helper
 from inception_sdk.tools.common.tools_utils import override_logging_level
 from inception_sdk.tools.renderer.render_utils import is_file_renderable
 from inception_sdk.tools.renderer.renderer import RendererConfig, SmartContractRenderer
+from inception_sdk.vault.postings.posting_classes import Posting
 
 with override_logging_level(logging.WARNING):
     from black import format_str
@@ -71,6 +73,14 @@ VALID_ACCOUNT_SCHEDULE_TAG_TIME_DELTA_FIELDS = (
 )
 
 DUMMY_CONTRA = "DUMMY_CONTRA"
+# products:batchGet errors that mean the products must be checked individually. 404 is returned if
+# any of the products don't exist, and 501 if the endpoint isn't supported
+BATCH_GET_PRODUCTS_FALLBACK_STATUS_CODES = ("404", "501")
+BALANCE_CLEARING_BATCH_DETAILS = {
+    "calendar_override": "true",
+    "force_override": "true",
+    "withdrawal_override": "true",
+}
 # These internal accounts should only be used for IDs that should not be changed into
 # e2e composite IDs. e.g. internal account "1"
 DEFAULT_REQUIRED_INTERNAL_ACCOUNTS_DICT: dict[str, list[str]] = {
@@ -127,111 +137,208 @@ def get_contract_content_for_e2e(product_id: str, contract_properties: dict[str,
 def upload_contracts(contracts: dict[str, dict[str, Any]]) -> None:
     """
     Uploads contracts and creates a mapping between original product ids and run-specific ids, so
-    that tests do not need to be aware of the modified ids
+    that tests do not need to be aware of the modified ids. The e2e product id includes a hash of
+    the final contract content, so contracts that are already deployed with identical content are
+    not re-uploaded. The remaining contracts are uploaded concurrently.
     :param contracts: dict[str, dict[str, object]], map of product ids and the corresponding
     dictionary of contract properties
     :return:
     """
-    for product_id, contract_properties in contracts.items():
-        e2e_contract_data = get_contract_content_for_e2e(product_id, contract_properties)
+    for product_id, (e2e_unique_product_id, product_version_id) in upload_product_versions(
+        contracts
+    ).items():
+        if contracts[product_id].get("is_internal", False):
+            endtoend.testhandle.internal_contract_pid_to_uploaded_pid[
+                product_id
+            ] = e2e_unique_product_id
+        else:
+            # We need to store both the product id and the product version id as supervisor syntax
+            # depends on the latter
+            endtoend.testhandle.contract_pid_to_uploaded_pid[product_id] = e2e_unique_product_id
+            endtoend.testhandle.contract_pid_to_uploaded_product_version_id[
+                product_id
+            ] = product_version_id
 
-        if endtoend.testhandle.do_version_check:
-            check_product_version(product_id, e2e_contract_data)
 
-        # All resource types that can be contract dependencies and for which we use CLU syntax
-        # should have their mapping adding to clu_reference_mappings
-        e2e_contract_data = replace_clu_dependencies(
-            product_id, e2e_contract_data, endtoend.testhandle.clu_reference_mappings
-        )
+def upload_product_versions(contracts: dict[str, dict[str, Any]]) -> dict[str, tuple[str, str]]:
+    """
+    Uploads contracts that aren't already deployed, without modifying the testhandle. See
+    `upload_contracts` for details
+    :param contracts: map of product ids and the corresponding dictionary of contract properties
+    :return: product id to the e2e product id and the product version id
+    """
+    upload_requests = {
+        product_id: _prepare_product_version_request(product_id, contract_properties)
+        for product_id, contract_properties in contracts.items()
+    }
 
-        # Inception contracts do not use CLU syntax for schedule tags (INC-5281)
-        e2e_contract_data = replace_schedule_tag_ids_in_contract(
-            contract_data=e2e_contract_data,
-            # we process internal products for which no schedules ever exist and therefore cannot
-            # be set on the testhandle
-            id_mapping=endtoend.testhandle.controlled_schedule_tags.get(product_id, {}),
-            default_paused_tag_id=endtoend.testhandle.default_paused_tag_id,
+    deployed_version_ids = _get_deployed_product_version_ids(
+        [request["product_id"] for request in upload_requests.values()]
+    )
+    requests_to_upload = {
+        product_id: request
+        for product_id, request in upload_requests.items()
+        if request["product_id"] not in deployed_version_ids
+    }
+    for product_id, request in upload_requests.items():
+        if product_id not in requests_to_upload:
+            log.info(f"Contract {request['product_id']} already deployed with matching content.")
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(endtoend.testhandle.setup_max_workers, len(requests_to_upload)))
+    ) as executor:
+        responses = dict(
+            zip(
+                requests_to_upload.keys(),
+                executor.map(
+                    lambda request: endtoend.core_api_helper.create_product_version(**request),
+                    requests_to_upload.values(),
+                ),
+            )
         )
 
-        e2e_contract_data = format_str(e2e_contract_data, mode=Mode(line_length=100))
+    product_versions: dict[str, tuple[str, str]] = {}
+    for product_id, request in upload_requests.items():
+        e2e_unique_product_id = request["product_id"]
+        if product_id in responses:
+            # Vault may have already seen this code with a different product id
+            log.info("Contract %s uploaded.", responses[product_id]["product_id"])
+            product_version_id = responses[product_id]["id"]
+        else:
+            product_version_id = deployed_version_ids[e2e_unique_product_id]
+        product_versions[product_id] = (e2e_unique_product_id, product_version_id)
 
-        parameters = contract_properties.get("template_params", {})
-        supported_denominations = contract_properties.get("supported_denoms", ["GBP"])
-        is_internal = contract_properties.get("is_internal", False)
-        display_name = contract_properties.get("display_name", "")
+    return product_versions
 
-        for param_name, param_value in parameters.items():
-            if "_account" in param_name.lower() and type(param_value) is not dict:
-                log.warning(
-                    f"If {param_name} is an internal account that should be uploaded by the"
-                    f" framework, ensure that the end-to-end parameter value is a dictionary with"
-                    f" key internal_account_key, e.g.  'accrued_interest_payable_account'"
-                    f": {{'internal_account_key': 'accrued_interest_payable_account'}}"
-                )
 
-            if type(param_value) is dict:
-                if param_value.get("internal_account_key"):
-                    parameters[param_name] = endtoend.testhandle.internal_account_id_to_uploaded_id[
-                        param_value["internal_account_key"]
-                    ]
+def _prepare_product_version_request(
+    product_id: str, contract_properties: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Prepares the e2e version of a contract and the corresponding product version request
+    :param product_id: the original product id
+    :param contract_properties: the contract properties, as per `upload_contracts`
+    :return: kwargs for `core_api_helper.create_product_version`
+    """
+    e2e_contract_data = get_contract_content_for_e2e(product_id, contract_properties)
 
-                # check for nested internal accounts
-                if nested_internal_accounts := param_value.get("nested_internal_account_keys"):
-                    parameters[param_name] = json.dumps(
-                        {
-                            key: endtoend.testhandle.internal_account_id_to_uploaded_id[
-                                param_value["nested_internal_account_keys"][key][
-                                    "internal_account_key"
-                                ]
-                            ]
-                            for key in nested_internal_accounts.keys()
-                        }
-                    )
-                # check for flags in json params
-                if any(key == "flag_key" for key in _get_nested_dict_keys(param_value)):
-                    parameters[param_name] = json.dumps(
-                        replace_flags_in_parameter(
-                            param_value, endtoend.testhandle.flag_definition_id_mapping
-                        )
+    if endtoend.testhandle.do_version_check:
+        check_product_version(product_id, e2e_contract_data)
+
+    # All resource types that can be contract dependencies and for which we use CLU syntax
+    # should have their mapping adding to clu_reference_mappings
+    e2e_contract_data = replace_clu_dependencies(
+        product_id, e2e_contract_data, endtoend.testhandle.clu_reference_mappings
+    )
+
+    # Inception contracts do not use CLU syntax for schedule tags (INC-5281)
+    e2e_contract_data = replace_schedule_tag_ids_in_contract(
+        contract_data=e2e_contract_data,
+        # we process internal products for which no schedules ever exist and therefore cannot
+        # be set on the testhandle
+        id_mapping=endtoend.testhandle.controlled_schedule_tags.get(product_id, {}),
+        default_paused_tag_id=endtoend.testhandle.default_paused_tag_id,
+    )
+
+    e2e_contract_data = format_str(e2e_contract_data, mode=Mode(line_length=100))
+
+    parameters = contract_properties.get("template_params", {})
+    supported_denominations = contract_properties.get("supported_denoms", ["GBP"])
+    is_internal = contract_properties.get("is_internal", False)
+    display_name = contract_properties.get("display_name", "")
+
+    for param_name, param_value in parameters.items():
+        if "_account" in param_name.lower() and type(param_value) is not dict:
+            log.warning(
+                f"If {param_name} is an internal account that should be uploaded by the"
+                f" framework, ensure that the end-to-end parameter value is a dictionary with"
+                f" key internal_account_key, e.g.  'accrued_interest_payable_account'"
+                f": {{'internal_account_key': 'accrued_interest_payable_account'}}"
+            )
+
+        if type(param_value) is dict:
+            if param_value.get("internal_account_key"):
+                parameters[param_name] = endtoend.testhandle.internal_account_id_to_uploaded_id[
+                    param_value["internal_account_key"]
+                ]
+
+            # check for nested internal accounts
+            if nested_internal_accounts := param_value.get("nested_internal_account_keys"):
+                parameters[param_name] = json.dumps(
+                    {
+                        key: endtoend.testhandle.internal_account_id_to_uploaded_id[
+                            param_value["nested_internal_account_keys"][key]["internal_account_key"]
+                        ]
+                        for key in nested_internal_accounts.keys()
+                    }
+                )
+            # check for flags in json params
+            if any(key == "flag_key" for key in _get_nested_dict_keys(param_value)):
+                parameters[param_name] = json.dumps(
+                    replace_flags_in_parameter(
+                        param_value, endtoend.testhandle.flag_definition_id_mapping
                     )
+                )
 
-        new_params = [
-            {"name": param_name, "value": param_value}
-            for param_name, param_value in parameters.items()
-        ]
-        ordered_params = str(collections.OrderedDict(sorted(parameters.items())))
+    new_params = [
+        {"name": param_name, "value": param_value} for param_name, param_value in parameters.items()
+    ]
+    ordered_params = str(collections.OrderedDict(sorted(parameters.items())))
+
+    code_hash = hashlib.md5(
+        (
+            e2e_contract_data + str(supported_denominations) + display_name + ordered_params or ""
+        ).encode("utf-8")
+    ).hexdigest()
+    e2e_unique_product_id = "e2e_" + product_id + "_" + code_hash
+
+    return dict(
+        request_id=e2e_unique_product_id,
+        code=e2e_contract_data,
+        product_id=e2e_unique_product_id,
+        supported_denominations=supported_denominations,
+        tags=[],
+        params=new_params,
+        is_internal=is_internal,
+        migration_strategy="PRODUCT_VERSION_MIGRATION_STRATEGY_UNKNOWN",
+        contract_properties=contract_properties,
+    )
 
-        code_hash = hashlib.md5(
-            (
-                e2e_contract_data + str(supported_denominations) + display_name + ordered_params
-                or ""
-            ).encode("utf-8")
-        ).hexdigest()
-        e2e_unique_product_id = "e2e_" + product_id + "_" + code_hash
-
-        resp = endtoend.core_api_helper.create_product_version(
-            request_id=e2e_unique_product_id,
-            code=e2e_contract_data,
-            product_id=e2e_unique_product_id,
-            supported_denominations=supported_denominations,
-            tags=[],
-            params=new_params,
-            is_internal=is_internal,
-            migration_strategy="PRODUCT_VERSION_MIGRATION_STRATEGY_UNKNOWN",
-            contract_properties=contract_properties,
-        )
 
-        # Vault may have already seen this code with a different product id
-        log.info("Contract %s uploaded.", resp["product_id"])
-        if is_internal:
-            endtoend.testhandle.internal_contract_pid_to_uploaded_pid[
-                product_id
-            ] = e2e_unique_product_id
-        else:
-            # We need to store both the product id and the product version id as supervisor syntax
-            # depends on the latter
-            endtoend.testhandle.contract_pid_to_uploaded_pid[product_id] = e2e_unique_product_id
-            endtoend.testhandle.contract_pid_to_uploaded_product_version_id[product_id] = resp["id"]
+def _get_deployed_product_version_ids(e2e_product_ids: list[str]) -> dict[str, str]:
+    """
+    Determines which e2e products already exist in the environment. As the e2e product ids contain
+    a hash of the contract content, an existing product is guaranteed to have matching content
+    :param e2e_product_ids: the e2e product ids to check
+    :return: e2e product id to current product version id, for products that already exist
+    """
+    if not e2e_product_ids:
+        return {}
+    try:
+        resp = endtoend.helper.send_request(
+            "get", "/v1/products:batchGet", params={"ids": e2e_product_ids}
+        )
+    except HTTPError as e:
+        # batchGet fails with a 404 if any of the ids are not found, so we fall back to checking
+        # each id individually to still skip the unchanged products. Other errors (e.g. transient
+        # failures) are raised rather than turning this into a request per id
+        if not e.args[0].startswith(BATCH_GET_PRODUCTS_FALLBACK_STATUS_CODES):
+            raise
+        log.debug(f"Could not batch get products {e2e_product_ids}: {e.args}")
+        if len(e2e_product_ids) == 1:
+            return {}
+        return {
+            product_id: product_version_id
+            for e2e_product_id in e2e_product_ids
+            for product_id, product_version_id in _get_deployed_product_version_ids(
+                [e2e_product_id]
+            ).items()
+        }
+    return {
+        product_id: product["current_version_id"]
+        for product_id, product in resp["products"].items()
+        if product.get("current_version_id")
+    }
 
 
 def create_account(
@@ -332,6 +439,35 @@ def create_internal_account(
     multiple teams
     :return: the created internal account resource
     """
+    e2e_account_id, internal_account = _create_internal_account(
+        account_id=account_id,
+        contract=contract,
+        accounting_tside=accounting_tside,
+        internal_contract_pid_to_uploaded_pid=(
+            endtoend.testhandle.internal_contract_pid_to_uploaded_pid
+        ),
+        details=details,
+        use_composite_id=use_composite_id,
+    )
+    endtoend.testhandle.internal_account_id_to_uploaded_id[account_id] = e2e_account_id
+
+    return internal_account
+
+
+def _create_internal_account(
+    account_id: str,
+    contract: str,
+    accounting_tside: str,
+    internal_contract_pid_to_uploaded_pid: dict[str, str],
+    details: dict[str, str] | None = None,
+    use_composite_id: bool = True,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Creates an internal account without modifying the testhandle. See `create_internal_account`
+    for details
+    :param internal_contract_pid_to_uploaded_pid: internal product id to e2e product id
+    :return: the e2e account id and the created internal account resource
+    """
     e2e_account_id = (
         _composite_internal_account_id(account_id=account_id, tside=accounting_tside)
         if use_composite_id
@@ -345,7 +481,7 @@ def create_internal_account(
             " a composite id or 36 otherwise"
         )
 
-    if contract not in endtoend.testhandle.internal_contract_pid_to_uploaded_pid:
+    if contract not in internal_contract_pid_to_uploaded_pid:
         raise NameError(
             "Contract ID: {} not found. " "Is it specified in the testfile?".format(contract)
         )
@@ -354,7 +490,7 @@ def create_internal_account(
     # accounts, but in 5.0 onwards idempotency is only guaranteed for a 7d window so we still
     # rely on an id check for those scenarios
     request_id = e2e_account_id
-    product_id = endtoend.testhandle.internal_contract_pid_to_uploaded_pid[contract]
+    product_id = internal_contract_pid_to_uploaded_pid[contract]
     internal_account = endtoend.core_api_helper.create_internal_account(
         request_id=request_id,
         internal_account_id=e2e_account_id,
@@ -362,9 +498,8 @@ def create_internal_account(
         accounting_tside=accounting_tside,
         details=details,
     )
-    endtoend.testhandle.internal_account_id_to_uploaded_id[account_id] = e2e_account_id
 
-    return internal_account
+    return e2e_account_id, internal_account
 
 
 def get_internal_account(account_id):
@@ -407,62 +542,70 @@ def some_non_zero_balances_exist(account_id: str) -> bool:
     return any(balance["amount"] != "0" for balance in balances)
 
 
-def clear_balances(account_handle):
+def get_balance_clearing_postings(
+    account_handle: dict[str, Any], balances: list[dict[str, str]]
+) -> list[list[Posting]]:
+    """
+    Creates the postings required to zero the non-zero balances of an account against the default
+    internal account
+    :param account_handle: the account resource
+    :param balances: the account's live balances
+    :return: a pair of postings per non-zero balance
+    """
     account_id = account_handle["id"]
+    liability_account = account_handle["accounting"]["tside"] == "TSIDE_LIABILITY"
 
-    balances = endtoend.core_api_helper.get_live_balances(account_id)
-
-    if account_handle["accounting"]["tside"] == "TSIDE_LIABILITY":
-        liability_account = True
-    else:
-        liability_account = False
-
+    clearing_postings = []
     for balance in balances:
         if balance["amount"] != "0":
             amount = Decimal(balance["amount"])
-            postings = []
             credit = (amount < 0 and liability_account) or (amount > 0 and not liability_account)
-            postings.append(
-                endtoend.postings_helper.create_posting(
-                    account_id=account_id,
-                    amount=str(abs(amount)),
-                    denomination=balance["denomination"],
-                    asset=balance["asset"],
-                    account_address=balance["account_address"],
-                    phase=balance["phase"],
-                    credit=credit,
-                )
-            )
-            postings.append(
-                endtoend.postings_helper.create_posting(
-                    account_id=endtoend.testhandle.internal_account_id_to_uploaded_id[
-                        endtoend.testhandle.internal_account
-                    ],
-                    amount=str(abs(amount)),
-                    denomination=balance["denomination"],
-                    asset=balance["asset"],
-                    account_address="DEFAULT",
-                    phase=balance["phase"],
-                    credit=not credit,
-                )
-            )
-            # withdrawal_override & calendar_override needed to force the funds out of TD
-            # todo: make this use output from KERN-I-26
-
-            pib_id = endtoend.postings_helper.create_custom_instruction(
-                postings,
-                batch_details={
-                    "calendar_override": "true",
-                    "force_override": "true",
-                    "withdrawal_override": "true",
-                },
-                instruction_details={"force_override": "true"},
-            )
-            # ensure that the balances have been updated for this pib
-            endtoend.balances_helper.wait_for_posting_balance_updates(
-                account_id=account_id,
-                posting_instruction_batch_id=pib_id,
+            clearing_postings.append(
+                [
+                    endtoend.postings_helper.create_posting(
+                        account_id=account_id,
+                        amount=str(abs(amount)),
+                        denomination=balance["denomination"],
+                        asset=balance["asset"],
+                        account_address=balance["account_address"],
+                        phase=balance["phase"],
+                        credit=credit,
+                    ),
+                    endtoend.postings_helper.create_posting(
+                        account_id=endtoend.testhandle.internal_account_id_to_uploaded_id[
+                            endtoend.testhandle.internal_account
+                        ],
+                        amount=str(abs(amount)),
+                        denomination=balance["denomination"],
+                        asset=balance["asset"],
+                        account_address="DEFAULT",
+                        phase=balance["phase"],
+                        credit=not credit,
+                    ),
+                ]
             )
+    return clearing_postings
+
+
+def clear_balances(account_handle):
+    account_id = account_handle["id"]
+
+    balances = endtoend.core_api_helper.get_live_balances(account_id)
+
+    for postings in get_balance_clearing_postings(account_handle, balances):
+        # withdrawal_override & calendar_override needed to force the funds out of TD
+        # todo: make this use output from KERN-I-26
+
+        pib_id = endtoend.postings_helper.create_custom_instruction(
+            postings,
+            batch_details=BALANCE_CLEARING_BATCH_DETAILS,
+            instruction_details={"force_override": "true"},
+        )
+        # ensure that the balances have been updated for this pib
+        endtoend.balances_helper.wait_for_posting_balance_updates(
+            account_id=account_id,
+            posting_instruction_batch_id=pib_id,
+        )
 
     # TODO: Add back in after TM-24384 is resolved to fix wallet e2e
     # endtoend.helper.retry_call(
@@ -582,6 +725,21 @@ def terminate_account(account: dict[str, Any]) -> dict[str, Any]:
 
 
 def teardown_all_accounts():
+    if endtoend.testhandle.use_kafka and endtoend.testhandle.kafka_producer:
+        # Clearing postings and status updates are sent in batches, so large numbers of accounts
+        # are torn down in a time bounded by throughput rather than round-trip latency
+        failed_account_ids: list[str] = []
+        for progress in endtoend.teardown_helper.bulk_teardown_accounts(
+            endtoend.testhandle.accounts
+        ):
+            failed_account_ids = progress.failed
+        endtoend.testhandle.accounts.clear()
+        if failed_account_ids:
+            raise Exception(
+                f"{datetime.utcnow()} - Failed to teardown {len(failed_account_ids)} accounts"
+            )
+        return
+
     fail_count = 0
     for account_id in endtoend.testhandle.accounts:
         try:
@@ -642,6 +800,30 @@ def create_account_schedule_tags(controlled_schedules: dict[str, list[str]]) ->
     on the endtoend.testhandle.controlled_schedule_tags and default_paused_tag_id attributes
     :param controlled_schedules: product id to schedule event type names
     """
+    store_account_schedule_tags(upload_account_schedule_tags(controlled_schedules))
+
+
+def store_account_schedule_tags(
+    account_schedule_tags: tuple[dict[str, dict[str, str]], str]
+) -> None:
+    """
+    Sets the tags created by `upload_account_schedule_tags` on the testhandle
+    """
+    (
+        endtoend.testhandle.controlled_schedule_tags,
+        endtoend.testhandle.default_paused_tag_id,
+    ) = account_schedule_tags
+
+
+def upload_account_schedule_tags(
+    controlled_schedules: dict[str, list[str]]
+) -> tuple[dict[str, dict[str, str]], str]:
+    """
+    Creates the tags required to control all specified schedules, plus a default paused tag,
+    without modifying the testhandle. See `create_account_schedule_tags` for details
+    :param controlled_schedules: product id to schedule event type names
+    :return: product id to schedule event type name to tag id, and the default paused tag id
+    """
     log.info("Creating required account schedule tags")
 
     def _create_and_upload_tag(tag: dict[str, Any], product_id: str, schedule_id: str) -> str:
@@ -692,7 +874,7 @@ def create_account_schedule_tags(controlled_schedules: dict[str, list[str]]) ->
         COMMON_ACCOUNT_SCHEDULE_TAG_PATH, "account_schedule_tag"
     )
 
-    endtoend.testhandle.controlled_schedule_tags = {
+    controlled_schedule_tags = {
         product_id: {
             schedule: _create_and_upload_tag(
                 default_tag_contents, product_id=product_id, schedule_id=schedule
@@ -709,15 +891,16 @@ def create_account_schedule_tags(controlled_schedules: dict[str, list[str]]) ->
         # The ordering is important here as it means we still honour explicit requests to control
         # schedules differently in the upgraded product
         final_to = {
-            **endtoend.testhandle.controlled_schedule_tags.get(from_product, {}),
-            **endtoend.testhandle.controlled_schedule_tags.get(to_product, {}),
+            **controlled_schedule_tags.get(from_product, {}),
+            **controlled_schedule_tags.get(to_product, {}),
         }
         if final_to:
-            endtoend.testhandle.controlled_schedule_tags[to_product] = final_to
+            controlled_schedule_tags[to_product] = final_to
 
-    endtoend.testhandle.default_paused_tag_id = _create_and_upload_tag(
+    default_paused_tag_id = _create_and_upload_tag(
         default_tag_contents, product_id="All", schedule_id="DEFAULT"
     )
+    return controlled_schedule_tags, default_paused_tag_id
 
 
 def create_flag_definitions(flag_definitions: dict[str, str]) -> None:
@@ -726,8 +909,33 @@ def create_flag_definitions(flag_definitions: dict[str, str]) -> None:
     :param flag_definitions: list of flag definition ids and corresponding resource file
      paths
     """
+    store_flag_definitions(upload_flag_definitions(flag_definitions))
+
+
+def store_flag_definitions(flag_definition_ids: tuple[dict[str, str], dict[str, str]]) -> None:
+    """
+    Adds the flag definition ids returned by `upload_flag_definitions` to the testhandle
+    """
+    flag_definition_id_mapping, flag_file_paths_to_e2e_ids = flag_definition_ids
+    endtoend.testhandle.flag_definition_id_mapping.update(flag_definition_id_mapping)
+    endtoend.testhandle.flag_file_paths_to_e2e_ids.update(flag_file_paths_to_e2e_ids)
+
+
+def upload_flag_definitions(
+    flag_definitions: dict[str, str]
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Creates flag definitions, handling scenarios where they may already exist, without modifying
+    the testhandle
+    :param flag_definitions: list of flag definition ids and corresponding resource file
+     paths
+    :return: flag definition id to e2e flag definition id, and file path to e2e flag definition id
+    for the newly created flag definitions
+    """
     log.info("Creating required flag definitions")
 
+    flag_definition_id_mapping: dict[str, str] = {}
+    flag_file_paths_to_e2e_ids: dict[str, str] = {}
     for flag_definition_id, file_path in flag_definitions.items():
         definition = extract_resource(
             file_path=flag_definitions[flag_definition_id],
@@ -736,20 +944,18 @@ def create_flag_definitions(flag_definitions: dict[str, str]) -> None:
 
         # re-use e2e flag definition ids if the same flag definition file is re-used across
         # schedules or tests
-        if file_path in endtoend.testhandle.flag_file_paths_to_e2e_ids:
-            e2e_flag_definition_id = endtoend.testhandle.flag_file_paths_to_e2e_ids[
-                flag_definitions[flag_definition_id]
-            ]
-            endtoend.testhandle.flag_definition_id_mapping[
-                flag_definition_id
-            ] = e2e_flag_definition_id
-            log.info(f"Reusing flag {e2e_flag_definition_id} for {flag_definition_id}")
+        existing_e2e_id = flag_file_paths_to_e2e_ids.get(
+            file_path
+        ) or endtoend.testhandle.flag_file_paths_to_e2e_ids.get(file_path)
+        if existing_e2e_id:
+            flag_definition_id_mapping[flag_definition_id] = existing_e2e_id
+            log.info(f"Reusing flag {existing_e2e_id} for {flag_definition_id}")
             continue
 
         # this id is chosen to be unique and also relatable to the original flag definition
         e2e_flag_definition_id = f"E2E_{flag_definition_id}_{uuid.uuid4().hex}"
-        endtoend.testhandle.flag_definition_id_mapping[flag_definition_id] = e2e_flag_definition_id
-        endtoend.testhandle.flag_file_paths_to_e2e_ids[file_path] = e2e_flag_definition_id
+        flag_definition_id_mapping[flag_definition_id] = e2e_flag_definition_id
+        flag_file_paths_to_e2e_ids[file_path] = e2e_flag_definition_id
         endtoend.core_api_helper.create_flag_definition(
             flag_definition_id=e2e_flag_definition_id,
             name=e2e_flag_definition_id,
@@ -758,8 +964,21 @@ def create_flag_definitions(flag_definitions: dict[str, str]) -> None:
             flag_visibility=str(definition.get("flag_visibility", "")),
         )
 
+    return flag_definition_id_mapping, flag_file_paths_to_e2e_ids
+
 
 def upload_internal_products(internal_products: Iterable[str]) -> None:
+    endtoend.testhandle.internal_contract_pid_to_uploaded_pid.update(
+        _upload_internal_products(internal_products)
+    )
+
+
+def _upload_internal_products(internal_products: Iterable[str]) -> dict[str, str]:
+    """
+    Uploads the internal products that haven't been uploaded yet, without modifying the testhandle
+    :param internal_products: the internal product ids, e.g. TSIDE_ASSET
+    :return: internal product id to e2e product id for the uploaded products
+    """
     available_products = {
         "TSIDE_ASSET": {
             "path": EMPTY_ASSET_CONTRACT,
@@ -783,7 +1002,12 @@ def upload_internal_products(internal_products: Iterable[str]) -> None:
         else:
             raise SetupError(f"Product {product} is not available.")
 
-    upload_contracts(products_to_upload)
+    return {
+        product_id: e2e_unique_product_id
+        for product_id, (e2e_unique_product_id, _) in upload_product_versions(
+            products_to_upload
+        ).items()
+    }
 
 
 def create_required_internal_accounts(required_internal_accounts: dict[str, list[str]]) -> None:
@@ -793,13 +1017,47 @@ def create_required_internal_accounts(required_internal_accounts: dict[str, list
     from the required_internal_accounts dict
     :param required_internal_accounts: dict of tside to list of required internal account ids
     """
+    store_required_internal_accounts(upload_required_internal_accounts(required_internal_accounts))
+
+
+def store_required_internal_accounts(
+    internal_account_ids: tuple[dict[str, str], dict[str, str]]
+) -> None:
+    """
+    Adds the internal product and account ids returned by `upload_required_internal_accounts` to
+    the testhandle
+    """
+    internal_contract_pid_to_uploaded_pid, internal_account_id_to_uploaded_id = internal_account_ids
+    endtoend.testhandle.internal_contract_pid_to_uploaded_pid.update(
+        internal_contract_pid_to_uploaded_pid
+    )
+    endtoend.testhandle.internal_account_id_to_uploaded_id.update(
+        internal_account_id_to_uploaded_id
+    )
+
+
+def upload_required_internal_accounts(
+    required_internal_accounts: dict[str, list[str]]
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Creates the required internal accounts and their products, without modifying the testhandle.
+    See `create_required_internal_accounts` for details
+    :param required_internal_accounts: dict of tside to list of required internal account ids
+    :return: internal product id to e2e product id for the uploaded products, and internal account
+    id to e2e account id for the required accounts
+    """
     log.info("Creating required internal products")
 
     # Guarantee that DUMMY_CONTRA is created
     liability_accounts = required_internal_accounts.setdefault("TSIDE_LIABILITY", [DUMMY_CONTRA])
     if DUMMY_CONTRA not in liability_accounts:
         liability_accounts.append(DUMMY_CONTRA)
-    upload_internal_products(required_internal_accounts.keys())
+    uploaded_product_ids = _upload_internal_products(required_internal_accounts.keys())
+    internal_contract_pid_to_uploaded_pid = {
+        **endtoend.testhandle.internal_contract_pid_to_uploaded_pid,
+        **uploaded_product_ids,
+    }
+    internal_account_id_to_uploaded_id: dict[str, str] = {}
 
     log.info("Creating required internal accounts")
 
@@ -813,18 +1071,20 @@ def create_required_internal_accounts(required_internal_accounts: dict[str, list
                 account_id=internal_account_id, tside=product
             )
             if _does_internal_account_exist(e2e_composite_id):
-                endtoend.testhandle.internal_account_id_to_uploaded_id[
-                    internal_account_id
-                ] = e2e_composite_id
+                internal_account_id_to_uploaded_id[internal_account_id] = e2e_composite_id
             else:
                 internal_accounts_to_create[product].append(internal_account_id)
 
     for product, internal_account_ids in internal_accounts_to_create.items():
         for internal_account_id in internal_account_ids:
-            created_account = create_internal_account(
+            (
+                internal_account_id_to_uploaded_id[internal_account_id],
+                created_account,
+            ) = _create_internal_account(
                 account_id=internal_account_id,
                 contract=product,
                 accounting_tside=product,
+                internal_contract_pid_to_uploaded_pid=internal_contract_pid_to_uploaded_pid,
             )
             log.info(f'Internal Account {created_account["id"]} created')
 
@@ -832,14 +1092,20 @@ def create_required_internal_accounts(required_internal_accounts: dict[str, list
     for tside, internal_account_list in DEFAULT_REQUIRED_INTERNAL_ACCOUNTS_DICT.items():
         for internal_account in internal_account_list:
             if not _does_internal_account_exist(internal_account):
-                created_account = create_internal_account(
+                (
+                    internal_account_id_to_uploaded_id[internal_account],
+                    created_account,
+                ) = _create_internal_account(
                     account_id=internal_account,
                     contract=product,
                     accounting_tside=tside,
+                    internal_contract_pid_to_uploaded_pid=internal_contract_pid_to_uploaded_pid,
                     use_composite_id=False,
                 )
                 log.info(f'Internal Account {created_account["id"]} created using non-e2e ID')
 
+    return uploaded_product_ids, internal_account_id_to_uploaded_id
+
 
 def _does_internal_account_exist(internal_account_id: str) -> bool:
     try:
@@ -949,6 +1215,23 @@ def create_calendars(calendars: dict[str, str]) -> None:
     Creates calendars, handling scenarios where they may already exist
     :param required_calendars: contract calendar ids and their corresponding resource file paths
     """
+    store_calendars(upload_calendars(calendars))
+
+
+def store_calendars(calendar_ids_to_e2e_ids: dict[str, str]) -> None:
+    """
+    Adds the calendar ids returned by `upload_calendars` to the testhandle
+    """
+    endtoend.testhandle.calendar_ids_to_e2e_ids.update(calendar_ids_to_e2e_ids)
+
+
+def upload_calendars(calendars: dict[str, str]) -> dict[str, str]:
+    """
+    Creates calendars, handling scenarios where they may already exist, without modifying the
+    testhandle
+    :param required_calendars: contract calendar ids and their corresponding resource file paths
+    :return: contract calendar id to e2e calendar id
+    """
     log.info("Creating required calendars")
 
     required_calendars_definitions = {
@@ -962,6 +1245,7 @@ def create_calendars(calendars: dict[str, str]) -> None:
     # In most cases the calendars will already exist, unless we're on a new environment, or
     # introducing a new one. We therefore first check if they exist and only create if
     # missing, vs first trying to create, which will mostly fail due to existing definitions
+    calendar_ids_to_e2e_ids: dict[str, str] = {}
     for (
         contract_calendar_id,
         calendar_definition,
@@ -977,7 +1261,9 @@ def create_calendars(calendars: dict[str, str]) -> None:
             description=calendar_definition.get("description", ""),
         )
 
-        endtoend.testhandle.calendar_ids_to_e2e_ids[contract_calendar_id] = e2e_calendar_id
+        calendar_ids_to_e2e_ids[contract_calendar_id] = e2e_calendar_id
+
+    return calendar_ids_to_e2e_ids
 
 
 def _generate_unique_calendar_id(contract_calendar_id: str) -> str:
@@ -489,6 +489,19 @@ def get_live_balances(
     return endtoend.helper.list_resources("balances/live", params)
 
 
+def get_live_balances_for_accounts(account_ids: list[str]) -> list[dict[str, str]]:
+    """
+    Fetches live balances for multiple accounts in a single paginated request
+    :param account_ids: the accounts to fetch live balances for
+    :return: the live balances, which include the `account_id` attribute
+    """
+    params = {
+        "account_ids": account_ids,
+    }
+
+    return endtoend.helper.list_resources("balances/live", params, page_size=1000)
+
+
 def get_timerange_balances(
     account_id: str,
     from_value_time: datetime = None,
@@ -506,6 +519,13 @@ def get_timerange_balances(
     return endtoend.helper.list_resources("balances/timerange", params)
 
 
+def batch_get_accounts(account_ids: list[str]) -> dict[str, dict[str, Any]]:
+    resp = endtoend.helper.send_request("get", "/v1/accounts:batchGet", params={"ids": account_ids})
+
+    # A dict of account_id to account objects
+    return resp["accounts"]
+
+
 def get_account_update(account_update_id: str) -> dict[str, Any]:
     """
     Retrieve a specific account update by its id
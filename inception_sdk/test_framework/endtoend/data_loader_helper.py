@@ -135,22 +135,38 @@ def get_flag_resource(
     }
 
 
-def generate_account_ids(number_of_accounts: int, id_base: str = "", start: int = 0):
+def generate_account_id_base(number_of_accounts: int, id_base: str = "") -> str:
     """
-    Generate random account ids using an optional base, to which a number is prefixed and a
-    random suffix is suffixed.
-    :param number_of_accounts: number of accounts to create ids for
+    Generate a random account id base, to which a number is prefixed to create account ids. See
+    `account_id_from_base`
+    :param number_of_accounts: number of accounts that will be created with this base
     :param id_base: optional string to include in the account ids
-    :param start: optional offset to the numbered prefix
     """
 
     # account id has max length 36 as it used to be uuid only. 1 subtracted for underscore
     prefix_length = 36 - len(id_base) - 2 - len(str(number_of_accounts))
     id_base = id_base + "".join(choices(ascii_uppercase + digits, k=prefix_length))
     log.info(f"Account id in format <#>_{id_base}")
+    return id_base
+
+
+def account_id_from_base(index: int, id_base: str) -> str:
+    # index is prefixed instead of suffixed due to an accounts bug that confuses <acc>_9 and
+    # <acc>_90
+    return "_".join([str(index), id_base])
+
+
+def generate_account_ids(number_of_accounts: int, id_base: str = "", start: int = 0):
+    """
+    Generate random account ids using an optional base, to which a number is prefixed and a
+    random suffix is suffixed.
+    :param number_of_accounts: number of accounts to create ids for
+    :param id_base: optional string to include in the account ids
+    :param start: optional offset to the numbered prefix
+    """
 
-    # i is prefixed instead of suffixed due to an accounts bug that confuses <acc>_9 and <acc>_90
-    return ["_".join([str(i), id_base]) for i in range(start, start + number_of_accounts)]
+    id_base = generate_account_id_base(number_of_accounts, id_base)
+    return [account_id_from_base(i, id_base) for i in range(start, start + number_of_accounts)]
 
 
 def process_flags(
@@ -220,11 +236,17 @@ def create_dataloader_resource_batch_requests(
         account_definitions = dependency_group["accounts"]
         num_accounts = len(account_definitions)
         group_instances = dependency_group["instances"]
-        # pre-generate ids so we can populate bi-directional dependencies and optimise
-        # data-loader processing.
-        account_ids = generate_account_ids(number_of_accounts=int(group_instances) * num_accounts)
+        # ids are generated from a common base per instance, so we can populate bi-directional
+        # dependencies and optimise data-loader processing without holding all ids in memory
+        account_id_base = generate_account_id_base(
+            number_of_accounts=int(group_instances) * num_accounts
+        )
         for i in range(group_instances):
             customer_id = str(customer_id_base + i)
+            account_ids = [
+                account_id_from_base(i * num_accounts + j, account_id_base)
+                for j in range(num_accounts)
+            ]
             customer_flags = process_flags(customer_definition, customer_id, "customer_id")
             batch_resource_ids.flag_ids.extend(customer_flags.keys())
             batch_resources.extend(customer_flags.values())
@@ -232,13 +254,12 @@ def create_dataloader_resource_batch_requests(
             batch_resources.append(
                 get_customer_resource(
                     customer_id,
-                    dependencies=list(customer_flags.keys())
-                    + account_ids[i * num_accounts : (i + 1) * num_accounts],  # noqa: E203
+                    dependencies=list(customer_flags.keys()) + account_ids,
                 )
             )
 
             for j, account in enumerate(account_definitions):
-                account_id = account_ids[i * len(account_definitions) + j]
+                account_id = account_ids[j]
                 account_flags = process_flags(account, account_id, "account_id")
                 batch_resource_ids.flag_ids.extend(account_flags.keys())
                 batch_resources.extend(account_flags.values())
@@ -295,6 +316,137 @@ def create_and_produce_data_loader_requests(
     return batch_id_mapping
 
 
+@dataclass
+class DataLoaderProgress:
+    """
+    Summary of a streamed data loader run. Only counts are kept so that memory usage does not
+    depend on the number of resources
+    :param produced_batches: number of resource batch requests produced
+    :param completed_batches: number of resource batches for which an update event was received
+    :param missing_batch_ids: ids of resource batches for which no update event was received once
+    all batches were produced
+    """
+
+    produced_batches: int = 0
+    completed_batches: int = 0
+    missing_batch_ids: list[str] = field(default_factory=list)
+
+
+@kafka_only_helper
+def stream_data_loader_requests(
+    producer,
+    dependency_groups: list[dict],
+    product_version_id: str,
+    batch_size: int = 150,
+    max_in_flight_batches: int = 20,
+    batch_handler: Callable[[dict, BatchResourceIds], None] | None = None,
+) -> DataLoaderProgress:
+    """
+    Lazily creates, produces and tracks data loader resource batch requests. Unlike
+    `create_and_produce_data_loader_requests` followed by `wait_for_batch_events`, at most
+    `max_in_flight_batches` batches are awaiting completion at any time. Once the limit is reached,
+    no more requests are produced until a batch completes, so memory usage is bounded by
+    `batch_size * max_in_flight_batches` regardless of the number of accounts
+    :param producer: kafka producer to use
+    :param dependency_groups: the dependency group definitions to create requests for
+    :param product_version_id: the product_version_id for the account resources
+    :param batch_size: the number of resources in a batch that must be reached before the request
+    is sent. See create_dataloader_resource_batch_requests for more info
+    :param max_in_flight_batches: the maximum number of produced batches that haven't completed yet
+    :param batch_handler: called with the resource batch updated event and the batch's
+    BatchResourceIds for each completed batch. This should handle all possible statuses for the
+    event. The BatchResourceIds are discarded afterwards
+    :raises AssertionError: if no in-flight batch completes while production is blocked, as the
+    remaining batches would never be produced
+    :return: the progress summary
+    """
+    consumer = endtoend.testhandle.kafka_consumers[DATA_LOADER_EVENTS_TOPIC]
+    progress = DataLoaderProgress()
+    in_flight_batches: dict[str, BatchResourceIds] = {}
+    # wait_for_messages removes completed batch ids from the dict it is given before calling the
+    # callback, so we keep a separate reference to each batch's resource ids
+    in_flight_resource_ids: dict[str, BatchResourceIds] = {}
+
+    def _on_batch_completed(event_msg: dict) -> None:
+        batch_id = event_msg["resource_batch_updated"]["resource_batch"]["id"]
+        progress.completed_batches += 1
+        batch_resource_ids = in_flight_resource_ids.pop(batch_id)
+        if batch_handler:
+            batch_handler(event_msg, batch_resource_ids)
+
+    def _wait_for_batches(max_matched_messages: int = 0) -> None:
+        wait_for_messages(
+            consumer,
+            matcher=_batch_event_matcher,
+            callback=_on_batch_completed,
+            unique_message_ids=in_flight_batches,
+            # See wait_for_batch_events
+            inter_message_timeout=200,
+            matched_message_timeout=0,
+            max_matched_messages=max_matched_messages,
+        )
+
+    for request, batch_resource_ids in create_dataloader_resource_batch_requests(
+        dependency_groups, product_version_id, batch_size
+    ):
+        if len(in_flight_batches) >= max_in_flight_batches:
+            # make sure the in-flight requests have been delivered before waiting on them
+            producer.flush()
+            _wait_for_batches(max_matched_messages=1)
+            if len(in_flight_batches) >= max_in_flight_batches:
+                # the remaining requests haven't been produced, so can't be reported as missing
+                message = (
+                    f"Timed out waiting for any of {len(in_flight_batches)} in-flight resource "
+                    f"batches to complete after producing {progress.produced_batches} batches, "
+                    f"{progress.completed_batches} completed. Missing batch ids: "
+                    f"{list(in_flight_batches)}"
+                )
+                log.error(message)
+                raise AssertionError(message)
+
+        batch_id = request["resource_batch"]["id"]
+        in_flight_batches[batch_id] = batch_resource_ids
+        in_flight_resource_ids[batch_id] = batch_resource_ids
+        produce_message(producer, DATA_LOADER_REQUEST_TOPIC, json.dumps(request))
+        progress.produced_batches += 1
+        if progress.produced_batches % max_in_flight_batches == 0:
+            log.info(
+                f"Produced {progress.produced_batches} resource batches, "
+                f"{progress.completed_batches} completed"
+            )
+
+    producer.flush()
+    _wait_for_batches()
+    progress.missing_batch_ids = list(in_flight_batches)
+    log.info(
+        f"Finished streaming dataloader requests. Produced {progress.produced_batches} resource "
+        f"batches, {progress.completed_batches} completed, "
+        f"{len(progress.missing_batch_ids)} missing"
+    )
+    return progress
+
+
+def _batch_event_matcher(
+    event_msg: dict[str, Any], unique_message_ids: dict[str, Any]
+) -> tuple[str, str, bool]:
+    updated_resource_batch = event_msg.get("resource_batch_updated", {}).get("resource_batch")
+    event_request_id = event_msg["event_id"]
+    # This means RESOURCE_BATCH_STATUS_PENDING batches will not match as they have
+    # 'resource_batch_created' instead of 'resource_batch_updated'
+    if not updated_resource_batch:
+        return "", event_request_id, False
+
+    status = updated_resource_batch["status"]
+    if status != "RESOURCE_BATCH_STATUS_COMPLETE":
+        log.warning(f"Got status {status} for batch_id {updated_resource_batch['id']}")
+
+    event_id = updated_resource_batch["id"]
+    if event_id in unique_message_ids:
+        return event_id, event_request_id, True
+    else:
+        return "", event_request_id, False
+
+
 def wait_for_batch_events(batch_ids: set[str], batch_handler: Callable | None = None):
     """
     Waits for data loader resource batch updated events and calls batch handler for each event.
@@ -305,29 +457,11 @@ def wait_for_batch_events(batch_ids: set[str], batch_handler: Callable | None =
 
     consumer = endtoend.testhandle.kafka_consumers[DATA_LOADER_EVENTS_TOPIC]
 
-    def matcher(event_msg, unique_message_ids):
-        updated_resource_batch = event_msg.get("resource_batch_updated", {}).get("resource_batch")
-        event_request_id = event_msg["event_id"]
-        # This means RESOURCE_BATCH_STATUS_PENDING batches will not match as they have
-        # 'resource_batch_created' instead of 'resource_batch_updated'
-        if not updated_resource_batch:
-            return "", event_request_id, False
-
-        status = updated_resource_batch["status"]
-        if status != "RESOURCE_BATCH_STATUS_COMPLETE":
-            log.warning(f"Got status {status} for batch_id {updated_resource_batch['id']}")
-
-        event_id = updated_resource_batch["id"]
-        if event_id in unique_message_ids:
-            return event_id, event_request_id, True
-        else:
-            return "", event_request_id, False
-
     log.info(f"Waiting for dataloader responses to batch IDs: {batch_ids}")
 
     wait_for_messages(
         consumer,
-        matcher=matcher,
+        matcher=_batch_event_matcher,
         callback=batch_handler,
         unique_message_ids={batch_id: None for batch_id in batch_ids},
         # As long as we are receiving new messages from DL we don't care if they are matched or not
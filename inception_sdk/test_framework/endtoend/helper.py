@@ -37,6 +37,8 @@ logging.basicConfig(
 WORKFLOW_ENDPOINTS = ["workflow", "policies", "task", "ticket"]
 DATA_LOADER_ENDPOINTS = ["dependency-groups", "resource-batches", "resources"]
 PROMETHEUS_ENDPOINTS = ["query", "query_range"]
+# Default maximum number of independent setup steps/resource uploads to run concurrently
+DEFAULT_SETUP_MAX_WORKERS = 4
 COMMON_ACCOUNT_SCHEDULE_TAG_PATH = (
     "inception_sdk/test_framework/endtoend/resources/account_schedule_tags/"
     "paused_account_schedule_tag.resource.yaml"
@@ -236,6 +238,12 @@ class TestInstance:
         # This is needed to ensure the results can be distinguished
         # 120 secs should be min because the averaging window on graphs is typically 2min
         self.paused_schedule_tag_delay: int = 600
+        # Maximum number of independent setup steps/resource uploads to run concurrently
+        self.setup_max_workers: int = DEFAULT_SETUP_MAX_WORKERS
+        # Account/plan id to schedule id to schedule, sorted by creation time
+        # Populated by the framework when fetching schedules and cleared after each test
+        # Used to avoid refetching unmodified schedules. See schedule_helper for invalidation
+        self.schedule_cache: dict[str, dict[str, dict[str, str]]] = {}
         # Mappings for CLU references, to be used when uploading e2e resources that depend on these
         # references (e.g. uploading a contract that depends on a flag definition).
         # This is simply a merged version of the other id mapping dictionaries to avoid having to
@@ -358,6 +366,7 @@ def teardown_test_resources():
 
     endtoend.contracts_helper.teardown_all_accounts()
     endtoend.supervisors_helper.close_all_plans()
+    endtoend.testhandle.schedule_cache.clear()
 
 
 def teardown_shared_resources():
@@ -4,9 +4,10 @@ import logging
 import os
 import time
 import uuid
+from dataclasses import replace
 from datetime import datetime
 from json import dumps
-from typing import Any
+from typing import Any, Iterable
 
 # inception sdk
 import inception_sdk.test_framework.endtoend as endtoend
@@ -29,6 +30,7 @@ from inception_sdk.vault.postings.posting_classes import (
     Settlement,
     Transfer,
 )
+from inception_sdk.vault.postings.posting_patterns import PostingPattern
 from inception_sdk.vault.postings.postings_helper import create_posting_instruction_batch
 
 log = logging.getLogger(__name__)
@@ -588,19 +590,63 @@ def produce_posting_messages(
     # We assume equal number of postings per account
     num_postings = len(account_postings[list(account_postings.keys())[0]])
 
-    create_request_ids = []
-    sleep_time = 1 / tps if tps else 0
     # Publish postings by index and then account. Otherwise we get a lot of backdating.
     # We may have to implement something more complex where we send each posting when the previous
     # was successfully completed
-    for posting_index in range(num_postings):
-        for account_id, pibs in account_postings.items():
-            create_request_ids.append(
-                create_and_produce_posting_request(
-                    producer, pibs[posting_index], key=account_id, migration=True
-                )
+    return _produce_account_pibs(
+        producer,
+        (
+            (account_id, pibs[posting_index])
+            for posting_index in range(num_postings)
+            for account_id, pibs in account_postings.items()
+        ),
+        tps,
+    )
+
+
+def produce_posting_pattern_messages(
+    producer, pattern: PostingPattern, tps: int = 200
+) -> list[str]:
+    """
+    Produces the posting requests of a bulk posting pattern in chronological order, returning the
+    corresponding create request ids. The batches are generated as they are produced, so the
+    pattern can be much larger than what would fit in memory as a dict of account postings.
+    :param producer: the kafka producer to use
+    :param pattern: the posting pattern, whose account ids must be the e2e account ids. Its
+     internal account ids are mapped to the uploaded ids, and its client batch ids are made unique
+     to this call
+    :param tps: the maximum TPS to produce at
+    :return: list of create request ids for the produced posting instruction batch requests
+    """
+    pattern = replace(
+        pattern,
+        transactions=[
+            replace(
+                transaction,
+                internal_account_id=endtoend.testhandle.internal_account_id_to_uploaded_id[
+                    transaction.internal_account_id
+                ],
             )
-            time.sleep(sleep_time)
+            for transaction in pattern.transactions
+        ],
+        client_batch_id_prefix=f"{pattern.client_batch_id_prefix}_{uuid.uuid4()}",
+    )
+    log.info(f"Producing posting requests for {len(pattern.account_ids)} accounts")
+    return _produce_account_pibs(
+        producer, ((batch.account_id, batch.pib) for batch in pattern.generate()), tps
+    )
+
+
+def _produce_account_pibs(
+    producer, account_pibs: Iterable[tuple[str, dict[str, Any]]], tps: int
+) -> list[str]:
+    create_request_ids = []
+    sleep_time = 1 / tps if tps else 0
+    for account_id, pib in account_pibs:
+        create_request_ids.append(
+            create_and_produce_posting_request(producer, pib, key=account_id, migration=True)
+        )
+        time.sleep(sleep_time)
     producer.flush()
     return create_request_ids
 
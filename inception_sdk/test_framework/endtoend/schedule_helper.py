@@ -3,6 +3,7 @@
 import logging
 import os
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
@@ -27,6 +28,8 @@ SCHEDULE_STATUS_OVERRIDE_START_TIMESTAMP = datetime.min.replace(tzinfo=timezone.
 SCHEDULE_STATUS_OVERRIDE_END_TIMESTAMP = datetime.max.replace(
     microsecond=0, tzinfo=timezone.utc
 ).isoformat()
+# Maximum number of schedule ids per schedules:batchGet request
+SCHEDULES_BATCH_GET_SIZE = 50
 
 
 class ResourceType(Enum):
@@ -41,11 +44,24 @@ class AccountScheduleTagStatusOverride(str, Enum):
     SKIPPED = "ACCOUNT_SCHEDULE_TAG_SCHEDULE_STATUS_OVERRIDE_TO_SKIPPED"
 
 
+def _sort_schedules(schedules: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+    """
+    Sorts schedules by creation time, oldest first
+    """
+    return dict(
+        sorted(
+            schedules.items(),
+            key=lambda x: parser.parse(x[1]["create_timestamp"]).timestamp(),
+        )
+    )
+
+
 def _filter_and_transform_schedules(
     schedules: dict[str, dict[str, str]],
     resource_id: str,
     resource_type: ResourceType,
     statuses_to_exclude: list[str] | None = None,
+    is_sorted: bool = False,
 ) -> dict[str, dict[str, str]]:
     """
     Transforms schedules into a dictionary keyed by contract/supervisor contract event_type,
@@ -56,6 +72,8 @@ def _filter_and_transform_schedules(
     :param resource_type: The ResourceType of the id that was passed in.
     :param statuses_to_exclude: Optional list of schedules statuses to exclude.
      None Defaults to ["SCHEDULE_STATUS_DISABLED"]
+    :param is_sorted: set to True if the schedules are already sorted by creation time (e.g. they
+    come from the schedule cache) to avoid sorting them again
     """
 
     # Schedule display name for v4 is of format "<RESOURCE_ID>:<EVENT_TYPE>"
@@ -65,12 +83,7 @@ def _filter_and_transform_schedules(
         statuses_to_exclude = statuses_to_exclude or ["SCHEDULE_STATUS_DISABLED"]
 
     output_schedules = {}
-    sorted_schedules = dict(
-        sorted(
-            schedules.items(),
-            key=lambda x: parser.parse(x[1]["create_timestamp"]).timestamp(),
-        )
-    )
+    sorted_schedules = schedules if is_sorted else _sort_schedules(schedules)
     for _, schedule_details in sorted_schedules.items():
         if schedule_details["status"] not in statuses_to_exclude:
             if schedule_details["display_name"].startswith(display_name_format):
@@ -82,58 +95,169 @@ def _filter_and_transform_schedules(
     return output_schedules
 
 
+def _fetch_resource_schedules(
+    resource_ids: list[str], resource_type: ResourceType, use_cache: bool
+) -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Fetches the unfiltered schedules for multiple accounts or plans. The schedule ids are listed
+    per resource, but the schedules themselves are fetched for all resources together in as few
+    batchGet requests as possible. Fetched schedules are stored in the schedule cache
+    :param resource_ids: the account or plan ids to fetch schedules for
+    :param resource_type: indicates whether the resource ids are for accounts or plans
+    :param use_cache: if True, schedules already in the cache are not fetched again
+    :return: resource id to schedule id to schedule, sorted by schedule creation time
+    """
+    schedule_cache = endtoend.testhandle.schedule_cache
+    resource_schedules: dict[str, dict[str, dict[str, str]]] = {}
+    resource_schedule_ids: dict[str, set[str]] = {}
+
+    for resource_id in resource_ids:
+        if use_cache and resource_id in schedule_cache:
+            resource_schedules[resource_id] = schedule_cache[resource_id]
+        elif resource_type == ResourceType.ACCOUNT:
+            resource_schedule_ids[resource_id] = set(
+                assoc["schedule_id"]
+                for assoc in endtoend.core_api_helper.get_account_schedule_assocs(resource_id)
+            )
+        else:
+            # plan-schedules endpoint returns partial schedule info, so we still want to enrich
+            # from schedule endpoint
+            resource_schedule_ids[resource_id] = set(
+                schedule["id"]
+                for schedule in endtoend.core_api_helper.get_plan_schedules(resource_id)
+            )
+
+    schedule_ids = sorted(set().union(*resource_schedule_ids.values()))
+    schedules: dict[str, dict[str, str]] = {}
+    for i in range(0, len(schedule_ids), SCHEDULES_BATCH_GET_SIZE):
+        schedules.update(
+            endtoend.core_api_helper.batch_get_schedules(
+                schedule_ids[i : i + SCHEDULES_BATCH_GET_SIZE]
+            )
+        )
+
+    for resource_id, ids in resource_schedule_ids.items():
+        resource_schedules[resource_id] = _sort_schedules(
+            {schedule_id: schedules[schedule_id] for schedule_id in ids if schedule_id in schedules}
+        )
+        # Resources without schedules yet (e.g. pending accounts) are not cached, as their
+        # schedules are only created later on
+        if resource_schedules[resource_id]:
+            schedule_cache[resource_id] = resource_schedules[resource_id]
+
+    return resource_schedules
+
+
+def invalidate_schedule_cache(
+    schedule_tag_ids: list[str] | None = None,
+    schedule_ids: list[str] | None = None,
+    resource_ids: list[str] | None = None,
+) -> None:
+    """
+    Removes cached schedules that may have been modified. Cached schedules are invalidated whenever
+    the framework updates a tag, skips or triggers jobs, or finishes waiting for a job, but tests
+    modifying schedules by other means (e.g. a contract amending schedules as a result of a
+    posting) must invalidate the cache explicitly before using cached lookups
+    :param schedule_tag_ids: invalidate resources with schedules controlled by these tags
+    :param schedule_ids: invalidate resources with these schedules
+    :param resource_ids: invalidate these accounts or plans
+    If none are specified, the whole cache is invalidated
+    """
+    schedule_cache = endtoend.testhandle.schedule_cache
+    if schedule_tag_ids is None and schedule_ids is None and resource_ids is None:
+        schedule_cache.clear()
+        return
+
+    tags_to_invalidate = set(schedule_tag_ids or [])
+    schedules_to_invalidate = set(schedule_ids or [])
+    for resource_id in resource_ids or []:
+        schedule_cache.pop(resource_id, None)
+    for resource_id in list(schedule_cache):
+        if any(
+            schedule_id in schedules_to_invalidate
+            or tags_to_invalidate.intersection(schedule.get("tags") or [])
+            for schedule_id, schedule in schedule_cache[resource_id].items()
+        ):
+            del schedule_cache[resource_id]
+
+
 def get_account_schedules(
-    account_id: str, statuses_to_exclude: list[str] | None = None
+    account_id: str, statuses_to_exclude: list[str] | None = None, use_cache: bool = False
 ) -> dict[str, dict[str, str]]:
     """
     Fetches all schedules for a given account, optionally excluding certain schedule statuses
     :param account_id: the account to fetch schedules for
     :param statuses_to_exclude: the statuses to exclude from the response. Set to empty list to
     disable filtering. None Defaults to ["SCHEDULE_STATUS_DISABLED"]
+    :param use_cache: if True, the schedules are taken from the schedule cache when available. See
+    `invalidate_schedule_cache` for details on when cached schedules may be stale
     :return: a dictionary of schedules keyed by their event type
     """
 
-    account_schedule_assocs = endtoend.core_api_helper.get_account_schedule_assocs(account_id)
-    if not account_schedule_assocs:
-        return {}
+    return get_accounts_schedules(
+        [account_id], statuses_to_exclude=statuses_to_exclude, use_cache=use_cache
+    )[account_id]
 
-    account_schedule_ids = set(assoc["schedule_id"] for assoc in account_schedule_assocs)
-    response_account_schedules = endtoend.core_api_helper.batch_get_schedules(account_schedule_ids)
 
-    return _filter_and_transform_schedules(
-        response_account_schedules,
-        resource_id=account_id,
-        resource_type=ResourceType.ACCOUNT,
-        statuses_to_exclude=statuses_to_exclude,
-    )
+def get_accounts_schedules(
+    account_ids: list[str], statuses_to_exclude: list[str] | None = None, use_cache: bool = False
+) -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Fetches all schedules for multiple accounts, using a single batchGet request for the schedules
+    of up to SCHEDULES_BATCH_GET_SIZE accounts. See `get_account_schedules` for parameter details
+    :return: account id to dictionary of schedules keyed by their event type
+    """
+    return {
+        account_id: _filter_and_transform_schedules(
+            schedules,
+            resource_id=account_id,
+            resource_type=ResourceType.ACCOUNT,
+            statuses_to_exclude=statuses_to_exclude,
+            is_sorted=True,
+        )
+        for account_id, schedules in _fetch_resource_schedules(
+            account_ids, ResourceType.ACCOUNT, use_cache
+        ).items()
+    }
 
 
 def get_plan_schedules(
-    plan_id: str, statuses_to_exclude: list[str] | None = None
+    plan_id: str, statuses_to_exclude: list[str] | None = None, use_cache: bool = False
 ) -> dict[str, dict[str, str]]:
     """
     Fetches all schedules for a given plan, optionally excluding certain schedule statuses
     :param plan_id: the plan to fetch schedules for
     :param statuses_to_exclude: the statuses to exclude from the response. Set to empty list to
     disable filtering. None Defaults to ["SCHEDULE_STATUS_DISABLED"]
+    :param use_cache: if True, the schedules are taken from the schedule cache when available. See
+    `invalidate_schedule_cache` for details on when cached schedules may be stale
     :return: a dictionary of schedules keyed by their event type
     """
 
-    plan_schedules = endtoend.core_api_helper.get_plan_schedules(plan_id)
-    if not plan_schedules:
-        return {}
+    return get_plans_schedules(
+        [plan_id], statuses_to_exclude=statuses_to_exclude, use_cache=use_cache
+    )[plan_id]
 
-    # plan-schedules endpoint returns partial schedule info, so we still want to enrich from
-    # schedule endpoint
-    schedule_ids = set(schedule["id"] for schedule in plan_schedules)
-    enriched_plan_schedules = endtoend.core_api_helper.batch_get_schedules(schedule_ids)
 
-    return _filter_and_transform_schedules(
-        enriched_plan_schedules,
-        resource_id=plan_id,
-        resource_type=ResourceType.PLAN,
-        statuses_to_exclude=statuses_to_exclude,
-    )
+def get_plans_schedules(
+    plan_ids: list[str], statuses_to_exclude: list[str] | None = None, use_cache: bool = False
+) -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Fetches all schedules for multiple plans. See `get_plan_schedules` for parameter details
+    :return: plan id to dictionary of schedules keyed by their event type
+    """
+    return {
+        plan_id: _filter_and_transform_schedules(
+            schedules,
+            resource_id=plan_id,
+            resource_type=ResourceType.PLAN,
+            statuses_to_exclude=statuses_to_exclude,
+            is_sorted=True,
+        )
+        for plan_id, schedules in _fetch_resource_schedules(
+            plan_ids, ResourceType.PLAN, use_cache
+        ).items()
+    }
 
 
 @kafka_only_helper
@@ -208,15 +332,38 @@ def fast_forward_tag(paused_tag_id: str, fast_forward_to_date: datetime) -> None
         schedule_status_override=AccountScheduleTagStatusOverride.FAST_FORWARD.value,
         schedule_status_override_end_timestamp=fast_forward_to_date.isoformat(),
     )
+    invalidate_schedule_cache(schedule_tag_ids=[paused_tag_id])
 
 
-def get_schedule_tag_next_run_times(account_id: str) -> dict[str, datetime]:
+def get_schedule_tag_next_run_times(
+    account_id: str, use_cache: bool = False
+) -> dict[str, datetime]:
     """
     Returns a dictionary of schedule tags and the earliest next runtime of any associated
     schedules.
     """
+    return _get_schedule_tag_next_run_times(get_account_schedules(account_id, use_cache=use_cache))
+
+
+def get_schedule_tag_next_run_times_for_accounts(
+    account_ids: list[str], use_cache: bool = False
+) -> dict[str, dict[str, datetime]]:
+    """
+    Returns a dictionary of account id to schedule tags and the earliest next runtime of any
+    associated schedules, fetching the schedules for all accounts together
+    """
+    return {
+        account_id: _get_schedule_tag_next_run_times(account_schedules)
+        for account_id, account_schedules in get_accounts_schedules(
+            account_ids, use_cache=use_cache
+        ).items()
+    }
+
+
+def _get_schedule_tag_next_run_times(
+    account_schedules: dict[str, dict[str, str]]
+) -> dict[str, datetime]:
     schedule_next_run_times = {}
-    account_schedules = get_account_schedules(account_id)
     for schedule_details in account_schedules.values():
         for schedule_tag in schedule_details.get("tags", []):
             next_runtime = extract_date(schedule_details["next_run_timestamp"])
@@ -235,6 +382,7 @@ def skip_scheduled_jobs_and_wait(
     resource_id: str,
     resource_type: ResourceType,
     initial_wait: int = 0,
+    use_cache: bool = False,
 ) -> None:
     """
     Skips jobs for a certain schedule tag between two dates and waits until this action is complete
@@ -248,9 +396,9 @@ def skip_scheduled_jobs_and_wait(
     useful if we know there is a long delay before the results will ever be met. For example, if
     waiting for 30 jobs to skip, we know there is a 30*20 wait just for those jobs to be published.
     This is only applicable when using the REST API, not when using Kafka
+    :param use_cache: if True, the schedule's id and tag are taken from the schedule cache when
+    available. See `invalidate_schedule_cache` for details on when cached schedules may be stale
     """
-    # TODO: could we refactor this a bit as we repeatedly fetch schedules for a given name and
-    # account/plan id?
     id_and_type = f"{resource_type.value=} {resource_id=}"
     log.info(
         f"Skipping jobs for {schedule_name=} between {skip_start_date=} and {skip_end_date=} for "
@@ -258,24 +406,11 @@ def skip_scheduled_jobs_and_wait(
     )
 
     if resource_type == ResourceType.ACCOUNT:
-        schedules = get_account_schedules(resource_id)
+        schedules = get_account_schedules(resource_id, use_cache=use_cache)
     else:
-        schedules = get_plan_schedules(resource_id)
+        schedules = get_plan_schedules(resource_id, use_cache=use_cache)
 
-    if schedule_name not in schedules:
-        raise KeyError(f"No enabled {schedule_name=} for {id_and_type}")
-
-    schedule = schedules[schedule_name]
-    schedule_id = schedule["id"]
-
-    if len(schedule["tags"]) == 0:
-        raise ValueError(f"No tags found on {schedule_name=} {schedule_id=} for {id_and_type}")
-    elif len(schedule["tags"]) > 1:
-        log.info(
-            f"Found multiple tags on {schedule_name=} {schedule_id=} for {id_and_type}. First "
-            f"will be used"
-        )
-    schedule_tag_id = schedule["tags"][0]
+    schedule_tag_id, schedule_id = _get_schedule_tag_and_id(schedules, schedule_name, id_and_type)
 
     skip_scheduled_jobs_between_dates(
         schedule_tag_id=schedule_tag_id,
@@ -290,6 +425,94 @@ def skip_scheduled_jobs_and_wait(
         initial_wait=initial_wait,
         expected_run_time=skip_end_date,
     )
+    invalidate_schedule_cache(resource_ids=[resource_id])
+
+
+def skip_scheduled_jobs_for_resources_and_wait(
+    schedule_name: str,
+    skip_start_date: datetime,
+    skip_end_date: datetime,
+    resource_ids: list[str],
+    resource_type: ResourceType,
+    initial_wait: int = 0,
+    use_cache: bool = False,
+) -> None:
+    """
+    Skips jobs for a certain schedule between two dates for multiple accounts or plans and waits
+    until this action is complete. The schedules for all resources are fetched together and each
+    distinct tag is only updated and waited for once, however many resources share it.
+    See `skip_scheduled_jobs_and_wait` for parameter details
+    :param resource_ids: The account or plan ids that the schedules belong to
+    """
+    log.info(
+        f"Skipping jobs for {schedule_name=} between {skip_start_date=} and {skip_end_date=} for "
+        f"{len(resource_ids)} resources of type {resource_type.value}"
+    )
+    if resource_type == ResourceType.ACCOUNT:
+        resource_schedules = get_accounts_schedules(resource_ids, use_cache=use_cache)
+    else:
+        resource_schedules = get_plans_schedules(resource_ids, use_cache=use_cache)
+
+    tag_to_schedule_ids: dict[str, list[str]] = {}
+    for resource_id, schedules in resource_schedules.items():
+        schedule_tag_id, schedule_id = _get_schedule_tag_and_id(
+            schedules, schedule_name, f"{resource_type.value=} {resource_id=}"
+        )
+        tag_to_schedule_ids.setdefault(schedule_tag_id, []).append(schedule_id)
+
+    for schedule_tag_id in tag_to_schedule_ids:
+        skip_scheduled_jobs_between_dates(
+            schedule_tag_id=schedule_tag_id,
+            skip_start_date=skip_start_date,
+            skip_end_date=skip_end_date,
+        )
+
+    if endtoend.testhandle.use_kafka:
+        wait_for_schedule_operation_events(
+            tag_names=list(tag_to_schedule_ids),
+            wait_for_timestamp=skip_end_date,
+            inter_message_timeout=initial_wait + 20,
+            matched_message_timeout=initial_wait + 20,
+        )
+        invalidate_schedule_cache(schedule_tag_ids=list(tag_to_schedule_ids))
+    else:
+        if initial_wait > 0:
+            time.sleep(initial_wait)
+        for schedule_ids in tag_to_schedule_ids.values():
+            for schedule_id in schedule_ids:
+                wait_for_schedule_job(
+                    schedule_id=schedule_id,
+                    job_statuses=["JOB_STATUS_SKIPPED"],
+                    initial_wait=0,
+                    expected_run_time=skip_end_date,
+                )
+    invalidate_schedule_cache(resource_ids=resource_ids)
+
+
+def _get_schedule_tag_and_id(
+    schedules: dict[str, dict[str, str]], schedule_name: str, id_and_type: str
+) -> tuple[str, str]:
+    """
+    Gets the tag controlling a schedule and the schedule's id
+    :param schedules: the resource's schedules, keyed by their event type
+    :param schedule_name: Name of the Schedule, as per the contract/supervisor contract event type
+    :param id_and_type: description of the resource, used in errors
+    :return: the schedule's tag id and the schedule's id
+    """
+    if schedule_name not in schedules:
+        raise KeyError(f"No enabled {schedule_name=} for {id_and_type}")
+
+    schedule = schedules[schedule_name]
+    schedule_id = schedule["id"]
+
+    if len(schedule["tags"]) == 0:
+        raise ValueError(f"No tags found on {schedule_name=} {schedule_id=} for {id_and_type}")
+    elif len(schedule["tags"]) > 1:
+        log.info(
+            f"Found multiple tags on {schedule_name=} {schedule_id=} for {id_and_type}. First "
+            f"will be used"
+        )
+    return schedule["tags"][0], schedule_id
 
 
 def trigger_next_schedule_job_and_wait(
@@ -328,6 +551,8 @@ def trigger_next_schedule_job_and_wait(
     wait_for_schedule_job(
         schedule_tag_id=tag_id, schedule_id=schedule_id, expected_run_time=next_run_time
     )
+    # the job may have run hooks that amended the resource's schedules
+    invalidate_schedule_cache(resource_ids=[resource_id])
 
 
 def trigger_next_schedule_job(
@@ -348,6 +573,28 @@ def trigger_next_schedule_job(
     a job should be emitted, and the expected next run time for the job. These 3 items enable a
     test writer to check the job has been emitted and processed as expected.
     """
+    schedule_tag_id, schedule_id, next_run_time = get_next_schedule_job(
+        schedule_name=schedule_name,
+        resource_id=resource_id,
+        resource_type=resource_type,
+        effective_date=effective_date,
+    )
+    advance_tag_past(schedule_tag_id=schedule_tag_id, run_time=next_run_time)
+    invalidate_schedule_cache(resource_ids=[resource_id])
+    return schedule_tag_id, schedule_id, next_run_time
+
+
+def get_next_schedule_job(
+    schedule_name: str,
+    resource_id: str,
+    resource_type: ResourceType,
+    effective_date: datetime | None = None,
+) -> tuple[str, str, datetime]:
+    """
+    Determines the tag, schedule and run time of the next job for a specified schedule, without
+    triggering it. See `trigger_next_schedule_job` for parameter details
+    :returns: id of the tag that controls the schedule, id of the schedule and the next run time
+    """
     id_and_type = f"{resource_type.value=} {resource_id=}"
     log.info(f"Triggering next job for {schedule_name=} for {id_and_type}")
 
@@ -380,14 +627,237 @@ def trigger_next_schedule_job(
     if effective_date and effective_date != next_run_time:
         raise ValueError(f"{effective_date=} does not match the actual {next_run_time=}")
 
-    after_next_run_time = next_run_time + relativedelta(seconds=1)
-    if after_next_run_time > datetime.now(tz=timezone.utc):
-        fast_forward_tag(paused_tag_id=schedule_tag_id, fast_forward_to_date=after_next_run_time)
+    return schedule_tag_id, schedule_id, next_run_time
+
+
+def advance_tag_past(schedule_tag_id: str, run_time: datetime) -> datetime:
+    """
+    Updates a tag so that jobs up to and including the run time are executed
+    :param schedule_tag_id: the tag to update
+    :param run_time: the run time of the last job to execute
+    :return: the timestamp the tag was advanced to
+    """
+    after_run_time = run_time + relativedelta(seconds=1)
+    if after_run_time > datetime.now(tz=timezone.utc):
+        fast_forward_tag(paused_tag_id=schedule_tag_id, fast_forward_to_date=after_run_time)
     else:
         update_tag_test_pause_at_timestamp(
-            schedule_tag_id=schedule_tag_id, test_pause_at_timestamp=after_next_run_time
+            schedule_tag_id=schedule_tag_id, test_pause_at_timestamp=after_run_time
         )
-    return schedule_tag_id, schedule_id, next_run_time
+    return after_run_time
+
+
+@dataclass
+class ScheduleJobExpectation:
+    """
+    A schedule job that a ScheduleProgressTracker is waiting for
+    :param schedule_tag_id: the tag controlling the schedule
+    :param schedule_id: the schedule the job belongs to
+    :param expected_run_time: the run time of the job
+    :param triggered_at: epoch time at which the job was triggered
+    """
+
+    schedule_tag_id: str
+    schedule_id: str
+    expected_run_time: datetime
+    triggered_at: float
+
+
+@dataclass
+class ScheduleJobLatency:
+    """
+    Timings for a tag processed by a ScheduleProgressTracker
+    :param schedule_tag_id: the tag that was advanced
+    :param expected_run_time: the latest job run time that was waited for
+    :param num_schedules: number of schedules (e.g. across accounts) waited for via this tag
+    :param trigger_latency: seconds between the tag being advanced and the operation event
+    being received
+    """
+
+    schedule_tag_id: str
+    expected_run_time: datetime
+    num_schedules: int
+    trigger_latency: float
+
+
+class ScheduleProgressTracker:
+    """
+    Advances many schedules, potentially across tags and accounts/plans, and then waits for all of
+    the resulting jobs together. Tags are shared by all accounts of a product, so a tag is only
+    updated once per run time regardless of the number of accounts. With Kafka, completion is
+    driven by the scheduler operation events, which are emitted per tag. Otherwise the REST API is
+    polled, with a single initial wait for all schedules.
+
+    e.g.
+    tracker = ScheduleProgressTracker()
+    for account_id in account_ids:
+        tracker.trigger_next_job("ACCRUE_INTEREST", account_id, ResourceType.ACCOUNT)
+    tracker.wait()
+    log.info(tracker.latency_report())
+    """
+
+    def __init__(self) -> None:
+        # tag id to the expected jobs controlled by the tag
+        self.expectations: dict[str, list[ScheduleJobExpectation]] = {}
+        # tag id to the timestamp it has been advanced to by this tracker
+        self.advanced_tags: dict[str, datetime] = {}
+        # populated as tags complete
+        self.latencies: list[ScheduleJobLatency] = []
+        # accounts and plans with triggered jobs, whose cached schedules are invalidated on wait
+        self.resource_ids: set[str] = set()
+
+    def trigger_next_job(
+        self,
+        schedule_name: str,
+        resource_id: str,
+        resource_type: ResourceType,
+        effective_date: datetime | None = None,
+    ) -> ScheduleJobExpectation:
+        """
+        Triggers the next job for a schedule, unless the schedule's tag has already been advanced
+        far enough by this tracker. See `trigger_next_schedule_job` for parameter details
+        :return: the job to be waited for
+        """
+        schedule_tag_id, schedule_id, next_run_time = get_next_schedule_job(
+            schedule_name=schedule_name,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            effective_date=effective_date,
+        )
+        if next_run_time >= self.advanced_tags.get(schedule_tag_id, next_run_time):
+            self.advanced_tags[schedule_tag_id] = advance_tag_past(schedule_tag_id, next_run_time)
+        else:
+            log.debug(f"{schedule_tag_id=} already advanced past {next_run_time=}")
+
+        expectation = ScheduleJobExpectation(
+            schedule_tag_id=schedule_tag_id,
+            schedule_id=schedule_id,
+            expected_run_time=next_run_time,
+            triggered_at=time.time(),
+        )
+        self.expectations.setdefault(schedule_tag_id, []).append(expectation)
+        self.resource_ids.add(resource_id)
+        return expectation
+
+    def wait(self, initial_wait: int = 70) -> None:
+        """
+        Waits for all triggered jobs to complete
+        :param initial_wait: see `wait_for_schedule_job`. When polling the REST API this wait is
+        only incurred once, regardless of the number of jobs
+        """
+        if not self.expectations:
+            return
+
+        if endtoend.testhandle.use_kafka:
+            self._wait_for_operation_events(initial_wait)
+        else:
+            self._poll_jobs(initial_wait)
+        invalidate_schedule_cache(
+            schedule_tag_ids=list(self.expectations), resource_ids=sorted(self.resource_ids)
+        )
+        self.expectations.clear()
+        self.resource_ids.clear()
+
+    def _wait_for_operation_events(self, initial_wait: int) -> None:
+        consumer = endtoend.testhandle.kafka_consumers[SCHEDULER_OPERATION_EVENTS_TOPIC]
+        tag_to_expected_run_time = {
+            tag_id: max(expectation.expected_run_time for expectation in expectations)
+            for tag_id, expectations in self.expectations.items()
+        }
+
+        def matcher(event_msg, unique_message_ids):
+            event_request_id = event_msg["event_id"]
+            operation = event_msg.get("operation_created", {}).get("operation", {})
+            tag_name = operation.get("tag_name")
+            if tag_name in unique_message_ids:
+                completed_run_timestamp = extract_date(operation["completed_run_timestamp"])
+                if completed_run_timestamp >= unique_message_ids[tag_name]:
+                    return tag_name, event_request_id, True
+            return "", event_request_id, False
+
+        def callback(event_msg):
+            tag_id = event_msg["operation_created"]["operation"]["tag_name"]
+            self._record_latency(tag_id, tag_to_expected_run_time[tag_id])
+
+        log.info(f"Waiting for {len(tag_to_expected_run_time)} operation events")
+        unmatched_tags = wait_for_messages(
+            consumer,
+            matcher=matcher,
+            callback=callback,
+            unique_message_ids=tag_to_expected_run_time.copy(),
+            inter_message_timeout=initial_wait + 20,
+            matched_message_timeout=initial_wait + 20,
+        )
+        if unmatched_tags:
+            raise Exception(
+                f"Failed to retrieve {len(unmatched_tags)} operation events"
+                f" for tags: {', '.join(unmatched_tags.keys())}"
+            )
+
+    def _poll_jobs(self, initial_wait: int) -> None:
+        if initial_wait > 0:
+            time.sleep(initial_wait)
+        for tag_id, expectations in self.expectations.items():
+            for expectation in expectations:
+                wait_for_schedule_job(
+                    schedule_id=expectation.schedule_id,
+                    expected_run_time=expectation.expected_run_time,
+                    initial_wait=0,
+                )
+            self._record_latency(
+                tag_id, max(expectation.expected_run_time for expectation in expectations)
+            )
+
+    def _record_latency(self, tag_id: str, expected_run_time: datetime) -> None:
+        expectations = self.expectations[tag_id]
+        latency = ScheduleJobLatency(
+            schedule_tag_id=tag_id,
+            expected_run_time=expected_run_time,
+            num_schedules=len(expectations),
+            trigger_latency=time.time()
+            - min(expectation.triggered_at for expectation in expectations),
+        )
+        log.debug(f"Schedule job latency: {latency}")
+        self.latencies.append(latency)
+
+    def latency_report(self) -> str:
+        """
+        :return: the recorded latencies, slowest first, as a human-readable table
+        """
+        lines = [f"{'tag':<80} {'run time':<26} {'schedules':>9} {'latency (s)':>11}"]
+        for latency in sorted(self.latencies, key=lambda x: x.trigger_latency, reverse=True):
+            lines.append(
+                f"{latency.schedule_tag_id:<80} {latency.expected_run_time.isoformat():<26} "
+                f"{latency.num_schedules:>9} {latency.trigger_latency:>11.1f}"
+            )
+        return "\n".join(lines)
+
+
+def trigger_next_schedule_jobs_and_wait(
+    schedules: list[tuple[str, str, ResourceType]],
+    effective_date: datetime | None = None,
+) -> ScheduleProgressTracker:
+    """
+    Triggers the next execution of multiple schedules and waits until all associated jobs are
+    complete. This is faster than repeated calls to `trigger_next_schedule_job_and_wait`, as the
+    jobs are processed by the scheduler concurrently and tags shared by multiple accounts are only
+    updated once
+    :param schedules: schedule name, resource id and resource type for each schedule to trigger
+    :param effective_date: An optional expected effective date for all jobs to trigger. If this
+    does not match the next_run_timestamp for a schedule, a ValueError is raised
+    :return: the tracker, which holds the latencies for each tag
+    """
+    tracker = ScheduleProgressTracker()
+    for schedule_name, resource_id, resource_type in schedules:
+        tracker.trigger_next_job(
+            schedule_name=schedule_name,
+            resource_id=resource_id,
+            resource_type=resource_type,
+            effective_date=effective_date,
+        )
+    tracker.wait()
+    log.info(f"Schedule job latencies:\n{tracker.latency_report()}")
+    return tracker
 
 
 def wait_for_schedule_job(
@@ -438,6 +908,12 @@ def wait_for_schedule_job(
             max_retries=7,
         )
 
+    # the job may have modified the schedule (e.g. its next_run_timestamp)
+    invalidate_schedule_cache(
+        schedule_tag_ids=[schedule_tag_id] if schedule_tag_id else [],
+        schedule_ids=[schedule_id] if schedule_id else [],
+    )
+
 
 def _check_jobs_status(
     schedule_id: str,
@@ -488,6 +964,7 @@ def update_tag_test_pause_at_timestamp(schedule_tag_id: str, test_pause_at_times
         schedule_status_override_start_timestamp=SCHEDULE_STATUS_OVERRIDE_START_TIMESTAMP,
         schedule_status_override_end_timestamp=SCHEDULE_STATUS_OVERRIDE_END_TIMESTAMP,
     )
+    invalidate_schedule_cache(schedule_tag_ids=[schedule_tag_id])
 
 
 def skip_scheduled_jobs_between_dates(
@@ -513,3 +990,4 @@ def skip_scheduled_jobs_between_dates(
         # the pause_at_timestamp must be == skip end timestamp to not interfere
         test_pause_at_timestamp=skip_end_date.isoformat(),
     )
+    invalidate_schedule_cache(schedule_tag_ids=[schedule_tag_id])
@@ -0,0 +1,145 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# inception sdk
+from inception_sdk.test_framework.endtoend.helper import DEFAULT_SETUP_MAX_WORKERS, SetupError
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+@dataclass
+class SetupStep:
+    """
+    A single unit of e2e setup work
+    :param name: unique name for the step, used to declare dependencies
+    :param func: callable with no arguments that performs the setup and returns its results. This
+    runs in a worker thread, so it must not modify the testhandle if other steps can run alongside
+    it
+    :param merge: callable that stores the results of func, e.g. on the testhandle. This runs in
+    the main thread before any dependent steps are started
+    :param depends_on: names of the steps that must complete before this one starts
+    """
+
+    name: str
+    func: Callable[[], Any]
+    merge: Callable[[Any], None] | None = None
+    depends_on: list[str] = field(default_factory=list)
+
+
+class SetupPlanner:
+    """
+    Builds a dependency DAG of e2e setup steps and runs independent steps concurrently. Steps are
+    started as soon as all of their dependencies have completed, so a slow resource type (e.g.
+    calendars) does not hold up unrelated ones (e.g. flag definitions).
+    Steps that run alongside others return their results, which are merged into the testhandle
+    in the main thread, so the testhandle is never modified from multiple threads
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_SETUP_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.steps: dict[str, SetupStep] = {}
+        # step name to duration in seconds, populated by `run`
+        self.timings: dict[str, float] = {}
+
+    def add_step(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: list[str] | None = None,
+        merge: Callable[[Any], None] | None = None,
+    ) -> "SetupPlanner":
+        if name in self.steps:
+            raise SetupError(f"Setup step {name} has already been added")
+        self.steps[name] = SetupStep(name=name, func=func, merge=merge, depends_on=depends_on or [])
+        return self
+
+    def execution_order(self) -> list[list[str]]:
+        """
+        Groups the steps into waves, where all steps in a wave only depend on steps in previous
+        waves. This is only used for validation and logging, as `run` does not wait for a full
+        wave to complete before starting steps whose dependencies are met
+        :return: list of waves, each containing the step names in insertion order
+        """
+        for step in self.steps.values():
+            unknown = [dependency for dependency in step.depends_on if dependency not in self.steps]
+            if unknown:
+                raise SetupError(f"Setup step {step.name} depends on unknown steps {unknown}")
+
+        waves: list[list[str]] = []
+        done: set[str] = set()
+        remaining = list(self.steps)
+        while remaining:
+            wave = [
+                name
+                for name in remaining
+                if all(dependency in done for dependency in self.steps[name].depends_on)
+            ]
+            if not wave:
+                raise SetupError(f"Circular dependency detected between setup steps {remaining}")
+            waves.append(wave)
+            done.update(wave)
+            remaining = [name for name in remaining if name not in done]
+        return waves
+
+    def run(self) -> None:
+        """
+        Runs all steps, respecting dependencies. Each step's results are merged as soon as it
+        completes. The first failure stops any further steps from being started and is re-raised
+        once in-flight steps have finished
+        """
+        log.debug(f"Setup plan: {self.execution_order()}")
+
+        pending = dict(self.steps)
+        done: set[str] = set()
+        in_flight: dict[Future, str] = {}
+
+        def _timed(step: SetupStep) -> tuple[Any, float]:
+            start = time.time()
+            result = step.func()
+            return result, time.time() - start
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def _submit_ready_steps() -> None:
+                ready = [
+                    name
+                    for name, step in pending.items()
+                    if all(dependency in done for dependency in step.depends_on)
+                ]
+                for name in ready:
+                    in_flight[executor.submit(_timed, pending.pop(name))] = name
+
+            _submit_ready_steps()
+            while in_flight:
+                completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    name = in_flight.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        # The executor's context manager waits for the remaining in-flight steps
+                        # before the exception propagates
+                        raise exception
+                    result, self.timings[name] = future.result()
+                    merge = self.steps[name].merge
+                    if merge is not None:
+                        merge(result)
+                    done.add(name)
+                    # start steps unblocked by this one straight away, rather than after all the
+                    # steps that completed alongside it
+                    _submit_ready_steps()
+
+        log.info(
+            "Setup steps completed in: "
+            + ", ".join(f"{name}={duration:.2f}s" for name, duration in self.timings.items())
+        )
@@ -0,0 +1,241 @@
+# Copyright @ 2023 Thought Machine Group Limited. All rights reserved.
+# standard libs
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+from inception_sdk.test_framework.endtoend.contracts_helper import (
+    BALANCE_CLEARING_BATCH_DETAILS,
+    get_balance_clearing_postings,
+)
+from inception_sdk.test_framework.endtoend.core_api_helper import AccountStatus
+from inception_sdk.test_framework.endtoend.kafka_helper import kafka_only_helper
+from inception_sdk.vault.postings.posting_classes import CustomInstruction
+from inception_sdk.vault.postings.postings_helper import create_posting_instruction_batch
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Number of accounts processed per batch. This bounds the size of batchGet requests and the number
+# of posting requests in flight at any given time
+DEFAULT_TEARDOWN_BATCH_SIZE = 50
+# Number of concurrent account status update requests
+DEFAULT_TEARDOWN_MAX_WORKERS = 8
+
+TERMINATED_ACCOUNT_STATUSES = [
+    AccountStatus.ACCOUNT_STATUS_CLOSED,
+    AccountStatus.ACCOUNT_STATUS_CANCELLED,
+]
+
+
+@dataclass
+class TeardownProgress:
+    """
+    Cumulative progress of a bulk teardown, yielded after each batch of accounts
+    :param total: total number of accounts to teardown
+    :param terminated: number of accounts closed or cancelled so far
+    :param failed: ids of accounts that could not be terminated
+    """
+
+    total: int
+    terminated: int = 0
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.terminated + len(self.failed)
+
+
+@kafka_only_helper
+def bulk_teardown_accounts(
+    account_ids: Iterable[str],
+    batch_size: int = DEFAULT_TEARDOWN_BATCH_SIZE,
+    max_workers: int = DEFAULT_TEARDOWN_MAX_WORKERS,
+) -> Iterator[TeardownProgress]:
+    """
+    Terminates accounts in batches. For each batch, balance-clearing postings for all accounts are
+    produced to Kafka together and their responses awaited together, followed by concurrent
+    account status updates. Accounts that cannot be handled in bulk (e.g. their contract reacts
+    to the clearing postings) fall back to the per-account `terminate_account` helper
+    :param account_ids: ids of the accounts to terminate
+    :param batch_size: number of accounts to process per batch
+    :param max_workers: number of concurrent account status update requests
+    :return: yields the cumulative progress after each batch
+    """
+    account_ids = list(account_ids)
+    progress = TeardownProgress(total=len(account_ids))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for i in range(0, len(account_ids), batch_size):
+            batch = account_ids[i : i + batch_size]
+            remaining_accounts = _terminate_account_batch(batch, executor)
+            progress.terminated += len(batch) - len(remaining_accounts)
+
+            # The per-account helper includes retries and checks that we can't afford in bulk
+            for account in remaining_accounts:
+                try:
+                    endtoend.contracts_helper.terminate_account(account)
+                    progress.terminated += 1
+                # We want to continue tearing down all accounts even if one fails
+                except BaseException as e:
+                    progress.failed.append(account["id"])
+                    log.exception(f"Failed to teardown account {account['id']}: {e.args}")
+
+            log.info(
+                f"Teardown progress: {progress.processed}/{progress.total} accounts processed, "
+                f"{len(progress.failed)} failed"
+            )
+            yield progress
+
+
+def _terminate_account_batch(
+    account_ids: list[str], executor: ThreadPoolExecutor
+) -> list[dict[str, Any]]:
+    """
+    Terminates a batch of accounts, as per `bulk_teardown_accounts`
+    :param account_ids: ids of the accounts in the batch
+    :param executor: executor used for concurrent account status updates
+    :return: the accounts that could not be terminated in bulk
+    """
+    accounts = endtoend.core_api_helper.batch_get_accounts(account_ids)
+    account_statuses = {
+        account_id: AccountStatus(account["status"]) for account_id, account in accounts.items()
+    }
+
+    # Unactivated accounts should be cancelled instead of closed
+    pending_account_ids = [
+        account_id
+        for account_id, status in account_statuses.items()
+        if status is AccountStatus.ACCOUNT_STATUS_PENDING
+    ]
+    open_account_ids = [
+        account_id
+        for account_id, status in account_statuses.items()
+        if status not in TERMINATED_ACCOUNT_STATUSES
+        and status is not AccountStatus.ACCOUNT_STATUS_PENDING
+        and status is not AccountStatus.ACCOUNT_STATUS_PENDING_CLOSURE
+    ]
+    pending_closure_account_ids = [
+        account_id
+        for account_id, status in account_statuses.items()
+        if status is AccountStatus.ACCOUNT_STATUS_PENDING_CLOSURE
+    ]
+
+    failed_account_ids = set(
+        _update_account_statuses(
+            pending_account_ids, AccountStatus.ACCOUNT_STATUS_CANCELLED, executor
+        )
+    )
+
+    if open_account_ids:
+        failed_account_ids.update(
+            _clear_account_balances(
+                {account_id: accounts[account_id] for account_id in open_account_ids}
+            )
+        )
+        closing_account_ids = [
+            account_id for account_id in open_account_ids if account_id not in failed_account_ids
+        ]
+        failed_account_ids.update(
+            _update_account_statuses(
+                closing_account_ids, AccountStatus.ACCOUNT_STATUS_PENDING_CLOSURE, executor
+            )
+        )
+        closing_account_ids = [
+            account_id for account_id in closing_account_ids if account_id not in failed_account_ids
+        ]
+        try:
+            endtoend.accounts_helper.wait_for_account_updates(
+                closing_account_ids, account_update_type="closure_update"
+            )
+        except Exception as e:
+            log.warning(f"Closure updates did not complete for all accounts in batch: {e.args}")
+            failed_account_ids.update(closing_account_ids)
+        else:
+            pending_closure_account_ids.extend(closing_account_ids)
+
+    failed_account_ids.update(
+        _update_account_statuses(
+            pending_closure_account_ids, AccountStatus.ACCOUNT_STATUS_CLOSED, executor
+        )
+    )
+
+    return [accounts[account_id] for account_id in account_ids if account_id in failed_account_ids]
+
+
+def _update_account_statuses(
+    account_ids: list[str], status: AccountStatus, executor: ThreadPoolExecutor
+) -> list[str]:
+    """
+    Concurrently updates the status of multiple accounts
+    :return: ids of the accounts that could not be updated
+    """
+
+    def _update(account_id: str) -> str | None:
+        try:
+            endtoend.core_api_helper.update_account(account_id, status)
+        except Exception as e:
+            log.debug(f"Failed to update {account_id=} to {status=}: {e.args}")
+            return account_id
+        return None
+
+    return [account_id for account_id in executor.map(_update, account_ids) if account_id]
+
+
+def _clear_account_balances(accounts: dict[str, dict[str, Any]]) -> list[str]:
+    """
+    Clears the balances of multiple accounts by producing a single balance-clearing posting
+    instruction batch per account and waiting for all responses and balance updates together
+    :param accounts: account id to account resource
+    :return: ids of the accounts whose balances could not be cleared
+    """
+    account_balances: dict[str, list[dict[str, str]]] = {account_id: [] for account_id in accounts}
+    for balance in endtoend.core_api_helper.get_live_balances_for_accounts(list(accounts)):
+        account_balances[balance["account_id"]].append(balance)
+
+    request_id_to_account_id: dict[str, str] = {}
+    for account_id, balances in account_balances.items():
+        postings = [
+            posting
+            for posting_pair in get_balance_clearing_postings(accounts[account_id], balances)
+            for posting in posting_pair
+        ]
+        if not postings:
+            continue
+        pib = create_posting_instruction_batch(
+            instructions=[CustomInstruction(postings)],
+            batch_details=BALANCE_CLEARING_BATCH_DETAILS,
+            instruction_details={"force_override": "true"},
+        )["posting_instruction_batch"]
+        request_id = endtoend.postings_helper.create_and_produce_posting_request(
+            endtoend.testhandle.kafka_producer, pib, key=account_id
+        )
+        request_id_to_account_id[request_id] = account_id
+
+    if not request_id_to_account_id:
+        return []
+
+    endtoend.testhandle.kafka_producer.flush()
+    pib_ids, errors = endtoend.postings_helper.wait_for_posting_responses(
+        list(request_id_to_account_id), migration=False
+    )
+    failed_account_ids = {request_id_to_account_id[request_id] for request_id in errors}
+    endtoend.balances_helper.wait_for_balance_updates(posting_instruction_batch_ids=pib_ids)
+
+    # Contracts may react to the clearing postings (e.g. fees on withdrawal), in which case the
+    # account is left for the per-account helper to handle
+    for balance in endtoend.core_api_helper.get_live_balances_for_accounts(
+        list(request_id_to_account_id.values())
+    ):
+        if balance["amount"] != "0":
+            failed_account_ids.add(balance["account_id"])
+
+    return list(failed_account_ids)
@@ -162,6 +162,7 @@ class TestContractsHelper(TestCase):
 class UpdateContractTest(TestCase):
     maxDiff = None
 
+    @patch.object(contracts_helper, "_get_deployed_product_version_ids", Mock(return_value={}))
     @patch.object(endtoend, "testhandle")
     @patch("builtins.open", mock_open(read_data=EXAMPLE_CONTRACT_CONTENTS))
     @patch.object(endtoend.core_api_helper, "create_product_version")
@@ -169,6 +170,7 @@ class UpdateContractTest(TestCase):
         self, create_product_version_mock: Mock, mock_testhandle: MagicMock
     ):
         type(mock_testhandle).default_paused_tag_id = PropertyMock(return_value="E2E_PAUSED_TAG")
+        type(mock_testhandle).setup_max_workers = PropertyMock(return_value=1)
         type(mock_testhandle).controlled_schedule_tags = PropertyMock(
             return_value={"TEST_CONTRACT": {"EVENT_WITH_SINGLE_TAG": "E2E_AST_1"}}
         )
@@ -192,6 +194,7 @@ class UpdateContractTest(TestCase):
 
 
 class UpdateRenderedContractTest(TestCase):
+    @patch.object(contracts_helper, "_get_deployed_product_version_ids", Mock(return_value={}))
     @patch.object(endtoend, "testhandle")
     @patch.object(contracts_helper, "SmartContractRenderer")
     @patch.object(endtoend.core_api_helper, "create_product_version")
@@ -208,6 +211,7 @@ class UpdateRenderedContractTest(TestCase):
         mock_renderer.return_value = mock_renderer_instance
 
         type(mock_testhandle).default_paused_tag_id = PropertyMock(return_value="E2E_PAUSED_TAG")
+        type(mock_testhandle).setup_max_workers = PropertyMock(return_value=1)
         type(mock_testhandle).controlled_schedule_tags = PropertyMock(
             return_value={
                 "TEST_CONTRACT": {
@@ -236,6 +240,102 @@ class UpdateRenderedContractTest(TestCase):
         )
 
 
+@patch.object(endtoend, "testhandle")
+@patch.object(endtoend.core_api_helper, "create_product_version")
+@patch.object(contracts_helper, "_prepare_product_version_request")
+@patch.object(endtoend.helper, "send_request")
+class UploadContractsTest(TestCase):
+    def _prepare_request(self, product_id: str, contract_properties: dict) -> dict:
+        return {
+            "product_id": f"e2e_{product_id}_hash",
+            "is_internal": contract_properties.get("is_internal", False),
+        }
+
+    def test_already_deployed_contracts_are_not_uploaded(
+        self,
+        mock_send_request: MagicMock,
+        mock_prepare_product_version_request: MagicMock,
+        mock_create_product_version: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.setup_max_workers = 2
+        mock_testhandle.contract_pid_to_uploaded_pid = {}
+        mock_testhandle.contract_pid_to_uploaded_product_version_id = {}
+        mock_prepare_product_version_request.side_effect = self._prepare_request
+        mock_send_request.return_value = {
+            "products": {"e2e_deployed_hash": {"current_version_id": "deployed_version"}}
+        }
+        mock_create_product_version.return_value = {
+            "id": "new_version",
+            "product_id": "e2e_new_hash",
+        }
+
+        contracts_helper.upload_contracts(contracts={"deployed": {}, "new": {}})
+
+        mock_create_product_version.assert_called_once_with(
+            product_id="e2e_new_hash", is_internal=False
+        )
+        self.assertDictEqual(
+            mock_testhandle.contract_pid_to_uploaded_product_version_id,
+            {"deployed": "deployed_version", "new": "new_version"},
+        )
+        self.assertDictEqual(
+            mock_testhandle.contract_pid_to_uploaded_pid,
+            {"deployed": "e2e_deployed_hash", "new": "e2e_new_hash"},
+        )
+
+    def test_contracts_checked_individually_if_batch_get_fails(
+        self,
+        mock_send_request: MagicMock,
+        mock_prepare_product_version_request: MagicMock,
+        mock_create_product_version: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.setup_max_workers = 2
+        mock_testhandle.contract_pid_to_uploaded_pid = {}
+        mock_testhandle.contract_pid_to_uploaded_product_version_id = {}
+        mock_prepare_product_version_request.side_effect = self._prepare_request
+
+        def send_request(method, path, params):
+            if params["ids"] == ["e2e_deployed_hash"]:
+                return {
+                    "products": {"e2e_deployed_hash": {"current_version_id": "deployed_version"}}
+                }
+            raise requests.HTTPError("404 Client Error: Not Found for url")
+
+        mock_send_request.side_effect = send_request
+        mock_create_product_version.return_value = {
+            "id": "new_version",
+            "product_id": "e2e_new_hash",
+        }
+
+        contracts_helper.upload_contracts(contracts={"deployed": {}, "new": {}})
+
+        mock_create_product_version.assert_called_once_with(
+            product_id="e2e_new_hash", is_internal=False
+        )
+        self.assertEqual(mock_send_request.call_count, 3)
+
+    def test_batch_get_errors_other_than_not_found_are_raised(
+        self,
+        mock_send_request: MagicMock,
+        mock_prepare_product_version_request: MagicMock,
+        mock_create_product_version: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.setup_max_workers = 2
+        mock_prepare_product_version_request.side_effect = self._prepare_request
+        mock_send_request.side_effect = requests.HTTPError(
+            "503 Server Error: Service Unavailable for url"
+        )
+
+        with self.assertRaisesRegex(requests.HTTPError, "503 Server Error"):
+            contracts_helper.upload_contracts(contracts={"deployed": {}, "new": {}})
+
+        mock_send_request.assert_called_once()
+        mock_create_product_version.assert_not_called()
+
+
 @patch.object(contracts_helper.uuid, "uuid4")
 @patch.object(endtoend.core_api_helper, "create_account_schedule_tag")
 @patch.object(endtoend, "testhandle")
@@ -1,4 +1,5 @@
 # standard libs
+import json
 from copy import deepcopy
 from typing import Generator
 from unittest import TestCase
@@ -320,3 +321,161 @@ class DataLoaderHelperTests(TestCase):
             account_resource["dependencies"],
             "Account should have dependencies on the customer and both of its flags",
         )
+
+
+@patch.object(data_loader_helper.endtoend, "testhandle")
+@patch.object(data_loader_helper, "produce_message")
+@patch.object(data_loader_helper, "wait_for_messages")
+class StreamDataLoaderRequestsTests(TestCase):
+    def setUp(self) -> None:
+        self.dependency_groups = deepcopy(TEST_DEPENDENCY_GROUPS)
+        self.in_flight_batch_counts: list[int] = []
+        return super().setUp()
+
+    def complete_batches(
+        self,
+        consumer,
+        matcher,
+        callback,
+        unique_message_ids,
+        inter_message_timeout,
+        matched_message_timeout,
+        max_matched_messages,
+    ):
+        self.in_flight_batch_counts.append(len(unique_message_ids))
+        batch_ids = list(unique_message_ids)
+        if max_matched_messages:
+            batch_ids = batch_ids[:max_matched_messages]
+        for batch_id in batch_ids:
+            del unique_message_ids[batch_id]
+            callback(
+                {
+                    "event_id": batch_id,
+                    "resource_batch_updated": {
+                        "resource_batch": {
+                            "id": batch_id,
+                            "status": "RESOURCE_BATCH_STATUS_COMPLETE",
+                        }
+                    },
+                }
+            )
+        return unique_message_ids
+
+    def test_in_flight_batches_are_bounded(
+        self, mock_wait_for_messages: Mock, mock_produce_message: Mock, mock_testhandle: Mock
+    ):
+        mock_testhandle.use_kafka = True
+        mock_wait_for_messages.side_effect = self.complete_batches
+        batch_handler = Mock()
+        producer = Mock()
+
+        progress = data_loader_helper.stream_data_loader_requests(
+            producer,
+            dependency_groups=self.dependency_groups,
+            product_version_id="1",
+            batch_size=1,
+            max_in_flight_batches=1,
+            batch_handler=batch_handler,
+        )
+
+        self.assertEqual(progress.produced_batches, 3)
+        self.assertEqual(progress.completed_batches, 3)
+        self.assertListEqual(progress.missing_batch_ids, [])
+        self.assertEqual(mock_produce_message.call_count, 3)
+        # the wait before producing the 2nd and 3rd batches and the final wait
+        self.assertListEqual(self.in_flight_batch_counts, [1, 1, 1])
+        customer_ids = [call.args[1].customer_ids for call in batch_handler.call_args_list]
+        self.assertListEqual(customer_ids, [["1000"], ["1001"], ["1002"]])
+
+    def test_blocked_production_timeout_raises(
+        self, mock_wait_for_messages: Mock, mock_produce_message: Mock, mock_testhandle: Mock
+    ):
+        mock_testhandle.use_kafka = True
+        # no batches ever complete
+        mock_wait_for_messages.side_effect = lambda consumer, unique_message_ids, **kwargs: (
+            unique_message_ids
+        )
+
+        with self.assertRaisesRegex(
+            AssertionError, "Timed out waiting for any of 2 in-flight resource batches"
+        ):
+            data_loader_helper.stream_data_loader_requests(
+                Mock(),
+                dependency_groups=self.dependency_groups,
+                product_version_id="1",
+                batch_size=1,
+                max_in_flight_batches=2,
+            )
+
+        # production stops once the in-flight limit is reached and no batch completes
+        self.assertEqual(mock_produce_message.call_count, 2)
+
+    def test_missing_batches_reported(
+        self, mock_wait_for_messages: Mock, mock_produce_message: Mock, mock_testhandle: Mock
+    ):
+        mock_testhandle.use_kafka = True
+        # no batches ever complete
+        mock_wait_for_messages.side_effect = lambda consumer, unique_message_ids, **kwargs: (
+            unique_message_ids
+        )
+
+        progress = data_loader_helper.stream_data_loader_requests(
+            Mock(),
+            dependency_groups=self.dependency_groups,
+            product_version_id="1",
+            batch_size=1,
+            max_in_flight_batches=5,
+        )
+
+        self.assertEqual(progress.produced_batches, 3)
+        self.assertEqual(progress.completed_batches, 0)
+        self.assertEqual(len(progress.missing_batch_ids), 3)
+
+
+@patch.object(data_loader_helper.endtoend, "testhandle")
+@patch.object(data_loader_helper, "produce_message")
+class StreamDataLoaderRequestsConsumerTests(TestCase):
+    """
+    Uses the real wait_for_messages with a consumer that receives an update event for each
+    produced batch
+    """
+
+    def test_all_batches_completed(self, mock_produce_message: Mock, mock_testhandle: Mock):
+        mock_testhandle.use_kafka = True
+        events: list[Mock] = []
+
+        def _produce_message(producer, topic, message):
+            batch_id = json.loads(message)["resource_batch"]["id"]
+            event = {
+                "event_id": f"event_{batch_id}",
+                "resource_batch_updated": {
+                    "resource_batch": {"id": batch_id, "status": "RESOURCE_BATCH_STATUS_COMPLETE"}
+                },
+            }
+            events.append(
+                Mock(
+                    error=Mock(return_value=None),
+                    value=Mock(return_value=json.dumps(event).encode()),
+                )
+            )
+
+        mock_produce_message.side_effect = _produce_message
+        consumer = Mock()
+        consumer.poll.side_effect = lambda timeout: events.pop(0) if events else None
+        mock_testhandle.kafka_consumers = {data_loader_helper.DATA_LOADER_EVENTS_TOPIC: consumer}
+        batch_handler = Mock()
+
+        progress = data_loader_helper.stream_data_loader_requests(
+            Mock(),
+            dependency_groups=deepcopy(TEST_DEPENDENCY_GROUPS),
+            product_version_id="1",
+            batch_size=1,
+            max_in_flight_batches=2,
+            batch_handler=batch_handler,
+        )
+
+        self.assertEqual(progress.produced_batches, 3)
+        self.assertEqual(progress.completed_batches, 3)
+        self.assertListEqual(progress.missing_batch_ids, [])
+        customer_ids = [call.args[1].customer_ids for call in batch_handler.call_args_list]
+        self.assertListEqual(customer_ids, [["1000"], ["1001"], ["1002"]])
@@ -1,5 +1,6 @@
 # standard libs
 import json
+from datetime import datetime, timezone
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch, sentinel
 
@@ -7,6 +8,7 @@ from unittest.mock import ANY, MagicMock, Mock, PropertyMock, patch, sentinel
 import inception_sdk.test_framework.endtoend as endtoend
 from inception_sdk.common.python.file_utils import load_file_contents
 from inception_sdk.test_framework.endtoend import postings_helper
+from inception_sdk.vault.postings.posting_patterns import PostingPattern, TransactionPattern
 
 ERROR_RESPONSE = json.loads(
     load_file_contents(
@@ -132,3 +134,49 @@ class WaitForPostingResponseTest(TestCase):
 
         self.assertListEqual(pib_ids, ["a"])
         self.assertDictEqual(errored_responses, {"b": {"key": "value"}})
+
+
+@patch.object(postings_helper.time, "sleep")
+@patch.object(postings_helper, "create_and_produce_posting_request")
+@patch.object(endtoend, "testhandle")
+class ProducePostingPatternMessagesTest(TestCase):
+    def test_pattern_produced_chronologically_with_uploaded_internal_accounts(
+        self,
+        mock_testhandle: Mock,
+        mock_create_and_produce_posting_request: Mock,
+        mock_sleep: Mock,
+    ):
+        mock_testhandle.internal_account_id_to_uploaded_id = {"1": "e2e_1"}
+        mock_create_and_produce_posting_request.side_effect = lambda _, pib, **__: pib[
+            "client_batch_id"
+        ]
+        pattern = PostingPattern(
+            account_ids=["account_a", "account_b"],
+            transactions_per_account=3,
+            start=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            end=datetime(2023, 1, 2, tzinfo=timezone.utc),
+            transactions=[TransactionPattern("inbound_hard_settlement", "10")],
+        )
+        mock_producer = Mock()
+
+        request_ids = postings_helper.produce_posting_pattern_messages(
+            mock_producer, pattern, tps=0
+        )
+
+        self.assertEqual(len(request_ids), 6)
+        self.assertEqual(len(set(request_ids)), 6)
+        produced = [call.args[1] for call in mock_create_and_produce_posting_request.call_args_list]
+        self.assertListEqual(
+            [pib["value_timestamp"] for pib in produced],
+            sorted(batch.timestamp.isoformat() for batch in pattern.generate()),
+        )
+        original_batch_ids = {batch.pib["client_batch_id"] for batch in pattern.generate()}
+        for pib in produced:
+            instruction = pib["posting_instructions"][0]["inbound_hard_settlement"]
+            self.assertEqual(instruction["internal_account_id"], "e2e_1")
+            self.assertNotIn(pib["client_batch_id"], original_batch_ids)
+        self.assertListEqual(
+            [call.kwargs for call in mock_create_and_produce_posting_request.call_args_list],
+            [{"key": batch.account_id, "migration": True} for batch in pattern.generate()],
+        )
+        mock_producer.flush.assert_called_once()
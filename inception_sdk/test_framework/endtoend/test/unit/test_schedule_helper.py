@@ -452,6 +452,233 @@ class PlanScheduleFetchingTest(TestCase):
         )
 
 
+def _schedule(schedule_id: str, resource_id: str, event_type: str, tag: str) -> dict:
+    return {
+        "id": schedule_id,
+        "display_name": f"{resource_id}:{event_type}",
+        "status": "SCHEDULE_STATUS_ENABLED",
+        "create_timestamp": "2022-03-08T09:24:48.886781Z",
+        "next_run_timestamp": "2022-03-09T00:00:00Z",
+        "tags": [tag],
+    }
+
+
+CACHED_SCHEDULES = {
+    "schedule_1": _schedule("schedule_1", "account_1", "ACCRUE", "ACCRUE_TAG"),
+    "schedule_2": _schedule("schedule_2", "account_2", "ACCRUE", "ACCRUE_TAG"),
+    "schedule_3": _schedule("schedule_3", "account_2", "APPLY", "APPLY_TAG"),
+}
+
+
+@patch.object(endtoend.core_api_helper, "batch_get_schedules")
+@patch.object(endtoend.core_api_helper, "get_account_schedule_assocs")
+@patch.object(endtoend, "testhandle")
+class ScheduleCacheTest(TestCase):
+    def setUp(self) -> None:
+        self.assocs = {
+            "account_1": [{"schedule_id": "schedule_1"}],
+            "account_2": [{"schedule_id": "schedule_2"}, {"schedule_id": "schedule_3"}],
+        }
+        return super().setUp()
+
+    def test_schedules_fetched_for_multiple_accounts_in_single_batch_get(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {}
+        mock_get_account_schedule_assocs.side_effect = self.assocs.get
+        mock_batch_get_schedules.return_value = CACHED_SCHEDULES
+
+        result = schedule_helper.get_accounts_schedules(["account_1", "account_2"])
+
+        mock_batch_get_schedules.assert_called_once_with(["schedule_1", "schedule_2", "schedule_3"])
+        self.assertDictEqual(
+            result,
+            {
+                "account_1": {"ACCRUE": CACHED_SCHEDULES["schedule_1"]},
+                "account_2": {
+                    "ACCRUE": CACHED_SCHEDULES["schedule_2"],
+                    "APPLY": CACHED_SCHEDULES["schedule_3"],
+                },
+            },
+        )
+
+    @patch.object(schedule_helper, "SCHEDULES_BATCH_GET_SIZE", 2)
+    def test_batch_get_split_by_max_size(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {}
+        mock_get_account_schedule_assocs.side_effect = self.assocs.get
+        mock_batch_get_schedules.side_effect = lambda ids: {
+            schedule_id: CACHED_SCHEDULES[schedule_id] for schedule_id in ids
+        }
+
+        schedule_helper.get_accounts_schedules(["account_1", "account_2"])
+
+        mock_batch_get_schedules.assert_has_calls(
+            [call(["schedule_1", "schedule_2"]), call(["schedule_3"])]
+        )
+
+    def test_cached_schedules_only_used_if_requested(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {}
+        mock_get_account_schedule_assocs.side_effect = self.assocs.get
+        mock_batch_get_schedules.return_value = CACHED_SCHEDULES
+
+        schedule_helper.get_account_schedules("account_1")
+        schedule_helper.get_account_schedules("account_1", use_cache=True)
+        self.assertEqual(mock_batch_get_schedules.call_count, 1)
+
+        schedule_helper.get_account_schedules("account_1")
+        self.assertEqual(mock_batch_get_schedules.call_count, 2)
+
+    def test_accounts_without_schedules_not_cached(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {}
+        mock_get_account_schedule_assocs.return_value = []
+
+        self.assertDictEqual(schedule_helper.get_account_schedules("account_1"), {})
+        mock_batch_get_schedules.assert_not_called()
+        self.assertDictEqual(mock_testhandle.schedule_cache, {})
+
+    @patch.object(endtoend.core_api_helper, "update_account_schedule_tag")
+    def test_tag_update_invalidates_resources_using_tag(
+        self,
+        mock_update_account_schedule_tag: MagicMock,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {
+            "account_1": {"schedule_1": CACHED_SCHEDULES["schedule_1"]},
+            "account_2": {"schedule_3": CACHED_SCHEDULES["schedule_3"]},
+        }
+
+        schedule_helper.fast_forward_tag("ACCRUE_TAG", datetime(2022, 3, 10, tzinfo=timezone.utc))
+
+        self.assertListEqual(list(mock_testhandle.schedule_cache), ["account_2"])
+
+    def test_invalidate_by_schedule_id_and_all(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {
+            "account_1": {"schedule_1": CACHED_SCHEDULES["schedule_1"]},
+            "account_2": {"schedule_3": CACHED_SCHEDULES["schedule_3"]},
+        }
+
+        schedule_helper.invalidate_schedule_cache(schedule_ids=["schedule_3"])
+        self.assertListEqual(list(mock_testhandle.schedule_cache), ["account_1"])
+
+        schedule_helper.invalidate_schedule_cache()
+        self.assertDictEqual(mock_testhandle.schedule_cache, {})
+
+    @patch.object(schedule_helper, "wait_for_schedule_operation_events")
+    @patch.object(schedule_helper, "skip_scheduled_jobs_between_dates")
+    def test_skip_for_resources_updates_shared_tag_once(
+        self,
+        mock_skip_scheduled_jobs_between_dates: MagicMock,
+        mock_wait_for_schedule_operation_events: MagicMock,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {}
+        mock_testhandle.use_kafka = True
+        mock_get_account_schedule_assocs.side_effect = self.assocs.get
+        mock_batch_get_schedules.return_value = CACHED_SCHEDULES
+        skip_start_date = datetime(2022, 3, 9, tzinfo=timezone.utc)
+        skip_end_date = datetime(2022, 3, 20, tzinfo=timezone.utc)
+
+        schedule_helper.skip_scheduled_jobs_for_resources_and_wait(
+            schedule_name="ACCRUE",
+            skip_start_date=skip_start_date,
+            skip_end_date=skip_end_date,
+            resource_ids=["account_1", "account_2"],
+            resource_type=schedule_helper.ResourceType.ACCOUNT,
+        )
+
+        mock_skip_scheduled_jobs_between_dates.assert_called_once_with(
+            schedule_tag_id="ACCRUE_TAG",
+            skip_start_date=skip_start_date,
+            skip_end_date=skip_end_date,
+        )
+        mock_wait_for_schedule_operation_events.assert_called_once_with(
+            tag_names=["ACCRUE_TAG"],
+            wait_for_timestamp=skip_end_date,
+            inter_message_timeout=20,
+            matched_message_timeout=20,
+        )
+        # both accounts use the skipped tag
+        self.assertDictEqual(mock_testhandle.schedule_cache, {})
+
+
+    @patch.object(schedule_helper, "wait_for_schedule_job")
+    @patch.object(schedule_helper, "skip_scheduled_jobs_between_dates")
+    def test_skip_fetches_schedules_and_invalidates_resource(
+        self,
+        mock_skip_scheduled_jobs_between_dates: MagicMock,
+        mock_wait_for_schedule_job: MagicMock,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        # the cached schedule is stale, as its tag has since changed
+        mock_testhandle.schedule_cache = {
+            "account_1": {"schedule_1": {**CACHED_SCHEDULES["schedule_1"], "tags": ["OLD_TAG"]}},
+            "account_2": {"schedule_3": CACHED_SCHEDULES["schedule_3"]},
+        }
+        mock_get_account_schedule_assocs.side_effect = self.assocs.get
+        mock_batch_get_schedules.return_value = CACHED_SCHEDULES
+        skip_start_date = datetime(2022, 3, 9, tzinfo=timezone.utc)
+        skip_end_date = datetime(2022, 3, 20, tzinfo=timezone.utc)
+
+        schedule_helper.skip_scheduled_jobs_and_wait(
+            schedule_name="ACCRUE",
+            skip_start_date=skip_start_date,
+            skip_end_date=skip_end_date,
+            resource_id="account_1",
+            resource_type=schedule_helper.ResourceType.ACCOUNT,
+        )
+
+        mock_skip_scheduled_jobs_between_dates.assert_called_once_with(
+            schedule_tag_id="ACCRUE_TAG",
+            skip_start_date=skip_start_date,
+            skip_end_date=skip_end_date,
+        )
+        self.assertListEqual(list(mock_testhandle.schedule_cache), ["account_2"])
+
+    def test_invalidate_by_resource_id(
+        self,
+        mock_testhandle: MagicMock,
+        mock_get_account_schedule_assocs: MagicMock,
+        mock_batch_get_schedules: MagicMock,
+    ):
+        mock_testhandle.schedule_cache = {
+            "account_1": {"schedule_1": CACHED_SCHEDULES["schedule_1"]},
+            "account_2": {"schedule_3": CACHED_SCHEDULES["schedule_3"]},
+        }
+
+        schedule_helper.invalidate_schedule_cache(resource_ids=["account_2", "account_3"])
+
+        self.assertListEqual(list(mock_testhandle.schedule_cache), ["account_1"])
+
+
 class GetSchedulesForJobTest(TestCase):
     pass
 
@@ -791,6 +1018,142 @@ class WaitForScheduleOperationEvents(TestCase):
         )
 
 
+@patch.object(schedule_helper, "advance_tag_past")
+@patch.object(schedule_helper, "get_next_schedule_job")
+class ScheduleProgressTrackerTest(TestCase):
+    def test_shared_tag_only_advanced_once(
+        self, mock_get_next_schedule_job: MagicMock, mock_advance_tag_past: MagicMock
+    ):
+        run_time = datetime(2020, 5, 1, 23, 59, 59, tzinfo=timezone.utc)
+        mock_get_next_schedule_job.side_effect = [
+            ("tag_id", "schedule_1", run_time),
+            ("tag_id", "schedule_2", run_time),
+        ]
+        mock_advance_tag_past.return_value = datetime(2020, 5, 2, tzinfo=timezone.utc)
+
+        tracker = schedule_helper.ScheduleProgressTracker()
+        for account_id in ["account_1", "account_2"]:
+            tracker.trigger_next_job(
+                "ACCRUE_INTEREST", account_id, schedule_helper.ResourceType.ACCOUNT
+            )
+
+        mock_advance_tag_past.assert_called_once_with("tag_id", run_time)
+        self.assertListEqual(
+            [expectation.schedule_id for expectation in tracker.expectations["tag_id"]],
+            ["schedule_1", "schedule_2"],
+        )
+
+    def test_tag_advanced_again_for_later_run_time(
+        self, mock_get_next_schedule_job: MagicMock, mock_advance_tag_past: MagicMock
+    ):
+        first_run_time = datetime(2020, 5, 1, 23, 59, 59, tzinfo=timezone.utc)
+        second_run_time = datetime(2020, 5, 2, 23, 59, 59, tzinfo=timezone.utc)
+        mock_get_next_schedule_job.side_effect = [
+            ("tag_id", "schedule_1", first_run_time),
+            ("tag_id", "schedule_2", second_run_time),
+        ]
+        mock_advance_tag_past.return_value = datetime(2020, 5, 2, tzinfo=timezone.utc)
+
+        tracker = schedule_helper.ScheduleProgressTracker()
+        for account_id in ["account_1", "account_2"]:
+            tracker.trigger_next_job(
+                "ACCRUE_INTEREST", account_id, schedule_helper.ResourceType.ACCOUNT
+            )
+
+        mock_advance_tag_past.assert_has_calls(
+            [call("tag_id", first_run_time), call("tag_id", second_run_time)]
+        )
+
+    @patch.dict(
+        "inception_sdk.test_framework.endtoend.testhandle.kafka_consumers",
+        {
+            schedule_helper.SCHEDULER_OPERATION_EVENTS_TOPIC: MockConsumer(
+                [MockMessage(value=EXAMPLE_OPERATION_EVENT)]
+            )
+        },
+    )
+    @patch.object(endtoend.testhandle, "use_kafka", True)
+    def test_wait_consumes_operation_events_for_all_tags(
+        self, mock_get_next_schedule_job: MagicMock, mock_advance_tag_past: MagicMock
+    ):
+        # the example event is for tag_id, completed at 2020-05-01T23:59:59Z
+        mock_get_next_schedule_job.return_value = (
+            "tag_id",
+            "schedule_id",
+            datetime(2020, 5, 1, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        tracker = schedule_helper.ScheduleProgressTracker()
+        tracker.trigger_next_job(
+            "ACCRUE_INTEREST", "account_1", schedule_helper.ResourceType.ACCOUNT
+        )
+        tracker.wait()
+
+        self.assertEqual(len(tracker.latencies), 1)
+        self.assertEqual(tracker.latencies[0].schedule_tag_id, "tag_id")
+        self.assertEqual(tracker.latencies[0].num_schedules, 1)
+        self.assertDictEqual(tracker.expectations, {})
+
+    @patch.dict(
+        "inception_sdk.test_framework.endtoend.testhandle.kafka_consumers",
+        {schedule_helper.SCHEDULER_OPERATION_EVENTS_TOPIC: Mock()},
+    )
+    @patch.object(endtoend.testhandle, "use_kafka", True)
+    @patch.object(schedule_helper, "wait_for_messages", Mock(return_value={"tag_id": None}))
+    def test_wait_raises_for_missing_operation_events(
+        self, mock_get_next_schedule_job: MagicMock, mock_advance_tag_past: MagicMock
+    ):
+        mock_get_next_schedule_job.return_value = (
+            "tag_id",
+            "schedule_id",
+            datetime(2020, 5, 1, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        tracker = schedule_helper.ScheduleProgressTracker()
+        tracker.trigger_next_job(
+            "ACCRUE_INTEREST", "account_1", schedule_helper.ResourceType.ACCOUNT
+        )
+        with self.assertRaises(Exception) as e:
+            tracker.wait()
+        self.assertEqual(
+            e.exception.args[0], "Failed to retrieve 1 operation events for tags: tag_id"
+        )
+
+    @patch.object(endtoend.testhandle, "use_kafka", False)
+    @patch.object(schedule_helper, "wait_for_schedule_job")
+    @patch.object(schedule_helper.time, "sleep")
+    def test_wait_polls_jobs_after_single_initial_wait_without_kafka(
+        self,
+        mock_sleep: MagicMock,
+        mock_wait_for_schedule_job: MagicMock,
+        mock_get_next_schedule_job: MagicMock,
+        mock_advance_tag_past: MagicMock,
+    ):
+        run_time = datetime(2020, 5, 1, 23, 59, 59, tzinfo=timezone.utc)
+        mock_get_next_schedule_job.side_effect = [
+            ("tag_1", "schedule_1", run_time),
+            ("tag_2", "schedule_2", run_time),
+        ]
+
+        tracker = schedule_helper.ScheduleProgressTracker()
+        for schedule_name in ["ACCRUE_INTEREST", "APPLY_INTEREST"]:
+            tracker.trigger_next_job(
+                schedule_name, "account_1", schedule_helper.ResourceType.ACCOUNT
+            )
+        tracker.wait(initial_wait=10)
+
+        mock_sleep.assert_called_once_with(10)
+        mock_wait_for_schedule_job.assert_has_calls(
+            [
+                call(schedule_id="schedule_1", expected_run_time=run_time, initial_wait=0),
+                call(schedule_id="schedule_2", expected_run_time=run_time, initial_wait=0),
+            ]
+        )
+        self.assertSetEqual(
+            {latency.schedule_tag_id for latency in tracker.latencies}, {"tag_1", "tag_2"}
+        )
+
+
 class ScheduleHelperTest(TestCase):
     @patch.object(schedule_helper, "wait_for_schedule_job")
     @patch.object(schedule_helper, "trigger_next_schedule_job")
@@ -0,0 +1,132 @@
+# standard libs
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+from inception_sdk.test_framework.endtoend.helper import SetupError
+from inception_sdk.test_framework.endtoend.setup_planner import SetupPlanner
+
+
+class SetupPlannerTest(TestCase):
+    def test_execution_order_groups_independent_steps(self):
+        planner = SetupPlanner()
+        planner.add_step("flags", Mock())
+        planner.add_step("calendars", Mock())
+        planner.add_step("contracts", Mock(), depends_on=["flags", "calendars"])
+        planner.add_step("supervisors", Mock(), depends_on=["contracts"])
+        planner.add_step("postings_api_client", Mock())
+
+        self.assertListEqual(
+            planner.execution_order(),
+            [["flags", "calendars", "postings_api_client"], ["contracts"], ["supervisors"]],
+        )
+
+    def test_circular_dependency_raises_setup_error(self):
+        planner = SetupPlanner()
+        planner.add_step("contracts", Mock(), depends_on=["supervisors"])
+        planner.add_step("supervisors", Mock(), depends_on=["contracts"])
+
+        with self.assertRaisesRegex(SetupError, "Circular dependency"):
+            planner.run()
+
+    def test_unknown_dependency_raises_setup_error(self):
+        planner = SetupPlanner()
+        planner.add_step("contracts", Mock(), depends_on=["calendars"])
+
+        with self.assertRaisesRegex(SetupError, "depends on unknown steps"):
+            planner.run()
+
+    def test_duplicate_step_raises_setup_error(self):
+        planner = SetupPlanner()
+        planner.add_step("contracts", Mock())
+
+        with self.assertRaisesRegex(SetupError, "has already been added"):
+            planner.add_step("contracts", Mock())
+
+    def test_steps_run_after_dependencies(self):
+        calls = []
+        planner = SetupPlanner(max_workers=2)
+        planner.add_step("contracts", lambda: calls.append("contracts"), depends_on=["flags"])
+        planner.add_step("flags", lambda: calls.append("flags"))
+
+        planner.run()
+
+        self.assertListEqual(calls, ["flags", "contracts"])
+        self.assertSetEqual(set(planner.timings), {"flags", "contracts"})
+
+    def test_independent_steps_run_concurrently(self):
+        # each step waits for the other to start, which can only succeed if they run concurrently
+        barrier = threading.Barrier(2, timeout=5)
+        planner = SetupPlanner(max_workers=2)
+        planner.add_step("flags", barrier.wait)
+        planner.add_step("calendars", barrier.wait)
+
+        planner.run()
+
+        self.assertFalse(barrier.broken)
+
+    def test_dependent_steps_start_before_unrelated_steps_complete(self):
+        # calendars only completes once contracts has started, which can only happen if contracts
+        # is started as soon as flags completes
+        contracts_started = threading.Event()
+        planner = SetupPlanner(max_workers=2)
+        planner.add_step("calendars", lambda: self.assertTrue(contracts_started.wait(timeout=5)))
+        planner.add_step("flags", Mock())
+        planner.add_step("contracts", contracts_started.set, depends_on=["flags"])
+
+        planner.run()
+
+        self.assertSetEqual(set(planner.timings), {"calendars", "flags", "contracts"})
+
+    def test_failed_step_prevents_dependent_steps(self):
+        dependent_step = Mock()
+        planner = SetupPlanner()
+        planner.add_step("flags", Mock(side_effect=ValueError("failed")))
+        planner.add_step("contracts", dependent_step, depends_on=["flags"])
+
+        with self.assertRaisesRegex(ValueError, "failed"):
+            planner.run()
+
+        dependent_step.assert_not_called()
+
+    def test_results_merged_in_main_thread_before_dependent_steps(self):
+        merged: dict[str, tuple[str, str]] = {}
+        planner = SetupPlanner(max_workers=2)
+        planner.add_step(
+            "flags",
+            lambda: "flag_ids",
+            merge=lambda result: merged.update(flags=(result, threading.current_thread().name)),
+        )
+        planner.add_step("contracts", lambda: self.assertIn("flags", merged), depends_on=["flags"])
+
+        planner.run()
+
+        self.assertDictEqual(merged, {"flags": ("flag_ids", threading.main_thread().name)})
+
+
+class BuildSetupPlanTest(TestCase):
+    @patch.object(endtoend, "testhandle")
+    def test_resources_with_references_uploaded_in_order(self, mock_testhandle: MagicMock):
+        mock_testhandle.setup_max_workers = 4
+
+        execution_order = endtoend.build_setup_plan().execution_order()
+
+        self.assertListEqual(
+            execution_order,
+            [
+                [
+                    "account_schedule_tags",
+                    "flag_definitions",
+                    "calendars",
+                    "workflow_definition_ids",
+                    "postings_api_client",
+                ],
+                ["internal_accounts"],
+                ["contracts"],
+                ["supervisor_contracts"],
+                ["contract_modules"],
+                ["workflows"],
+            ],
+        )
@@ -0,0 +1,149 @@
+# standard libs
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, call, patch
+
+# inception sdk
+import inception_sdk.test_framework.endtoend as endtoend
+from inception_sdk.test_framework.endtoend import teardown_helper
+from inception_sdk.test_framework.endtoend.core_api_helper import AccountStatus
+
+
+def _account(account_id: str, status: str) -> dict:
+    return {"id": account_id, "status": status, "accounting": {"tside": "TSIDE_LIABILITY"}}
+
+
+def _balance(account_id: str, amount: str) -> dict:
+    return {
+        "account_id": account_id,
+        "amount": amount,
+        "denomination": "GBP",
+        "asset": "COMMERCIAL_BANK_MONEY",
+        "account_address": "DEFAULT",
+        "phase": "POSTING_PHASE_COMMITTED",
+    }
+
+
+@patch.object(endtoend, "testhandle")
+@patch.object(endtoend.contracts_helper, "terminate_account")
+@patch.object(endtoend.accounts_helper, "wait_for_account_updates")
+@patch.object(endtoend.balances_helper, "wait_for_balance_updates")
+@patch.object(endtoend.postings_helper, "wait_for_posting_responses")
+@patch.object(endtoend.postings_helper, "create_and_produce_posting_request")
+@patch.object(endtoend.core_api_helper, "update_account")
+@patch.object(endtoend.core_api_helper, "get_live_balances_for_accounts")
+@patch.object(endtoend.core_api_helper, "batch_get_accounts")
+class BulkTeardownAccountsTest(TestCase):
+    def test_accounts_terminated_in_bulk(
+        self,
+        mock_batch_get_accounts: MagicMock,
+        mock_get_live_balances_for_accounts: MagicMock,
+        mock_update_account: MagicMock,
+        mock_create_and_produce_posting_request: MagicMock,
+        mock_wait_for_posting_responses: MagicMock,
+        mock_wait_for_balance_updates: MagicMock,
+        mock_wait_for_account_updates: MagicMock,
+        mock_terminate_account: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.use_kafka = True
+        mock_testhandle.internal_account = "DUMMY_CONTRA"
+        mock_testhandle.internal_account_id_to_uploaded_id = {"DUMMY_CONTRA": "e2e_DUMMY_CONTRA"}
+        mock_batch_get_accounts.return_value = {
+            "open_1": _account("open_1", "ACCOUNT_STATUS_OPEN"),
+            "open_2": _account("open_2", "ACCOUNT_STATUS_OPEN"),
+            "pending": _account("pending", "ACCOUNT_STATUS_PENDING"),
+            "closed": _account("closed", "ACCOUNT_STATUS_CLOSED"),
+        }
+        mock_get_live_balances_for_accounts.side_effect = [
+            [_balance("open_1", "10"), _balance("open_2", "0")],
+            [_balance("open_1", "0")],
+        ]
+        mock_create_and_produce_posting_request.return_value = "request_1"
+        mock_wait_for_posting_responses.return_value = (["pib_1"], {})
+
+        progress = list(
+            teardown_helper.bulk_teardown_accounts(["open_1", "open_2", "pending", "closed"])
+        )
+
+        self.assertEqual(len(progress), 1)
+        self.assertEqual(progress[0].terminated, 4)
+        self.assertListEqual(progress[0].failed, [])
+        # only accounts with non-zero balances get a clearing posting
+        mock_create_and_produce_posting_request.assert_called_once()
+        mock_wait_for_balance_updates.assert_called_once_with(
+            posting_instruction_batch_ids=["pib_1"]
+        )
+        mock_wait_for_account_updates.assert_called_once_with(
+            ["open_1", "open_2"], account_update_type="closure_update"
+        )
+        mock_update_account.assert_has_calls(
+            [
+                call("pending", AccountStatus.ACCOUNT_STATUS_CANCELLED),
+                call("open_1", AccountStatus.ACCOUNT_STATUS_PENDING_CLOSURE),
+                call("open_2", AccountStatus.ACCOUNT_STATUS_PENDING_CLOSURE),
+                call("open_1", AccountStatus.ACCOUNT_STATUS_CLOSED),
+                call("open_2", AccountStatus.ACCOUNT_STATUS_CLOSED),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(mock_update_account.call_count, 5)
+        mock_terminate_account.assert_not_called()
+
+    def test_accounts_with_remaining_balances_fall_back_to_terminate_account(
+        self,
+        mock_batch_get_accounts: MagicMock,
+        mock_get_live_balances_for_accounts: MagicMock,
+        mock_update_account: MagicMock,
+        mock_create_and_produce_posting_request: MagicMock,
+        mock_wait_for_posting_responses: MagicMock,
+        mock_wait_for_balance_updates: MagicMock,
+        mock_wait_for_account_updates: MagicMock,
+        mock_terminate_account: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.use_kafka = True
+        mock_testhandle.internal_account = "DUMMY_CONTRA"
+        mock_testhandle.internal_account_id_to_uploaded_id = {"DUMMY_CONTRA": "e2e_DUMMY_CONTRA"}
+        account = _account("open_1", "ACCOUNT_STATUS_OPEN")
+        mock_batch_get_accounts.return_value = {"open_1": account}
+        # e.g. the contract charges a fee as a result of the clearing posting
+        mock_get_live_balances_for_accounts.side_effect = [
+            [_balance("open_1", "10")],
+            [_balance("open_1", "-1")],
+        ]
+        mock_create_and_produce_posting_request.return_value = "request_1"
+        mock_wait_for_posting_responses.return_value = (["pib_1"], {})
+
+        progress = list(teardown_helper.bulk_teardown_accounts(["open_1"]))
+
+        self.assertEqual(progress[-1].terminated, 1)
+        mock_terminate_account.assert_called_once_with(account)
+        mock_update_account.assert_not_called()
+
+    def test_failed_accounts_reported_in_progress(
+        self,
+        mock_batch_get_accounts: MagicMock,
+        mock_get_live_balances_for_accounts: MagicMock,
+        mock_update_account: MagicMock,
+        mock_create_and_produce_posting_request: MagicMock,
+        mock_wait_for_posting_responses: MagicMock,
+        mock_wait_for_balance_updates: MagicMock,
+        mock_wait_for_account_updates: MagicMock,
+        mock_terminate_account: MagicMock,
+        mock_testhandle: MagicMock,
+    ):
+        mock_testhandle.use_kafka = True
+        mock_batch_get_accounts.side_effect = lambda account_ids: {
+            account_id: _account(account_id, "ACCOUNT_STATUS_PENDING") for account_id in account_ids
+        }
+        mock_update_account.side_effect = [None, Exception("update failed")]
+        mock_terminate_account.side_effect = Mock(side_effect=Exception("terminate failed"))
+
+        progress = list(
+            teardown_helper.bulk_teardown_accounts(["pending_1", "pending_2"], batch_size=1)
+        )
+
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(progress[-1].terminated, 1)
+        self.assertListEqual(progress[-1].failed, ["pending_2"])
+        self.assertEqual(progress[-1].processed, 2)
@@ -468,17 +468,33 @@ def create_workflow_definition_id_mapping():
     that tests do not need to be aware of the modified ids
     :return:
     """
+    store_workflow_definition_id_mapping(generate_workflow_definition_id_mapping())
 
+
+def store_workflow_definition_id_mapping(
+    workflow_definition_id_mapping: dict[str, str] | None
+) -> None:
+    """
+    Sets the mapping returned by `generate_workflow_definition_id_mapping` on the testhandle
+    """
+    if workflow_definition_id_mapping is not None:
+        endtoend.testhandle.workflow_definition_id_mapping = workflow_definition_id_mapping
+
+
+def generate_workflow_definition_id_mapping() -> dict[str, str] | None:
+    """
+    Generates the mapping between original definition ids and run-specific ids, without modifying
+    the testhandle
+    :return: original to run-specific workflow definition id, or None if the test has no workflows
+    """
     if not hasattr(endtoend.testhandle, "WORKFLOWS"):
-        return
+        return None
 
-    workflow_definition_id_mapping = {
+    return {
         workflow_definition_id: generate_unique_workflow_definition_id(workflow_definition_id)
         for workflow_definition_id in endtoend.testhandle.WORKFLOWS
     }
 
-    endtoend.testhandle.workflow_definition_id_mapping = workflow_definition_id_mapping
-
 
 def update_and_upload_workflows():
     """
@@ -1,14 +1,16 @@
 # standard libs
+import hashlib
 import json
 import logging
 import os
 import platform
+import re
 import subprocess
 import tempfile
 import uuid
+from collections import defaultdict
 from pathlib import Path
-from shutil import copytree
-from typing import IO, Any
+from typing import Any, DefaultDict, Iterable
 
 # third party
 import requests
@@ -25,6 +27,15 @@ logger = logging.getLogger("deployment_utils")
 CLU_ERROR_KEYWORDS = ["FAIL", "failed to", "INVALID"]
 CLU_WARNING_KEYWORDS = ["PARTIAL SUCCESS"]
 EXPECTED_XSRF_TOKEN_LEN = 54
+RESOURCE_FILE_PATTERNS = ["*.resource.yaml", "*.resources.yaml"]
+# CLU syntax for referencing a file relative to the resource file, or another resource by id
+# (optionally followed by the field to reference, e.g. `&{resource_id:product_id}`)
+FILE_REFERENCE_PATTERN = re.compile(r"@\{(?P<file>[^}]+)\}")
+RESOURCE_REFERENCE_PATTERN = re.compile(r"&\{(?P<resource_id>[^}:]+)(:[^}]*)?\}")
+# CLU text output for a resource that was imported. The output may be wrapped across lines
+IMPORTED_RESOURCE_PATTERN = re.compile(
+    r"with ID\s+(?P<resource_id>\S+)\s+was IMPORTED successfully"
+)
 
 # mapping each type of instantiation config variable to the corresponding Vault object type and keys
 # the variable names are to be used in the instantiation_resources list located in the tmp_resources
@@ -144,7 +155,12 @@ def import_manifest_must_be_set_to_provide_extra_flags(input_dict: dict[str, Any
 
     return input_dict.get("import_manifest") or all(
         input_dict.get(flag) in {None, False, ""}
-        for flag in ["auth_cookie", "activate_workflows", "update_workflows_inst_config"]
+        for flag in [
+            "auth_cookie",
+            "activate_workflows",
+            "update_workflows_inst_config",
+            "deployment_ledger_dir",
+        ]
     )
 
 
@@ -189,6 +205,13 @@ flags.DEFINE_string(
     "the Headers of a graphql request and copying the value of the cookie header. "
     "Can only be passed if `import_manifest` is also set",
 )
+flags.DEFINE_string(
+    name="deployment_ledger_dir",
+    default="",
+    help="Directory containing a ledger of the resources imported into each environment. If set, "
+    "only resources whose content has changed since they were last imported are sent to CLU, and "
+    "only their workflows are post-processed. Can only be passed if `import_manifest` is also set",
+)
 
 # Validation
 flags.mark_bool_flags_as_mutual_exclusive(
@@ -200,10 +223,11 @@ flags.register_multi_flags_validator(
         "auth_cookie",
         "update_workflows_inst_config",
         "activate_workflows",
+        "deployment_ledger_dir",
     ],
     multi_flags_checker=import_manifest_must_be_set_to_provide_extra_flags,
     message="`import_manifest` must be set if providing one or more of `auth_cookie`, "
-    "`update_workflows_inst_config` and `activate_workflows`",
+    "`update_workflows_inst_config`, `activate_workflows` and `deployment_ledger_dir`",
 )
 flags.register_multi_flags_validator(
     flag_names=["auth_cookie", "update_workflows_inst_config"],
@@ -271,18 +295,257 @@ def check_system() -> None:
         raise Exception(f"Unsupported system {current_system}")
 
 
-def copy_resources(temp_dir, resource_root_dir="library") -> str:
+def _load_resources(file_path: Path) -> list[dict[str, Any]]:
+    with open(file_path, "r", encoding="utf-8") as resource_file:
+        resource_file_content = yaml.safe_load(resource_file) or {}
+    # .resources.yaml files contain a list of resources, .resource.yaml files a single one
+    return resource_file_content.get("resources", [resource_file_content])
+
+
+def _get_file_references(file_path: Path, content: str) -> list[Path]:
+    return [
+        Path(os.path.normpath(file_path.parent / match["file"]))
+        for match in FILE_REFERENCE_PATTERN.finditer(content)
+    ]
+
+
+def get_resource_file_index(resource_root: Path) -> DefaultDict[str, list[Path]]:
+    """
+    Index the resource files under the resource root by the ids of the resources they define
+    :param resource_root: root dir where deployment resources are
+    :returns: resource id to the paths of the resource files defining it. Ids may be defined by
+    multiple files (e.g. test-specific variants of a resource)
+    """
+    resource_file_index: DefaultDict[str, list[Path]] = defaultdict(list)
+    for pattern in RESOURCE_FILE_PATTERNS:
+        for file_path in sorted(resource_root.rglob(pattern)):
+            for resource in _load_resources(file_path):
+                if "id" in resource:
+                    resource_file_index[resource["id"]].append(file_path)
+    return resource_file_index
+
+
+def get_manifest_resource_ids(manifest_path: Path) -> list[str]:
+    """
+    :param manifest_path: path to the CLU manifest
+    :returns: the ids of the resources to import, in manifest order
+    """
+    with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+        return yaml.safe_load(manifest_file).get("resource_ids") or []
+
+
+def get_resource_files(resource_ids: list[str], resource_root: Path) -> set[Path]:
+    """
+    Determine the files needed to import resources, following `@{file}` and `&{resource_id}`
+    references transitively
+    :param resource_ids: the ids of the resources to import
+    :param resource_root: root dir where deployment resources are
+    :returns: paths of all files the resources depend on
+    """
+    resource_file_index = get_resource_file_index(resource_root)
+    resource_files: set[Path] = set()
+    visited_ids: set[str] = set()
+    files_to_visit: list[Path] = []
+
+    def _visit_ids(ids: Iterable[str]):
+        for resource_id in ids:
+            if resource_id in visited_ids:
+                continue
+            visited_ids.add(resource_id)
+            if resource_id not in resource_file_index:
+                # CLU will report this with more context, so we don't fail here
+                logger.warning(f"No resource file found under {resource_root} for {resource_id}")
+            files_to_visit.extend(resource_file_index[resource_id])
+
+    _visit_ids(resource_ids)
+    while files_to_visit:
+        file_path = files_to_visit.pop()
+        if file_path in resource_files:
+            continue
+        if not file_path.exists():
+            logger.warning(f"Referenced file {file_path} does not exist")
+            continue
+        resource_files.add(file_path)
+        content = file_path.read_text(encoding="utf-8", errors="ignore")
+        files_to_visit.extend(_get_file_references(file_path, content))
+        _visit_ids(match["resource_id"] for match in RESOURCE_REFERENCE_PATTERN.finditer(content))
+
+    return resource_files
+
+
+def get_resource_hashes(resource_ids: list[str], resource_root: Path) -> dict[str, str]:
+    """
+    Hash the content of resources, including the content of any files they reference via
+    `@{file}` and the hashes of any resources they reference via `&{resource_id}`, transitively.
+    Changing a dependency therefore also changes the hashes of its dependents, e.g. a
+    SMART_CONTRACT_MODULE_VERSIONS_LINK is re-imported when the module version it links changes
+    :param resource_ids: the ids of the resources to hash
+    :param resource_root: root dir where deployment resources are
+    :returns: resource id to sha256 hex digest of the resource content. Resources that can't be
+    found have no hash
+    """
+    resource_file_index = get_resource_file_index(resource_root)
+    loaded_resources: dict[Path, list[dict[str, Any]]] = {}
+    # resource id to the digest of its own content and the ids of the resources it references
+    content_hashes: dict[str, tuple[str, list[str]]] = {}
+    resource_hashes: dict[str, str] = {}
+
+    def _get_content_hash(resource_id: str) -> tuple[str, list[str]]:
+        digest = hashlib.sha256()
+        files_to_visit: list[Path] = []
+        referenced_ids: list[str] = []
+        for file_path in resource_file_index[resource_id]:
+            if file_path not in loaded_resources:
+                loaded_resources[file_path] = _load_resources(file_path)
+            for resource in loaded_resources[file_path]:
+                if resource.get("id") == resource_id:
+                    definition = json.dumps(resource, sort_keys=True, default=str)
+                    digest.update(definition.encode("utf-8"))
+                    files_to_visit.extend(_get_file_references(file_path, definition))
+                    referenced_ids.extend(
+                        match["resource_id"]
+                        for match in RESOURCE_REFERENCE_PATTERN.finditer(definition)
+                    )
+        visited_files: set[Path] = set()
+        while files_to_visit:
+            file_path = files_to_visit.pop(0)
+            if file_path in visited_files or not file_path.exists():
+                continue
+            visited_files.add(file_path)
+            content = file_path.read_bytes()
+            digest.update(content)
+            decoded_content = content.decode("utf-8", errors="ignore")
+            files_to_visit.extend(_get_file_references(file_path, decoded_content))
+            referenced_ids.extend(
+                match["resource_id"]
+                for match in RESOURCE_REFERENCE_PATTERN.finditer(decoded_content)
+            )
+        return digest.hexdigest(), sorted(set(referenced_ids) - {resource_id})
+
+    def _get_resource_hash(resource_id: str, dependents: tuple[str, ...]) -> str | None:
+        if resource_id in resource_hashes:
+            return resource_hashes[resource_id]
+        # missing resources are reported by CLU, and cyclic references can't be imported anyway
+        if resource_id not in resource_file_index or resource_id in dependents:
+            return None
+        if resource_id not in content_hashes:
+            content_hashes[resource_id] = _get_content_hash(resource_id)
+        content_hash, referenced_ids = content_hashes[resource_id]
+        digest = hashlib.sha256(content_hash.encode("utf-8"))
+        for referenced_id in referenced_ids:
+            referenced_hash = _get_resource_hash(referenced_id, dependents + (resource_id,))
+            digest.update(f"{referenced_id}:{referenced_hash}".encode("utf-8"))
+        resource_hashes[resource_id] = digest.hexdigest()
+        return resource_hashes[resource_id]
+
+    return {
+        resource_id: resource_hash
+        for resource_id in resource_ids
+        if (resource_hash := _get_resource_hash(resource_id, ())) is not None
+    }
+
+
+def load_deployment_ledger(ledger_path: Path) -> dict[str, str]:
+    """
+    :param ledger_path: path to the environment's deployment ledger
+    :returns: resource id to the hash of the resource content when it was last imported. Empty if
+    the ledger doesn't exist yet
+    """
+    if not ledger_path.exists():
+        return {}
+    with open(ledger_path, "r", encoding="utf-8") as ledger_file:
+        return json.load(ledger_file)
+
+
+def save_deployment_ledger(ledger_path: Path, ledger: dict[str, str]) -> None:
+    """
+    :param ledger_path: path to the environment's deployment ledger
+    :param ledger: resource id to the hash of the resource content when it was last imported
+    """
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(ledger_path, "w", encoding="utf-8") as ledger_file:
+        json.dump(ledger, ledger_file, indent=2, sort_keys=True)
+
+
+def get_changed_resource_ids(
+    resource_ids: list[str], resource_hashes: dict[str, str], ledger: dict[str, str]
+) -> list[str]:
+    """
+    :param resource_ids: the ids of the resources in the manifest
+    :param resource_hashes: resource id to the hash of the current resource content
+    :param ledger: resource id to the hash of the resource content when it was last imported
+    :returns: the ids of resources that have not been imported with their current content, in
+    manifest order. Resources that can't be hashed are always included so that CLU reports them
+    """
+    return [
+        resource_id
+        for resource_id in resource_ids
+        if resource_id not in resource_hashes
+        or ledger.get(resource_id) != resource_hashes[resource_id]
+    ]
+
+
+def get_imported_resource_ids(clu_output: list[str]) -> set[str]:
+    """
+    :param clu_output: the text output of a CLU import
+    :returns: the ids of resources that CLU reports as successfully imported
+    """
+    return {
+        match["resource_id"] for match in IMPORTED_RESOURCE_PATTERN.finditer("".join(clu_output))
+    }
+
+
+def stage_resources(
+    temp_dir: str,
+    resource_root_dir: str,
+    manifest_file_name: str,
+    resource_ids: list[str] | None = None,
+) -> str:
     """
-    Make a copy of the contents from resource root (where manifest is)
-    and all its subdirs into a temporary directory
+    Stage the manifest and only the files it depends on into a temporary directory, preserving
+    their paths relative to the resource root. Files are hard linked, or symlinked if hard links
+    aren't possible, instead of copying the whole resource root
     :param temp_dir: the temporary directory
-    :param resource_root_dir: root dir where deployment resources are
+    :param resource_root_dir: root dir where deployment resources are (where manifest is)
+    :param manifest_file_name: the manifest file name within the resource root
+    :param resource_ids: if provided, the staged manifest only imports these resources instead of
+    all of the manifest's resources. Their dependencies are still staged so that CLU can resolve
+    references to them
     :returns: the destination tmp dir
     """
-    src = os.path.join(os.getcwd(), resource_root_dir)
-    dst = os.path.join(temp_dir, resource_root_dir)
-    copytree(src, dst)
-    return dst
+    src = Path(os.getcwd(), resource_root_dir)
+    dst = Path(temp_dir, resource_root_dir)
+    manifest_path = src / manifest_file_name
+    if resource_ids is None:
+        resource_ids = get_manifest_resource_ids(manifest_path)
+        staged_files = {manifest_path}
+    else:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = yaml.safe_load(manifest_file)
+        manifest["resource_ids"] = resource_ids
+        staged_manifest_path = dst / manifest_file_name
+        staged_manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(staged_manifest_path, "w", encoding="utf-8") as staged_manifest_file:
+            yaml.safe_dump(manifest, staged_manifest_file, sort_keys=False)
+        staged_files = set()
+
+    staged_files.update(get_resource_files(resource_ids, src))
+    for file_path in staged_files:
+        relative_path = file_path.relative_to(src) if file_path.is_relative_to(src) else None
+        if relative_path is None:
+            # e.g. `@{../shared.yaml}` from a resource at the root. CLU resolves the reference
+            # relative to the staged file, so this would not be found
+            logger.warning(f"Referenced file {file_path} is outside of {src} and is not staged")
+            continue
+        staged_path = dst / relative_path
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(file_path, staged_path)
+        except OSError:
+            # e.g. the temp dir is on another filesystem
+            os.symlink(file_path, staged_path)
+    logger.info(f"Staged {len(staged_files)} files for {manifest_file_name} in {dst}")
+    return str(dst)
 
 
 def run_deployment_utils(unknown_args: list[str]):
@@ -302,11 +565,26 @@ def run_deployment_utils(unknown_args: list[str]):
         )
     elif FLAGS.import_manifest:
         # At this point we have validated that we're in an inception repo, so it's safe to create
-        # a temp directory without risking copying huge amounts of data
-        # TODO: do we still need this temp directory? It was initially required to modify temp
-        # copies of files during import, but this is no longer required with newer CLU features
+        # a temp directory. Only the files the manifest needs are staged, so that CLU doesn't
+        # have to scan the whole resource root
+        resource_ids = None
+        if FLAGS.deployment_ledger_dir:
+            ledger_path = Path(FLAGS.deployment_ledger_dir, f"{FLAGS.environment_name}.json")
+            ledger = load_deployment_ledger(ledger_path)
+            src = Path(os.getcwd(), resource_root)
+            manifest_resource_ids = get_manifest_resource_ids(src / file_name)
+            resource_hashes = get_resource_hashes(manifest_resource_ids, src)
+            resource_ids = get_changed_resource_ids(manifest_resource_ids, resource_hashes, ledger)
+            logger.info(
+                f"{len(resource_ids)} of {len(manifest_resource_ids)} resources have changed since "
+                f"they were last imported to {FLAGS.environment_name}"
+            )
+            if not resource_ids:
+                logger.info("Exiting Deployment Utils")
+                return
+
         with tempfile.TemporaryDirectory(dir=os.getcwd()) as temp_dir:
-            dst = copy_resources(temp_dir, resource_root)
+            dst = stage_resources(temp_dir, resource_root, file_name, resource_ids)
             manifest_path = os.path.join(dst, file_name)
 
             logger.info(f"Importing manifest at {manifest_path} to {FLAGS.environment_name}")
@@ -319,6 +597,16 @@ def run_deployment_utils(unknown_args: list[str]):
                 environment=environment,
                 additional_args=unknown_args,
             )
+            imported_resource_ids = None
+            if FLAGS.deployment_ledger_dir:
+                # resources that failed to import are left out so that they are retried next time
+                imported_resource_ids = get_imported_resource_ids(clu_output)
+                ledger.update(
+                    (resource_id, resource_hashes[resource_id])
+                    for resource_id in imported_resource_ids
+                    if resource_id in resource_hashes
+                )
+                save_deployment_ledger(ledger_path, ledger)
             if success:
                 post_processing(
                     clu_output=clu_output,
@@ -327,6 +615,7 @@ def run_deployment_utils(unknown_args: list[str]):
                     update_workflows_inst_config=FLAGS.update_workflows_inst_config,
                     auth_cookie=FLAGS.auth_cookie,
                     resource_root=resource_root,
+                    workflow_definition_ids=imported_resource_ids,
                 )
             else:
                 logger.warning("Post Processing skipped due to error excuting CLU command")
@@ -352,21 +641,11 @@ def run_clu(
     :param output_format: 'text' or 'json', as per CLU `output` flag
     :returns: tuple of
     - bool indicating success (true) or failure (false). Always True when using `json` output_format
-    - list of str representing stdout from CLU. Will contain a single string if using
-    `json` output_format
+    - list of str representing the output from CLU. In `text` output_format these are the lines
+    from stdout and stderr, in the order CLU wrote them. In `json` output_format this is a single
+    string with all of stdout, and stderr is only logged
     """
 
-    def _read_lines_from_io(io: IO | None = None) -> list[str]:
-        output = []
-        if io:
-            # This way we output lines one-by-one as we get them from stdout, which provides
-            # faster feedback to human users
-            line = next(io, "")
-            if line:
-                _log_clu_output(line.strip())
-                output.append(line)
-        return output
-
     command = [clu_path, function, manifest_path, f"--output={output_format}"]
     if function != "validate":
         if environment is None:
@@ -378,29 +657,34 @@ def run_clu(
     if additional_args:
         command.extend(additional_args)
 
-    # Using Popen instead of run to be able to both print and capture stdout
-    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     if output_format == "json":
-        return True, _read_lines_from_io(process.stdout)
-
+        # The json may span multiple lines and must not be mixed with stderr. communicate reads
+        # both pipes at once, so CLU can't block on a full stderr pipe while we read stdout
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        stdout, stderr = process.communicate()
+        for line in stderr.splitlines():
+            _log_clu_output(line.strip())
+        return True, [stdout]
+
+    # Using Popen instead of run to be able to both print and capture the output. stderr is merged
+    # into stdout so that a single pipe is read and CLU can't block writing to the other one
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     clu_output = []
-    # Print output as we get it until the process is complete
-    # Append each line to list as reading it from process.stdout pops the information
-    while True:
-        # Capture any output before the process has completed
-        clu_output.extend(_read_lines_from_io(process.stdout))
-        return_code = process.poll()
-        if return_code is not None:
-            success = return_code == 0
-            if success:
-                logger.info("Completed CLU command")
-            else:
-                logger.error("Error while executing CLU command")
-            # At this point the process has completed, but we may have missed some output
-            clu_output.extend(_read_lines_from_io(process.stdout))
-            clu_output.extend(_read_lines_from_io(process.stderr))
-            break
-    return success, clu_output
+    # Iterating over stdout blocks until each line is available, so lines are output one-by-one
+    # as we get them, which provides faster feedback to human users, until CLU closes stdout
+    if process.stdout:
+        for line in process.stdout:
+            _log_clu_output(line.strip())
+            clu_output.append(line)
+    return_code = process.wait()
+
+    if return_code == 0:
+        logger.info("Completed CLU command")
+    else:
+        logger.error("Error while executing CLU command")
+    return return_code == 0, clu_output
 
 
 def post_processing(
@@ -410,6 +694,7 @@ def post_processing(
     update_workflows_inst_config: bool = False,
     auth_cookie: str = "",
     resource_root: str = "library",
+    workflow_definition_ids: set[str] | None = None,
 ) -> None:
     """
     :param clu_output: output from CLU deployment
@@ -421,6 +706,8 @@ def post_processing(
     :param auth_cookie: authentication cookie containing three different tokens, used for
     ops-dash login
     :resource_root: root dir that contains manifest.yaml and all deployment resources
+    :param workflow_definition_ids: if provided, only the instantiation config of these workflow
+    definitions is updated. Activation only ever applies to workflows imported by `clu_output`
     """
     logger.info("Starting post processing")
     if activate_workflows:
@@ -428,7 +715,11 @@ def post_processing(
     if update_workflows_inst_config:
         xsrf_token = extract_xsrf_token_from_cookie(auth_cookie)
         handle_workflows_inst_config(
-            xsrf_token, auth_cookie, environment.ops_dash_url, resource_root
+            xsrf_token,
+            auth_cookie,
+            environment.ops_dash_url,
+            resource_root,
+            workflow_definition_ids,
         )
     logger.info("Completed post processing")
 
@@ -478,7 +769,11 @@ def handle_workflow_activation(environment: Environment, clu_output: list[str]):
 
 
 def handle_workflows_inst_config(
-    xsrf_token: str, auth_cookie: str, ops_dash_url: str, resource_root="library"
+    xsrf_token: str,
+    auth_cookie: str,
+    ops_dash_url: str,
+    resource_root="library",
+    workflow_definition_ids: set[str] | None = None,
 ):
     """
     Updates the workflows instantiation configurations after a CLU deployment, based on the setup
@@ -490,6 +785,7 @@ def handle_workflows_inst_config(
     :param ops_dash_url: url of the ops-dash for the specific environment where the workflows
     instantiation config needs to be updated
     :param resource_root: root dir where deployment resources reside
+    :param workflow_definition_ids: if provided, only these workflow definitions are updated
     """
     logger.info("Updating Workflow Instantiation Config")
     if not xsrf_token:
@@ -511,6 +807,8 @@ def handle_workflows_inst_config(
             resources = yaml.safe_load(yaml_str)["resources"]
             for resource in resources:
                 wf_def_id = resource["id"]
+                if workflow_definition_ids is not None and wf_def_id not in workflow_definition_ids:
+                    continue
                 logger.info(f"Updating inst config for workflow {wf_def_id}")
                 wf_inst_resources = resource["instantiation_resources"]
                 if not wf_inst_resources:
@@ -1,5 +1,10 @@
 # standard libs
-from unittest import TestCase, main
+import json
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import TestCase, main, mock
 
 # inception sdk
 import inception_sdk.tools.deployment_utils.deployment_utils as deployment_utils
@@ -147,5 +152,278 @@ class DeploymentUtilsTest(TestCase):
         self.assertFalse(deployment_utils.deployment_status_successful(clu_output_2))
 
 
+class ResourceLibraryTestCase(TestCase):
+    """
+    Runs each test from the root of a small resource library
+    """
+
+    def setUp(self) -> None:
+        self.root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.root.cleanup)
+        files = {
+            "library/test_manifest.yaml": "resource_ids:\n  - product\n",
+            "library/product/product.resource.yaml": (
+                "id: product\npayload: |\n  code: '@{contracts/product.py}'\n"
+                "  tag: '&{PRODUCT_TAG:id}'\n"
+            ),
+            "library/product/contracts/product.py": "pass\n",
+            "library/product/tags.resources.yaml": (
+                "resources:\n  - id: PRODUCT_TAG\n    payload: '@{tag_spec.yaml}'\n"
+            ),
+            "library/product/tag_spec.yaml": "tag: '&{SHARED_TAG}'\n",
+            "library/common/shared.resource.yaml": "id: SHARED_TAG\n",
+            "library/other/other.resource.yaml": "id: other\npayload: '@{other.py}'\n",
+            "library/other/other.py": "pass\n",
+        }
+        for file_path, content in files.items():
+            full_path = Path(self.root.name, file_path)
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            full_path.write_text(content)
+        cwd = os.getcwd()
+        os.chdir(self.root.name)
+        self.addCleanup(os.chdir, cwd)
+
+
+class StageResourcesTest(ResourceLibraryTestCase):
+    def test_only_manifest_dependencies_staged(self):
+        with tempfile.TemporaryDirectory(dir=self.root.name) as temp_dir:
+            dst = deployment_utils.stage_resources(temp_dir, "library", "test_manifest.yaml")
+
+            staged_files = sorted(
+                str(file_path.relative_to(dst))
+                for file_path in Path(dst).rglob("*")
+                if file_path.is_file()
+            )
+            self.assertListEqual(
+                staged_files,
+                [
+                    "common/shared.resource.yaml",
+                    "product/contracts/product.py",
+                    "product/product.resource.yaml",
+                    "product/tag_spec.yaml",
+                    "product/tags.resources.yaml",
+                    "test_manifest.yaml",
+                ],
+            )
+            self.assertEqual(Path(dst, "product/contracts/product.py").read_text(), "pass\n")
+
+    def test_missing_references_logged(self):
+        Path(self.root.name, "library/product/contracts/product.py").unlink()
+        Path(self.root.name, "library/test_manifest.yaml").write_text(
+            "resource_ids:\n  - product\n  - missing\n"
+        )
+
+        with tempfile.TemporaryDirectory(dir=self.root.name) as temp_dir:
+            with self.assertLogs(deployment_utils.logger, level="WARNING") as logs:
+                deployment_utils.stage_resources(temp_dir, "library", "test_manifest.yaml")
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("No resource file found", logs.output[0])
+        self.assertIn("product.py does not exist", logs.output[1])
+
+    def test_falls_back_to_symlinks(self):
+        with tempfile.TemporaryDirectory(dir=self.root.name) as temp_dir:
+            with mock.patch.object(deployment_utils.os, "link", side_effect=OSError):
+                dst = deployment_utils.stage_resources(temp_dir, "library", "test_manifest.yaml")
+
+            self.assertTrue(Path(dst, "test_manifest.yaml").is_symlink())
+            self.assertEqual(Path(dst, "product/contracts/product.py").read_text(), "pass\n")
+
+    def test_only_changed_resources_imported(self):
+        with tempfile.TemporaryDirectory(dir=self.root.name) as temp_dir:
+            dst = deployment_utils.stage_resources(
+                temp_dir, "library", "test_manifest.yaml", resource_ids=["other"]
+            )
+
+            self.assertFalse(Path(dst, "test_manifest.yaml").is_symlink())
+            self.assertListEqual(
+                deployment_utils.get_manifest_resource_ids(Path(dst, "test_manifest.yaml")),
+                ["other"],
+            )
+            self.assertTrue(Path(dst, "other/other.py").exists())
+            self.assertFalse(Path(dst, "product").exists())
+        # the original manifest is unchanged
+        self.assertListEqual(
+            deployment_utils.get_manifest_resource_ids(
+                Path(self.root.name, "library/test_manifest.yaml")
+            ),
+            ["product"],
+        )
+
+
+class DeploymentLedgerTest(ResourceLibraryTestCase):
+    def _get_resource_hashes(self) -> dict[str, str]:
+        return deployment_utils.get_resource_hashes(
+            ["product", "PRODUCT_TAG", "SHARED_TAG", "missing"], Path(self.root.name, "library")
+        )
+
+    def test_referenced_file_changes_change_hash(self):
+        resource_hashes = self._get_resource_hashes()
+        self.assertListEqual(list(resource_hashes), ["product", "PRODUCT_TAG", "SHARED_TAG"])
+
+        # tag_spec.yaml is included in PRODUCT_TAG, which product references by id
+        Path(self.root.name, "library/product/tag_spec.yaml").write_text("tag: new\n")
+        new_resource_hashes = self._get_resource_hashes()
+
+        self.assertListEqual(
+            deployment_utils.get_changed_resource_ids(
+                ["product", "PRODUCT_TAG", "SHARED_TAG", "missing"],
+                new_resource_hashes,
+                resource_hashes,
+            ),
+            ["product", "PRODUCT_TAG", "missing"],
+        )
+
+    def test_referenced_resource_changes_change_dependent_hashes(self):
+        resource_hashes = self._get_resource_hashes()
+
+        # SHARED_TAG is referenced by PRODUCT_TAG's tag_spec.yaml, which product references
+        Path(self.root.name, "library/common/shared.resource.yaml").write_text(
+            "id: SHARED_TAG\nname: new\n"
+        )
+        new_resource_hashes = self._get_resource_hashes()
+
+        self.assertListEqual(
+            deployment_utils.get_changed_resource_ids(
+                ["product", "PRODUCT_TAG", "SHARED_TAG"], new_resource_hashes, resource_hashes
+            ),
+            ["product", "PRODUCT_TAG", "SHARED_TAG"],
+        )
+
+    def test_module_versions_link_changes_with_linked_module(self):
+        Path(self.root.name, "library/common/module.resources.yaml").write_text(
+            "resources:\n"
+            "  - id: utils_version\n"
+            "    type: SMART_CONTRACT_MODULE_VERSION\n"
+            "    payload: '@{utils.py}'\n"
+            "  - id: product_module_versions_link\n"
+            "    type: SMART_CONTRACT_MODULE_VERSIONS_LINK\n"
+            "    payload: |\n"
+            "      smart_contract_version_id: '&{product}'\n"
+            "      alias_to_contract_module_version_id:\n"
+            "        utils: '&{utils_version}'\n"
+        )
+        Path(self.root.name, "library/common/utils.py").write_text("pass\n")
+        resource_ids = ["utils_version", "product", "product_module_versions_link"]
+        resource_root = Path(self.root.name, "library")
+        resource_hashes = deployment_utils.get_resource_hashes(resource_ids, resource_root)
+
+        Path(self.root.name, "library/common/utils.py").write_text("UTILS = 1\n")
+        new_resource_hashes = deployment_utils.get_resource_hashes(resource_ids, resource_root)
+        self.assertListEqual(
+            deployment_utils.get_changed_resource_ids(
+                resource_ids, new_resource_hashes, resource_hashes
+            ),
+            ["utils_version", "product_module_versions_link"],
+        )
+
+        Path(self.root.name, "library/product/contracts/product.py").write_text("PRODUCT = 1\n")
+        newest_resource_hashes = deployment_utils.get_resource_hashes(resource_ids, resource_root)
+        self.assertListEqual(
+            deployment_utils.get_changed_resource_ids(
+                resource_ids, newest_resource_hashes, new_resource_hashes
+            ),
+            ["product", "product_module_versions_link"],
+        )
+
+    def test_ledger_round_trip(self):
+        ledger_path = Path(self.root.name, "ledger", "env.json")
+        self.assertDictEqual(deployment_utils.load_deployment_ledger(ledger_path), {})
+
+        deployment_utils.save_deployment_ledger(ledger_path, {"product": "abc"})
+
+        self.assertDictEqual(
+            deployment_utils.load_deployment_ledger(ledger_path), {"product": "abc"}
+        )
+
+    def test_get_imported_resource_ids(self):
+        clu_output = [
+            "2022-01-28 13:57:34.112 - INFO: WORKFLOW_DEFINITION_VERSION with ID\n",
+            "CASA_APPLICATION was IMPORTED successfully using a create action.\n",
+            "2022-01-28 13:57:35.893 - INFO: SMART_CONTRACT_VERSION with ID casa was NOT "
+            "IMPORTED successfully using a create action.\n",
+            "2022-01-28 13:57:36.101 - INFO: FLAG_DEFINITION with ID DORMANT was IMPORTED "
+            "successfully using a create action.\n",
+        ]
+
+        self.assertSetEqual(
+            deployment_utils.get_imported_resource_ids(clu_output),
+            {"CASA_APPLICATION", "DORMANT"},
+        )
+
+    @mock.patch.object(deployment_utils, "update_workflow_instantiation_config")
+    def test_inst_config_only_updated_for_imported_workflows(self, mock_update: mock.Mock):
+        Path(self.root.name, "library/product/workflows").mkdir()
+        Path(self.root.name, "library/product/workflows/inst_config.tmp_resources.yaml").write_text(
+            "resources:\n"
+            "  - id: CHANGED\n    instantiation_resources: [Customer]\n"
+            "  - id: UNCHANGED\n    instantiation_resources: [Customer]\n"
+        )
+
+        deployment_utils.handle_workflows_inst_config(
+            "token", "cookie", "ops_dash", "library", workflow_definition_ids={"CHANGED"}
+        )
+
+        mock_update.assert_called_once_with(
+            "CHANGED", ["Customer"], "ops_dash/graphql", "token", "cookie"
+        )
+
+
+@mock.patch.object(deployment_utils.subprocess, "Popen")
+class RunCluTest(TestCase):
+    def _mock_process(self, mock_popen: mock.Mock, return_code: int, output: str):
+        process = mock_popen.return_value
+        process.stdout = StringIO(output)
+        process.wait.return_value = return_code
+
+    def test_output_streamed_until_completion(self, mock_popen: mock.Mock):
+        self._mock_process(mock_popen, 0, "line 1\nline 2\n")
+
+        with self.assertLogs(deployment_utils.logger, level="INFO") as logs:
+            success, clu_output = deployment_utils.run_clu("clu", "validate", "manifest.yaml")
+
+        self.assertTrue(success)
+        self.assertListEqual(clu_output, ["line 1\n", "line 2\n"])
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records],
+            ["line 1", "line 2", "Completed CLU command"],
+        )
+        mock_popen.return_value.poll.assert_not_called()
+
+    def test_stderr_merged_into_output(self, mock_popen: mock.Mock):
+        # CLU's stderr is redirected to its stdout, so errors arrive in order with the other lines
+        self._mock_process(mock_popen, 1, "line 1\nFAIL: bad manifest\n")
+
+        with self.assertLogs(deployment_utils.logger, level="ERROR") as logs:
+            success, clu_output = deployment_utils.run_clu("clu", "validate", "manifest.yaml")
+
+        self.assertFalse(success)
+        self.assertListEqual(clu_output, ["line 1\n", "FAIL: bad manifest\n"])
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records],
+            ["FAIL: bad manifest", "Error while executing CLU command"],
+        )
+        self.assertEqual(mock_popen.call_args.kwargs["stderr"], deployment_utils.subprocess.STDOUT)
+
+    def test_json_output(self, mock_popen: mock.Mock):
+        mock_popen.return_value.communicate.return_value = (
+            '{\n  "validate": {}\n}\n',
+            "FAIL: bad manifest\n",
+        )
+
+        with self.assertLogs(deployment_utils.logger, level="ERROR") as logs:
+            success, clu_output = deployment_utils.run_clu(
+                "clu", "validate", "manifest.yaml", output_format="json"
+            )
+
+        self.assertTrue(success)
+        self.assertListEqual(clu_output, ['{\n  "validate": {}\n}\n'])
+        self.assertDictEqual(json.loads(clu_output[0]), {"validate": {}})
+        self.assertListEqual(
+            [record.getMessage() for record in logs.records], ["FAIL: bad manifest"]
+        )
+        self.assertIn("--output=json", mock_popen.call_args.args[0])
+
+
 if __name__ == "__main__":
     main(DeploymentUtilsTest)
@@ -3,13 +3,16 @@ import hashlib
 import logging
 import os
 import pathlib
-import pickle
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from os import path
 from time import time
 from typing import Generator
 
 # third party
+from git import GitCommandError, Repo
 from pydriller import Repository
 from pydriller.domain.commit import Commit
 
@@ -32,24 +35,120 @@ class GitSourceFinderResult:
     git_commit_hash: str
 
 
+# the number of new commits to index before writing them to the cache
+INDEX_BATCH_SIZE = 500
+# allows SQLite to memory-map up to this many bytes of the cache file
+CACHE_MMAP_SIZE = 256 * 1024 * 1024
+# git file modes that do not refer to file contents (deleted files and submodules)
+NON_BLOB_MODES = {"000000", "160000"}
+
+
 class GitSourceFinderCache:
-    # the algorithm used to generate file hashes (not commit hashes)
-    alg: str
-    commit_hashes: set[str]
-    # map of file hashes to the commit hash they are found in
-    hash_map: dict[str, str]
+    """
+    An SQLite index of file hashes to the commit and blob they are found in. Indexed commits are
+    recorded alongside the file hashes, so new commits can be appended without rewriting the
+    existing index.
+    """
+
+    def __init__(self, cache_filepath: str | os.PathLike = ":memory:", alg: str = "md5") -> None:
+        """
+        Open the cache, creating it if it does not exist.
+        :param cache_filepath: path to the cache file. If `:memory:` the cache is not persisted
+        :param alg: the algorithm used to generate file hashes, if the cache is new
+        """
+        self._connection = sqlite3.connect(cache_filepath)
+        self._connection.execute(f"PRAGMA mmap_size={CACHE_MMAP_SIZE}")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS commits (commit_hash TEXT PRIMARY KEY)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes (file_hash TEXT PRIMARY KEY, "
+                "commit_hash TEXT NOT NULL, blob_hash TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS file_hashes_commit_hash ON file_hashes (commit_hash)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO metadata (key, value) VALUES ('alg', ?)", (alg,)
+            )
+
+    @classmethod
+    def in_memory_copy(cls, cache_filepath: str | os.PathLike) -> "GitSourceFinderCache":
+        """
+        Load an existing cache file into memory, so that it can be updated without writing to disk.
+        """
+        cache = cls()
+        with sqlite3.connect(cache_filepath) as source:
+            source.backup(cache._connection)
+        return cache
+
+    @property
+    def alg(self) -> str:
+        """
+        The algorithm used to generate file hashes (not commit hashes)
+        """
+        (alg,) = self._connection.execute("SELECT value FROM metadata WHERE key = 'alg'").fetchone()
+        return alg
+
+    @property
+    def commit_hashes(self) -> set[str]:
+        return {row[0] for row in self._connection.execute("SELECT commit_hash FROM commits")}
+
+    def get(self, file_hash: str) -> tuple[str, str] | None:
+        """
+        :return: the commit hash and blob hash for the file hash, if indexed
+        """
+        return self._connection.execute(
+            "SELECT commit_hash, blob_hash FROM file_hashes WHERE file_hash = ?", (file_hash,)
+        ).fetchone()
+
+    def add_commits(self, commit_hashes: list[str], hash_map: dict[str, tuple[str, str]]) -> None:
+        """
+        Record commits as indexed, along with the file hashes found in them. File hashes that are
+        already indexed are updated to refer to the new commit.
+        :param commit_hashes: the indexed commits
+        :param hash_map: file hash to the commit hash and blob hash it is found in
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO commits (commit_hash) VALUES (?)",
+                ((commit_hash,) for commit_hash in commit_hashes),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO file_hashes (file_hash, commit_hash, blob_hash) "
+                "VALUES (?, ?, ?)",
+                (
+                    (file_hash, commit_hash, blob_hash)
+                    for file_hash, (commit_hash, blob_hash) in hash_map.items()
+                ),
+            )
 
-    def __init__(self) -> None:
+    def remove_commits(self, commit_hashes: list[str]) -> None:
         """
-        Initialise an empty cache object using default values.
+        Remove commits, and the file hashes found in them, from the index.
         """
-        defaults = self._default_values()
-        self.alg = defaults["alg"]
-        self.commit_hashes = defaults["commit_hashes"]
-        self.hash_map = defaults["hash_map"]
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM file_hashes WHERE commit_hash = ?",
+                ((commit_hash,) for commit_hash in commit_hashes),
+            )
+            self._connection.executemany(
+                "DELETE FROM commits WHERE commit_hash = ?",
+                ((commit_hash,) for commit_hash in commit_hashes),
+            )
 
-    def _default_values(self) -> dict:
-        return {"alg": "md5", "commit_hashes": set(), "hash_map": {}}
+    def reset(self, alg: str) -> None:
+        """
+        Remove all indexed commits and file hashes, and set the hashing algorithm.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM file_hashes")
+            self._connection.execute("DELETE FROM commits")
+            self._connection.execute("UPDATE metadata SET value = ? WHERE key = 'alg'", (alg,))
 
 
 class SourceNotFound(Exception):
@@ -59,8 +158,8 @@ class SourceNotFound(Exception):
 class GitSourceFinder:
     """
     GitSourceFinder defines methods to retrieve source files from a Git repo based on the file
-    checksum. It will detect a local Git repo and traverse every historic commit made to the repo
-    to find an associated source file that matches the checksum provided.
+    checksum. It will detect a local Git repo and index the files modified by every historic commit
+    made to the repo to find an associated source file that matches the checksum provided.
     """
 
     def __init__(
@@ -69,6 +168,7 @@ class GitSourceFinder:
         hashing_algorithm: str = "md5",
         git_repo_root: str | os.PathLike = ".",
         save_cache: bool = True,
+        num_workers: int = 8,
     ) -> None:
         """
         Discover the local Git repo and attempt to load the cache file.
@@ -77,21 +177,24 @@ class GitSourceFinder:
         supported by hashlib https://docs.python.org/3/library/hashlib.html
         :param git_repo_root: path to the git repo root
         :param save_cache: write the cache file to disk to allow speedy loading of commits
+        :param num_workers: number of threads used to read and hash files when indexing commits
         """
         self._save_cache_to_disk = save_cache
         if hashing_algorithm not in hashlib.algorithms_available:
             raise ValueError(f"Unsupported hash type {hashing_algorithm}")
         else:
             self.hashing_algorithm = hashing_algorithm
+        self._num_workers = num_workers
+        self._thread_local = threading.local()
         repo = load_repo(git_repo_root)
         if repo.git.working_dir is None:
             raise BareRepoException()
+        self._repo = repo
         self._git_root = str(repo.git.working_dir)
         self._cache_filepath = cache_filepath or pathlib.Path(".gsfcache")
-        self._app_cache = self._load_cache() or GitSourceFinderCache()
+        self._app_cache = self._load_cache()
         if not self._validate_cache():
-            self._app_cache = GitSourceFinderCache()
-            self._app_cache.alg = self.hashing_algorithm
+            self._app_cache.reset(self.hashing_algorithm)
 
     def get_source(
         self,
@@ -100,8 +203,10 @@ class GitSourceFinder:
         filepath: str | None = None,
     ) -> GitSourceFinderResult:
         """
-        Calculate checksums against all source files associated with every commit in the local Git
-        repo and return the first match against the hash_digest.
+        Look up the file checksum in the index of source files modified by every commit in the
+        local Git repo and return the match against the hash_digest. If a commit hash or filepath
+        is provided and the checksum is not indexed against that commit, the matching commits'
+        source files are checked instead.
         """
         if not file_hash.strip():
             raise ValueError("hash_digest is not a valid non-empty string")
@@ -109,6 +214,14 @@ class GitSourceFinder:
         if not git_commit_hash and not filepath:
             git_commit_hash = self.get_commit_hash(file_hash)
 
+        indexed = self._app_cache.get(file_hash)
+        if indexed and indexed[0] == git_commit_hash:
+            return GitSourceFinderResult(
+                source_code=self._read_blob(indexed[1]),
+                file_hash=file_hash,
+                git_commit_hash=indexed[0],
+            )
+
         if git_commit_hash or filepath:
             with override_logging_level(logging.WARNING):
                 commits = Repository(
@@ -124,15 +237,27 @@ class GitSourceFinder:
         """
         Return the Git commit hash that contains the source file checksum hash_digest.
         """
-        if file_hash in self._app_cache.hash_map:
-            return self._app_cache.hash_map[file_hash]
-        else:
+        indexed = self._app_cache.get(file_hash)
+        if not indexed:
             self._populate_cache()
-            return self._app_cache.hash_map.get(file_hash)
+            indexed = self._app_cache.get(file_hash)
+        return indexed[0] if indexed else None
 
     def _hash(self, data: str) -> str:
         return hashlib.new(self.hashing_algorithm, data.encode("utf-8")).hexdigest()
 
+    def _read_blob(self, blob_hash: str) -> str:
+        # each thread needs its own repo, as the object database is read through a git process
+        if not hasattr(self._thread_local, "repo"):
+            self._thread_local.repo = Repo(self._git_root)
+        data = self._thread_local.repo.odb.stream(bytes.fromhex(blob_hash)).read()
+        # decoded in the same way as pydriller's ModifiedFile.source_code
+        return data.decode("utf-8", "ignore")
+
+    def _hash_blob(self, blob_hash: str) -> str | None:
+        source_code = self._read_blob(blob_hash)
+        return self._hash(source_code) if source_code else None
+
     def _find_source_from_hash(
         self, commits: Generator[Commit, None, None], file_hash: str
     ) -> GitSourceFinderResult | None:
@@ -147,24 +272,28 @@ class GitSourceFinder:
                             git_commit_hash=commit.hash,
                         )
 
-    def _load_cache(self) -> GitSourceFinderCache | None:
+    def _load_cache(self) -> GitSourceFinderCache:
         log.info(f"Loading cache from `{self._cache_filepath}`")
-        if path.isfile(self._cache_filepath):
-            with open(self._cache_filepath, "rb") as file:
-                cache = pickle.load(file)
-                if isinstance(cache, GitSourceFinderCache):
-                    return cache
-        else:
+        if not path.isfile(self._cache_filepath):
             log.warning("Cache path does not point to a file")
+            return GitSourceFinderCache(
+                self._cache_filepath if self._save_cache_to_disk else ":memory:",
+                self.hashing_algorithm,
+            )
+
+        try:
+            if self._save_cache_to_disk:
+                return GitSourceFinderCache(self._cache_filepath, self.hashing_algorithm)
+            return GitSourceFinderCache.in_memory_copy(self._cache_filepath)
+        except sqlite3.DatabaseError:
+            log.warning(f"Cache file {self._cache_filepath} is not a valid cache")
+            if self._save_cache_to_disk:
+                os.remove(self._cache_filepath)
+                return GitSourceFinderCache(self._cache_filepath, self.hashing_algorithm)
+            return GitSourceFinderCache(alg=self.hashing_algorithm)
 
     def _validate_cache(self) -> bool:
-        if not self._app_cache:
-            return False
-        if (
-            self._app_cache.commit_hashes is None
-            or self._app_cache.hash_map is None
-            or self._app_cache.alg != self.hashing_algorithm
-        ):
+        if self._app_cache.alg != self.hashing_algorithm:
             log.warning(
                 f"Cache file {self._cache_filepath} is empty or invalid (algorithm mismatch)"
             )
@@ -173,52 +302,77 @@ class GitSourceFinder:
             return True
 
     def _clean_cache(self, all_git_commit_hashes: list[str]) -> None:
+        all_git_commit_hashes_set = set(all_git_commit_hashes)
         invalid_hashes = [
             cached_hash
             for cached_hash in self._app_cache.commit_hashes
-            if cached_hash not in all_git_commit_hashes
-        ]
-        invalid_checksums = [
-            checksum
-            for checksum, git_commit_hash in self._app_cache.hash_map.items()
-            if git_commit_hash in invalid_hashes
+            if cached_hash not in all_git_commit_hashes_set
         ]
-        if invalid_hashes or invalid_checksums:
+        if invalid_hashes:
             log.info("Removing stale commit hashes from cache")
-            for invalid_hash in invalid_hashes:
-                self._app_cache.commit_hashes.remove(invalid_hash)
-            for checksum in invalid_checksums:
-                self._app_cache.hash_map.pop(checksum)
+            self._app_cache.remove_commits(invalid_hashes)
 
-    def _save_cache(self):
-        if self._save_cache_to_disk:
-            with open(self._cache_filepath, "wb+") as file:
-                log.info(f"Writing cache file {self._cache_filepath}")
-                pickle.dump(self._app_cache, file)
+    def _get_commit_blobs(self) -> dict[str, list[str]]:
+        """
+        List the blobs (i.e. file contents) modified by each commit, from a single walk of the
+        repo's history. As with pydriller, merge commits are treated as modifying no files.
+        :return: commit hash to the hashes of the blobs it modified, oldest commit first
+        """
+        try:
+            log_output = self._repo.git.log(
+                "HEAD", "--reverse", "--raw", "--no-abbrev", "--no-renames", "--format=commit %H"
+            )
+        except GitCommandError:
+            log.warning("Could not list commits, the repo may not have any")
+            return {}
+
+        commit_blobs: dict[str, list[str]] = {}
+        blob_hashes: list[str] = []
+        for line in log_output.splitlines():
+            if line.startswith("commit "):
+                blob_hashes = commit_blobs[line.removeprefix("commit ")] = []
+            elif line.startswith(":"):
+                # e.g. `:100644 100644 <old blob hash> <new blob hash> M\t<path>`
+                _, new_mode, _, blob_hash, _ = line[1:].split("\t", 1)[0].split(" ")
+                if new_mode not in NON_BLOB_MODES:
+                    blob_hashes.append(blob_hash)
+        return commit_blobs
 
     def _populate_cache(self):
         self._t_start = time()
         log.info("Populating the cache, this may take several minutes...")
-        with override_logging_level(logging.WARNING):
-            commits = list(Repository(self._git_root, num_workers=8).traverse_commits())
-        commit_hashes = [commit.hash for commit in commits]
-        self._clean_cache(commit_hashes)
-        update_made = False
-        for i, commit in enumerate(commits):
-            self._report_status(i, len(commits))
-            if commit.hash not in self._app_cache.commit_hashes:
-                self._app_cache.hash_map.update(self._get_source_file_hash_map(commit))
-                self._app_cache.commit_hashes.add(commit.hash)
-                update_made = True
-        if update_made:
-            self._save_cache()
-
-    def _get_source_file_hash_map(self, commit: Commit) -> dict[str, str]:
+        commit_blobs = self._get_commit_blobs()
+        self._clean_cache(list(commit_blobs))
+        indexed_commit_hashes = self._app_cache.commit_hashes
+        new_commit_hashes = [
+            commit_hash for commit_hash in commit_blobs if commit_hash not in indexed_commit_hashes
+        ]
+        for i in range(0, len(new_commit_hashes), INDEX_BATCH_SIZE):
+            self._report_status(i, len(new_commit_hashes))
+            batch = new_commit_hashes[i : i + INDEX_BATCH_SIZE]
+            self._app_cache.add_commits(batch, self._get_source_file_hash_map(batch, commit_blobs))
+
+    def _get_source_file_hash_map(
+        self, commit_hashes: list[str], commit_blobs: dict[str, list[str]]
+    ) -> dict[str, tuple[str, str]]:
+        """
+        Hash the files modified by the commits, reading and hashing each distinct blob once.
+        :param commit_hashes: the commits to index, oldest first
+        :param commit_blobs: commit hash to the hashes of the blobs it modified
+        :return: file hash to the latest commit hash it is found in and its blob hash
+        """
+        blob_commits: dict[str, str] = {}
+        for commit_hash in commit_hashes:
+            for blob_hash in commit_blobs[commit_hash]:
+                blob_commits[blob_hash] = commit_hash
+
         hash_map = {}
-        if commit.hash not in self._app_cache.commit_hashes:
-            for modified_file in commit.modified_files:
-                if modified_file.source_code:
-                    hash_map.update({self._hash(modified_file.source_code): commit.hash})
+        with ThreadPoolExecutor(max_workers=self._num_workers) as executor:
+            for blob_hash, file_hash in zip(
+                blob_commits, executor.map(self._hash_blob, blob_commits)
+            ):
+                if file_hash:
+                    hash_map[file_hash] = (blob_commits[blob_hash], blob_hash)
         return hash_map
 
     def _report_status(self, current_iteration: int, total_interations: int):
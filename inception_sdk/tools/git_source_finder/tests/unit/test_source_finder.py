@@ -1,4 +1,6 @@
 # standard libs
+import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
@@ -12,21 +14,58 @@ from inception_sdk.tools.git_source_finder.source_finder import (
 )
 
 
-class TestGitSourceFinder(unittest.TestCase):
-    def create_mock_commit(self, num_modified_files: int = 1) -> Mock:
-        def get_source_code(suffix: str):
-            return f"source_code{suffix}"
+class TestGitSourceFinderCache(unittest.TestCase):
+    def test_empty_cache_defaults(self):
+        cache = GitSourceFinderCache()
+        self.assertEqual(cache.alg, "md5")
+        self.assertEqual(cache.commit_hashes, set())
+        self.assertIsNone(cache.get("checksum"))
+
+    def test_add_commits(self):
+        cache = GitSourceFinderCache()
+        cache.add_commits(["a", "b"], {"checksum1": ("a", "blob1"), "checksum2": ("b", "blob2")})
+        cache.add_commits(["c"], {"checksum1": ("c", "blob1")})
+        self.assertEqual(cache.commit_hashes, {"a", "b", "c"})
+        self.assertEqual(cache.get("checksum1"), ("c", "blob1"))
+        self.assertEqual(cache.get("checksum2"), ("b", "blob2"))
+
+    def test_remove_commits(self):
+        cache = GitSourceFinderCache()
+        cache.add_commits(["a", "b"], {"checksum1": ("a", "blob1"), "checksum2": ("b", "blob2")})
+        cache.remove_commits(["a"])
+        self.assertEqual(cache.commit_hashes, {"b"})
+        self.assertIsNone(cache.get("checksum1"))
+        self.assertEqual(cache.get("checksum2"), ("b", "blob2"))
+
+    def test_reset(self):
+        cache = GitSourceFinderCache()
+        cache.add_commits(["a"], {"checksum1": ("a", "blob1")})
+        cache.reset("sha1")
+        self.assertEqual(cache.alg, "sha1")
+        self.assertEqual(cache.commit_hashes, set())
+        self.assertIsNone(cache.get("checksum1"))
+
+    def test_persisted_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_filepath = os.path.join(tmp_dir, ".gsfcache")
+            GitSourceFinderCache(cache_filepath, alg="sha1").add_commits(
+                ["a"], {"checksum1": ("a", "blob1")}
+            )
 
-        mock_modified_files = [
-            Mock(source_code=get_source_code(str(i))) for i in range(num_modified_files)
-        ]
-        mock_commit = Mock(modified_files=mock_modified_files, hash="git_commit_hash")
-        return mock_commit
+            cache = GitSourceFinderCache(cache_filepath, alg="md5")
+            self.assertEqual(cache.alg, "sha1")
+            self.assertEqual(cache.get("checksum1"), ("a", "blob1"))
 
-    def create_test_cache(self, cache_values: dict) -> GitSourceFinderCache:
+            in_memory_cache = GitSourceFinderCache.in_memory_copy(cache_filepath)
+            in_memory_cache.add_commits(["b"], {})
+            self.assertEqual(in_memory_cache.commit_hashes, {"a", "b"})
+            self.assertEqual(GitSourceFinderCache(cache_filepath).commit_hashes, {"a"})
+
+
+class TestGitSourceFinder(unittest.TestCase):
+    def create_test_cache(self, commit_hashes: list[str], hash_map: dict) -> GitSourceFinderCache:
         test_cache = GitSourceFinderCache()
-        for k, v in cache_values.items():
-            setattr(test_cache, k, v)
+        test_cache.add_commits(commit_hashes, hash_map)
         return test_cache
 
     def test_init_unrecognised_hash_alg(self):
@@ -43,6 +82,7 @@ class TestGitSourceFinder(unittest.TestCase):
     def test_init_recognised_hash_alg(
         self, mock_load_cache: Mock, mock_load_repo: Mock, mock_validate_cache: Mock
     ):
+        mock_load_cache.return_value = GitSourceFinderCache()
         mock_validate_cache.return_value = False
         gsf = GitSourceFinder(hashing_algorithm="sha1")
         self.assertEqual(gsf._app_cache.alg, "sha1")
@@ -50,6 +90,17 @@ class TestGitSourceFinder(unittest.TestCase):
         mock_load_repo.assert_called_once()
         mock_validate_cache.assert_called_once()
 
+    @patch.object(source_finder, "load_repo")
+    def test_init_invalid_cache_file_replaced(self, mock_load_repo: Mock):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_filepath = os.path.join(tmp_dir, ".gsfcache")
+            with open(cache_filepath, "wb") as cache_file:
+                cache_file.write(b"not a database")
+            with self.assertLogs(source_finder.log, "WARNING") as logs:
+                gsf = GitSourceFinder(cache_filepath=cache_filepath)
+            self.assertEqual(gsf._app_cache.commit_hashes, set())
+            self.assertIn(f"Cache file {cache_filepath} is not a valid cache", logs.output[0])
+
     @patch.object(GitSourceFinder, "_load_cache")
     @patch.object(GitSourceFinder, "_validate_cache")
     @patch.object(source_finder, "load_repo")
@@ -64,6 +115,7 @@ class TestGitSourceFinder(unittest.TestCase):
         mock_load_cache: Mock,
     ):
         source_code = "source_code"
+        mock_load_cache.return_value = GitSourceFinderCache()
         mock_get_commit_hash.return_value = "commit_hash"
         mock_modified_files = [Mock(source_code=source_code)]
         mock_commit = Mock(modified_files=mock_modified_files, hash="commit_hash")
@@ -82,6 +134,31 @@ class TestGitSourceFinder(unittest.TestCase):
         mock_load_repo.assert_called_once()
         mock_load_cache.assert_called_once()
 
+    @patch.object(GitSourceFinder, "_load_cache")
+    @patch.object(source_finder, "load_repo")
+    @patch.object(source_finder, "Repository")
+    @patch.object(GitSourceFinder, "_read_blob")
+    def test_get_source_indexed(
+        self,
+        mock_read_blob: Mock,
+        mock_Repository: Mock,
+        mock_load_repo: Mock,
+        mock_load_cache: Mock,
+    ):
+        mock_load_cache.return_value = self.create_test_cache(
+            ["commit_hash"], {"checksum": ("commit_hash", "blob_hash")}
+        )
+        mock_read_blob.return_value = "source_code"
+        gsf = GitSourceFinder()
+        self.assertEqual(
+            gsf.get_source("checksum"),
+            GitSourceFinderResult(
+                source_code="source_code", file_hash="checksum", git_commit_hash="commit_hash"
+            ),
+        )
+        mock_read_blob.assert_called_once_with("blob_hash")
+        mock_Repository.assert_not_called()
+
     @patch.object(GitSourceFinder, "_load_cache")
     @patch.object(GitSourceFinder, "_validate_cache")
     @patch.object(source_finder, "load_repo")
@@ -91,6 +168,7 @@ class TestGitSourceFinder(unittest.TestCase):
         mock_validate_cache: Mock,
         mock_load_cache: Mock,
     ):
+        mock_load_cache.return_value = GitSourceFinderCache()
         mock_validate_cache.return_value = False
         gsf = GitSourceFinder()
         with self.assertRaises(ValueError) as test:
@@ -102,7 +180,7 @@ class TestGitSourceFinder(unittest.TestCase):
             "hash_digest is not a valid non-empty string",
         )
 
-    @patch.object(GitSourceFinder, "_validate_cache")
+    @patch.object(GitSourceFinder, "_load_cache")
     @patch.object(source_finder, "load_repo")
     @patch.object(source_finder, "Repository")
     @patch.object(source_finder.log, "info")
@@ -111,9 +189,10 @@ class TestGitSourceFinder(unittest.TestCase):
         mock_log_info: Mock,
         mock_Repository: Mock,
         mock_load_repo: Mock,
-        mock_validate_cache: Mock,
+        mock_load_cache: Mock,
     ):
-        mock_validate_cache.return_value = False
+        mock_load_cache.return_value = GitSourceFinderCache()
+        mock_load_repo.return_value.git.log.return_value = ""
         gsf = GitSourceFinder()
         with self.assertRaises(SourceNotFound) as test:
             gsf.get_source(file_hash="abcdef123456789")
@@ -122,32 +201,26 @@ class TestGitSourceFinder(unittest.TestCase):
             'No file exists for md5 hash "abcdef123456789"',
         )
         mock_log_info.assert_called_with("Populating the cache, this may take several minutes...")
-        mock_Repository.assert_called_once()
+        mock_Repository.assert_not_called()
         mock_load_repo.assert_called_once()
 
     def test_get_commit_hash(self):
         mock_app_cache = self.create_test_cache(
-            {
-                "alg": "md5",
-                "commit_hashes": {"git_commit_hash"},
-                "hash_map": {"checksum": "git_commit_hash"},
-            }
+            ["git_commit_hash"], {"checksum": ("git_commit_hash", "blob_hash")}
         )
         mock_gsf = Mock(_app_cache=mock_app_cache)
         commit_hash = GitSourceFinder.get_commit_hash(mock_gsf, "checksum")
         self.assertEqual(commit_hash, "git_commit_hash")
+        mock_gsf._populate_cache.assert_not_called()
 
     def test_get_commit_hash_doesnt_exist(self):
         mock_app_cache = self.create_test_cache(
-            {
-                "alg": "md5",
-                "commit_hashes": {"git_commit_hash"},
-                "hash_map": {"checksum": "git_commit_hash"},
-            }
+            ["git_commit_hash"], {"checksum": ("git_commit_hash", "blob_hash")}
         )
         mock_gsf = Mock(_app_cache=mock_app_cache)
         commit_hash = GitSourceFinder.get_commit_hash(mock_gsf, "")
         self.assertEqual(commit_hash, None)
+        mock_gsf._populate_cache.assert_called_once()
 
     def test_hash(self):
         mock_gsf = Mock(hashing_algorithm="md5")
@@ -155,6 +228,16 @@ class TestGitSourceFinder(unittest.TestCase):
             GitSourceFinder._hash(mock_gsf, "data"), "8d777f385d3dfec8815d20f7496026dc"
         )
 
+    def test_hash_blob(self):
+        mock_gsf = Mock(_read_blob=Mock(return_value="data"), _hash=Mock(return_value="checksum"))
+        self.assertEqual(GitSourceFinder._hash_blob(mock_gsf, "blob_hash"), "checksum")
+        mock_gsf._read_blob.assert_called_once_with("blob_hash")
+
+    def test_hash_blob_empty(self):
+        mock_gsf = Mock(_read_blob=Mock(return_value=""))
+        self.assertIsNone(GitSourceFinder._hash_blob(mock_gsf, "blob_hash"))
+        mock_gsf._hash.assert_not_called()
+
     def test_validate_cache_valid(self):
         valid_app_cache = GitSourceFinderCache()
         mock_gsf = Mock(_app_cache=valid_app_cache, hashing_algorithm=valid_app_cache.alg)
@@ -171,185 +254,148 @@ class TestGitSourceFinder(unittest.TestCase):
             "Cache file cache/file is empty or invalid (algorithm mismatch)"
         )
 
-    @patch.object(source_finder.log, "warning")
-    def test_validate_cache_empty_defaults(self, mock_log: Mock):
-        empty_cache = GitSourceFinderCache()
-        self.assertEqual(empty_cache.alg, "md5")
-        self.assertEqual(empty_cache.commit_hashes, set())
-        self.assertEqual(empty_cache.hash_map, {})
-        mock_log.assert_not_called()
+    def test_get_commit_blobs(self):
+        mock_gsf = Mock()
+        mock_gsf._repo.git.log.return_value = "\n".join(
+            [
+                "commit commit_1",
+                "",
+                ":000000 100644 " + "0" * 40 + " blob_1 A\tfile_1",
+                ":000000 160000 " + "0" * 40 + " submodule A\tsubmodule",
+                "commit merge_commit",
+                "commit commit_2",
+                "",
+                ":100644 100755 blob_1 blob_2 M\tfile 1",
+                ":100644 000000 blob_3 " + "0" * 40 + " D\tfile_2",
+            ]
+        )
+        self.assertEqual(
+            GitSourceFinder._get_commit_blobs(mock_gsf),
+            {"commit_1": ["blob_1"], "merge_commit": [], "commit_2": ["blob_2"]},
+        )
 
     @patch.object(source_finder.log, "info")
-    @patch.object(source_finder, "Repository")
-    def test_populate_cache_empty(self, mock_Repository: Mock, mock_log: Mock):
-        mock_Repository.return_value = Mock(
-            traverse_commits=Mock(return_value=[self.create_mock_commit()])
+    def test_populate_cache_empty(self, mock_log: Mock):
+        mock_get_source_file_hash_map = Mock(
+            return_value={"checksum": ("git_commit_hash", "blob_hash")}
         )
-        expected_hash_map = {"checksum": "commit_hash"}
-        mock_get_source_file_hash_map = Mock(return_value=expected_hash_map)
         mock_gsf = Mock(
             _app_cache=GitSourceFinderCache(),
+            _get_commit_blobs=Mock(return_value={"git_commit_hash": ["blob_hash"]}),
             _get_source_file_hash_map=mock_get_source_file_hash_map,
         )
         GitSourceFinder._populate_cache(mock_gsf)
-        self.assertEqual(mock_gsf._app_cache.hash_map, expected_hash_map)
+        self.assertEqual(mock_gsf._app_cache.get("checksum"), ("git_commit_hash", "blob_hash"))
         self.assertEqual(mock_gsf._app_cache.commit_hashes, {"git_commit_hash"})
         mock_log.assert_called_with("Populating the cache, this may take several minutes...")
-        mock_Repository.assert_called()
         mock_gsf._report_status.assert_called()
-        mock_gsf._save_cache.assert_called()
+        mock_get_source_file_hash_map.assert_called_once_with(
+            ["git_commit_hash"], {"git_commit_hash": ["blob_hash"]}
+        )
 
     @patch.object(source_finder.log, "info")
-    @patch.object(source_finder, "Repository")
-    def test_populate_cache_not_empty(self, mock_Repository: Mock, mock_log: Mock):
-        mock_Repository.return_value = Mock(
-            traverse_commits=Mock(return_value=[self.create_mock_commit()])
+    def test_populate_cache_not_empty(self, mock_log: Mock):
+        commit_blobs = {"git_commit_hash_2": ["blob_2"], "git_commit_hash": ["blob_1"]}
+        mock_get_source_file_hash_map = Mock(
+            return_value={"checksum": ("git_commit_hash", "blob_1")}
         )
-        initial_hash_map = {"checksum": "git_commit_hash"}
-        mock_get_source_file_hash_map = Mock(return_value=initial_hash_map)
         populated_cache = self.create_test_cache(
-            {
-                "alg": "md5",
-                "commit_hashes": {"git_commit_hash_2"},
-                "hash_map": {"checksum_2": "git_commit_hash_2"},
-            }
+            ["git_commit_hash_2"], {"checksum_2": ("git_commit_hash_2", "blob_2")}
         )
         mock_gsf = Mock(
             _app_cache=populated_cache,
+            _get_commit_blobs=Mock(return_value=commit_blobs),
             _get_source_file_hash_map=mock_get_source_file_hash_map,
         )
         GitSourceFinder._populate_cache(mock_gsf)
-        self.assertEqual(
-            mock_gsf._app_cache.hash_map,
-            {"checksum_2": "git_commit_hash_2"} | initial_hash_map,
-        )
+        self.assertEqual(mock_gsf._app_cache.get("checksum_2"), ("git_commit_hash_2", "blob_2"))
+        self.assertEqual(mock_gsf._app_cache.get("checksum"), ("git_commit_hash", "blob_1"))
         self.assertEqual(
             mock_gsf._app_cache.commit_hashes, {"git_commit_hash_2", "git_commit_hash"}
         )
         mock_log.assert_called_once_with("Populating the cache, this may take several minutes...")
-        mock_Repository.assert_called_once()
+        # only the new commit is indexed
+        mock_get_source_file_hash_map.assert_called_once_with(["git_commit_hash"], commit_blobs)
         mock_gsf._report_status.assert_called_once()
-        mock_gsf._save_cache.assert_called_once()
 
     @patch.object(source_finder.log, "info")
-    @patch.object(source_finder, "Repository")
-    def test_populate_cache_already_populated(self, mock_Repository: Mock, mock_log: Mock):
-        mock_Repository.return_value = Mock(
-            traverse_commits=Mock(return_value=[self.create_mock_commit()])
-        )
-        initial_hash_map = {"checksum": "git_commit_hash"}
+    def test_populate_cache_already_populated(self, mock_log: Mock):
         populated_cache = self.create_test_cache(
-            {
-                "alg": "md5",
-                "commit_hashes": {"git_commit_hash"},
-                "hash_map": initial_hash_map,
-            }
+            ["git_commit_hash"], {"checksum": ("git_commit_hash", "blob_hash")}
         )
-        mock_gsf = Mock(_app_cache=populated_cache)
-        GitSourceFinder._populate_cache(mock_gsf)
-        self.assertEqual(
-            mock_gsf._app_cache.hash_map,
-            initial_hash_map,
+        mock_gsf = Mock(
+            _app_cache=populated_cache,
+            _get_commit_blobs=Mock(return_value={"git_commit_hash": ["blob_hash"]}),
         )
+        GitSourceFinder._populate_cache(mock_gsf)
+        self.assertEqual(mock_gsf._app_cache.get("checksum"), ("git_commit_hash", "blob_hash"))
         self.assertEqual(mock_gsf._app_cache.commit_hashes, {"git_commit_hash"})
         mock_log.assert_called_once_with("Populating the cache, this may take several minutes...")
-        mock_Repository.assert_called()
-        mock_gsf._report_status.assert_called()
+        mock_gsf._report_status.assert_not_called()
         mock_gsf._get_source_file_hash_map.assert_not_called()
-        mock_gsf._save_cache.assert_not_called()
 
-    @patch.object(source_finder, "Repository")
-    def test_get_source_file_hash_map_already_exists(self, mock_Repository: Mock):
-        mock_Repository.return_value = Mock(
-            traverse_commits=Mock(return_value=[self.create_mock_commit()])
+    def test_get_source_file_hash_map(self):
+        mock_hash_blob = Mock(side_effect=lambda blob_hash: f"checksum_{blob_hash}")
+        mock_gsf = Mock(_num_workers=2, _hash_blob=mock_hash_blob)
+        hash_map = GitSourceFinder._get_source_file_hash_map(
+            mock_gsf,
+            ["commit_1", "commit_2"],
+            {"commit_1": ["blob_1", "blob_2"], "commit_2": ["blob_1"], "commit_3": ["blob_3"]},
         )
-        initial_hash_map = {"checksum": "git_commit_hash"}
-        populated_cache = self.create_test_cache(
+        self.assertEqual(
+            hash_map,
             {
-                "alg": "md5",
-                "commit_hashes": {"git_commit_hash"},
-                "hash_map": initial_hash_map,
-            }
+                "checksum_blob_1": ("commit_2", "blob_1"),
+                "checksum_blob_2": ("commit_1", "blob_2"),
+            },
         )
-        mock_gsf = Mock(_app_cache=populated_cache)
-        hash_map = GitSourceFinder._get_source_file_hash_map(mock_gsf, self.create_mock_commit())
-        mock_gsf._hash.assert_not_called()
-        self.assertEqual(hash_map, {})
+        # each distinct blob is only hashed once
+        self.assertEqual(mock_hash_blob.call_count, 2)
 
-    @patch.object(source_finder, "Repository")
-    def test_get_source_file_hash_map_update_required(self, mock_Repository: Mock):
-        mock_Repository.return_value = Mock(
-            traverse_commits=Mock(return_value=[self.create_mock_commit()])
+    def test_get_source_file_hash_map_skips_empty_files(self):
+        mock_gsf = Mock(_num_workers=2, _hash_blob=Mock(return_value=None))
+        hash_map = GitSourceFinder._get_source_file_hash_map(
+            mock_gsf, ["commit_1"], {"commit_1": ["blob_1"]}
         )
-        initial_hash_map = {"old_checksum": "old_commit_hash"}
-        populated_cache = self.create_test_cache(
-            {
-                "alg": "md5",
-                "commit_hashes": {"old_commit_hash"},
-                "hash_map": initial_hash_map,
-            }
-        )
-        mock_hash = Mock(return_value="checksum")
-        mock_gsf = Mock(_app_cache=populated_cache, _hash=mock_hash)
-        hash_map = GitSourceFinder._get_source_file_hash_map(mock_gsf, self.create_mock_commit())
-        mock_gsf._hash.assert_called_once_with("source_code0")
-        self.assertEqual(hash_map, {"checksum": "git_commit_hash"})
+        self.assertEqual(hash_map, {})
 
     @patch.object(source_finder.log, "info")
     def test_clean_cache_stale_records(self, mock_log_info: Mock):
         populated_cache = self.create_test_cache(
+            ["stale", "a", "b", "c"],
             {
-                "alg": "md5",
-                "commit_hashes": {"stale", "a", "b", "c"},
-                "hash_map": {
-                    "checksum1": "stale",
-                    "checksum2": "stale",
-                    "checksum3": "a",
-                    "checksum4": "b",
-                    "checksum5": "c",
-                },
-            }
+                "checksum1": ("stale", "blob1"),
+                "checksum2": ("stale", "blob2"),
+                "checksum3": ("a", "blob3"),
+                "checksum4": ("b", "blob4"),
+                "checksum5": ("c", "blob5"),
+            },
         )
         git_commit_hashes = ["a", "b", "c"]
         mock_gsf = Mock(_app_cache=populated_cache)
         GitSourceFinder._clean_cache(mock_gsf, git_commit_hashes)
         mock_log_info.assert_called_with("Removing stale commit hashes from cache")
         self.assertEqual(mock_gsf._app_cache.commit_hashes, {"a", "b", "c"})
-        self.assertEqual(
-            mock_gsf._app_cache.hash_map,
-            {
-                "checksum3": "a",
-                "checksum4": "b",
-                "checksum5": "c",
-            },
-        )
+        self.assertIsNone(mock_gsf._app_cache.get("checksum1"))
+        self.assertIsNone(mock_gsf._app_cache.get("checksum2"))
+        self.assertEqual(mock_gsf._app_cache.get("checksum3"), ("a", "blob3"))
 
     @patch.object(source_finder.log, "info")
     def test_clean_cache_no_stale_records(self, mock_log_info: Mock):
         populated_cache = self.create_test_cache(
+            ["a", "b", "c"],
             {
-                "alg": "md5",
-                "commit_hashes": {"a", "b", "c"},
-                "hash_map": {
-                    "checksum1": "a",
-                    "checksum2": "b",
-                    "checksum3": "c",
-                },
-            }
+                "checksum1": ("a", "blob1"),
+                "checksum2": ("b", "blob2"),
+                "checksum3": ("c", "blob3"),
+            },
         )
         git_commit_hashes = ["a", "b", "c"]
         mock_gsf = Mock(_app_cache=populated_cache)
         GitSourceFinder._clean_cache(mock_gsf, git_commit_hashes)
         mock_log_info.assert_not_called()
         self.assertEqual(mock_gsf._app_cache.commit_hashes, {"a", "b", "c"})
-        self.assertEqual(
-            mock_gsf._app_cache.hash_map,
-            {
-                "checksum1": "a",
-                "checksum2": "b",
-                "checksum3": "c",
-            },
-        )
+        self.assertEqual(mock_gsf._app_cache.get("checksum1"), ("a", "blob1"))
 
 
 if __name__ == "__main__":
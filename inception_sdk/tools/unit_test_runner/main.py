@@ -0,0 +1,92 @@
+# standard libs
+import logging
+import os
+import sys
+
+# inception sdk
+from inception_sdk.common.python.flag_utils import FLAGS, flags, parse_flags
+from inception_sdk.tools.unit_test_runner.runner import (
+    DEFAULT_PRELOAD_DIRS,
+    DEFAULT_PRELOAD_MODULES,
+    DEFAULT_TEST_DIRS,
+    DEFAULT_UNIT_TEST_SEARCH_DIRS,
+    find_preload_modules,
+    find_test_modules,
+    find_unmatched_test_modules,
+    load_timings,
+    run_tests,
+    save_timings,
+)
+
+log = logging.getLogger(__name__)
+logging.basicConfig(
+    level=os.environ.get("LOGLEVEL", "INFO"),
+    format="%(asctime)s.%(msecs)03d - %(levelname)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+flags.DEFINE_list(
+    name="test_dirs",
+    default=DEFAULT_TEST_DIRS,
+    help="directories to search for test modules, relative to the repository root. Globs are "
+    "supported. Ignored if test modules are passed as positional arguments",
+)
+
+flags.DEFINE_list(
+    name="preload_modules",
+    default=DEFAULT_PRELOAD_MODULES,
+    help="modules to import once before the workers start",
+)
+
+flags.DEFINE_list(
+    name="preload_dirs",
+    default=DEFAULT_PRELOAD_DIRS,
+    help="directories whose non-test modules are imported once before the workers start, "
+    "relative to the repository root. Globs are supported",
+)
+
+flags.DEFINE_integer(
+    name="num_workers",
+    default=os.cpu_count() or 1,
+    lower_bound=1,
+    help="number of worker processes. Defaults to the number of CPUs",
+)
+
+flags.DEFINE_string(
+    name="timings_file",
+    default=".unit_test_timings.json",
+    help="path to the historical test module durations used to balance the workers. It is "
+    "updated with the durations from this run",
+)
+
+
+def main(argv: list[str]):
+    test_modules = parse_flags(argv)
+    repo_root = os.getcwd()
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+    if not test_modules:
+        test_modules = find_test_modules(FLAGS.test_dirs, repo_root)
+        unmatched_modules = find_unmatched_test_modules(
+            FLAGS.test_dirs, DEFAULT_UNIT_TEST_SEARCH_DIRS, repo_root
+        )
+        if unmatched_modules:
+            log.warning(
+                f"{len(unmatched_modules)} unit test modules are not in any of the test dirs "
+                f"and will not be run: {', '.join(unmatched_modules)}"
+            )
+
+    report = run_tests(
+        test_modules,
+        num_workers=FLAGS.num_workers,
+        timings=load_timings(FLAGS.timings_file),
+        preload_modules=FLAGS.preload_modules + find_preload_modules(FLAGS.preload_dirs, repo_root),
+    )
+    save_timings(FLAGS.timings_file, report.results)
+
+    print(report.format(), file=sys.stderr)
+    sys.exit(0 if report.was_successful() else 1)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
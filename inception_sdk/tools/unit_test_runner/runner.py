@@ -0,0 +1,351 @@
+# standard libs
+import gc
+import heapq
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from glob import glob
+from traceback import format_exception
+
+log = logging.getLogger(__name__)
+
+# Paths are relative to the repository root and may contain globs
+DEFAULT_TEST_DIRS = [
+    "library/*/test/unit",
+    "library/*/contracts/tests/unit",
+    "library/features/v4/**/test",
+    "library/features/v4/**/tests",
+]
+# Directories whose unit test modules should all be found by the test dirs, relative to the
+# repository root. Modules in test dirs for other kinds of tests are not unit tests
+DEFAULT_UNIT_TEST_SEARCH_DIRS = ["library"]
+TEST_DIR_NAMES = {"test", "tests"}
+NON_UNIT_TEST_DIR_NAMES = {"e2e", "simulation", "performance", "manifest_tests"}
+DEFAULT_PRELOAD_MODULES = [
+    "contracts_api",
+    "inception_sdk.test_framework.contracts.unit.common",
+]
+DEFAULT_PRELOAD_DIRS = ["library/features/v4", "library/*/contracts/template"]
+TEST_FILE_PATTERNS = ["test*.py", "*_test.py"]
+# Assumed duration of a test module without any history, if no other durations are known either
+DEFAULT_MODULE_DURATION = 1.0
+SEPARATOR_WIDTH = 70
+
+
+@dataclass
+class ModuleResult:
+    module: str
+    duration: float
+    tests_run: int = 0
+    # each failure or error is the test's description and the formatted traceback
+    failures: list[tuple[str, str]] = field(default_factory=list)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    skipped: int = 0
+    expected_failures: int = 0
+    unexpected_successes: int = 0
+
+
+@dataclass
+class RunReport:
+    results: list[ModuleResult]
+    duration: float
+    # duration of each completed shard, as measured by the worker running it
+    shard_durations: list[float]
+    # each shard that didn't complete (e.g. as its worker crashed) is the shard's description and
+    # the formatted traceback. Its modules have no results
+    shard_errors: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def tests_run(self) -> int:
+        return sum(result.tests_run for result in self.results)
+
+    @property
+    def failures(self) -> list[tuple[str, str]]:
+        return [failure for result in self.results for failure in result.failures]
+
+    @property
+    def errors(self) -> list[tuple[str, str]]:
+        return self.shard_errors + [error for result in self.results for error in result.errors]
+
+    @property
+    def unexpected_successes(self) -> int:
+        return sum(result.unexpected_successes for result in self.results)
+
+    def was_successful(self) -> bool:
+        return not self.failures and not self.errors and not self.unexpected_successes
+
+    def format(self) -> str:
+        """
+        Format the merged results of all shards like unittest's text runner does
+        """
+        lines = []
+        for flavour, problems in [("ERROR", self.errors), ("FAIL", self.failures)]:
+            for description, traceback in problems:
+                lines.extend(
+                    [
+                        "=" * SEPARATOR_WIDTH,
+                        f"{flavour}: {description}",
+                        "-" * SEPARATOR_WIDTH,
+                        traceback,
+                    ]
+                )
+        lines.append("-" * SEPARATOR_WIDTH)
+        lines.append(
+            f"Ran {self.tests_run} tests in {self.duration:.3f}s across "
+            f"{len(self.shard_durations) + len(self.shard_errors)} shards "
+            f"(longest shard {max(self.shard_durations, default=0):.3f}s)"
+        )
+        details = [
+            f"{name}={count}"
+            for name, count in [
+                ("failures", len(self.failures)),
+                ("errors", len(self.errors)),
+                ("skipped", sum(result.skipped for result in self.results)),
+                ("expected failures", sum(r.expected_failures for r in self.results)),
+                ("unexpected successes", self.unexpected_successes),
+            ]
+            if count
+        ]
+        status = "OK" if self.was_successful() else "FAILED"
+        lines.append(f"{status} ({', '.join(details)})" if details else status)
+        return "\n".join(lines)
+
+
+def _path_to_module(path: str, root: str) -> str:
+    return os.path.splitext(os.path.relpath(path, root))[0].replace(os.sep, ".")
+
+
+def _is_test_file(path: str) -> bool:
+    return any(fnmatch(os.path.basename(path), pattern) for pattern in TEST_FILE_PATTERNS)
+
+
+def _find_python_files(dir_patterns: list[str], root: str) -> set[str]:
+    paths = set()
+    for pattern in dir_patterns:
+        for directory in glob(os.path.join(root, pattern), recursive=True):
+            for dirpath, _, filenames in os.walk(directory):
+                paths.update(
+                    os.path.join(dirpath, filename)
+                    for filename in filenames
+                    if filename.endswith(".py") and filename != "__init__.py"
+                )
+    return paths
+
+
+def find_test_modules(test_dirs: list[str], root: str = ".") -> list[str]:
+    """
+    :param test_dirs: directories to search for test modules, relative to root. May contain globs
+    :param root: the repository root, which must be on the python path
+    :return: the sorted names of all test modules in the directories
+    """
+    return sorted(
+        _path_to_module(path, root)
+        for path in _find_python_files(test_dirs, root)
+        if _is_test_file(path)
+    )
+
+
+def find_preload_modules(preload_dirs: list[str], root: str = ".") -> list[str]:
+    """
+    :param preload_dirs: directories containing modules that most tests import, such as features
+    and templates, relative to root. May contain globs
+    :param root: the repository root, which must be on the python path
+    :return: the sorted names of all modules in the directories, excluding tests
+    """
+    return sorted(
+        _path_to_module(path, root)
+        for path in _find_python_files(preload_dirs, root)
+        if not _is_test_file(path)
+        and not TEST_DIR_NAMES.intersection(os.path.relpath(path, root).split(os.sep))
+    )
+
+
+def find_unmatched_test_modules(
+    test_dirs: list[str], search_dirs: list[str], root: str = "."
+) -> list[str]:
+    """
+    :param test_dirs: directories to search for test modules, relative to root. May contain globs
+    :param search_dirs: directories that all unit test modules should be found in by test_dirs,
+    relative to root. May contain globs
+    :param root: the repository root
+    :return: the sorted names of unit test modules in test or tests directories under search_dirs
+    that none of test_dirs contain, and so would not be run
+    """
+    matched_paths = _find_python_files(test_dirs, root)
+    unmatched_modules = []
+    for path in _find_python_files(search_dirs, root) - matched_paths:
+        directories = set(os.path.relpath(path, root).split(os.sep)[:-1])
+        if (
+            _is_test_file(path)
+            and TEST_DIR_NAMES.intersection(directories)
+            and not NON_UNIT_TEST_DIR_NAMES.intersection(directories)
+        ):
+            unmatched_modules.append(_path_to_module(path, root))
+    return sorted(unmatched_modules)
+
+
+def preload(modules: list[str]) -> None:
+    """
+    Import modules so that processes forked afterwards share them instead of importing them again.
+    Import errors are ignored, as the tests that depend on the module will report them
+    """
+    start = time.perf_counter()
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.debug(f"Could not preload {module}: {e!r}")
+    log.info(f"Preloaded {len(modules)} modules in {time.perf_counter() - start:.3f}s")
+
+
+def load_timings(timings_file: str) -> dict[str, float]:
+    """
+    :param timings_file: path to a json file of test module names to their last duration in seconds
+    :return: the durations, or an empty dict if there is no valid file
+    """
+    try:
+        with open(timings_file, "r", encoding="utf-8") as f:
+            return {module: float(duration) for module, duration in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_timings(timings_file: str, results: list[ModuleResult]) -> None:
+    timings = load_timings(timings_file)
+    timings.update({result.module: round(result.duration, 3) for result in results})
+    with open(timings_file, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(timings.items())), f, indent=2)
+
+
+def shard_modules(
+    modules: list[str], timings: dict[str, float], num_shards: int
+) -> list[list[str]]:
+    """
+    Split modules into shards of similar total duration, by assigning the longest remaining module
+    to the shard with the least work so far.
+    :param modules: test module names
+    :param timings: historical durations of test modules. Modules without a duration are assumed to
+    take the median known duration
+    :param num_shards: the maximum number of shards
+    :return: the non-empty shards
+    """
+    known_durations = [timings[module] for module in modules if module in timings]
+    default_duration = (
+        statistics.median(known_durations) if known_durations else DEFAULT_MODULE_DURATION
+    )
+    by_duration = sorted(
+        modules, key=lambda module: (-timings.get(module, default_duration), module)
+    )
+    shards: list[list[str]] = [[] for _ in range(max(1, min(num_shards, len(modules))))]
+    # each entry is a shard's total duration and its index
+    loads = [(0.0, i) for i in range(len(shards))]
+    for module in by_duration:
+        load, i = heapq.heappop(loads)
+        shards[i].append(module)
+        heapq.heappush(loads, (load + timings.get(module, default_duration), i))
+    return [shard for shard in shards if shard]
+
+
+def _format_problems(problems: list[tuple[unittest.TestCase, str]]) -> list[tuple[str, str]]:
+    return [(str(test), traceback) for test, traceback in problems]
+
+
+def run_module(module: str) -> ModuleResult:
+    """
+    Run all tests in a module, buffering their output so that shards don't interleave it
+    """
+    start = time.perf_counter()
+    result = unittest.TestResult()
+    result.buffer = True
+    # import errors are reported as failed tests by the loader
+    unittest.defaultTestLoader.loadTestsFromName(module).run(result)
+    return ModuleResult(
+        module=module,
+        duration=time.perf_counter() - start,
+        tests_run=result.testsRun,
+        failures=_format_problems(result.failures),
+        errors=_format_problems(result.errors),
+        skipped=len(result.skipped),
+        expected_failures=len(result.expectedFailures),
+        unexpected_successes=len(result.unexpectedSuccesses),
+    )
+
+
+def run_shard(modules: list[str]) -> tuple[list[ModuleResult], float]:
+    start = time.perf_counter()
+    results = [run_module(module) for module in modules]
+    return results, time.perf_counter() - start
+
+
+def run_tests(
+    modules: list[str],
+    num_workers: int,
+    timings: dict[str, float] | None = None,
+    preload_modules: list[str] | None = None,
+) -> RunReport:
+    """
+    Run test modules in parallel worker processes and merge their results.
+    Modules are preloaded before the workers are forked, so that workers share the already imported
+    modules copy-on-write. Where fork isn't available, each worker preloads them itself.
+    :param modules: test module names
+    :param num_workers: the number of worker processes, and so shards
+    :param timings: historical durations of test modules, used to balance the shards
+    :param preload_modules: modules to import once for all workers
+    :return: the merged results. Each shard runs in its own worker process, so a worker crashing
+    only loses the results of its own shard, which is reported as an error
+    """
+    start = time.perf_counter()
+    preload_modules = preload_modules or []
+    shards = shard_modules(modules, timings or {}, num_workers)
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+    if use_fork:
+        preload(preload_modules)
+        # keep the preloaded objects out of garbage collection, which would otherwise write to
+        # (and so copy) the memory shared with the workers
+        gc.freeze()
+    log.info(f"Running {len(modules)} test modules in {len(shards)} shards")
+    try:
+        # a pool is broken as soon as any of its workers crashes, so each shard gets its own
+        with ExitStack() as stack:
+            futures = [
+                stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=1,
+                        mp_context=multiprocessing.get_context("fork" if use_fork else "spawn"),
+                        initializer=None if use_fork else preload,
+                        initargs=() if use_fork else (preload_modules,),
+                    )
+                ).submit(run_shard, shard)
+                for shard in shards
+            ]
+            results: list[ModuleResult] = []
+            shard_durations: list[float] = []
+            shard_errors: list[tuple[str, str]] = []
+            for future, shard in zip(futures, shards):
+                try:
+                    shard_results, shard_duration = future.result()
+                except Exception as e:
+                    shard_errors.append(
+                        (f"shard ({', '.join(shard)})", "".join(format_exception(e)))
+                    )
+                    continue
+                results.extend(shard_results)
+                shard_durations.append(shard_duration)
+    finally:
+        if use_fork:
+            gc.unfreeze()
+    return RunReport(
+        results=results,
+        duration=time.perf_counter() - start,
+        shard_durations=shard_durations,
+        shard_errors=shard_errors,
+    )
@@ -0,0 +1,197 @@
+# standard libs
+import json
+import os
+import sys
+import textwrap
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+# inception sdk
+from inception_sdk.tools.unit_test_runner import runner
+
+PASSING_TESTS = """
+import unittest
+
+import {package}.helper
+
+
+class PassingTest(unittest.TestCase):
+    def test_pass(self):
+        print("hidden unless the test fails")
+        self.assertTrue({package}.helper.PRELOADED)
+
+    @unittest.skip("skipped")
+    def test_skip(self):
+        pass
+"""
+
+FAILING_TESTS = """
+import unittest
+
+
+class FailingTest(unittest.TestCase):
+    def test_fail(self):
+        print("shown as the test failed")
+        self.assertEqual(1, 2)
+
+    def test_error(self):
+        raise ValueError("broken")
+"""
+
+CRASHING_TESTS = """
+import os
+import unittest
+
+
+class CrashingTest(unittest.TestCase):
+    def test_crash(self):
+        os._exit(1)
+"""
+
+
+class ShardModulesTest(TestCase):
+    def test_shards_balanced_by_duration(self):
+        timings = {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 1.0}
+
+        shards = runner.shard_modules(list(timings), timings, num_shards=2)
+
+        self.assertListEqual(shards, [["a", "d"], ["b", "c", "e"]])
+
+    def test_modules_without_timings_use_median(self):
+        timings = {"a": 4.0, "b": 2.0, "c": 1.0}
+
+        shards = runner.shard_modules(["a", "b", "c", "new"], timings, num_shards=2)
+
+        self.assertListEqual(shards, [["a", "c"], ["b", "new"]])
+
+    def test_no_more_shards_than_modules(self):
+        self.assertListEqual(runner.shard_modules(["a"], {}, num_shards=4), [["a"]])
+        self.assertListEqual(runner.shard_modules([], {}, num_shards=4), [])
+
+
+class TimingsTest(TestCase):
+    def test_timings_round_trip_and_merge(self):
+        with TemporaryDirectory() as temp_dir:
+            timings_file = os.path.join(temp_dir, "timings.json")
+            self.assertDictEqual(runner.load_timings(timings_file), {})
+
+            runner.save_timings(timings_file, [runner.ModuleResult("a", 1.23456)])
+            runner.save_timings(timings_file, [runner.ModuleResult("b", 2.0)])
+
+            self.assertDictEqual(runner.load_timings(timings_file), {"a": 1.235, "b": 2.0})
+
+    def test_invalid_timings_ignored(self):
+        with TemporaryDirectory() as temp_dir:
+            timings_file = os.path.join(temp_dir, "timings.json")
+            with open(timings_file, "w", encoding="utf-8") as f:
+                json.dump(["not", "a", "dict"], f)
+
+            self.assertDictEqual(runner.load_timings(timings_file), {})
+
+
+class RunTestsTest(TestCase):
+    def setUp(self):
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        sys.path.insert(0, self.root)
+        self.addCleanup(sys.path.remove, self.root)
+        self.package = "runner_test_package"
+        files = {
+            "helper.py": "PRELOADED = True\n",
+            "tests/test_passing.py": PASSING_TESTS.format(package=self.package),
+            "tests/failing_test.py": FAILING_TESTS,
+            "crashing/test_crashing.py": CRASHING_TESTS,
+            "tests/utils.py": "",
+            "other/test/test_other.py": PASSING_TESTS.format(package=self.package),
+            "other/test/simulation/test_other_simulation.py": "",
+            "other/test_parameters.py": "",
+        }
+        for path, content in files.items():
+            path = os.path.join(self.root, self.package, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(textwrap.dedent(content))
+
+    def tearDown(self):
+        for module in list(sys.modules):
+            if module.startswith(self.package):
+                del sys.modules[module]
+
+    def test_find_modules(self):
+        self.assertListEqual(
+            runner.find_test_modules([f"{self.package}/**/tests"], self.root),
+            [f"{self.package}.tests.failing_test", f"{self.package}.tests.test_passing"],
+        )
+        self.assertListEqual(
+            runner.find_preload_modules([self.package], self.root), [f"{self.package}.helper"]
+        )
+
+    def test_find_unmatched_modules(self):
+        self.assertListEqual(
+            runner.find_unmatched_test_modules(
+                [f"{self.package}/**/tests"], [self.package], self.root
+            ),
+            [f"{self.package}.other.test.test_other"],
+        )
+        self.assertListEqual(
+            runner.find_unmatched_test_modules(
+                [f"{self.package}/**/tests", f"{self.package}/**/test"], [self.package], self.root
+            ),
+            [],
+        )
+
+    def test_results_merged_across_workers(self):
+        report = runner.run_tests(
+            [f"{self.package}.tests.test_passing", f"{self.package}.tests.failing_test"],
+            num_workers=2,
+            preload_modules=[f"{self.package}.helper", "does_not_exist"],
+        )
+
+        self.assertEqual(len(report.shard_durations), 2)
+        self.assertEqual(report.tests_run, 4)
+        self.assertFalse(report.was_successful())
+        self.assertEqual(len(report.failures), 1)
+        self.assertEqual(len(report.errors), 1)
+        self.assertSetEqual(
+            {result.module for result in report.results},
+            {f"{self.package}.tests.test_passing", f"{self.package}.tests.failing_test"},
+        )
+        output = report.format()
+        self.assertIn("FAIL: test_fail", output)
+        self.assertIn("ERROR: test_error", output)
+        self.assertIn("ValueError: broken", output)
+        self.assertIn("shown as the test failed", output)
+        self.assertNotIn("hidden unless the test fails", output)
+        self.assertIn("Ran 4 tests", output)
+        self.assertIn("FAILED (failures=1, errors=1, skipped=1)", output)
+
+    def test_crashed_shard_reported_as_error(self):
+        report = runner.run_tests(
+            [f"{self.package}.tests.test_passing", f"{self.package}.crashing.test_crashing"],
+            num_workers=2,
+        )
+
+        self.assertListEqual(
+            [result.module for result in report.results], [f"{self.package}.tests.test_passing"]
+        )
+        self.assertEqual(report.tests_run, 2)
+        self.assertEqual(len(report.shard_durations), 1)
+        self.assertEqual(len(report.errors), 1)
+        self.assertFalse(report.was_successful())
+        output = report.format()
+        self.assertIn(f"ERROR: shard ({self.package}.crashing.test_crashing)", output)
+        self.assertIn("BrokenProcessPool", output)
+        self.assertIn("across 2 shards", output)
+
+    def test_import_errors_reported(self):
+        report = runner.run_tests([f"{self.package}.tests.does_not_exist"], num_workers=1)
+
+        self.assertEqual(len(report.errors), 1)
+        self.assertIn("does_not_exist", report.format())
+
+    def test_successful_run(self):
+        report = runner.run_tests([f"{self.package}.tests.test_passing"], num_workers=1)
+
+        self.assertTrue(report.was_successful())
+        self.assertTrue(report.format().endswith("OK (skipped=1)"))
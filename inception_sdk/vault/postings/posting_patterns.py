@@ -0,0 +1,220 @@
+# standard libs
+import heapq
+import random
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterator, NamedTuple
+
+# inception sdk
+from inception_sdk.vault.postings.posting_classes import (
+    DEFAULT_ADVICE,
+    DEFAULT_DENOMINATION,
+    DEFAULT_INTERNAL_ACCOUNT,
+    InboundAuthorisation,
+    InboundHardSettlement,
+    OutboundAuthorisation,
+    OutboundHardSettlement,
+    PostingInstruction,
+)
+from inception_sdk.vault.postings.postings_helper import create_pib_from_posting_instructions
+
+INSTRUCTION_TYPES = {
+    "inbound_hard_settlement": InboundHardSettlement,
+    "outbound_hard_settlement": OutboundHardSettlement,
+    "inbound_authorisation": InboundAuthorisation,
+    "outbound_authorisation": OutboundAuthorisation,
+}
+
+
+@dataclass(frozen=True)
+class AmountRange:
+    """
+    Amounts drawn uniformly between minimum and maximum, inclusive, in steps of the smallest unit
+    for the number of decimal places
+    """
+
+    minimum: str
+    maximum: str
+    decimal_places: int = 2
+
+    def sample(self, rng: random.Random) -> str:
+        unit = Decimal(1).scaleb(-self.decimal_places)
+        minimum = Decimal(self.minimum).quantize(unit)
+        steps = int((Decimal(self.maximum).quantize(unit) - minimum) / unit)
+        return str(minimum + rng.randint(0, steps) * unit)
+
+
+@dataclass(frozen=True)
+class TransactionPattern:
+    """
+    A kind of transaction within a PostingPattern
+    :param instruction_type: one of INSTRUCTION_TYPES
+    :param amount: a fixed amount, or a range to draw amounts from
+    :param weight: the relative likelihood of this kind of transaction
+    """
+
+    instruction_type: str
+    amount: str | AmountRange
+    weight: float = 1.0
+    denomination: str = DEFAULT_DENOMINATION
+    internal_account_id: str = DEFAULT_INTERNAL_ACCOUNT
+    advice: bool = DEFAULT_ADVICE
+    instruction_details: dict[str, str] | None = None
+    batch_details: dict[str, str] | None = None
+
+    def __post_init__(self):
+        if self.instruction_type not in INSTRUCTION_TYPES:
+            raise ValueError(
+                f"Unsupported instruction_type {self.instruction_type!r}. "
+                f"Must be one of {list(INSTRUCTION_TYPES)}"
+            )
+
+    @classmethod
+    def from_dict(cls, pattern: dict[str, Any]) -> "TransactionPattern":
+        amount = pattern["amount"]
+        return cls(
+            **{
+                **pattern,
+                "amount": AmountRange(**amount) if isinstance(amount, dict) else str(amount),
+            }
+        )
+
+    def sample_amount(self, rng: random.Random) -> str:
+        return self.amount.sample(rng) if isinstance(self.amount, AmountRange) else self.amount
+
+
+class PatternBatch(NamedTuple):
+    account_id: str
+    timestamp: datetime
+    # the posting instruction batch, as used by the postings API
+    pib: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class PostingPattern:
+    """
+    Declares a bulk posting scenario of transactions_per_account transactions for each account,
+    at random times between start and end. Each transaction is drawn from the transactions, in
+    proportion to their weights. The same pattern and seed always generate the same batches, and
+    each account's batches don't depend on the other accounts.
+    :param account_ids: the accounts to post to
+    :param transactions_per_account: the number of transactions for each account
+    :param start: the earliest transaction timestamp
+    :param end: the timestamp all transactions are before
+    :param transactions: the kinds of transactions to draw from
+    :param seed: seed for all random choices
+    :param client_batch_id_prefix: prefix for client batch ids, which are followed by the account's
+    index and the transaction's index for that account. Client transaction ids are the client batch
+    id followed by _0
+    """
+
+    account_ids: list[str]
+    transactions_per_account: int
+    start: datetime
+    end: datetime
+    transactions: list[TransactionPattern] = field(default_factory=list)
+    seed: int = 0
+    client_batch_id_prefix: str = "posting_pattern"
+
+    def __post_init__(self):
+        if not self.transactions:
+            raise ValueError("A posting pattern needs at least one transaction pattern")
+        if self.end <= self.start:
+            raise ValueError(f"end {self.end} must be after start {self.start}")
+        if self.transactions_per_account < 0:
+            raise ValueError("transactions_per_account must not be negative")
+
+    @classmethod
+    def from_dict(cls, pattern: dict[str, Any]) -> "PostingPattern":
+        """
+        Creates a pattern from its declaration in a yaml or json file. Timestamps may be
+        datetimes or isoformat strings and amount ranges are dicts of AmountRange's fields, e.g.
+        account_ids: ["Main account"]
+        transactions_per_account: 100
+        start: 2020-01-01T00:00:00+00:00
+        end: 2020-02-01T00:00:00+00:00
+        transactions:
+          - instruction_type: outbound_hard_settlement
+            amount: {minimum: "5", maximum: "50"}
+            weight: 3
+          - instruction_type: inbound_hard_settlement
+            amount: "100"
+        """
+        return cls(
+            **{
+                **pattern,
+                "start": _to_datetime(pattern["start"]),
+                "end": _to_datetime(pattern["end"]),
+                "transactions": [
+                    TransactionPattern.from_dict(transaction)
+                    for transaction in pattern["transactions"]
+                ],
+            }
+        )
+
+    def generate(self) -> Iterator[PatternBatch]:
+        """
+        Lazily generates the batches for all accounts in chronological order. Only one pending
+        batch per account is held in memory, so very large patterns can be streamed.
+        """
+        return heapq.merge(
+            *(
+                self._generate_for_account(account_index, account_id)
+                for account_index, account_id in enumerate(self.account_ids)
+            ),
+            key=lambda batch: batch.timestamp,
+        )
+
+    def pib_templates(self, account_id: str) -> list[dict[str, Any]]:
+        """
+        Generates a single account's batches without value timestamps, in the format of a
+        performance test profile's postings_setup pib_template
+        :param account_id: the target account id used in the profile, e.g. "Main account"
+        """
+        return [
+            {key: value for key, value in batch.pib.items() if key != "value_timestamp"}
+            for batch in replace(self, account_ids=[account_id]).generate()
+        ]
+
+    def _generate_for_account(self, account_index: int, account_id: str) -> Iterator[PatternBatch]:
+        rng = random.Random(f"{self.seed}:{account_id}")
+        weights = [transaction.weight for transaction in self.transactions]
+        period = self.end - self.start
+        # The times are the sorted values of transactions_per_account uniform samples over the
+        # period. Each is drawn as the minimum of the samples remaining after the previous one, so
+        # that they can be generated in order without drawing and sorting them all first
+        position = 0.0
+        for i in range(self.transactions_per_account):
+            remaining = self.transactions_per_account - i
+            position += (1 - position) * (1 - (1 - rng.random()) ** (1 / remaining))
+            timestamp = self.start + period * position
+            transaction = rng.choices(self.transactions, weights)[0]
+            client_batch_id = f"{self.client_batch_id_prefix}_{account_index}_{i}"
+            instruction = INSTRUCTION_TYPES[transaction.instruction_type](
+                amount=transaction.sample_amount(rng),
+                target_account_id=account_id,
+                denomination=transaction.denomination,
+                internal_account_id=transaction.internal_account_id,
+                advice=transaction.advice,
+            )
+            yield PatternBatch(
+                account_id,
+                timestamp,
+                create_pib_from_posting_instructions(
+                    [
+                        PostingInstruction(
+                            instruction,
+                            client_transaction_id=f"{client_batch_id}_0",
+                            instruction_details=transaction.instruction_details,
+                        )
+                    ],
+                    value_datetime=timestamp,
+                    batch_details=transaction.batch_details,
+                    client_batch_id=client_batch_id,
+                )["posting_instruction_batch"],
+            )
+
+
+def _to_datetime(timestamp: datetime | str) -> datetime:
+    return timestamp if isinstance(timestamp, datetime) else datetime.fromisoformat(timestamp)
@@ -0,0 +1,128 @@
+# standard libs
+from dataclasses import replace
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import TestCase
+
+# inception sdk
+from inception_sdk.vault.postings.posting_patterns import (
+    AmountRange,
+    PostingPattern,
+    TransactionPattern,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+END = datetime(2023, 2, 1, tzinfo=timezone.utc)
+
+PATTERN = PostingPattern(
+    account_ids=["account_a", "account_b", "account_c"],
+    transactions_per_account=50,
+    start=START,
+    end=END,
+    transactions=[
+        TransactionPattern(
+            "outbound_hard_settlement", AmountRange(minimum="5", maximum="50"), weight=3
+        ),
+        TransactionPattern("inbound_hard_settlement", "100", batch_details={"key": "value"}),
+    ],
+    seed=1,
+)
+
+
+def _get_instruction(pib: dict) -> tuple[str, dict]:
+    """
+    :return: the instruction type and its details from a single instruction pib
+    """
+    posting_instruction = pib["posting_instructions"][0]
+    instruction_type = next(key for key in posting_instruction if key.endswith("hard_settlement"))
+    return instruction_type, posting_instruction[instruction_type]
+
+
+class PostingPatternTest(TestCase):
+    def test_batches_generated_in_chronological_order_within_period(self):
+        batches = list(PATTERN.generate())
+
+        self.assertEqual(len(batches), 150)
+        timestamps = [batch.timestamp for batch in batches]
+        self.assertListEqual(timestamps, sorted(timestamps))
+        self.assertGreaterEqual(timestamps[0], START)
+        self.assertLess(timestamps[-1], END)
+        for account_id in PATTERN.account_ids:
+            self.assertEqual(len([b for b in batches if b.account_id == account_id]), 50)
+
+    def test_batches_match_transaction_patterns(self):
+        for batch in PATTERN.generate():
+            instruction_type, details = _get_instruction(batch.pib)
+            self.assertEqual(batch.pib["value_timestamp"], batch.timestamp.isoformat())
+            self.assertEqual(details["target_account"], {"account_id": batch.account_id})
+            if instruction_type == "inbound_hard_settlement":
+                self.assertEqual(details["amount"], "100")
+                self.assertDictEqual(batch.pib["batch_details"], {"key": "value"})
+            else:
+                self.assertTrue(Decimal("5") <= Decimal(details["amount"]) <= Decimal("50"))
+                self.assertEqual(Decimal(details["amount"]).as_tuple().exponent, -2)
+
+    def test_same_seed_generates_same_batches(self):
+        self.assertListEqual(list(PATTERN.generate()), list(PATTERN.generate()))
+        self.assertNotEqual(list(PATTERN.generate()), list(replace(PATTERN, seed=2).generate()))
+
+    def test_accounts_independent_of_other_accounts(self):
+        def get_account_b_transactions(pattern: PostingPattern) -> list:
+            return [
+                (batch.timestamp, _get_instruction(batch.pib))
+                for batch in pattern.generate()
+                if batch.account_id == "account_b"
+            ]
+
+        self.assertListEqual(
+            get_account_b_transactions(PATTERN),
+            get_account_b_transactions(replace(PATTERN, account_ids=["account_b"])),
+        )
+
+    def test_ids_unique(self):
+        batch_ids = [batch.pib["client_batch_id"] for batch in PATTERN.generate()]
+
+        self.assertEqual(len(set(batch_ids)), len(batch_ids))
+        self.assertIn("posting_pattern_1_0", batch_ids)
+
+    def test_from_dict(self):
+        pattern = PostingPattern.from_dict(
+            {
+                "account_ids": PATTERN.account_ids,
+                "transactions_per_account": 50,
+                "start": START.isoformat(),
+                "end": END,
+                "seed": 1,
+                "transactions": [
+                    {
+                        "instruction_type": "outbound_hard_settlement",
+                        "amount": {"minimum": "5", "maximum": "50"},
+                        "weight": 3,
+                    },
+                    {
+                        "instruction_type": "inbound_hard_settlement",
+                        "amount": 100,
+                        "batch_details": {"key": "value"},
+                    },
+                ],
+            }
+        )
+
+        self.assertEqual(pattern, PATTERN)
+
+    def test_pib_templates(self):
+        templates = PATTERN.pib_templates("Main account")
+
+        self.assertEqual(len(templates), 50)
+        for template in templates:
+            self.assertNotIn("value_timestamp", template)
+            _, details = _get_instruction(template)
+            self.assertEqual(details["target_account"], {"account_id": "Main account"})
+
+    def test_invalid_patterns_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported instruction_type"):
+            TransactionPattern("transfer", "10")
+        with self.assertRaisesRegex(ValueError, "at least one transaction pattern"):
+            replace(PATTERN, transactions=[])
+        with self.assertRaisesRegex(ValueError, "must be after start"):
+            replace(PATTERN, end=START)
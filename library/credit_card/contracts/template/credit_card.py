@@ -7,7 +7,7 @@ from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal
 from json import dumps
-from typing import Callable, Optional, Union
+from typing import Callable, NamedTuple, Optional, Union
 from zoneinfo import ZoneInfo
 
 # features
@@ -113,6 +113,31 @@ ParameterTypes = Union[
     UnionItemValue,
 ]
 
+# Parameter derived state that is needed throughout a single hook execution
+CardState = NamedTuple(
+    "CardState",
+    [
+        ("supported_txn_types", dict[str, Optional[list[str]]]),
+        ("supported_fee_types", list[str]),
+        ("txn_types_to_charge_interest_from_txn_date", list[str]),
+        ("txn_types_in_interest_free_period", dict[str, list[str]]),
+    ],
+)
+
+# Balance addresses for the supported transaction and fee types, built once per hook execution.
+# Keys use "" for absent txn_refs and accrual types
+AddressTable = NamedTuple(
+    "AddressTable",
+    [
+        # (txn_type, txn_ref, status) to address
+        ("principal", dict[tuple[str, str, str], str]),
+        # (txn_type or fee_type, txn_ref, accrual_type, status) to address
+        ("interest", dict[tuple[str, str, str, str], str]),
+        # (fee_type, status) to address
+        ("fees", dict[tuple[str, str], str]),
+    ],
+)
+
 api = "4.0.0"
 version = "5.0.0"
 display_name = "Credit Card"
@@ -125,6 +150,9 @@ CHARGED = "CHARGED"
 AUTH = "AUTH"
 UNPAID = "UNPAID"
 UNCHARGED = "UNCHARGED"
+PRINCIPAL_ADDRESS_STATUSES = [AUTH, CHARGED, BILLED, UNPAID]
+INTEREST_ADDRESS_STATUSES = [UNCHARGED, CHARGED, BILLED, UNPAID]
+FEE_ADDRESS_STATUSES = [CHARGED, BILLED, UNPAID]
 # account type
 ACCOUNT_TYPE = "CREDIT_CARD"
 
@@ -3537,6 +3565,95 @@ def _get_supported_txn_types(
     return supported_txn_types
 
 
+def _get_txn_types_to_charge_interest_from_txn_date(
+    vault: SmartContractVault, effective_datetime: Optional[datetime] = None
+) -> list[str]:
+    """
+    Determine the transaction types that are charged interest from the date of transaction
+
+    :param vault: Vault object for the account
+    :param effective_datetime: Datetime as of which to retrieve parameters, if not provided
+    the latest values are retrieved
+    :return: Transaction types (lower case) charged interest from the date of transaction
+    """
+    txn_types_with_params: dict[str, dict[str, str]] = utils.get_parameter(
+        vault, name=PARAM_TXN_TYPES, at_datetime=effective_datetime, is_json=True
+    )
+
+    return [
+        txn_type
+        for txn_type, params in txn_types_with_params.items()
+        if utils.str_to_bool(params.get("charge_interest_from_transaction_date", "False"))
+    ]
+
+
+def _get_txn_types_in_interest_free_period(
+    vault: SmartContractVault, cut_off_datetime: datetime
+) -> dict[str, list[str]]:
+    """
+    Determine the transaction types and refs that have an active interest free period
+
+    :param vault: Vault object for the account
+    :param cut_off_datetime: Datetime as of which to retrieve parameters. Interest free periods
+    expiring after this datetime are considered active
+    :return: Map of transaction types (lower case) to refs (upper case) with an active interest
+    free period. Transaction types without refs map to an empty list
+    """
+    txn_types_in_interest_free_period: dict[str, list[str]] = {}
+    interest_free_expiry = utils.get_parameter(
+        vault, name=PARAM_INTEREST_FREE_EXPIRY, at_datetime=cut_off_datetime, is_json=True
+    )
+    txn_interest_free_expiry = utils.get_parameter(
+        vault, name=PARAM_TXN_INTEREST_FREE_EXPIRY, at_datetime=cut_off_datetime, is_json=True
+    )
+
+    for txn_type in interest_free_expiry:
+        if (
+            interest_free_expiry[txn_type]
+            and parse(interest_free_expiry[txn_type]).replace(tzinfo=ZoneInfo("UTC"))
+            > cut_off_datetime
+        ):
+            txn_types_in_interest_free_period[txn_type] = []
+
+    for txn_type in txn_interest_free_expiry:
+        txn_types_in_interest_free_period[txn_type] = []
+        for ref in txn_interest_free_expiry[txn_type]:
+            if (
+                txn_interest_free_expiry[txn_type][ref]
+                and parse(txn_interest_free_expiry[txn_type][ref]).replace(tzinfo=ZoneInfo("UTC"))
+                > cut_off_datetime
+            ):
+                txn_types_in_interest_free_period[txn_type].append(ref.upper())
+
+    return txn_types_in_interest_free_period
+
+
+def _get_card_state(
+    vault: SmartContractVault, effective_datetime: datetime, cut_off_datetime: datetime
+) -> CardState:
+    """
+    Parse the JSON parameters describing the supported transaction types, refs and interest free
+    periods once per hook execution, so that they can be shared by the helpers that need them
+
+    :param vault: Vault object for the account
+    :param effective_datetime: Datetime as of which to retrieve the supported transaction types
+    :param cut_off_datetime: Datetime as of which to retrieve the transaction type parameters and
+    interest free periods
+    :return: The card state
+    """
+    supported_txn_types = _get_supported_txn_types(vault, effective_datetime)
+    return CardState(
+        supported_txn_types=supported_txn_types,
+        supported_fee_types=_get_supported_fee_types(vault, supported_txn_types),
+        txn_types_to_charge_interest_from_txn_date=(
+            _get_txn_types_to_charge_interest_from_txn_date(vault, cut_off_datetime)
+        ),
+        txn_types_in_interest_free_period=_get_txn_types_in_interest_free_period(
+            vault, cut_off_datetime
+        ),
+    )
+
+
 def _construct_stems(txn_types: dict[str, Optional[list[str]]]) -> list[str]:
     """
     Given a Map of txn_types with any nested txn_level refs, construct a full list of stems by
@@ -3721,47 +3838,12 @@ def _process_interest_accrual_and_charging(
     denomination = utils.get_parameter(
         vault, name=PARAM_DENOMINATION, at_datetime=effective_datetime
     )
-    supported_txn_types = _get_supported_txn_types(vault, effective_datetime)
-    supported_fee_types = _get_supported_fee_types(vault, supported_txn_types)
-
-    txn_types_with_params: dict[str, dict[str, str]] = utils.get_parameter(
-        vault, name=PARAM_TXN_TYPES, at_datetime=accrual_cut_off_dt, is_json=True
+    card_state = _get_card_state(
+        vault, effective_datetime=effective_datetime, cut_off_datetime=accrual_cut_off_dt
     )
 
-    txn_types_to_charge_interest_from_txn_date = [
-        txn_type
-        for txn_type, params in txn_types_with_params.items()
-        if utils.str_to_bool(params.get("charge_interest_from_transaction_date", "False"))
-    ]
-
     is_revolver = _is_revolver(in_flight_balances, denomination)
 
-    txn_types_in_interest_free_period: dict[str, list[str]] = {}
-    interest_free_expiry = utils.get_parameter(
-        vault, name=PARAM_INTEREST_FREE_EXPIRY, at_datetime=accrual_cut_off_dt, is_json=True
-    )
-    txn_interest_free_expiry = utils.get_parameter(
-        vault, name=PARAM_TXN_INTEREST_FREE_EXPIRY, at_datetime=accrual_cut_off_dt, is_json=True
-    )
-
-    for txn_type in interest_free_expiry:
-        if (
-            interest_free_expiry[txn_type]
-            and parse(interest_free_expiry[txn_type]).replace(tzinfo=ZoneInfo("UTC"))
-            > accrual_cut_off_dt
-        ):
-            txn_types_in_interest_free_period[txn_type] = []
-
-    for txn_type in txn_interest_free_expiry:
-        txn_types_in_interest_free_period[txn_type] = []
-        for ref in txn_interest_free_expiry[txn_type]:
-            if (
-                txn_interest_free_expiry[txn_type][ref]
-                and parse(txn_interest_free_expiry[txn_type][ref]).replace(tzinfo=ZoneInfo("UTC"))
-                > accrual_cut_off_dt
-            ):
-                txn_types_in_interest_free_period[txn_type].append(ref.upper())
-
     # TODO: `accrual_instructions` is updated within function, should pass it around
     interest_accruals_by_sub_type = _accrue_interest(
         vault,
@@ -3769,10 +3851,10 @@ def _process_interest_accrual_and_charging(
         denomination,
         balances,
         accrual_instructions,
-        supported_txn_types,
-        supported_fee_types,
-        txn_types_to_charge_interest_from_txn_date,
-        txn_types_in_interest_free_period,
+        card_state.supported_txn_types,
+        card_state.supported_fee_types,
+        card_state.txn_types_to_charge_interest_from_txn_date,
+        card_state.txn_types_in_interest_free_period,
         is_revolver,
     )
 
@@ -3782,10 +3864,10 @@ def _process_interest_accrual_and_charging(
         is_revolver,
         denomination,
         interest_accruals_by_sub_type,
-        txn_types_to_charge_interest_from_txn_date,
+        card_state.txn_types_to_charge_interest_from_txn_date,
         in_flight_balances,
         accrual_instructions,
-        txn_types_in_interest_free_period,
+        card_state.txn_types_in_interest_free_period,
     )
 
     # # Only full outstanding is affected by charged interest
@@ -3977,6 +4059,13 @@ def _get_balances_to_accrue_on(
     outstanding_statement_amount = _get_outstanding_statement_amount(
         balances, denomination, supported_fee_types, supported_txn_types
     )
+    is_revolver = _is_revolver(balances, denomination)
+
+    # Index the balances by address once, rather than scanning all balances for each
+    # transaction type and ref
+    net_per_address: dict[str, Decimal] = defaultdict(Decimal)
+    for dimensions, balance in balances.items():
+        net_per_address[dimensions[0]] += balance.net
 
     def _update_balances_to_accrue_on(
         charge_type: str, sub_type: str, ref: Optional[str] = None
@@ -3999,14 +4088,10 @@ def _get_balances_to_accrue_on(
         elif charge_type == FEES and accrue_interest_on_unpaid_fees:
             addresses_to_accrue_on = [_fee_address(sub_type, UNPAID)]
 
+        # each address is only counted once, regardless of how often it is listed
+        addresses_to_accrue_on = list(dict.fromkeys(addresses_to_accrue_on))
         amount_to_accrue_on = Decimal(
-            sum(
-                [
-                    balance.net
-                    for dimensions, balance in balances.items()
-                    if dimensions[0] in addresses_to_accrue_on
-                ]
-            )
+            sum([net_per_address.get(address, Decimal(0)) for address in addresses_to_accrue_on])
         )
 
         if amount_to_accrue_on == Decimal(0):
@@ -4029,16 +4114,15 @@ def _get_balances_to_accrue_on(
             and not _is_txn_type_in_interest_free_period(
                 txn_types_in_interest_free_period, sub_type, ref
             )
-            and not _is_revolver(balances, denomination)
+            and not is_revolver
         ):
             # <transaction_type>_BILLED accrues to <transaction_type>_INTEREST_POST_SCOD_UNCHARGED
             billed_amount_to_accrue_on = Decimal(
                 sum(
                     [
-                        balance.net
-                        for dimensions, balance in balances.items()
-                        if dimensions[0] in addresses_to_accrue_on
-                        and dimensions[0].endswith(BILLED)
+                        net_per_address.get(address, Decimal(0))
+                        for address in addresses_to_accrue_on
+                        if address.endswith(BILLED)
                     ]
                 )
             )
@@ -4046,10 +4130,9 @@ def _get_balances_to_accrue_on(
             charged_amount_to_accrue_on = Decimal(
                 sum(
                     [
-                        balance.net
-                        for dimensions, balance in balances.items()
-                        if dimensions[0] in addresses_to_accrue_on
-                        and dimensions[0].endswith(CHARGED)
+                        net_per_address.get(address, Decimal(0))
+                        for address in addresses_to_accrue_on
+                        if address.endswith(CHARGED)
                     ]
                 )
             )
@@ -4083,9 +4166,7 @@ def _get_balances_to_accrue_on(
     # into revolver by next PDD
     # We will decide further down whether the interest is accrued to UNCHARGED address or CHARGED
     # directly
-    accrue_on_all_balances = (
-        _is_revolver(balances, denomination) or outstanding_statement_amount > 0
-    )
+    accrue_on_all_balances = is_revolver or outstanding_statement_amount > 0
     for txn_type, refs in supported_txn_types.items():
         for ref in refs or [""]:
             charge_interest_on_txn_type_from_txn_date = (
@@ -4541,20 +4622,15 @@ def _process_statement_cut_off(
     )
     supported_txn_types = _get_supported_txn_types(vault, scod_effective_dt)
     supported_fee_types = _get_supported_fee_types(vault, supported_txn_types)
+    address_table = _build_address_table(supported_txn_types, supported_fee_types)
 
     # Find out whether we accrue interest from transaction day, for later checks
     accrue_interest_from_txn_day = _is_txn_interest_accrual_from_txn_day(vault)
 
-    txn_types_with_params = utils.get_parameter(
-        vault, name=PARAM_TXN_TYPES, at_datetime=effective_datetime, is_json=True
+    txn_types_to_charge_interest_from_txn_date = _get_txn_types_to_charge_interest_from_txn_date(
+        vault, effective_datetime
     )
 
-    txn_types_to_charge_interest_from_txn_date = [
-        txn_type
-        for txn_type, params in txn_types_with_params.items()
-        if utils.str_to_bool(params.get("charge_interest_from_transaction_date", "False"))
-    ]
-
     # some instructions must be effective as of just before end of SCOD (e.g. over-limit fee) to
     # fall in the statement, so we group them based on their value timestamp
     instructions_ts: dict[datetime, list[CustomInstruction]] = {
@@ -4580,6 +4656,7 @@ def _process_statement_cut_off(
             denomination,
             in_flight_balances,
             credit_limit,
+            address_table=address_table,
         )
     )
 
@@ -4591,6 +4668,7 @@ def _process_statement_cut_off(
                 txn_types_to_charge_interest_from_txn_date,
                 denomination,
                 in_flight_balances,
+                address_table=address_table,
             )
         )
 
@@ -4656,6 +4734,7 @@ def _adjust_interest_uncharged_balances(
     txn_types_to_charge_interest_from_txn_date: list[str],
     denomination: str,
     in_flight_balances: BalanceDefaultDict,
+    address_table: Optional[AddressTable] = None,
 ) -> list[CustomInstruction]:
     """
     Rebalances uncharged interest balances. Flow at SCOD for non revolver accounts is :
@@ -4669,20 +4748,24 @@ def _adjust_interest_uncharged_balances(
     :param denomination: Denomination of the account
     :param in_flight_balances: Latest account balances updated with balances of the
     CustomInstructions created within the current hook execution
+    :param address_table: Balance addresses for the supported types. Built from
+    supported_txn_types if not provided
     :return: CustomInstructions to rebalance the uncharged interest
     """
+    if address_table is None:
+        address_table = _build_address_table(supported_txn_types, [])
 
     uncharged_adjustment_postings = []
 
     for txn_type, refs in supported_txn_types.items():
         if txn_type.lower() not in txn_types_to_charge_interest_from_txn_date:
             for txn_ref in refs or [""]:
-                from_balance_address = _interest_address(
-                    txn_type, UNCHARGED, txn_ref=txn_ref, accrual_type=PRE_SCOD
-                )
-                to_balance_address = _interest_address(
-                    txn_type, UNCHARGED, txn_ref=txn_ref, accrual_type=POST_SCOD
-                )
+                from_balance_address = address_table.interest[
+                    (txn_type, txn_ref, PRE_SCOD, UNCHARGED)
+                ]
+                to_balance_address = address_table.interest[
+                    (txn_type, txn_ref, POST_SCOD, UNCHARGED)
+                ]
                 _, rebalance_postings = _rebalance_balance_buckets(
                     vault,
                     in_flight_balances,
@@ -4701,6 +4784,7 @@ def _bill_charged_txns_and_bank_charges(
     denomination: str,
     in_flight_balances: BalanceDefaultDict,
     credit_limit: Decimal,
+    address_table: Optional[AddressTable] = None,
 ) -> list[CustomInstruction]:
     """
     Determine what is billed for this statement cycle and create corresponding posting instructions
@@ -4711,8 +4795,13 @@ def _bill_charged_txns_and_bank_charges(
     :param in_flight_balances: Latest account balances updated with balances of the
     CustomInstructions created within the current hook execution
     :param credit_limit: Account credit limit at SCOD cut-off
+    :param address_table: Balance addresses for the supported types. Built from
+    supported_txn_types if not provided
     :return: List of CustomInstructions at SCOD cut-off to bill charged transactions
     """
+    supported_fee_types = _get_supported_fee_types(vault, supported_txn_types)
+    if address_table is None:
+        address_table = _build_address_table(supported_txn_types, supported_fee_types)
 
     scod_instructions = []
 
@@ -4726,11 +4815,11 @@ def _bill_charged_txns_and_bank_charges(
         :param txn_ref: Transaction level reference
         """
         if charge_type == PRINCIPAL:
-            from_balance_address = _principal_address(sub_type, CHARGED, txn_ref=txn_ref)
-            to_balance_address = _principal_address(sub_type, BILLED, txn_ref=txn_ref)
+            from_balance_address = address_table.principal[(sub_type, txn_ref or "", CHARGED)]
+            to_balance_address = address_table.principal[(sub_type, txn_ref or "", BILLED)]
         elif charge_type == FEES:
-            from_balance_address = _fee_address(fee_type=sub_type, fee_status=CHARGED)
-            to_balance_address = _fee_address(fee_type=sub_type, fee_status=BILLED)
+            from_balance_address = address_table.fees[(sub_type, CHARGED)]
+            to_balance_address = address_table.fees[(sub_type, BILLED)]
 
         _, rebalance_postings = _rebalance_balance_buckets(
             vault=vault,
@@ -4746,7 +4835,6 @@ def _bill_charged_txns_and_bank_charges(
             _construct_statement_breakdown(txn_type, PRINCIPAL, txn_ref=ref)
 
     # Bill charged Fees
-    supported_fee_types = _get_supported_fee_types(vault, supported_txn_types)
     for fee_type in supported_fee_types:
         _construct_statement_breakdown(fee_type, FEES)
 
@@ -4757,6 +4845,7 @@ def _bill_charged_txns_and_bank_charges(
             supported_txn_types,
             denomination,
             in_flight_balances,
+            address_table=address_table,
         )
     )
 
@@ -4780,6 +4869,7 @@ def _bill_charged_interest(
     supported_txn_types: dict[str, Optional[list[str]]],
     denomination: str,
     in_flight_balances: BalanceDefaultDict,
+    address_table: Optional[AddressTable] = None,
 ) -> list[CustomInstruction]:
     """
     Creates instructions to move spend from transaction_type_INTEREST_CHARGED to
@@ -4792,8 +4882,12 @@ def _bill_charged_interest(
     :param denomination: Denomination of the account
     :param in_flight_balances: Latest account balances updated with balances of the
     CustomInstructions created within the current hook execution
+    :param address_table: Balance addresses for the supported types. Built from
+    supported_txn_types and supported_fee_types if not provided
     :return: CustomInstructions to bill charged interest
     """
+    if address_table is None:
+        address_table = _build_address_table(supported_txn_types, supported_fee_types)
 
     billed_posting_instructions = []
 
@@ -4804,8 +4898,8 @@ def _bill_charged_interest(
         :param txn_ref: Optional transaction level reference
         """
         # TODO: notify inception about these changes
-        from_balance_address = _interest_address(sub_type, CHARGED, txn_ref=txn_ref)
-        to_balance_address = _interest_address(sub_type, BILLED, txn_ref=txn_ref)
+        from_balance_address = address_table.interest[(sub_type, txn_ref or "", "", CHARGED)]
+        to_balance_address = address_table.interest[(sub_type, txn_ref or "", "", BILLED)]
 
         _, rebalance_postings = _rebalance_balance_buckets(
             vault=vault,
@@ -5940,7 +6034,7 @@ def _get_overdue_address_age(overdue_address: str) -> int:
     :param overdue_address: The address to get the age for
     :return: The age of the address
     """
-    return int(overdue_address.replace(OVERDUE + "_", ""))
+    return int(overdue_address[len(OVERDUE) + 1 :])
 
 
 def _age_overdue_address(overdue_address: str) -> str:
@@ -5962,6 +6056,7 @@ def _move_outstanding_statement_balances_to_unpaid(
     denomination: str,
     supported_txn_types: dict[str, Optional[list[str]]],
     supported_fee_types: list[str],
+    address_table: Optional[AddressTable] = None,
 ) -> list[CustomInstruction]:
     """
     Move any unpaid statement amount to past_due.
@@ -5972,8 +6067,13 @@ def _move_outstanding_statement_balances_to_unpaid(
     :param denomination: Denomination of the account
     :param supported_txn_types: Map of supported transaction types (txn_type to txn_level_refs)
     :param supported_fee_types: Supported fee types
+    :param address_table: Balance addresses for the supported types. Built from
+    supported_txn_types and supported_fee_types if not provided
     :return: CustomInstructions to move balances to past_due
     """
+    if address_table is None:
+        address_table = _build_address_table(supported_txn_types, supported_fee_types)
+
     posting_instructions: list[CustomInstruction] = []
 
     def move_statement_balance_to_unpaid(
@@ -5987,15 +6087,16 @@ def _move_outstanding_statement_balances_to_unpaid(
         """
         statement_address = ""
         past_due_address = ""
+        txn_ref = txn_ref or ""
         if charge_type == PRINCIPAL:
-            statement_address = _principal_address(sub_type, BILLED, txn_ref=txn_ref)
-            past_due_address = _principal_address(sub_type, UNPAID, txn_ref=txn_ref)
+            statement_address = address_table.principal[(sub_type, txn_ref, BILLED)]
+            past_due_address = address_table.principal[(sub_type, txn_ref, UNPAID)]
         elif charge_type == INTEREST:
-            statement_address = _interest_address(sub_type, BILLED, txn_ref=txn_ref)
-            past_due_address = _interest_address(sub_type, UNPAID, txn_ref=txn_ref)
+            statement_address = address_table.interest[(sub_type, txn_ref, "", BILLED)]
+            past_due_address = address_table.interest[(sub_type, txn_ref, "", UNPAID)]
         elif charge_type == FEES:
-            statement_address = _fee_address(sub_type, BILLED)
-            past_due_address = _fee_address(sub_type, UNPAID)
+            statement_address = address_table.fees[(sub_type, BILLED)]
+            past_due_address = address_table.fees[(sub_type, UNPAID)]
 
         statement_to_past_due = utils.balance_at_coordinates(
             balances=in_flight_balances, address=statement_address, denomination=denomination
@@ -6226,6 +6327,45 @@ def _fee_address(fee_type: str, fee_status: str) -> str:
     return f"{fee_type}S_{fee_status}"
 
 
+def _build_address_table(
+    supported_txn_types: dict[str, Optional[list[str]]], supported_fee_types: list[str]
+) -> AddressTable:
+    """
+    Builds the principal, interest and fee balance addresses for all supported transaction and fee
+    types so that they can be looked up rather than rebuilt for each rebalancing posting.
+
+    :param supported_txn_types: Map of supported transaction types (txn_type to txn_level_refs)
+    :param supported_fee_types: Supported fee types
+    :return: The balance addresses of the supported types
+    """
+    principal: dict[tuple[str, str, str], str] = {}
+    interest: dict[tuple[str, str, str, str], str] = {}
+    fees: dict[tuple[str, str], str] = {}
+
+    for txn_type, txn_refs in supported_txn_types.items():
+        for txn_ref in txn_refs or [""]:
+            for status in PRINCIPAL_ADDRESS_STATUSES:
+                principal[(txn_type, txn_ref, status)] = _principal_address(
+                    txn_type, status, txn_ref=txn_ref
+                )
+            for status in INTEREST_ADDRESS_STATUSES:
+                interest[(txn_type, txn_ref, "", status)] = _interest_address(
+                    txn_type, status, txn_ref=txn_ref
+                )
+            for accrual_type in ACCRUAL_TYPES:
+                interest[(txn_type, txn_ref, accrual_type, UNCHARGED)] = _interest_address(
+                    txn_type, UNCHARGED, txn_ref=txn_ref, accrual_type=accrual_type
+                )
+
+    for fee_type in supported_fee_types:
+        for status in FEE_ADDRESS_STATUSES:
+            fees[(fee_type, status)] = _fee_address(fee_type, status)
+        for status in INTEREST_ADDRESS_STATUSES:
+            interest[(fee_type, "", "", status)] = _interest_address(fee_type, status)
+
+    return AddressTable(principal=principal, interest=interest, fees=fees)
+
+
 def _charge_overlimit_fee(
     vault: SmartContractVault,
     in_flight_balances: BalanceDefaultDict,
@@ -276,17 +276,15 @@ class AccrueInterestTest(CreditCardTestBase):
 
 
 @patch.object(credit_card, "_rebalance_balance_buckets")
-@patch.object(credit_card, "_interest_address")
 class AdjustInterestUnchargedBalancesTest(CreditCardTestBase):
     def test_adjust_interest_uncharged_balances(
         self,
-        mock_interest_address: MagicMock,
         mock_rebalance_balance_buckets: MagicMock,
     ):
         # construct values
         rebalance_postings = [SentinelCustomInstruction("rebalance_postings")]
         supported_txn_types: dict[str, Optional[list[str]]] = {
-            "PURCHASE": [sentinel.txn_ref],
+            "PURCHASE": ["REF1"],
             "CASH_ADVANCE": None,
             "BALANCE_TRANSFER": None,
         }
@@ -297,10 +295,6 @@ class AdjustInterestUnchargedBalancesTest(CreditCardTestBase):
 
         # construct mocks
         mock_vault = self.create_mock()
-        mock_interest_address.side_effect = [
-            sentinel.from_balance_address,
-            sentinel.to_balance_address,
-        ]
         mock_rebalance_balance_buckets.return_value = (
             sentinel._,
             rebalance_postings,
@@ -317,27 +311,49 @@ class AdjustInterestUnchargedBalancesTest(CreditCardTestBase):
         self.assertEqual(rebalance_postings, result)
 
         # assert calls
-        mock_interest_address.assert_has_calls(
-            calls=[
-                call(
-                    "PURCHASE",
-                    "UNCHARGED",
-                    txn_ref=sentinel.txn_ref,
-                    accrual_type="PRE_SCOD",
-                ),
-                call(
-                    "PURCHASE",
-                    "UNCHARGED",
-                    txn_ref=sentinel.txn_ref,
-                    accrual_type="POST_SCOD",
-                ),
-            ]
+        mock_rebalance_balance_buckets.assert_called_once_with(
+            mock_vault,
+            sentinel.in_flight_balances,
+            "PURCHASE_REF1_INTEREST_PRE_SCOD_UNCHARGED",
+            "PURCHASE_REF1_INTEREST_POST_SCOD_UNCHARGED",
+            self.default_denomination,
+        )
+
+    def test_adjust_interest_uncharged_balances_uses_address_table(
+        self,
+        mock_rebalance_balance_buckets: MagicMock,
+    ):
+        # construct values
+        supported_txn_types: dict[str, Optional[list[str]]] = {"PURCHASE": None}
+        address_table = credit_card.AddressTable(
+            principal={},
+            interest={
+                ("PURCHASE", "", "PRE_SCOD", "UNCHARGED"): "FROM_ADDRESS",
+                ("PURCHASE", "", "POST_SCOD", "UNCHARGED"): "TO_ADDRESS",
+            },
+            fees={},
+        )
+
+        # construct mocks
+        mock_vault = self.create_mock()
+        mock_rebalance_balance_buckets.return_value = (sentinel._, [])
+
+        # run function
+        credit_card._adjust_interest_uncharged_balances(
+            vault=mock_vault,
+            supported_txn_types=supported_txn_types,
+            txn_types_to_charge_interest_from_txn_date=[],
+            denomination=self.default_denomination,
+            in_flight_balances=sentinel.in_flight_balances,
+            address_table=address_table,
         )
+
+        # assert calls
         mock_rebalance_balance_buckets.assert_called_once_with(
             mock_vault,
             sentinel.in_flight_balances,
-            sentinel.from_balance_address,
-            sentinel.to_balance_address,
+            "FROM_ADDRESS",
+            "TO_ADDRESS",
             self.default_denomination,
         )
 
@@ -2164,18 +2180,16 @@ class CalculateMadTest(CreditCardTestBase):
 
 
 @patch.object(credit_card, "_rebalance_balance_buckets")
-@patch.object(credit_card, "_interest_address")
 class BillChargedInterestTest(CreditCardTestBase):
     def test_bill_charged_interest(
         self,
-        mock_interest_address: MagicMock,
         mock_rebalance_balance_buckets: MagicMock,
     ):
         # construct values
         rebalance_postings_1 = [SentinelCustomInstruction("rebalance_postings_1")]
         rebalance_postings_2 = [SentinelCustomInstruction("rebalance_postings_2")]
         supported_txn_types: dict[str, Optional[list[str]]] = {
-            "PURCHASE": [sentinel.txn_ref],
+            "PURCHASE": ["REF1"],
         }
         supported_fee_types = [
             "ANNUAL_FEE",
@@ -2183,12 +2197,6 @@ class BillChargedInterestTest(CreditCardTestBase):
         expected_result = [*rebalance_postings_1, *rebalance_postings_2]
 
         # construct mocks
-        mock_interest_address.side_effect = [
-            sentinel.from_balance_address_1,
-            sentinel.to_balance_address_1,
-            sentinel.from_balance_address_2,
-            sentinel.to_balance_address_2,
-        ]
         mock_rebalance_balance_buckets.side_effect = [
             (
                 sentinel._,
@@ -2211,44 +2219,20 @@ class BillChargedInterestTest(CreditCardTestBase):
         self.assertEqual(expected_result, result)
 
         # assert calls
-        mock_interest_address.assert_has_calls(
-            calls=[
-                call(
-                    "PURCHASE",
-                    "CHARGED",
-                    txn_ref=sentinel.txn_ref,
-                ),
-                call(
-                    "PURCHASE",
-                    "BILLED",
-                    txn_ref=sentinel.txn_ref,
-                ),
-                call(
-                    "ANNUAL_FEE",
-                    "CHARGED",
-                    txn_ref=None,
-                ),
-                call(
-                    "ANNUAL_FEE",
-                    "BILLED",
-                    txn_ref=None,
-                ),
-            ]
-        )
         mock_rebalance_balance_buckets.assert_has_calls(
             calls=[
                 call(
                     vault=sentinel.vault,
                     in_flight_balances=sentinel.in_flight_balances,
-                    debit_address=sentinel.from_balance_address_1,
-                    credit_address=sentinel.to_balance_address_1,
+                    debit_address="PURCHASE_REF1_INTEREST_CHARGED",
+                    credit_address="PURCHASE_REF1_INTEREST_BILLED",
                     denomination=self.default_denomination,
                 ),
                 call(
                     vault=sentinel.vault,
                     in_flight_balances=sentinel.in_flight_balances,
-                    debit_address=sentinel.from_balance_address_2,
-                    credit_address=sentinel.to_balance_address_2,
+                    debit_address="ANNUAL_FEE_INTEREST_CHARGED",
+                    credit_address="ANNUAL_FEE_INTEREST_BILLED",
                     denomination=self.default_denomination,
                 ),
             ]
@@ -3390,6 +3374,65 @@ class PrincipalAddressTest(CreditCardTestBase):
         self.assertEqual(results, expected_result)
 
 
+class BuildAddressTableTest(CreditCardTestBase):
+    def test_addresses_match_address_builders(self):
+        supported_txn_types: dict[str, Optional[list[str]]] = {
+            "PURCHASE": None,
+            "BALANCE_TRANSFER": ["REF1", "REF2"],
+            "BALANCE_TRANSFER_INTEREST_FREE_PERIOD": ["REF3"],
+        }
+        supported_fee_types = ["ANNUAL_FEE"]
+
+        result = credit_card._build_address_table(supported_txn_types, supported_fee_types)
+
+        for txn_type, txn_refs in supported_txn_types.items():
+            for txn_ref in txn_refs or [""]:
+                for status in credit_card.PRINCIPAL_ADDRESS_STATUSES:
+                    self.assertEqual(
+                        result.principal[(txn_type, txn_ref, status)],
+                        credit_card._principal_address(txn_type, status, txn_ref=txn_ref),
+                    )
+                for status in credit_card.INTEREST_ADDRESS_STATUSES:
+                    self.assertEqual(
+                        result.interest[(txn_type, txn_ref, "", status)],
+                        credit_card._interest_address(txn_type, status, txn_ref=txn_ref),
+                    )
+                for accrual_type in credit_card.ACCRUAL_TYPES:
+                    self.assertEqual(
+                        result.interest[(txn_type, txn_ref, accrual_type, "UNCHARGED")],
+                        credit_card._interest_address(
+                            txn_type, "UNCHARGED", txn_ref=txn_ref, accrual_type=accrual_type
+                        ),
+                    )
+        for status in credit_card.FEE_ADDRESS_STATUSES:
+            self.assertEqual(
+                result.fees[("ANNUAL_FEE", status)], credit_card._fee_address("ANNUAL_FEE", status)
+            )
+
+    def test_example_addresses(self):
+        result = credit_card._build_address_table(
+            {"PURCHASE": None, "BALANCE_TRANSFER": ["REF1"]}, ["ANNUAL_FEE"]
+        )
+
+        self.assertEqual(result.principal[("PURCHASE", "", "BILLED")], "PURCHASE_BILLED")
+        self.assertEqual(
+            result.principal[("BALANCE_TRANSFER", "REF1", "UNPAID")], "BALANCE_TRANSFER_REF1_UNPAID"
+        )
+        self.assertEqual(
+            result.interest[("BALANCE_TRANSFER", "REF1", "PRE_SCOD", "UNCHARGED")],
+            "BALANCE_TRANSFER_REF1_INTEREST_PRE_SCOD_UNCHARGED",
+        )
+        self.assertEqual(
+            result.interest[("ANNUAL_FEE", "", "", "CHARGED")], "ANNUAL_FEE_INTEREST_CHARGED"
+        )
+        self.assertEqual(result.fees[("ANNUAL_FEE", "UNPAID")], "ANNUAL_FEES_UNPAID")
+
+    def test_no_supported_types(self):
+        result = credit_card._build_address_table({}, [])
+
+        self.assertEqual(result, credit_card.AddressTable(principal={}, interest={}, fees={}))
+
+
 class InterestAddressTest(CreditCardTestBase):
     txn_type = "TXN_TYPE"
     txn_ref = "TXN_REF"
@@ -3473,13 +3516,9 @@ class GetTxnTypeAndRefFromAddressTest(CreditCardTestBase):
 @patch.object(credit_card, "_bill_charged_interest")
 @patch.object(credit_card, "_get_supported_fee_types")
 @patch.object(credit_card, "_rebalance_balance_buckets")
-@patch.object(credit_card, "_fee_address")
-@patch.object(credit_card, "_principal_address")
 class BillChargedTransactionsAndBankChargesTest(CreditCardTestBase):
     def test_with_principal_and_fee_addresses(
         self,
-        mock_principal_address: MagicMock,
-        mock_fee_address: MagicMock,
         mock_rebalance_balance_buckets: MagicMock,
         mock_get_supported_fee_types: MagicMock,
         mock_bill_charged_interest: MagicMock,
@@ -3501,9 +3540,7 @@ class BillChargedTransactionsAndBankChargesTest(CreditCardTestBase):
         ]
 
         # construct mocks
-        mock_principal_address.side_effect = ["PURCHASE_CHARGED", "PURCHASE_BILLED"]
         mock_get_supported_fee_types.return_value = supported_fee_types
-        mock_fee_address.side_effect = ["ANNUAL_FEES_CHARGED", "ANNUAL_FEES_BILLED"]
         mock_rebalance_balance_buckets.side_effect = [
             (
                 sentinel._,
@@ -3528,22 +3565,10 @@ class BillChargedTransactionsAndBankChargesTest(CreditCardTestBase):
         self.assertEqual(expected_result, result)
 
         # assert calls
-        mock_principal_address.assert_has_calls(
-            calls=[
-                call("PURCHASE", "CHARGED", txn_ref=""),
-                call("PURCHASE", "BILLED", txn_ref=""),
-            ]
-        )
         mock_get_supported_fee_types.assert_called_once_with(
             sentinel.vault,
             supported_txn_types,
         )
-        mock_fee_address.assert_has_calls(
-            calls=[
-                call(fee_type="ANNUAL_FEE", fee_status="CHARGED"),
-                call(fee_type="ANNUAL_FEE", fee_status="BILLED"),
-            ]
-        )
         mock_rebalance_balance_buckets.assert_has_calls(
             calls=[
                 call(
@@ -3568,6 +3593,9 @@ class BillChargedTransactionsAndBankChargesTest(CreditCardTestBase):
             supported_txn_types,
             self.default_denomination,
             sentinel.in_flight_balances,
+            address_table=credit_card._build_address_table(
+                supported_txn_types, supported_fee_types
+            ),
         )
         mock_adjust_aggregate_balances.assert_called_once_with(
             sentinel.vault,
@@ -3988,6 +4016,10 @@ class ProcessStatementCutOffTest(CreditCardTestBase):
         self.mock_get_supported_fee_types = patch_get_supported_fee_types.start()
         self.mock_get_supported_fee_types.return_value = sentinel.supported_fee_types
 
+        patch_build_address_table = patch.object(credit_card, "_build_address_table")
+        self.mock_build_address_table = patch_build_address_table.start()
+        self.mock_build_address_table.return_value = sentinel.address_table
+
         patch_is_txn_interest_accrual_from_txn_day = patch.object(
             credit_card, "_is_txn_interest_accrual_from_txn_day"
         )
@@ -4126,6 +4158,7 @@ class ProcessStatementCutOffTest(CreditCardTestBase):
             sentinel.denomination,
             sentinel.inflight_balances,
             sentinel.credit_limit,
+            address_table=sentinel.address_table,
         )
         self.mock_adjust_interest_uncharged_balances.assert_called_once_with(
             mock_vault,
@@ -4133,6 +4166,10 @@ class ProcessStatementCutOffTest(CreditCardTestBase):
             [],  # txn_types_to_charge_interest_from_txn_date
             sentinel.denomination,
             sentinel.inflight_balances,
+            address_table=sentinel.address_table,
+        )
+        self.mock_build_address_table.assert_called_once_with(
+            sentinel.supported_txn_types, sentinel.supported_fee_types
         )
         self.mock_get_outstanding_statement_amount.assert_called_once_with(
             sentinel.inflight_balances,
@@ -4218,6 +4255,7 @@ class ProcessStatementCutOffTest(CreditCardTestBase):
             sentinel.denomination,
             inflight_balances,
             sentinel.credit_limit,
+            address_table=sentinel.address_table,
         )
         self.mock_adjust_interest_uncharged_balances.assert_not_called()
         self.mock_get_outstanding_statement_amount.assert_called_once_with(
@@ -8170,7 +8208,7 @@ class GetBalancesToAccrueOnTest(CreditCardTestBase):
         mock_interest_address.side_effect = ["INTEREST_ADDRESS_BILLED"]
         mock_fee_address.side_effect = ["FEE_ADDRESS"]
         mock_is_txn_type_in_interest_free_period.side_effect = [False, False]
-        mock_is_revolver.side_effect = [False, False]
+        mock_is_revolver.return_value = False
 
         # run function
         result = credit_card._get_balances_to_accrue_on(
@@ -8190,12 +8228,7 @@ class GetBalancesToAccrueOnTest(CreditCardTestBase):
         mock_get_outstanding_statement_amount.assert_called_once_with(
             balances, self.default_denomination, supported_fee_types, supported_txn_types
         )
-        mock_is_revolver.assert_has_calls(
-            calls=[
-                call(balances, self.default_denomination),
-                call(balances, self.default_denomination),
-            ]
-        )
+        mock_is_revolver.assert_called_once_with(balances, self.default_denomination)
         mock_is_txn_type_in_interest_free_period.assert_has_calls(
             calls=[
                 call(sentinel.txn_types_in_interest_free_period, "TEST", ""),
@@ -8239,6 +8272,99 @@ class GetBalancesToAccrueOnTest(CreditCardTestBase):
             ]
         )
 
+    def test_get_balances_to_accrue_on_with_many_txn_refs(self):
+        # cards can have 50+ balance transfer refs, each with their own balance addresses
+        refs = [f"REF{i}" for i in range(60)]
+        mapping = {}
+        for i, ref in enumerate(refs):
+            mapping[
+                self.balance_coordinate(
+                    account_address=f"BALANCE_TRANSFER_{ref}_BILLED", denomination="GBP"
+                )
+            ] = self.balance(debit=Decimal(i), credit=Decimal("0"))
+            mapping[
+                self.balance_coordinate(
+                    account_address=f"BALANCE_TRANSFER_{ref}_CHARGED", denomination="GBP"
+                )
+            ] = self.balance(debit=Decimal("1"), credit=Decimal("0"))
+        mapping[
+            self.balance_coordinate(account_address="PURCHASE_UNPAID", denomination="GBP")
+        ] = self.balance(debit=Decimal("10"), credit=Decimal("0"))
+        balances = BalanceDefaultDict(mapping=mapping)
+
+        result = credit_card._get_balances_to_accrue_on(
+            balances=balances,
+            denomination=self.default_denomination,
+            supported_fee_types=[],
+            supported_txn_types={"PURCHASE": None, "BALANCE_TRANSFER": refs},
+            txn_types_to_charge_interest_from_txn_date=[],
+            accrue_interest_from_txn_day=True,
+            accrue_interest_on_unpaid_interest=False,
+            accrue_interest_on_unpaid_fees=False,
+            txn_types_in_interest_free_period={"balance_transfer": ["REF0"]},
+        )
+
+        self.assertDictEqual(
+            result,
+            {
+                # REF0 is in an interest free period, so it is not split by accrual type
+                ("PRINCIPAL", "BALANCE_TRANSFER", ""): {"REF0": Decimal("1")},
+                ("PRINCIPAL", "BALANCE_TRANSFER", "POST_SCOD"): {
+                    ref: Decimal(i) for i, ref in enumerate(refs) if i > 0
+                },
+                ("PRINCIPAL", "BALANCE_TRANSFER", "PRE_SCOD"): {
+                    ref: Decimal("1") for ref in refs[1:]
+                },
+                ("PRINCIPAL", "PURCHASE", "POST_SCOD"): {"": Decimal("0")},
+                ("PRINCIPAL", "PURCHASE", "PRE_SCOD"): {"": Decimal("0")},
+            },
+        )
+
+
+class GetCardStateTest(CreditCardTestBase):
+    @patch.object(credit_card, "_get_supported_fee_types")
+    @patch.object(credit_card.utils, "get_parameter")
+    def test_card_state_parses_parameters(
+        self, mock_get_parameter: MagicMock, mock_get_supported_fee_types: MagicMock
+    ):
+        cut_off_datetime = datetime(2020, 6, 1, tzinfo=ZoneInfo("UTC"))
+        mock_get_parameter.side_effect = mock_utils_get_parameter(
+            parameters={
+                credit_card.PARAM_TXN_TYPES: {
+                    "purchase": {},
+                    "balance_transfer": {"charge_interest_from_transaction_date": "True"},
+                },
+                credit_card.PARAM_TXN_REFS: {"balance_transfer": ["ref1", "ref2"]},
+                credit_card.PARAM_INTEREST_FREE_EXPIRY: {
+                    "purchase": "2020-12-31 12:00:00",
+                    "cash_advance": "2020-01-01 12:00:00",
+                    "transfer": "",
+                },
+                credit_card.PARAM_TXN_INTEREST_FREE_EXPIRY: {
+                    "balance_transfer": {"ref1": "2020-12-31 12:00:00", "ref2": ""}
+                },
+            }
+        )
+        mock_get_supported_fee_types.return_value = sentinel.supported_fee_types
+        supported_txn_types = {"PURCHASE": None, "BALANCE_TRANSFER": ["REF1", "REF2"]}
+
+        result = credit_card._get_card_state(
+            sentinel.vault,
+            effective_datetime=sentinel.effective_datetime,
+            cut_off_datetime=cut_off_datetime,
+        )
+
+        self.assertEqual(
+            result,
+            credit_card.CardState(
+                supported_txn_types=supported_txn_types,
+                supported_fee_types=sentinel.supported_fee_types,
+                txn_types_to_charge_interest_from_txn_date=["balance_transfer"],
+                txn_types_in_interest_free_period={"purchase": [], "balance_transfer": ["REF1"]},
+            ),
+        )
+        mock_get_supported_fee_types.assert_called_once_with(sentinel.vault, supported_txn_types)
+
 
 class ProcessPaymentDueDateTest(CreditCardTestBase):
     @patch.object(credit_card, "_is_revolver")
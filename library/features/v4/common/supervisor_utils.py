@@ -5,7 +5,7 @@ Provides commonly used Contracts API v4 helper methods for use with supervisor c
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import Decimal
-from typing import Callable, Union
+from typing import Callable, NamedTuple, Union
 
 # features
 import library.features.v4.common.addresses as addresses
@@ -77,12 +77,32 @@ def sort_supervisees(supervisees: list[SuperviseeContractVault]) -> list[Supervi
     :param supervisees: list of supervisee vault objects
     :return sorted_supervisees: list of ordered vault objects
     """
-    sorted_supervisees_by_id = sorted(supervisees, key=lambda vault: vault.account_id)
-    sorted_supervisees_by_age_then_id = sorted(
-        sorted_supervisees_by_id, key=lambda vault: vault.get_account_creation_datetime()
+    # a single sort on a composite key is equivalent to sorting by id and then by creation date
+    return sorted(
+        supervisees, key=lambda vault: (vault.get_account_creation_datetime(), vault.account_id)
     )
 
-    return sorted_supervisees_by_age_then_id
+
+def get_supervisees_by_alias(
+    vault: SupervisorContractVault, aliases: list[str]
+) -> dict[str, list[SuperviseeContractVault]]:
+    """
+    Returns the supervisee vault objects for multiple aliases, each ordered by account creation
+    date. This only sorts the supervisees once, so should be preferred over multiple calls to
+    `get_supervisees_for_alias` in the same hook execution.
+
+    :param vault: supervisor vault object
+    :param aliases: the supervisee aliases to filter for
+    :return: alias to supervisee vault objects for that alias, ordered by account creation date
+    """
+    supervisees_by_alias: dict[str, list[SuperviseeContractVault]] = {
+        alias: [] for alias in aliases
+    }
+    for supervisee in sort_supervisees(list(vault.supervisees.values())):
+        alias = supervisee.get_alias()
+        if alias in supervisees_by_alias:
+            supervisees_by_alias[alias].append(supervisee)
+    return supervisees_by_alias
 
 
 def get_balance_default_dicts_for_supervisees(
@@ -119,6 +139,76 @@ def get_balances_default_dicts_from_timeseries(
     }
 
 
+SuperviseeBalancesSnapshot = NamedTuple(
+    "SuperviseeBalancesSnapshot",
+    [
+        # (supervisee account id, effective datetime) to balances derived from the timeseries
+        ("balances", dict[tuple[str, datetime], BalanceDefaultDict]),
+    ],
+)
+
+
+def create_supervisee_balances_snapshot() -> SuperviseeBalancesSnapshot:
+    """
+    Creates a snapshot of supervisee balances to be shared by all features within a single hook
+    execution. Balances are only derived from a supervisee's timeseries the first time they are
+    requested for a given datetime, so that multiple features requiring the same balances do not
+    each rebuild them.
+    The snapshot must not be reused across hook executions.
+    :return: the empty snapshot
+    """
+    return SuperviseeBalancesSnapshot(balances={})
+
+
+def get_snapshot_balances(
+    snapshot: SuperviseeBalancesSnapshot,
+    supervisee: SuperviseeContractVault,
+    effective_datetime: datetime,
+) -> BalanceDefaultDict:
+    """
+    Returns a supervisee's balances at the provided datetime, using balances timeseries.
+    :param snapshot: the snapshot to retrieve balances from
+    :param supervisee: the supervisee vault object
+    :param effective_datetime: the datetime at which the balances should be retrieved
+    :return: the supervisee's balances. These must not be modified by the caller
+    """
+    return get_snapshot_balances_for_supervisees(
+        snapshot=snapshot, supervisees=[supervisee], effective_datetime=effective_datetime
+    )[supervisee.account_id]
+
+
+def get_snapshot_balances_for_supervisees(
+    snapshot: SuperviseeBalancesSnapshot,
+    supervisees: list[SuperviseeContractVault],
+    effective_datetime: datetime,
+) -> dict[str, BalanceDefaultDict]:
+    """
+    Equivalent to `get_balances_default_dicts_from_timeseries`, but only derives the balances of
+    supervisees that are not already in the snapshot
+    :param snapshot: the snapshot to retrieve balances from
+    :param supervisees: the vault objects to get balances for
+    :param effective_datetime: the datetime at which the balances should be retrieved
+    :return: a dictionary that maps the supervisees account ID to the retrieved balances. These
+    must not be modified by the caller
+    """
+    if missing_supervisees := [
+        supervisee
+        for supervisee in supervisees
+        if (supervisee.account_id, effective_datetime) not in snapshot.balances
+    ]:
+        for account_id, balances in get_balances_default_dicts_from_timeseries(
+            supervisees=missing_supervisees, effective_datetime=effective_datetime
+        ).items():
+            snapshot.balances[(account_id, effective_datetime)] = balances
+
+    supervisees_balances = {}
+    for supervisee in supervisees:
+        key = (supervisee.account_id, effective_datetime)
+        if key in snapshot.balances:
+            supervisees_balances[supervisee.account_id] = snapshot.balances[key]
+    return supervisees_balances
+
+
 def sum_balances_across_supervisees(
     balances: list[BalanceDefaultDict],
     denomination: str,
@@ -230,12 +320,15 @@ def create_aggregate_posting_instructions(
     :return: The aggregated custom instructions
     """
 
+    # Accumulate per coordinate rather than adding BalanceDefaultDicts, which would copy the
+    # whole aggregate for every instruction
     aggregate_balances = BalanceDefaultDict()
     for supervisee_account_id, posting_instructions in posting_instructions_by_supervisee.items():
         for posting_instruction in posting_instructions:
-            aggregate_balances += posting_instruction.balances(
+            for balance_coordinate, balance in posting_instruction.balances(
                 account_id=supervisee_account_id, tside=tside
-            )
+            ).items():
+                aggregate_balances[balance_coordinate] += balance
 
     filtered_aggregate_balances = filter_aggregate_balances(
         aggregate_balances=aggregate_balances,
@@ -157,6 +157,57 @@ class GetSuperviseesForAliasTest(SupervisorFeatureTest):
         result = supervisor_utils.sort_supervisees([])
         self.assertListEqual(result, [])
 
+    def test_get_supervisees_by_alias_partitions_sorted_supervisees(self):
+        # construct mocks
+        mock_vault_loan_1 = self.create_supervisee_mock(
+            supervisee_alias="loan",
+            account_id="001",
+            creation_date=datetime(2020, 1, 2, tzinfo=ZoneInfo("UTC")),
+        )
+        mock_vault_loan_2 = self.create_supervisee_mock(
+            supervisee_alias="loan",
+            account_id="002",
+            creation_date=datetime(2020, 1, 1, tzinfo=ZoneInfo("UTC")),
+        )
+        mock_vault_loc = self.create_supervisee_mock(supervisee_alias="loc", account_id="003")
+        mock_vault_other = self.create_supervisee_mock(supervisee_alias="other", account_id="004")
+        mock_supervisor_vault = self.create_supervisor_mock(
+            supervisees={
+                "001": mock_vault_loan_1,
+                "002": mock_vault_loan_2,
+                "003": mock_vault_loc,
+                "004": mock_vault_other,
+            }
+        )
+
+        # run function
+        result = supervisor_utils.get_supervisees_by_alias(
+            mock_supervisor_vault, ["loc", "loan", "missing"]
+        )
+        self.assertDictEqual(
+            result,
+            {
+                "loc": [mock_vault_loc],
+                "loan": [mock_vault_loan_2, mock_vault_loan_1],
+                "missing": [],
+            },
+        )
+
+    @patch.object(supervisor_utils, "sort_supervisees")
+    def test_get_supervisees_by_alias_only_sorts_once(self, mock_sort_supervisees: MagicMock):
+        # construct mocks
+        mock_vault_loan = self.create_supervisee_mock(supervisee_alias="loan", account_id="001")
+        mock_vault_loc = self.create_supervisee_mock(supervisee_alias="loc", account_id="002")
+        mock_supervisor_vault = self.create_supervisor_mock(
+            supervisees={"001": mock_vault_loan, "002": mock_vault_loc}
+        )
+        mock_sort_supervisees.return_value = [mock_vault_loc, mock_vault_loan]
+
+        # run function
+        result = supervisor_utils.get_supervisees_by_alias(mock_supervisor_vault, ["loan", "loc"])
+        self.assertDictEqual(result, {"loan": [mock_vault_loan], "loc": [mock_vault_loc]})
+        mock_sort_supervisees.assert_called_once_with([mock_vault_loan, mock_vault_loc])
+
 
 class GetBalanceDefaultDictsForSuperviseesTest(SupervisorFeatureTest):
     def test_correct_balance_default_dict_list_is_returned(
@@ -249,6 +300,73 @@ class GetBalanceDefaultDictFromTimeseriesTest(SupervisorFeatureTest):
         self.assertEqual(result, expected_result)
 
 
+@patch.object(supervisor_utils.utils, "get_balance_default_dict_from_mapping")
+class SuperviseeBalancesSnapshotTest(SupervisorFeatureTest):
+    def test_balances_only_derived_once_per_supervisee_and_datetime(
+        self, mock_get_balance_default_dict_from_mapping: MagicMock
+    ):
+        mock_get_balance_default_dict_from_mapping.side_effect = [
+            sentinel.s1_balances_at_default_datetime,
+            sentinel.s1_balances_at_next_day,
+        ]
+        mock_s1 = self.create_supervisee_mock(
+            account_id="s1",
+            requires_fetched_balances=sentinel.s1_timeseries,
+        )
+        snapshot = supervisor_utils.create_supervisee_balances_snapshot()
+
+        for _ in range(2):
+            self.assertEqual(
+                supervisor_utils.get_snapshot_balances(
+                    snapshot=snapshot, supervisee=mock_s1, effective_datetime=DEFAULT_DATETIME
+                ),
+                sentinel.s1_balances_at_default_datetime,
+            )
+        self.assertEqual(
+            supervisor_utils.get_snapshot_balances(
+                snapshot=snapshot,
+                supervisee=mock_s1,
+                effective_datetime=DEFAULT_DATETIME + relativedelta(days=1),
+            ),
+            sentinel.s1_balances_at_next_day,
+        )
+        self.assertEqual(mock_get_balance_default_dict_from_mapping.call_count, 2)
+
+    def test_snapshot_balances_for_supervisees_only_derives_missing_balances(
+        self, mock_get_balance_default_dict_from_mapping: MagicMock
+    ):
+        mock_get_balance_default_dict_from_mapping.side_effect = [
+            sentinel.s1_balance_default_dict,
+            sentinel.s2_balance_default_dict,
+        ]
+        mock_s1 = self.create_supervisee_mock(
+            account_id="s1", requires_fetched_balances=sentinel.s1_timeseries
+        )
+        mock_s2 = self.create_supervisee_mock(
+            account_id="s2", requires_fetched_balances=sentinel.s2_timeseries
+        )
+        snapshot = supervisor_utils.create_supervisee_balances_snapshot()
+        supervisor_utils.get_snapshot_balances(
+            snapshot=snapshot, supervisee=mock_s1, effective_datetime=DEFAULT_DATETIME
+        )
+
+        result = supervisor_utils.get_snapshot_balances_for_supervisees(
+            snapshot=snapshot, supervisees=[mock_s1, mock_s2], effective_datetime=DEFAULT_DATETIME
+        )
+
+        self.assertDictEqual(
+            result,
+            {"s1": sentinel.s1_balance_default_dict, "s2": sentinel.s2_balance_default_dict},
+        )
+        mock_get_balance_default_dict_from_mapping.assert_has_calls(
+            [
+                call(mapping=sentinel.s1_timeseries, effective_datetime=DEFAULT_DATETIME),
+                call(mapping=sentinel.s2_timeseries, effective_datetime=DEFAULT_DATETIME),
+            ]
+        )
+        self.assertEqual(mock_get_balance_default_dict_from_mapping.call_count, 2)
+
+
 class SumBalancesAcrossSuperviseesTest(SupervisorFeatureTest):
     @patch.object(supervisor_utils.utils, "sum_balances")
     def test_correct_sum_is_returned(
@@ -823,6 +941,67 @@ class CreateAggregatePostingInstructionsTest(SupervisorFeatureTest):
         )
         mock_create_postings.assert_not_called()
 
+    def test_aggregate_balances_scale_with_number_of_supervisees(
+        self,
+        mock_create_postings: MagicMock,
+        mock_filter_aggregate_balances: MagicMock,
+    ):
+        # plans can have hundreds of supervisees, each contributing to the same few coordinates
+        mock_filter_aggregate_balances.return_value = {}
+        for number_of_supervisees in [10, 100, 500]:
+            with self.subTest(number_of_supervisees=number_of_supervisees):
+                posting_instructions = {
+                    f"supervisee_{i}": [
+                        self.custom_instruction(
+                            postings=[
+                                Posting(
+                                    credit=False,
+                                    amount=Decimal("1"),
+                                    denomination=self.default_denomination,
+                                    account_id=f"supervisee_{i}",
+                                    account_address=DEFAULT_ADDRESS,
+                                    asset=DEFAULT_ASSET,
+                                    phase=Phase.COMMITTED,
+                                ),
+                                Posting(
+                                    credit=True,
+                                    amount=Decimal("1"),
+                                    denomination=self.default_denomination,
+                                    account_id=f"supervisee_{i}",
+                                    account_address=addresses.PENALTIES,
+                                    asset=DEFAULT_ASSET,
+                                    phase=Phase.COMMITTED,
+                                ),
+                            ]
+                        )
+                    ]
+                    for i in range(number_of_supervisees)
+                }
+
+                supervisor_utils.create_aggregate_posting_instructions(
+                    aggregate_account_id=sentinel.account_id,
+                    posting_instructions_by_supervisee=posting_instructions,
+                    prefix=sentinel.prefix,
+                    balances=sentinel.balances,
+                    addresses_to_aggregate=sentinel.addresses_to_aggregate,
+                )
+
+                aggregate_balances = mock_filter_aggregate_balances.call_args.kwargs[
+                    "aggregate_balances"
+                ]
+                self.assertEqual(len(aggregate_balances), 2)
+                for address, expected_net in [
+                    (DEFAULT_ADDRESS, Decimal(number_of_supervisees)),
+                    (addresses.PENALTIES, -Decimal(number_of_supervisees)),
+                ]:
+                    balance_coordinate = BalanceCoordinate(
+                        account_address=address,
+                        asset=DEFAULT_ASSET,
+                        denomination=self.default_denomination,
+                        phase=Phase.COMMITTED,
+                    )
+                    self.assertEqual(aggregate_balances[balance_coordinate].net, expected_net)
+
 
 @patch.object(supervisor_utils.utils, "round_decimal")
 class FilterAggregateBalancesTest(SupervisorFeatureTest):
@@ -2,7 +2,7 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from decimal import ROUND_05UP, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_UP, Decimal
-from json import dumps
+from json import dumps, loads
 from typing import Mapping
 from unittest.mock import MagicMock, call, patch, sentinel
 from zoneinfo import ZoneInfo
@@ -541,6 +541,139 @@ class GetParameterTest(FeatureTest):
         self.assertEqual(result, True)
 
 
+class GetParameterCacheTest(FeatureTest):
+    parameter_timeseries = construct_parameter_timeseries(
+        parameter_name_to_value_map={
+            "test_parameter": "test_value",
+            "test_parameter_json": dumps({"test_key": "test_value"}),
+            "test_parameter_optional_not_set": OptionalValue(value=None),
+        },
+        default_datetime=DEFAULT_DATETIME,
+    )
+
+    def test_repeated_lookups_use_cached_value(self):
+        mock_vault = self.create_mock(parameter_ts=self.parameter_timeseries)
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        results = [
+            utils.get_parameter(
+                vault=mock_vault, name="test_parameter", parameter_cache=parameter_cache
+            )
+            for _ in range(2)
+        ]
+
+        self.assertListEqual(results, ["test_value", "test_value"])
+        mock_vault.get_parameter_timeseries.assert_called_once_with(name="test_parameter")
+
+    @patch.object(utils, "loads", wraps=loads)
+    def test_repeated_json_lookups_use_cached_decoded_value(self, mock_loads: MagicMock):
+        mock_vault = self.create_mock(parameter_ts=self.parameter_timeseries)
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        results = [
+            utils.get_parameter(
+                vault=mock_vault,
+                name="test_parameter_json",
+                is_json=True,
+                parameter_cache=parameter_cache,
+            )
+            for _ in range(2)
+        ]
+
+        self.assertListEqual(results, [{"test_key": "test_value"}, {"test_key": "test_value"}])
+        mock_vault.get_parameter_timeseries.assert_called_once_with(name="test_parameter_json")
+        mock_loads.assert_called_once()
+
+    def test_lookups_without_cache_are_not_cached(self):
+        mock_vault = self.create_mock(parameter_ts=self.parameter_timeseries)
+
+        for _ in range(2):
+            utils.get_parameter(vault=mock_vault, name="test_parameter")
+
+        self.assertEqual(mock_vault.get_parameter_timeseries.call_count, 2)
+
+    def test_lookups_at_different_datetimes_are_cached_separately(self):
+        previous_datetime = DEFAULT_DATETIME - relativedelta(hours=1)
+        parameter_ts = {
+            "test_parameter": ParameterTimeseries(
+                [(previous_datetime, "some_old_value"), (DEFAULT_DATETIME, "test_value")]
+            )
+        }
+        mock_vault = self.create_mock(parameter_ts=parameter_ts)
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        results = [
+            utils.get_parameter(
+                vault=mock_vault,
+                name="test_parameter",
+                at_datetime=at_datetime,
+                parameter_cache=parameter_cache,
+            )
+            for at_datetime in [previous_datetime, DEFAULT_DATETIME, previous_datetime]
+        ]
+
+        self.assertListEqual(results, ["some_old_value", "test_value", "some_old_value"])
+        self.assertEqual(mock_vault.get_parameter_timeseries.call_count, 2)
+
+    def test_json_and_raw_lookups_are_cached_separately(self):
+        mock_vault = self.create_mock(parameter_ts=self.parameter_timeseries)
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        raw_result = utils.get_parameter(
+            vault=mock_vault, name="test_parameter_json", parameter_cache=parameter_cache
+        )
+        json_result = utils.get_parameter(
+            vault=mock_vault,
+            name="test_parameter_json",
+            is_json=True,
+            parameter_cache=parameter_cache,
+        )
+
+        self.assertEqual(raw_result, dumps({"test_key": "test_value"}))
+        self.assertEqual(json_result, {"test_key": "test_value"})
+
+    def test_optional_default_value_applied_to_cached_value(self):
+        mock_vault = self.create_mock(parameter_ts=self.parameter_timeseries)
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        results = [
+            utils.get_parameter(
+                vault=mock_vault,
+                name="test_parameter_optional_not_set",
+                is_optional=True,
+                default_value=default_value,
+                parameter_cache=parameter_cache,
+            )
+            for default_value in ["default_1", "default_2"]
+        ]
+
+        self.assertListEqual(results, ["default_1", "default_2"])
+        mock_vault.get_parameter_timeseries.assert_called_once()
+
+    def test_is_flag_in_list_applied_uses_cached_flag_list(self):
+        parameter_ts = construct_parameter_timeseries(
+            parameter_name_to_value_map={"test_flags": dumps(["TEST_FLAG"])},
+            default_datetime=DEFAULT_DATETIME,
+        )
+        mock_vault = self.create_mock(
+            parameter_ts=parameter_ts,
+            flags_ts={"TEST_FLAG": FlagTimeseries([(DEFAULT_DATETIME, True)])},
+        )
+        parameter_cache: utils.ParameterCacheTypeAlias = {}
+
+        for _ in range(3):
+            self.assertTrue(
+                utils.is_flag_in_list_applied(
+                    vault=mock_vault,
+                    parameter_name="test_flags",
+                    effective_datetime=DEFAULT_DATETIME,
+                    parameter_cache=parameter_cache,
+                )
+            )
+
+        mock_vault.get_parameter_timeseries.assert_called_once_with(name="test_flags")
+
+
 class HasParameterChangedTest(FeatureTest):
     def test_has_parameter_changed_returns_true_if_parameters_have_changed(self):
         old_parameters: dict[str, utils.ParameterValueTypeAlias] = {
@@ -91,6 +91,10 @@ PostingsTypeAlias = Union[
 
 ParameterValueTypeAlias = Union[Decimal, str, datetime, OptionalValue, UnionItemValue, int]
 
+# Parameter values cannot change within a hook execution, so a hook can pass the same dict to each
+# get_parameter call to cache the retrieved values for its execution. Keyed by
+# (parameter name, at_datetime, is_json, is_boolean, is_union) to the converted value
+ParameterCacheTypeAlias = dict[tuple[str, Optional[datetime], bool, bool, bool], Any]
 
 # yearly_to_daily_rate
 VALID_DAYS_IN_YEAR = ["360", "365", "366", "actual"]
@@ -231,6 +235,7 @@ def get_parameter(
     is_union: bool = False,
     is_optional: bool = False,
     default_value: Optional[Any] = None,
+    parameter_cache: Optional[ParameterCacheTypeAlias] = None,
 ) -> Any:
     """
     Get the parameter value for a given parameter
@@ -245,30 +250,41 @@ def get_parameter(
     :param is_optional: if true we treat the parameter as optional
     :param default_value: only used in conjunction with the is_optional arg, the value to use if the
     parameter is not set.
+    :param parameter_cache: a dict that is only used for the current hook execution. If provided,
+    the retrieved and converted values are cached in it, so repeated calls with the same arguments
+    don't retrieve the timeseries or json decode the value again. Cached json values are shared by
+    all callers, so must not be mutated
     :return: the parameter value, this is type hinted as Any because the parameter could be
     json loaded, therefore it value can be any json serialisable type and we gain little benefit
     from having an extensive Union list
     """
-    if at_datetime:
-        parameter = vault.get_parameter_timeseries(name=name).at(at_datetime=at_datetime)
+    cache_key = (name, at_datetime, is_json, is_boolean, is_union)
+    if parameter_cache is not None and cache_key in parameter_cache:
+        parameter = parameter_cache[cache_key]
     else:
-        parameter = vault.get_parameter_timeseries(name=name).latest()
+        if at_datetime:
+            parameter = vault.get_parameter_timeseries(name=name).at(at_datetime=at_datetime)
+        else:
+            parameter = vault.get_parameter_timeseries(name=name).latest()
+
+        if is_union and parameter is not None:
+            parameter = parameter.key
 
-    if is_union and parameter is not None:
-        parameter = parameter.key
+        if is_boolean and parameter is not None:
+            # since boolean parameters are defined by the UnionShape() parameter shape, the key
+            # must be accessed
+            # parameter = str_to_bool(parameter.key)
+            parameter = str_to_bool(parameter)
 
-    if is_boolean and parameter is not None:
-        # since boolean parameters are defined by the UnionShape() parameter shape, the key must be
-        # accessed
-        # parameter = str_to_bool(parameter.key)
-        parameter = str_to_bool(parameter)
+        if is_json and parameter is not None:
+            parameter = loads(parameter)
 
-    if is_json and parameter is not None:
-        parameter = loads(parameter)
+        if parameter_cache is not None:
+            parameter_cache[cache_key] = parameter
 
     if is_optional:
         parameter = parameter.value if parameter.is_set() else default_value
-        
+
     return parameter
 
 
@@ -761,6 +777,7 @@ def is_flag_in_list_applied(
     vault: SmartContractVault,
     parameter_name: str,
     effective_datetime: Optional[datetime] = None,
+    parameter_cache: Optional[ParameterCacheTypeAlias] = None,
 ) -> bool:
     """
     Determine if a flag in the list provided is set and active
@@ -769,9 +786,12 @@ def is_flag_in_list_applied(
     :param parameter_name: str, name of the parameter to retrieve
     :param effective_datetime: datetime at which to retrieve the flag timeseries value. If not
     specified the latest value is retrieved
+    :param parameter_cache: the hook execution's parameter cache, see get_parameter
     :return: bool, True if any of the flags in the list are applied at the given datetime
     """
-    flag_names: list[str] = get_parameter(vault, name=parameter_name, is_json=True)
+    flag_names: list[str] = get_parameter(
+        vault, name=parameter_name, is_json=True, parameter_cache=parameter_cache
+    )
 
     return any(
         vault.get_flag_timeseries(flag=flag_name).at(at_datetime=effective_datetime)
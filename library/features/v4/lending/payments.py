@@ -39,6 +39,26 @@ RepaymentAmounts = NamedTuple(
     ],
 )
 
+RepaymentPlanEntry = NamedTuple(
+    "RepaymentPlanEntry",
+    [
+        ("target_account_id", str),
+        ("address", str),
+        ("unrounded_amount", Decimal),
+        ("rounded_amount", Decimal),
+        # whether this is the last address of an address list for the target
+        ("ends_address_list", bool),
+    ],
+)
+
+RepaymentPlan = NamedTuple(
+    "RepaymentPlan",
+    [
+        ("targets", list[str]),
+        ("entries", list[RepaymentPlanEntry]),
+    ],
+)
+
 
 def redistribute_postings(
     debit_account: str,
@@ -170,28 +190,106 @@ def distribute_repayment_for_multiple_targets(
     amounts for each address.
         - the remaining repayment amount.
     """
+    repayment_plan = create_repayment_plan(
+        balances_per_target=balances_per_target,
+        denomination=denomination,
+        repayment_hierarchy=repayment_hierarchy,
+    )
+    return distribute_repayment_plan(
+        repayment_plan=repayment_plan, repayment_amount=repayment_amount
+    )
+
 
+def create_repayment_plan(
+    balances_per_target: dict[str, BalanceDefaultDict],
+    denomination: str,
+    repayment_hierarchy: list[list[str]],
+    phase: Phase = Phase.COMMITTED,
+) -> RepaymentPlan:
+    """
+    Extracts the outstanding amounts for each repayment target and address once, in the order in
+    which they are repaid, so that repayments can be distributed without re-reading balances.
+    See `distribute_repayment_for_multiple_targets` for how the hierarchy is applied. Empty address
+    lists in the hierarchy are ignored.
+    :param balances_per_target: a dictionary where the key is the repayment target account id and
+    the value is its balances. This should be sorted in order of which target should be repaid
+    first.
+    :param denomination: the denomination of the repayment
+    :param repayment_hierarchy: The order in which a repayment amount is to be distributed across
+    addresses for one or more targets. The outer list represents ordering across accounts and the
+    the inner lists represent ordering within an account.
+    :param phase: The balance phase of the balances fetched to get amounts from
+    :return: the repayment plan
+    """
+    balance_coordinates = {
+        address: BalanceCoordinate(address, DEFAULT_ASSET, denomination, phase)
+        for address_list in repayment_hierarchy
+        for address in address_list
+    }
+    # an address can appear in multiple address lists, so amounts are only extracted once
+    amounts_per_target_address: dict[tuple[str, str], tuple[Decimal, Decimal]] = {}
+    entries: list[RepaymentPlanEntry] = []
+    for address_list in repayment_hierarchy:
+        for target_account_id, balances in balances_per_target.items():
+            for index, address in enumerate(address_list):
+                if (target_account_id, address) not in amounts_per_target_address:
+                    unrounded_amount = balances[balance_coordinates[address]].net
+                    amounts_per_target_address[(target_account_id, address)] = (
+                        unrounded_amount,
+                        utils.round_decimal(unrounded_amount, 2),
+                    )
+                unrounded_amount, rounded_amount = amounts_per_target_address[
+                    (target_account_id, address)
+                ]
+                entries.append(
+                    RepaymentPlanEntry(
+                        target_account_id=target_account_id,
+                        address=address,
+                        unrounded_amount=unrounded_amount,
+                        rounded_amount=rounded_amount,
+                        ends_address_list=index == len(address_list) - 1,
+                    )
+                )
+
+    return RepaymentPlan(targets=list(balances_per_target.keys()), entries=entries)
+
+
+def distribute_repayment_plan(
+    repayment_plan: RepaymentPlan,
+    repayment_amount: Decimal,
+) -> tuple[dict[str, dict[str, RepaymentAmounts]], Decimal]:
+    """
+    Distributes a repayment amount across a repayment plan in a single pass. The results are the
+    same as distributing the amount with `distribute_repayment_for_single_target` for each address
+    list and target in turn.
+    :param repayment_plan: the plan created by `create_repayment_plan`
+    :param repayment_amount: repayment amount to distribute
+    :return: A tuple containing
+        - a dictionary where the key is the target account id and the value is the repayment
+    amounts for each address.
+        - the remaining repayment amount.
+    """
     remaining_repayment_amount = repayment_amount
     repayments_per_target: dict[str, dict[str, RepaymentAmounts]] = {
-        target: {} for target in balances_per_target.keys()
+        target: {} for target in repayment_plan.targets
     }
 
-    for address_list in repayment_hierarchy:
-        for target_account_id in balances_per_target.keys():
-            (
-                repayment_per_address,
-                remaining_repayment_amount,
-            ) = distribute_repayment_for_single_target(
-                balances=balances_per_target[target_account_id],
-                repayment_amount=remaining_repayment_amount,
-                denomination=denomination,
-                repayment_hierarchy=address_list,
+    for entry in repayment_plan.entries:
+        rounded_repayment_amount = min(entry.rounded_amount, remaining_repayment_amount)
+        # can't repay a balance that is < 2 decimal points - this should be dealt with in
+        # close_code for early repayments
+        if rounded_repayment_amount != Decimal(0):
+            # ensure that the unrounded repayment amount is <= unrounded address amount
+            repayments_per_target[entry.target_account_id][entry.address] = RepaymentAmounts(
+                unrounded_amount=entry.unrounded_amount
+                if entry.rounded_amount <= remaining_repayment_amount
+                else remaining_repayment_amount,
+                rounded_amount=rounded_repayment_amount,
             )
+            remaining_repayment_amount -= rounded_repayment_amount
 
-            repayments_per_target[target_account_id].update(repayment_per_address)
-
-            if remaining_repayment_amount == Decimal("0"):
-                return repayments_per_target, Decimal("0")
+        if entry.ends_address_list and remaining_repayment_amount == Decimal("0"):
+            return repayments_per_target, Decimal("0")
 
     return repayments_per_target, remaining_repayment_amount
 
@@ -438,409 +438,303 @@ class DistributeRepaymentsTest(PaymentsTestCommon):
         self.assertEqual(overpayment_amount, Decimal("0.00"))
 
 
-@patch.object(payments, "distribute_repayment_for_single_target")
 class DistributeRepaymentsMultipleTargetsTest(PaymentsTestCommon):
-    mock_vault_1 = MagicMock(account_id="loan_1")
-    mock_vault_2 = MagicMock(account_id="loan_2")
     default_repayment_hierarchy = [["ADDRESS_1"], ["ADDRESS_2", "ADDRESS_3"]]
 
-    def test_with_single_target(self, mock_distribute_repayment_for_single_target: MagicMock):
-        mock_distribute_repayment_for_single_target.side_effect = [
-            (
-                # Call 1: ["ADDRESS_1"], loan_1
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
-                    ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            (
-                # Call 2: ["ADDRESS_2", "ADDRESS_3"], loan_1
-                {
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
-                    ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-        ]
-
-        expected_result = (
-            {
-                self.mock_vault_1: {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
-                    ),
-                }
-            },
-            sentinel.remaining_repayment_amount,
+    def _balances(self, amounts: dict[str, str]) -> BalanceDefaultDict:
+        return BalanceDefaultDict(
+            mapping={
+                BalanceCoordinate(
+                    address, DEFAULT_ASSET, self.default_denomination, Phase.COMMITTED
+                ): Balance(net=Decimal(amount))
+                for address, amount in amounts.items()
+            }
         )
 
-        balances_per_target: dict[str, BalanceDefaultDict] = {
-            self.mock_vault_1: sentinel.loan_1_balances
+    def test_with_single_target(self):
+        balances_per_target = {
+            "loan_1": self._balances({"ADDRESS_1": "10", "ADDRESS_2": "5", "ADDRESS_3": "0.0052"}),
         }
+
         result = payments.distribute_repayment_for_multiple_targets(
             balances_per_target=balances_per_target,
-            repayment_amount=sentinel.repayment_amount,
+            repayment_amount=Decimal("20"),
             denomination=self.default_denomination,
             repayment_hierarchy=self.default_repayment_hierarchy,
         )
 
-        self.assertEqual(result, expected_result)
-
-        calls = [
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[0],
-            ),
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[1],
-            ),
-        ]
-        mock_distribute_repayment_for_single_target.assert_has_calls(calls)
-
-    def test_with_one_list_hierarchy(self, mock_distribute_repayment_for_single_target: MagicMock):
-        repayment_hierarchy = [["ADDRESS_1", "ADDRESS_2", "ADDRESS_3"]]
-        mock_distribute_repayment_for_single_target.side_effect = [
-            # Call 1: ["ADDRESS_1", "ADDRESS_2", "ADDRESS_3"], loan_1
-            (
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
-                    ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 2: ["ADDRESS_1", "ADDRESS_2", "ADDRESS_3"], loan_2
-            (
-                {
+        expected_result = (
+            {
+                "loan_1": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("10"), rounded_amount=Decimal("10")
                     ),
                     "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("5"), rounded_amount=Decimal("5")
                     ),
                     "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("0.0052"), rounded_amount=Decimal("0.01")
                     ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-        ]
+                }
+            },
+            Decimal("4.99"),
+        )
+        self.assertEqual(result, expected_result)
 
-        balances_per_target: dict[str, BalanceDefaultDict] = {
-            self.mock_vault_1: sentinel.loan_1_balances,
-            self.mock_vault_2: sentinel.loan_2_balances,
+    def test_with_one_list_hierarchy(self):
+        balances_per_target = {
+            "loan_1": self._balances({"ADDRESS_1": "1", "ADDRESS_2": "2"}),
+            "loan_2": self._balances({"ADDRESS_1": "3", "ADDRESS_3": "4"}),
         }
+
         result = payments.distribute_repayment_for_multiple_targets(
             balances_per_target=balances_per_target,
-            repayment_amount=sentinel.repayment_amount,
+            repayment_amount=Decimal("100"),
             denomination=self.default_denomination,
-            repayment_hierarchy=repayment_hierarchy,
+            repayment_hierarchy=[["ADDRESS_1", "ADDRESS_2", "ADDRESS_3"]],
         )
 
         expected_result = (
             {
-                self.mock_vault_1: {
+                "loan_1": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("1"), rounded_amount=Decimal("1")
                     ),
                     "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("2"), rounded_amount=Decimal("2")
                     ),
                 },
-                self.mock_vault_2: {
+                "loan_2": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
-                    ),
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("3"), rounded_amount=Decimal("3")
                     ),
                     "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("4"), rounded_amount=Decimal("4")
                     ),
                 },
             },
-            sentinel.remaining_repayment_amount,
+            Decimal("90"),
         )
-
         self.assertEqual(result, expected_result)
 
-        calls = [
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=repayment_hierarchy[0],
-            ),
-            call(
-                balances=sentinel.loan_2_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=repayment_hierarchy[0],
-            ),
-        ]
-        mock_distribute_repayment_for_single_target.assert_has_calls(calls)
+    def test_full_repayment(self):
+        balances_per_target = {
+            "loan_1": self._balances({"ADDRESS_1": "1", "ADDRESS_2": "2", "ADDRESS_3": "3"}),
+            "loan_2": self._balances({"ADDRESS_1": "4", "ADDRESS_2": "5", "ADDRESS_3": "6"}),
+        }
 
-    def test_full_repayment(self, mock_distribute_repayment_for_single_target: MagicMock):
-        mock_distribute_repayment_for_single_target.side_effect = [
-            # Call 1: ["ADDRESS_1"], loan_1
-            (
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
-                    )
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 2: ["ADDRESS_1"], loan_2
-            (
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
-                    )
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 3: ["ADDRESS_2", "ADDRESS_3]", loan_1
-            (
-                {
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
-                    ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 4: ["ADDRESS_2", "ADDRESS_3]", loan_2
-            (
-                {
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_2_rounded_amount,
-                    ),
-                    "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_2_rounded_amount,
-                    ),
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-        ]
+        result = payments.distribute_repayment_for_multiple_targets(
+            balances_per_target=balances_per_target,
+            repayment_amount=Decimal("21"),
+            denomination=self.default_denomination,
+            repayment_hierarchy=self.default_repayment_hierarchy,
+        )
 
         expected_result = (
             {
-                self.mock_vault_1: {
+                "loan_1": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("1"), rounded_amount=Decimal("1")
                     ),
                     "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("2"), rounded_amount=Decimal("2")
                     ),
                     "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("3"), rounded_amount=Decimal("3")
                     ),
                 },
-                self.mock_vault_2: {
+                "loan_2": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("4"), rounded_amount=Decimal("4")
                     ),
                     "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("5"), rounded_amount=Decimal("5")
                     ),
                     "ADDRESS_3": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_3_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_3_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("6"), rounded_amount=Decimal("6")
                     ),
                 },
             },
-            sentinel.remaining_repayment_amount,
+            Decimal("0"),
         )
+        self.assertEqual(result, expected_result)
 
-        balances_per_target: dict[str, BalanceDefaultDict] = {
-            self.mock_vault_1: sentinel.loan_1_balances,
-            self.mock_vault_2: sentinel.loan_2_balances,
+    def test_partial_repayment(self):
+        balances_per_target = {
+            "loan_1": self._balances({"ADDRESS_1": "1", "ADDRESS_2": "2", "ADDRESS_3": "3"}),
+            "loan_2": self._balances({"ADDRESS_1": "4", "ADDRESS_2": "5", "ADDRESS_3": "6"}),
         }
+
         result = payments.distribute_repayment_for_multiple_targets(
             balances_per_target=balances_per_target,
-            repayment_amount=sentinel.repayment_amount,
+            repayment_amount=Decimal("6"),
             denomination=self.default_denomination,
             repayment_hierarchy=self.default_repayment_hierarchy,
         )
 
-        self.assertEqual(result, expected_result)
-
-        calls = [
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[0],
-            ),
-            call(
-                balances=sentinel.loan_2_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[0],
-            ),
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[1],
-            ),
-            call(
-                balances=sentinel.loan_2_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[1],
-            ),
-        ]
-        mock_distribute_repayment_for_single_target.assert_has_calls(calls)
-
-    def test_partial_repayment(self, mock_distribute_repayment_for_single_target: MagicMock):
-        mock_distribute_repayment_for_single_target.side_effect = [
-            # Call 1: ["ADDRESS_1"], loan_1
-            (
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
-                    )
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 2: ["ADDRESS_1"], loan_2
-            (
-                {
-                    "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
-                    )
-                },
-                sentinel.remaining_repayment_amount,
-            ),
-            # Call 3: ["ADDRESS_2", "ADDRESS_3]", loan_1
-            (
-                {
-                    "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
-                    ),
-                },
-                Decimal("0"),
-            ),
-        ]
-
+        # ADDRESS_1 is repaid across both loans before ADDRESS_2 is partially repaid on loan_1
         expected_result = (
             {
-                self.mock_vault_1: {
+                "loan_1": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("1"), rounded_amount=Decimal("1")
                     ),
                     "ADDRESS_2": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_2_loan_1_unrounded_amount,
-                        rounded_amount=sentinel.address_2_loan_1_rounded_amount,
+                        unrounded_amount=Decimal("1"), rounded_amount=Decimal("1")
                     ),
                 },
-                self.mock_vault_2: {
+                "loan_2": {
                     "ADDRESS_1": payments.RepaymentAmounts(
-                        unrounded_amount=sentinel.address_1_loan_2_unrounded_amount,
-                        rounded_amount=sentinel.address_1_loan_2_rounded_amount,
+                        unrounded_amount=Decimal("4"), rounded_amount=Decimal("4")
                     ),
                 },
             },
             Decimal("0"),
         )
+        self.assertEqual(result, expected_result)
 
-        balances_per_target: dict[str, BalanceDefaultDict] = {
-            self.mock_vault_1: sentinel.loan_1_balances,
-            self.mock_vault_2: sentinel.loan_2_balances,
+    def test_results_match_distributing_per_target(self):
+        balances_per_target = {
+            "loan_1": self._balances(
+                {"ADDRESS_1": "1.234", "ADDRESS_2": "0.0049", "ADDRESS_3": "3.3333"}
+            ),
+            "loan_2": self._balances({"ADDRESS_1": "0.0052", "ADDRESS_3": "6.789"}),
+            "loan_3": self._balances({"ADDRESS_2": "2.5", "ADDRESS_3": "0.001"}),
         }
-        result = payments.distribute_repayment_for_multiple_targets(
+
+        for repayment_amount in ["0.01", "1.24", "5", "7.77", "13.16", "100"]:
+            with self.subTest(repayment_amount=repayment_amount):
+                # distribute per address list and target, as the plan is expected to
+                remaining_repayment_amount = Decimal(repayment_amount)
+                expected_repayments: dict[str, dict[str, payments.RepaymentAmounts]] = {
+                    target: {} for target in balances_per_target
+                }
+                for address_list in self.default_repayment_hierarchy:
+                    for target, balances in balances_per_target.items():
+                        (
+                            repayment_per_address,
+                            remaining_repayment_amount,
+                        ) = payments.distribute_repayment_for_single_target(
+                            balances=balances,
+                            repayment_amount=remaining_repayment_amount,
+                            denomination=self.default_denomination,
+                            repayment_hierarchy=address_list,
+                        )
+                        expected_repayments[target].update(repayment_per_address)
+
+                result = payments.distribute_repayment_for_multiple_targets(
+                    balances_per_target=balances_per_target,
+                    repayment_amount=Decimal(repayment_amount),
+                    denomination=self.default_denomination,
+                    repayment_hierarchy=self.default_repayment_hierarchy,
+                )
+
+                self.assertEqual(result, (expected_repayments, remaining_repayment_amount))
+
+
+class RepaymentPlanTest(PaymentsTestCommon):
+    def test_create_repayment_plan_orders_entries_by_hierarchy_then_target(self):
+        balance_coordinate = BalanceCoordinate(
+            "ADDRESS_1", DEFAULT_ASSET, self.default_denomination, Phase.COMMITTED
+        )
+        balances_per_target = {
+            "loan_1": BalanceDefaultDict(
+                mapping={balance_coordinate: Balance(net=Decimal("1.005"))}
+            ),
+            "loan_2": BalanceDefaultDict(),
+        }
+
+        result = payments.create_repayment_plan(
             balances_per_target=balances_per_target,
-            repayment_amount=sentinel.repayment_amount,
             denomination=self.default_denomination,
-            repayment_hierarchy=self.default_repayment_hierarchy,
+            repayment_hierarchy=[["ADDRESS_1", "ADDRESS_2"], ["ADDRESS_1"]],
         )
 
-        self.assertEqual(result, expected_result)
+        self.assertEqual(
+            result,
+            payments.RepaymentPlan(
+                targets=["loan_1", "loan_2"],
+                entries=[
+                    payments.RepaymentPlanEntry(
+                        "loan_1", "ADDRESS_1", Decimal("1.005"), Decimal("1.01"), False
+                    ),
+                    payments.RepaymentPlanEntry(
+                        "loan_1", "ADDRESS_2", Decimal("0"), Decimal("0"), True
+                    ),
+                    payments.RepaymentPlanEntry(
+                        "loan_2", "ADDRESS_1", Decimal("0"), Decimal("0"), False
+                    ),
+                    payments.RepaymentPlanEntry(
+                        "loan_2", "ADDRESS_2", Decimal("0"), Decimal("0"), True
+                    ),
+                    payments.RepaymentPlanEntry(
+                        "loan_1", "ADDRESS_1", Decimal("1.005"), Decimal("1.01"), True
+                    ),
+                    payments.RepaymentPlanEntry(
+                        "loan_2", "ADDRESS_1", Decimal("0"), Decimal("0"), True
+                    ),
+                ],
+            ),
+        )
 
-        calls = [
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[0],
+    @patch.object(payments.utils, "round_decimal")
+    def test_create_repayment_plan_rounds_each_target_address_once(
+        self, mock_round_decimal: MagicMock
+    ):
+        mock_round_decimal.return_value = Decimal("0")
+
+        payments.create_repayment_plan(
+            balances_per_target={"loan_1": BalanceDefaultDict(), "loan_2": BalanceDefaultDict()},
+            denomination=self.default_denomination,
+            repayment_hierarchy=[["ADDRESS_1", "ADDRESS_2"], ["ADDRESS_1"], ["ADDRESS_2"]],
+        )
+
+        self.assertEqual(mock_round_decimal.call_count, 4)
+
+    def test_repayment_plan_can_be_distributed_multiple_times(self):
+        balance_coordinate = BalanceCoordinate(
+            "ADDRESS_1", DEFAULT_ASSET, self.default_denomination, Phase.COMMITTED
+        )
+        repayment_plan = payments.create_repayment_plan(
+            balances_per_target={
+                "loan_1": BalanceDefaultDict(
+                    mapping={balance_coordinate: Balance(net=Decimal("10"))}
+                ),
+            },
+            denomination=self.default_denomination,
+            repayment_hierarchy=[["ADDRESS_1"]],
+        )
+
+        self.assertEqual(
+            payments.distribute_repayment_plan(
+                repayment_plan=repayment_plan, repayment_amount=Decimal("4")
             ),
-            call(
-                balances=sentinel.loan_2_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[0],
+            (
+                {
+                    "loan_1": {
+                        "ADDRESS_1": payments.RepaymentAmounts(
+                            unrounded_amount=Decimal("4"), rounded_amount=Decimal("4")
+                        )
+                    }
+                },
+                Decimal("0"),
             ),
-            call(
-                balances=sentinel.loan_1_balances,
-                repayment_amount=sentinel.remaining_repayment_amount,
-                denomination=self.default_denomination,
-                repayment_hierarchy=self.default_repayment_hierarchy[1],
+        )
+        self.assertEqual(
+            payments.distribute_repayment_plan(
+                repayment_plan=repayment_plan, repayment_amount=Decimal("15")
             ),
-        ]
-        mock_distribute_repayment_for_single_target.assert_has_calls(calls)
+            (
+                {
+                    "loan_1": {
+                        "ADDRESS_1": payments.RepaymentAmounts(
+                            unrounded_amount=Decimal("10"), rounded_amount=Decimal("10")
+                        )
+                    }
+                },
+                Decimal("5"),
+            ),
+        )
 
 
 @patch.object(payments.early_repayment, "is_posting_an_early_repayment")
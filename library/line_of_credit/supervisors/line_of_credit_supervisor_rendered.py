@@ -3,7 +3,7 @@
 
 # Objects below have been imported from:
 #    line_of_credit_supervisor.py
-# md5:f1caa8160814498877fb6ca7e7ab7eee
+# md5:67d34034055f7b05b59e28556eb3fc66
 
 from contracts_api import (
     DEFAULT_ADDRESS,
@@ -257,6 +257,7 @@ def scheduled_event_hook(
     update_account_event_type_directives: dict[str, list[UpdateAccountEventTypeDirective]] = {}
     supervisee_notification_directives: dict[str, list[AccountNotificationDirective]] = {}
     (loc_vault, loan_vaults) = _get_loc_and_loan_supervisee_vault_objects(vault=vault)
+    balances_snapshot = supervisor_utils_create_supervisee_balances_snapshot()
     if event_type == supervisor_utils_SUPERVISEE_SCHEDULE_SYNC_EVENT:
         update_plan_event_type_directives = supervisor_utils_get_supervisee_schedule_sync_updates(
             vault=vault,
@@ -274,6 +275,7 @@ def scheduled_event_hook(
                     hook_arguments=hook_arguments,
                     loc_vault=loc_vault,
                     loan_vaults=loan_vaults,
+                    balances_snapshot=balances_snapshot,
                 )
             )
         (
@@ -298,7 +300,10 @@ def scheduled_event_hook(
                 due_amount_custom_instructions,
                 repayment_amount,
             ) = _get_due_amount_custom_instructions(
-                hook_arguments=hook_arguments, loc_vault=loc_vault, loan_vaults=loan_vaults
+                hook_arguments=hook_arguments,
+                loc_vault=loc_vault,
+                loan_vaults=loan_vaults,
+                balances_snapshot=balances_snapshot,
             )
             supervisee_pi_directives.update(due_amount_custom_instructions)
             supervisee_notification_directives.update(
@@ -330,7 +335,10 @@ def scheduled_event_hook(
             vault=loc_vault, effective_datetime=hook_arguments.effective_datetime
         ):
             overdue_custom_instructions = _get_overdue_custom_instructions(
-                hook_arguments=hook_arguments, loc_vault=loc_vault, loan_vaults=loan_vaults
+                hook_arguments=hook_arguments,
+                loc_vault=loc_vault,
+                loan_vaults=loan_vaults,
+                balances_snapshot=balances_snapshot,
             )
             (
                 overdue_principal_amount,
@@ -379,7 +387,10 @@ def scheduled_event_hook(
         ):
             supervisee_notification_directives.update(
                 _handle_delinquency(
-                    hook_arguments=hook_arguments, loc_vault=loc_vault, loan_vaults=loan_vaults
+                    hook_arguments=hook_arguments,
+                    loc_vault=loc_vault,
+                    loan_vaults=loan_vaults,
+                    balances_snapshot=balances_snapshot,
                 )
             )
         update_plan_event_type_directives = _update_check_delinquency_schedule(
@@ -405,7 +416,7 @@ def scheduled_event_hook(
 
 # Objects below have been imported from:
 #    utils.py
-# md5:b4718e1c735d11f6848158f777e7084f
+# md5:e66d1cf64dca0ad8f8092b70e5a2b335
 
 utils_PostingInstructionTypeAlias = Union[
     AuthorisationAdjustment,
@@ -431,6 +442,7 @@ utils_PostingInstructionListAlias = list[
         Transfer,
     ]
 ]
+utils_ParameterCacheTypeAlias = dict[tuple[str, Optional[datetime], bool, bool, bool], Any]
 utils_VALID_DAYS_IN_YEAR = ["360", "365", "366", "actual"]
 utils_DEFAULT_DAYS_IN_YEAR = "actual"
 utils_RATE_DECIMAL_PLACES = 10
@@ -463,14 +475,13 @@ def utils_yearly_to_daily_rate(
     effective_date: datetime, yearly_rate: Decimal, days_in_year: str = "actual"
 ) -> Decimal:
     """
-    Calculate the daily rate from a yearly rate, for a given `days_in_year` convention and date
+    Calculate the number of days in year
     :param effective_date: the date as of which the conversion happens. This may affect the outcome
     based on the `days_in_year` value.
-    :param yearly_rate: the rate to convert
     :param days_in_year: the number of days in the year to assume for the calculation. One of `360`,
     `365`, `366` or `actual`. If actual is used, the number of days is based on effective_date's
     year
-    :return: the corresponding daily rate
+    :return: the corresponding number of days in year
     """
     days_in_year = (
         days_in_year if days_in_year in utils_VALID_DAYS_IN_YEAR else utils_DEFAULT_DAYS_IN_YEAR
@@ -497,6 +508,7 @@ def utils_get_parameter(
     is_union: bool = False,
     is_optional: bool = False,
     default_value: Optional[Any] = None,
+    parameter_cache: Optional[utils_ParameterCacheTypeAlias] = None,
 ) -> Any:
     """
     Get the parameter value for a given parameter
@@ -511,22 +523,32 @@ def utils_get_parameter(
     :param is_optional: if true we treat the parameter as optional
     :param default_value: only used in conjunction with the is_optional arg, the value to use if the
     parameter is not set.
+    :param parameter_cache: a dict that is only used for the current hook execution. If provided,
+    the retrieved and converted values are cached in it, so repeated calls with the same arguments
+    don't retrieve the timeseries or json decode the value again. Cached json values are shared by
+    all callers, so must not be mutated
     :return: the parameter value, this is type hinted as Any because the parameter could be
     json loaded, therefore it value can be any json serialisable type and we gain little benefit
     from having an extensive Union list
     """
-    if at_datetime:
-        parameter = vault.get_parameter_timeseries(name=name).at(at_datetime=at_datetime)
+    cache_key = (name, at_datetime, is_json, is_boolean, is_union)
+    if parameter_cache is not None and cache_key in parameter_cache:
+        parameter = parameter_cache[cache_key]
     else:
-        parameter = vault.get_parameter_timeseries(name=name).latest()
+        if at_datetime:
+            parameter = vault.get_parameter_timeseries(name=name).at(at_datetime=at_datetime)
+        else:
+            parameter = vault.get_parameter_timeseries(name=name).latest()
+        if is_union and parameter is not None:
+            parameter = parameter.key
+        if is_boolean and parameter is not None:
+            parameter = utils_str_to_bool(parameter)
+        if is_json and parameter is not None:
+            parameter = loads(parameter)
+        if parameter_cache is not None:
+            parameter_cache[cache_key] = parameter
     if is_optional:
         parameter = parameter.value if parameter.is_set() else default_value
-    if is_union and parameter is not None:
-        parameter = parameter.key
-    if is_boolean and parameter is not None:
-        parameter = utils_str_to_bool(parameter.key)
-    if is_json and parameter is not None:
-        parameter = loads(parameter)
     return parameter
 
 
@@ -726,7 +748,11 @@ def utils_standard_instruction_details(
 
 
 def utils_is_flag_in_list_applied(
-    *, vault: Any, parameter_name: str, effective_datetime: Optional[datetime] = None
+    *,
+    vault: Any,
+    parameter_name: str,
+    effective_datetime: Optional[datetime] = None,
+    parameter_cache: Optional[utils_ParameterCacheTypeAlias] = None,
 ) -> bool:
     """
     Determine if a flag in the list provided is set and active
@@ -735,9 +761,12 @@ def utils_is_flag_in_list_applied(
     :param parameter_name: str, name of the parameter to retrieve
     :param effective_datetime: datetime at which to retrieve the flag timeseries value. If not
     specified the latest value is retrieved
+    :param parameter_cache: the hook execution's parameter cache, see get_parameter
     :return: bool, True if any of the flags in the list are applied at the given datetime
     """
-    flag_names: list[str] = utils_get_parameter(vault, name=parameter_name, is_json=True)
+    flag_names: list[str] = utils_get_parameter(
+        vault, name=parameter_name, is_json=True, parameter_cache=parameter_cache
+    )
     return any(
         (
             vault.get_flag_timeseries(flag=flag_name).at(at_datetime=effective_datetime)
@@ -1214,7 +1243,7 @@ addresses_PENALTIES = "PENALTIES"
 
 # Objects below have been imported from:
 #    supervisor_utils.py
-# md5:badd574e398fc715274627e947d1a001
+# md5:9758361c696d91c84bbc31851271e0e2
 
 supervisor_utils_SUPERVISEE_SCHEDULE_SYNC_EVENT = "SUPERVISEE_SCHEDULE_SYNC"
 
@@ -1256,11 +1285,31 @@ def supervisor_utils_sort_supervisees(supervisees: list[Any]) -> list[Any]:
     :param supervisees: list of supervisee vault objects
     :return sorted_supervisees: list of ordered vault objects
     """
-    sorted_supervisees_by_id = sorted(supervisees, key=lambda vault: vault.account_id)
-    sorted_supervisees_by_age_then_id = sorted(
-        sorted_supervisees_by_id, key=lambda vault: vault.get_account_creation_datetime()
+    return sorted(
+        supervisees, key=lambda vault: (vault.get_account_creation_datetime(), vault.account_id)
     )
-    return sorted_supervisees_by_age_then_id
+
+
+def supervisor_utils_get_supervisees_by_alias(
+    vault: Any, aliases: list[str]
+) -> dict[str, list[Any]]:
+    """
+    Returns the supervisee vault objects for multiple aliases, each ordered by account creation
+    date. This only sorts the supervisees once, so should be preferred over multiple calls to
+    `get_supervisees_for_alias` in the same hook execution.
+
+    :param vault: supervisor vault object
+    :param aliases: the supervisee aliases to filter for
+    :return: alias to supervisee vault objects for that alias, ordered by account creation date
+    """
+    supervisees_by_alias: dict[str, list[SuperviseeContractVault]] = {
+        alias: [] for alias in aliases
+    }
+    for supervisee in supervisor_utils_sort_supervisees(list(vault.supervisees.values())):
+        alias = supervisee.get_alias()
+        if alias in supervisees_by_alias:
+            supervisees_by_alias[alias].append(supervisee)
+    return supervisees_by_alias
 
 
 def supervisor_utils_get_balance_default_dicts_for_supervisees(
@@ -1296,6 +1345,71 @@ def supervisor_utils_get_balances_default_dicts_from_timeseries(
     }
 
 
+supervisor_utils_SuperviseeBalancesSnapshot = NamedTuple(
+    "SuperviseeBalancesSnapshot", [("balances", dict[tuple[str, datetime], BalanceDefaultDict])]
+)
+
+
+def supervisor_utils_create_supervisee_balances_snapshot() -> supervisor_utils_SuperviseeBalancesSnapshot:
+    """
+    Creates a snapshot of supervisee balances to be shared by all features within a single hook
+    execution. Balances are only derived from a supervisee's timeseries the first time they are
+    requested for a given datetime, so that multiple features requiring the same balances do not
+    each rebuild them.
+    The snapshot must not be reused across hook executions.
+    :return: the empty snapshot
+    """
+    return supervisor_utils_SuperviseeBalancesSnapshot(balances={})
+
+
+def supervisor_utils_get_snapshot_balances(
+    snapshot: supervisor_utils_SuperviseeBalancesSnapshot,
+    supervisee: Any,
+    effective_datetime: datetime,
+) -> BalanceDefaultDict:
+    """
+    Returns a supervisee's balances at the provided datetime, using balances timeseries.
+    :param snapshot: the snapshot to retrieve balances from
+    :param supervisee: the supervisee vault object
+    :param effective_datetime: the datetime at which the balances should be retrieved
+    :return: the supervisee's balances. These must not be modified by the caller
+    """
+    return supervisor_utils_get_snapshot_balances_for_supervisees(
+        snapshot=snapshot, supervisees=[supervisee], effective_datetime=effective_datetime
+    )[supervisee.account_id]
+
+
+def supervisor_utils_get_snapshot_balances_for_supervisees(
+    snapshot: supervisor_utils_SuperviseeBalancesSnapshot,
+    supervisees: list[Any],
+    effective_datetime: datetime,
+) -> dict[str, BalanceDefaultDict]:
+    """
+    Equivalent to `get_balances_default_dicts_from_timeseries`, but only derives the balances of
+    supervisees that are not already in the snapshot
+    :param snapshot: the snapshot to retrieve balances from
+    :param supervisees: the vault objects to get balances for
+    :param effective_datetime: the datetime at which the balances should be retrieved
+    :return: a dictionary that maps the supervisees account ID to the retrieved balances. These
+    must not be modified by the caller
+    """
+    if missing_supervisees := [
+        supervisee
+        for supervisee in supervisees
+        if (supervisee.account_id, effective_datetime) not in snapshot.balances
+    ]:
+        for account_id, balances in supervisor_utils_get_balances_default_dicts_from_timeseries(
+            supervisees=missing_supervisees, effective_datetime=effective_datetime
+        ).items():
+            snapshot.balances[account_id, effective_datetime] = balances
+    supervisees_balances = {}
+    for supervisee in supervisees:
+        key = (supervisee.account_id, effective_datetime)
+        if key in snapshot.balances:
+            supervisees_balances[supervisee.account_id] = snapshot.balances[key]
+    return supervisees_balances
+
+
 def supervisor_utils_sum_balances_across_supervisees(
     balances: list[BalanceDefaultDict],
     denomination: str,
@@ -1364,9 +1478,10 @@ def supervisor_utils_create_aggregate_posting_instructions(
     aggregate_balances = BalanceDefaultDict()
     for (supervisee_account_id, posting_instructions) in posting_instructions_by_supervisee.items():
         for posting_instruction in posting_instructions:
-            aggregate_balances += posting_instruction.balances(
+            for balance_coordinate, balance in posting_instruction.balances(
                 account_id=supervisee_account_id, tside=tside
-            )
+            ).items():
+                aggregate_balances[balance_coordinate] += balance
     filtered_aggregate_balances = supervisor_utils_filter_aggregate_balances(
         aggregate_balances=aggregate_balances,
         balances=balances,
@@ -3948,11 +4063,24 @@ overpayment_SupervisorOverpaymentPrincipalAdjustment = (
 
 # Objects below have been imported from:
 #    payments.py
-# md5:c8020a38a72304fb2f82b95b605625fe
+# md5:1e053efcc20dea743e379028df0d6c58
 
 payments_RepaymentAmounts = NamedTuple(
     "RepaymentAmounts", [("unrounded_amount", Decimal), ("rounded_amount", Decimal)]
 )
+payments_RepaymentPlanEntry = NamedTuple(
+    "RepaymentPlanEntry",
+    [
+        ("target_account_id", str),
+        ("address", str),
+        ("unrounded_amount", Decimal),
+        ("rounded_amount", Decimal),
+        ("ends_address_list", bool),
+    ],
+)
+payments_RepaymentPlan = NamedTuple(
+    "RepaymentPlan", [("targets", list[str]), ("entries", list[payments_RepaymentPlanEntry])]
+)
 
 
 def payments_redistribute_postings(
@@ -3997,53 +4125,6 @@ def payments_redistribute_postings(
     ]
 
 
-def payments_distribute_repayment_for_single_target(
-    balances: BalanceDefaultDict,
-    repayment_amount: Decimal,
-    denomination: str,
-    repayment_hierarchy: Optional[list[str]] = None,
-    phase: Phase = Phase.COMMITTED,
-) -> tuple[dict[str, payments_RepaymentAmounts], Decimal]:
-    """
-    Determines how a repayment amount is distributed across balances based on the repayment
-    hierarchy and the outstanding balances. Each repayment hierarchy address' balance is
-    rounded to 2 decimal points for repayment purposes. Both rounded and unrounded amounts are
-    returned so that the consumer can decide how to handle remainders. For example, a repayment of
-    0.01 distributed to a balance of 0.0052 or to a balance of 0.0012
-
-    :param balances: The balances to distribute the repayment amount across
-    :param repayment_amount: The 2 decimal point repayment amount to distribute
-    :param denomination: The denomination of the repayment
-    :param repayment_hierarchy: Order in which a repayment amount is to be
-    distributed across addresses. Defaults to standard lending repayment hierarchy
-    :param phase: The balance phase of the balances fetched to get amounts from
-    :return: A dictionary of addresses to repayment amounts to be repaid and the remaining
-    repayment amount
-    """
-    remaining_repayment_amount = repayment_amount
-    if repayment_hierarchy is None:
-        repayment_hierarchy = lending_addresses_REPAYMENT_HIERARCHY
-    repayment_per_address: dict[str, payments_RepaymentAmounts] = {}
-    for repayment_address in repayment_hierarchy:
-        balance_address = BalanceCoordinate(repayment_address, DEFAULT_ASSET, denomination, phase)
-        unrounded_address_amount = balances[balance_address].net
-        rounded_address_amount = utils_round_decimal(unrounded_address_amount, 2)
-        rounded_address_repayment_amount = min(rounded_address_amount, remaining_repayment_amount)
-        if rounded_address_repayment_amount == Decimal(0):
-            continue
-        unrounded_address_repayment_amount = (
-            unrounded_address_amount
-            if rounded_address_amount <= remaining_repayment_amount
-            else remaining_repayment_amount
-        )
-        repayment_per_address[repayment_address] = payments_RepaymentAmounts(
-            unrounded_amount=unrounded_address_repayment_amount,
-            rounded_amount=rounded_address_repayment_amount,
-        )
-        remaining_repayment_amount -= rounded_address_repayment_amount
-    return (repayment_per_address, remaining_repayment_amount)
-
-
 def payments_distribute_repayment_for_multiple_targets(
     balances_per_target: dict[str, BalanceDefaultDict],
     repayment_amount: Decimal,
@@ -4077,24 +4158,100 @@ def payments_distribute_repayment_for_multiple_targets(
     amounts for each address.
         - the remaining repayment amount.
     """
+    repayment_plan = payments_create_repayment_plan(
+        balances_per_target=balances_per_target,
+        denomination=denomination,
+        repayment_hierarchy=repayment_hierarchy,
+    )
+    return payments_distribute_repayment_plan(
+        repayment_plan=repayment_plan, repayment_amount=repayment_amount
+    )
+
+
+def payments_create_repayment_plan(
+    balances_per_target: dict[str, BalanceDefaultDict],
+    denomination: str,
+    repayment_hierarchy: list[list[str]],
+    phase: Phase = Phase.COMMITTED,
+) -> payments_RepaymentPlan:
+    """
+    Extracts the outstanding amounts for each repayment target and address once, in the order in
+    which they are repaid, so that repayments can be distributed without re-reading balances.
+    See `distribute_repayment_for_multiple_targets` for how the hierarchy is applied. Empty address
+    lists in the hierarchy are ignored.
+    :param balances_per_target: a dictionary where the key is the repayment target account id and
+    the value is its balances. This should be sorted in order of which target should be repaid
+    first.
+    :param denomination: the denomination of the repayment
+    :param repayment_hierarchy: The order in which a repayment amount is to be distributed across
+    addresses for one or more targets. The outer list represents ordering across accounts and the
+    the inner lists represent ordering within an account.
+    :param phase: The balance phase of the balances fetched to get amounts from
+    :return: the repayment plan
+    """
+    balance_coordinates = {
+        address: BalanceCoordinate(address, DEFAULT_ASSET, denomination, phase)
+        for address_list in repayment_hierarchy
+        for address in address_list
+    }
+    amounts_per_target_address: dict[tuple[str, str], tuple[Decimal, Decimal]] = {}
+    entries: list[payments_RepaymentPlanEntry] = []
+    for address_list in repayment_hierarchy:
+        for target_account_id, balances in balances_per_target.items():
+            for index, address in enumerate(address_list):
+                if (target_account_id, address) not in amounts_per_target_address:
+                    unrounded_amount = balances[balance_coordinates[address]].net
+                    amounts_per_target_address[target_account_id, address] = (
+                        unrounded_amount,
+                        utils_round_decimal(unrounded_amount, 2),
+                    )
+                unrounded_amount, rounded_amount = amounts_per_target_address[
+                    target_account_id, address
+                ]
+                entries.append(
+                    payments_RepaymentPlanEntry(
+                        target_account_id=target_account_id,
+                        address=address,
+                        unrounded_amount=unrounded_amount,
+                        rounded_amount=rounded_amount,
+                        ends_address_list=index == len(address_list) - 1,
+                    )
+                )
+    return payments_RepaymentPlan(targets=list(balances_per_target.keys()), entries=entries)
+
+
+def payments_distribute_repayment_plan(
+    repayment_plan: payments_RepaymentPlan, repayment_amount: Decimal
+) -> tuple[dict[str, dict[str, payments_RepaymentAmounts]], Decimal]:
+    """
+    Distributes a repayment amount across a repayment plan in a single pass. The results are the
+    same as distributing the amount with `distribute_repayment_for_single_target` for each address
+    list and target in turn.
+    :param repayment_plan: the plan created by `create_repayment_plan`
+    :param repayment_amount: repayment amount to distribute
+    :return: A tuple containing
+        - a dictionary where the key is the target account id and the value is the repayment
+    amounts for each address.
+        - the remaining repayment amount.
+    """
     remaining_repayment_amount = repayment_amount
     repayments_per_target: dict[str, dict[str, payments_RepaymentAmounts]] = {
-        target: {} for target in balances_per_target.keys()
+        target: {} for target in repayment_plan.targets
     }
-    for address_list in repayment_hierarchy:
-        for target_account_id in balances_per_target.keys():
-            (
-                repayment_per_address,
-                remaining_repayment_amount,
-            ) = payments_distribute_repayment_for_single_target(
-                balances=balances_per_target[target_account_id],
-                repayment_amount=remaining_repayment_amount,
-                denomination=denomination,
-                repayment_hierarchy=address_list,
+    for entry in repayment_plan.entries:
+        rounded_repayment_amount = min(entry.rounded_amount, remaining_repayment_amount)
+        if rounded_repayment_amount != Decimal(0):
+            repayments_per_target[entry.target_account_id][
+                entry.address
+            ] = payments_RepaymentAmounts(
+                unrounded_amount=entry.unrounded_amount
+                if entry.rounded_amount <= remaining_repayment_amount
+                else remaining_repayment_amount,
+                rounded_amount=rounded_repayment_amount,
             )
-            repayments_per_target[target_account_id].update(repayment_per_address)
-            if remaining_repayment_amount == Decimal("0"):
-                return (repayments_per_target, Decimal("0"))
+            remaining_repayment_amount -= rounded_repayment_amount
+        if entry.ends_address_list and remaining_repayment_amount == Decimal("0"):
+            return (repayments_per_target, Decimal("0"))
     return (repayments_per_target, remaining_repayment_amount)
 
 
@@ -4319,7 +4476,7 @@ drawdown_loan_PARAM_PENALTY_INTEREST_INCOME_ACCOUNT = "penalty_interest_income_a
 
 # Objects below have been imported from:
 #    line_of_credit_supervisor.py
-# md5:f1caa8160814498877fb6ca7e7ab7eee
+# md5:67d34034055f7b05b59e28556eb3fc66
 
 PLAN_TYPE = "LINE_OF_CREDIT_SUPERVISOR"
 LOC_ACCOUNT_TYPE = "LOC"
@@ -4685,9 +4842,13 @@ def _handle_accrue_interest(
     hook_arguments: SupervisorScheduledEventHookArguments,
     loc_vault: Any,
     loan_vaults: list[Any],
+    balances_snapshot: Optional[supervisor_utils_SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[PostingInstructionsDirective]]:
     supervisee_pi_directives = {}
     posting_instructions_by_supervisee = {}
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils_create_supervisee_balances_snapshot()
+    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
     denomination = common_parameters_get_denomination_parameter(vault=loc_vault)
     last_execution_datetime = loc_vault.get_last_execution_datetime(
         event_type=due_amount_calculation_DUE_AMOUNT_CALCULATION_EVENT
@@ -4705,14 +4866,21 @@ def _handle_accrue_interest(
             > next_due_calc_datetime.date()
             else next_due_calc_datetime
         )
+        loan_balances = supervisor_utils_get_snapshot_balances(
+            snapshot=balances_snapshot, supervisee=loan, effective_datetime=midnight
+        )
         accrual_instructions = _get_standard_interest_accrual_custom_instructions(
             vault=loan,
             hook_arguments=hook_arguments,
             next_due_amount_calculation_datetime=next_due_calc_datetime_loan,
             denomination=denomination,
+            balances=loan_balances,
         )
         accrual_instructions += _get_penalty_interest_accrual_custom_instructions(
-            loan_vault=loan, hook_arguments=hook_arguments, denomination=denomination
+            loan_vault=loan,
+            hook_arguments=hook_arguments,
+            denomination=denomination,
+            balances=loan_balances,
         )
         if accrual_instructions:
             supervisee_pi_directives.update(
@@ -4728,10 +4896,8 @@ def _handle_accrue_interest(
             posting_instructions_by_supervisee.update({loan.account_id: accrual_instructions})
     if not supervisee_pi_directives:
         return supervisee_pi_directives
-    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances_mapping = loc_vault.get_balances_timeseries()
-    balances = utils_get_balance_default_dict_from_mapping(
-        mapping=balances_mapping, effective_datetime=midnight
+    balances = supervisor_utils_get_snapshot_balances(
+        snapshot=balances_snapshot, supervisee=loc_vault, effective_datetime=midnight
     )
     if interest_aggregate_custom_instructions := supervisor_utils_create_aggregate_posting_instructions(
         aggregate_account_id=loc_vault.account_id,
@@ -4764,12 +4930,15 @@ def _get_standard_interest_accrual_custom_instructions(
     hook_arguments: SupervisorScheduledEventHookArguments,
     next_due_amount_calculation_datetime: datetime,
     denomination: Optional[str] = None,
+    balances: Optional[BalanceDefaultDict] = None,
 ) -> list[CustomInstruction]:
-    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances_mapping = vault.get_balances_timeseries()
-    balances = utils_get_balance_default_dict_from_mapping(
-        mapping=balances_mapping, effective_datetime=midnight
-    )
+    if balances is None:
+        midnight = hook_arguments.effective_datetime.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        balances = utils_get_balance_default_dict_from_mapping(
+            mapping=vault.get_balances_timeseries(), effective_datetime=midnight
+        )
     if denomination is None:
         denomination = common_parameters_get_denomination_parameter(vault=vault)
     return interest_accrual_supervisor_daily_accrual_logic(
@@ -4793,6 +4962,7 @@ def _get_penalty_interest_accrual_custom_instructions(
     loan_vault: Any,
     hook_arguments: SupervisorScheduledEventHookArguments,
     denomination: Optional[str] = None,
+    balances: Optional[BalanceDefaultDict] = None,
 ) -> list[CustomInstruction]:
     """
     Accrues penalty interest on the drawdown loan passed into the loan_vault argument
@@ -4801,12 +4971,15 @@ def _get_penalty_interest_accrual_custom_instructions(
     :param loan_vault: The loan to accrue penality interest on
     :param hook_arguments: The supervisor schedule event hook arguments
     :param denomination: The denomination of the loan
+    :param balances: The loan's balances at midnight of the effective date. Derived from the
+    balances timeseries if not provided
     :return: A list of penalty accrual custom instructions for the loan
     """
     midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances = utils_get_balance_default_dict_from_mapping(
-        mapping=loan_vault.get_balances_timeseries(), effective_datetime=midnight
-    )
+    if balances is None:
+        balances = utils_get_balance_default_dict_from_mapping(
+            mapping=loan_vault.get_balances_timeseries(), effective_datetime=midnight
+        )
     if denomination is None:
         denomination = common_parameters_get_denomination_parameter(vault=loan_vault)
     penalty_interest_rate = _get_penalty_interest_rate_parameter(loan_vault=loan_vault)
@@ -4843,7 +5016,10 @@ def _get_penalty_interest_accrual_custom_instructions(
 
 
 def _get_due_amount_custom_instructions(
-    hook_arguments: SupervisorScheduledEventHookArguments, loc_vault: Any, loan_vaults: list[Any]
+    hook_arguments: SupervisorScheduledEventHookArguments,
+    loc_vault: Any,
+    loan_vaults: list[Any],
+    balances_snapshot: Optional[supervisor_utils_SuperviseeBalancesSnapshot] = None,
 ) -> tuple[dict[str, list[PostingInstructionsDirective]], Decimal]:
     """
     Gets transfer due instructions for each loan supervisee and instructs the transfer
@@ -4856,8 +5032,12 @@ def _get_due_amount_custom_instructions(
     total_repayment_amount = Decimal("0")
     application_precision = _get_application_precision_parameter(loan_vaults=loan_vaults)
     instructions_for_aggregation: dict[str, list[CustomInstruction]] = {}
-    supervisees_balances = supervisor_utils_get_balances_default_dicts_from_timeseries(
-        supervisees=[loc_vault] + loan_vaults, effective_datetime=hook_arguments.effective_datetime
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils_create_supervisee_balances_snapshot()
+    supervisees_balances = supervisor_utils_get_snapshot_balances_for_supervisees(
+        snapshot=balances_snapshot,
+        supervisees=[loc_vault] + loan_vaults,
+        effective_datetime=hook_arguments.effective_datetime,
     )
     for loan_vault in loan_vaults:
         if (
@@ -5050,7 +5230,10 @@ def _update_check_delinquency_schedule(
 
 
 def _get_overdue_custom_instructions(
-    hook_arguments: SupervisorScheduledEventHookArguments, loc_vault: Any, loan_vaults: list[Any]
+    hook_arguments: SupervisorScheduledEventHookArguments,
+    loc_vault: Any,
+    loan_vaults: list[Any],
+    balances_snapshot: Optional[supervisor_utils_SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[PostingInstructionsDirective]]:
     """
     Gets overdue instructions for each loan supervisee and instructs the transfer overdue PIB
@@ -5061,8 +5244,12 @@ def _get_overdue_custom_instructions(
     denomination = common_parameters_get_denomination_parameter(vault=loc_vault)
     application_precision = _get_application_precision_parameter(loan_vaults=loan_vaults)
     instructions_for_aggregation: dict[str, list[CustomInstruction]] = {}
-    supervisees_balances = supervisor_utils_get_balances_default_dicts_from_timeseries(
-        supervisees=[loc_vault] + loan_vaults, effective_datetime=hook_arguments.effective_datetime
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils_create_supervisee_balances_snapshot()
+    supervisees_balances = supervisor_utils_get_snapshot_balances_for_supervisees(
+        snapshot=balances_snapshot,
+        supervisees=[loc_vault] + loan_vaults,
+        effective_datetime=hook_arguments.effective_datetime,
     )
     for loan_vault in loan_vaults:
         loan_balances = supervisees_balances[loan_vault.account_id]
@@ -5161,7 +5348,10 @@ def _get_overdue_amounts_from_instructions(
 
 
 def _handle_delinquency(
-    hook_arguments: SupervisorScheduledEventHookArguments, loc_vault: Any, loan_vaults: list[Any]
+    hook_arguments: SupervisorScheduledEventHookArguments,
+    loc_vault: Any,
+    loan_vaults: list[Any],
+    balances_snapshot: Optional[supervisor_utils_SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[AccountNotificationDirective]]:
     """
     A Line of Credit is considered delinquent if any of the loans have overdue amounts for a
@@ -5171,9 +5361,12 @@ def _handle_delinquency(
     notification.
     """
     denomination = common_parameters_get_denomination_parameter(vault=loc_vault)
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils_create_supervisee_balances_snapshot()
     for loan_vault in loan_vaults:
-        loan_vault_balances = utils_get_balance_default_dict_from_mapping(
-            mapping=loan_vault.get_balances_timeseries(),
+        loan_vault_balances = supervisor_utils_get_snapshot_balances(
+            snapshot=balances_snapshot,
+            supervisee=loan_vault,
             effective_datetime=hook_arguments.effective_datetime,
         )
         if utils_sum_balances(
@@ -5197,14 +5390,12 @@ def _get_delinquency_notification(account_id: str) -> list[AccountNotificationDi
 
 
 def _get_loc_and_loan_supervisee_vault_objects(vault: Any) -> tuple[Optional[Any], list[Any]]:
-    loc_vault = _get_loc_vault(vault=vault)
-    loan_vaults = supervisor_utils_get_supervisees_for_alias(vault=vault, alias=DRAWDOWN_LOAN_ALIAS)
-    return (loc_vault, loan_vaults)
-
-
-def _get_loc_vault(vault: Any) -> Optional[Any]:
-    supervisees = supervisor_utils_get_supervisees_for_alias(vault=vault, alias=LOC_ALIAS)
-    return supervisees[0] if len(supervisees) == 1 else None
+    supervisees_by_alias = supervisor_utils_get_supervisees_by_alias(
+        vault=vault, aliases=[LOC_ALIAS, DRAWDOWN_LOAN_ALIAS]
+    )
+    loc_vaults = supervisees_by_alias[LOC_ALIAS]
+    loc_vault = loc_vaults[0] if len(loc_vaults) == 1 else None
+    return (loc_vault, supervisees_by_alias[DRAWDOWN_LOAN_ALIAS])
 
 
 def _get_paid_off_loans_notification(
@@ -202,6 +202,9 @@ def scheduled_event_hook(
     update_account_event_type_directives: dict[str, list[UpdateAccountEventTypeDirective]] = {}
     supervisee_notification_directives: dict[str, list[AccountNotificationDirective]] = {}
     loc_vault, loan_vaults = _get_loc_and_loan_supervisee_vault_objects(vault=vault)
+    # shared by all features in this hook execution so each supervisee's balances are only derived
+    # from the timeseries once
+    balances_snapshot = supervisor_utils.create_supervisee_balances_snapshot()
 
     if event_type == supervisor_utils.SUPERVISEE_SCHEDULE_SYNC_EVENT:
         update_plan_event_type_directives = supervisor_utils.get_supervisee_schedule_sync_updates(
@@ -221,6 +224,7 @@ def scheduled_event_hook(
                     hook_arguments=hook_arguments,
                     loc_vault=loc_vault,
                     loan_vaults=loan_vaults,
+                    balances_snapshot=balances_snapshot,
                 )
             )
 
@@ -253,6 +257,7 @@ def scheduled_event_hook(
                 hook_arguments=hook_arguments,
                 loc_vault=loc_vault,
                 loan_vaults=loan_vaults,
+                balances_snapshot=balances_snapshot,
             )
             supervisee_pi_directives.update(due_amount_custom_instructions)
             supervisee_notification_directives.update(
@@ -291,6 +296,7 @@ def scheduled_event_hook(
                 hook_arguments=hook_arguments,
                 loc_vault=loc_vault,
                 loan_vaults=loan_vaults,
+                balances_snapshot=balances_snapshot,
             )
             (
                 overdue_principal_amount,
@@ -343,6 +349,7 @@ def scheduled_event_hook(
                     hook_arguments=hook_arguments,
                     loc_vault=loc_vault,
                     loan_vaults=loan_vaults,
+                    balances_snapshot=balances_snapshot,
                 )
             )
         update_plan_event_type_directives = _update_check_delinquency_schedule(
@@ -889,9 +896,13 @@ def _handle_accrue_interest(
     hook_arguments: SupervisorScheduledEventHookArguments,
     loc_vault: SuperviseeContractVault,
     loan_vaults: list[SuperviseeContractVault],
+    balances_snapshot: Optional[supervisor_utils.SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[PostingInstructionsDirective]]:
     supervisee_pi_directives = {}
     posting_instructions_by_supervisee = {}
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils.create_supervisee_balances_snapshot()
+    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
 
     denomination = common_parameters.get_denomination_parameter(vault=loc_vault)
     last_execution_datetime = loc_vault.get_last_execution_datetime(
@@ -915,14 +926,21 @@ def _handle_accrue_interest(
             else next_due_calc_datetime
         )
 
+        loan_balances = supervisor_utils.get_snapshot_balances(
+            snapshot=balances_snapshot, supervisee=loan, effective_datetime=midnight
+        )
         accrual_instructions = _get_standard_interest_accrual_custom_instructions(
             vault=loan,
             hook_arguments=hook_arguments,
             next_due_amount_calculation_datetime=next_due_calc_datetime_loan,
             denomination=denomination,
+            balances=loan_balances,
         )
         accrual_instructions += _get_penalty_interest_accrual_custom_instructions(
-            loan_vault=loan, hook_arguments=hook_arguments, denomination=denomination
+            loan_vault=loan,
+            hook_arguments=hook_arguments,
+            denomination=denomination,
+            balances=loan_balances,
         )
         if accrual_instructions:
             supervisee_pi_directives.update(
@@ -940,11 +958,8 @@ def _handle_accrue_interest(
     if not supervisee_pi_directives:
         return supervisee_pi_directives
 
-    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances_mapping = loc_vault.get_balances_timeseries()
-    balances = utils.get_balance_default_dict_from_mapping(
-        mapping=balances_mapping,
-        effective_datetime=midnight,
+    balances = supervisor_utils.get_snapshot_balances(
+        snapshot=balances_snapshot, supervisee=loc_vault, effective_datetime=midnight
     )
 
     if interest_aggregate_custom_instructions := (
@@ -982,13 +997,16 @@ def _get_standard_interest_accrual_custom_instructions(
     hook_arguments: SupervisorScheduledEventHookArguments,
     next_due_amount_calculation_datetime: datetime,
     denomination: Optional[str] = None,
+    balances: Optional[BalanceDefaultDict] = None,
 ) -> list[CustomInstruction]:
-    midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances_mapping = vault.get_balances_timeseries()
-    balances = utils.get_balance_default_dict_from_mapping(
-        mapping=balances_mapping,
-        effective_datetime=midnight,
-    )
+    if balances is None:
+        midnight = hook_arguments.effective_datetime.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        balances = utils.get_balance_default_dict_from_mapping(
+            mapping=vault.get_balances_timeseries(),
+            effective_datetime=midnight,
+        )
 
     if denomination is None:
         denomination = common_parameters.get_denomination_parameter(vault=vault)
@@ -1018,6 +1036,7 @@ def _get_penalty_interest_accrual_custom_instructions(
     loan_vault: SuperviseeContractVault,
     hook_arguments: SupervisorScheduledEventHookArguments,
     denomination: Optional[str] = None,
+    balances: Optional[BalanceDefaultDict] = None,
 ) -> list[CustomInstruction]:
     """
     Accrues penalty interest on the drawdown loan passed into the loan_vault argument
@@ -1026,13 +1045,16 @@ def _get_penalty_interest_accrual_custom_instructions(
     :param loan_vault: The loan to accrue penality interest on
     :param hook_arguments: The supervisor schedule event hook arguments
     :param denomination: The denomination of the loan
+    :param balances: The loan's balances at midnight of the effective date. Derived from the
+    balances timeseries if not provided
     :return: A list of penalty accrual custom instructions for the loan
     """
     midnight = hook_arguments.effective_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
-    balances = utils.get_balance_default_dict_from_mapping(
-        mapping=loan_vault.get_balances_timeseries(),
-        effective_datetime=midnight,
-    )
+    if balances is None:
+        balances = utils.get_balance_default_dict_from_mapping(
+            mapping=loan_vault.get_balances_timeseries(),
+            effective_datetime=midnight,
+        )
 
     if denomination is None:
         denomination = common_parameters.get_denomination_parameter(vault=loan_vault)
@@ -1078,6 +1100,7 @@ def _get_due_amount_custom_instructions(
     hook_arguments: SupervisorScheduledEventHookArguments,
     loc_vault: SuperviseeContractVault,
     loan_vaults: list[SuperviseeContractVault],
+    balances_snapshot: Optional[supervisor_utils.SuperviseeBalancesSnapshot] = None,
 ) -> tuple[dict[str, list[PostingInstructionsDirective]], Decimal]:
     """
     Gets transfer due instructions for each loan supervisee and instructs the transfer
@@ -1092,8 +1115,12 @@ def _get_due_amount_custom_instructions(
     application_precision = _get_application_precision_parameter(loan_vaults=loan_vaults)
     instructions_for_aggregation: dict[str, list[CustomInstruction]] = {}
 
-    supervisees_balances = supervisor_utils.get_balances_default_dicts_from_timeseries(
-        supervisees=[loc_vault] + loan_vaults, effective_datetime=hook_arguments.effective_datetime
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils.create_supervisee_balances_snapshot()
+    supervisees_balances = supervisor_utils.get_snapshot_balances_for_supervisees(
+        snapshot=balances_snapshot,
+        supervisees=[loc_vault] + loan_vaults,
+        effective_datetime=hook_arguments.effective_datetime,
     )
 
     for loan_vault in loan_vaults:
@@ -1309,6 +1336,7 @@ def _get_overdue_custom_instructions(
     hook_arguments: SupervisorScheduledEventHookArguments,
     loc_vault: SuperviseeContractVault,
     loan_vaults: list[SuperviseeContractVault],
+    balances_snapshot: Optional[supervisor_utils.SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[PostingInstructionsDirective]]:
     """
     Gets overdue instructions for each loan supervisee and instructs the transfer overdue PIB
@@ -1327,8 +1355,12 @@ def _get_overdue_custom_instructions(
     application_precision = _get_application_precision_parameter(loan_vaults=loan_vaults)
     instructions_for_aggregation: dict[str, list[CustomInstruction]] = {}
 
-    supervisees_balances = supervisor_utils.get_balances_default_dicts_from_timeseries(
-        supervisees=[loc_vault] + loan_vaults, effective_datetime=hook_arguments.effective_datetime
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils.create_supervisee_balances_snapshot()
+    supervisees_balances = supervisor_utils.get_snapshot_balances_for_supervisees(
+        snapshot=balances_snapshot,
+        supervisees=[loc_vault] + loan_vaults,
+        effective_datetime=hook_arguments.effective_datetime,
     )
 
     for loan_vault in loan_vaults:
@@ -1430,6 +1462,7 @@ def _handle_delinquency(
     hook_arguments: SupervisorScheduledEventHookArguments,
     loc_vault: SuperviseeContractVault,
     loan_vaults: list[SuperviseeContractVault],
+    balances_snapshot: Optional[supervisor_utils.SuperviseeBalancesSnapshot] = None,
 ) -> dict[str, list[AccountNotificationDirective]]:
     """
     A Line of Credit is considered delinquent if any of the loans have overdue amounts for a
@@ -1439,9 +1472,12 @@ def _handle_delinquency(
     notification.
     """
     denomination = common_parameters.get_denomination_parameter(vault=loc_vault)
+    if balances_snapshot is None:
+        balances_snapshot = supervisor_utils.create_supervisee_balances_snapshot()
     for loan_vault in loan_vaults:
-        loan_vault_balances = utils.get_balance_default_dict_from_mapping(
-            mapping=loan_vault.get_balances_timeseries(),
+        loan_vault_balances = supervisor_utils.get_snapshot_balances(
+            snapshot=balances_snapshot,
+            supervisee=loan_vault,
             effective_datetime=hook_arguments.effective_datetime,
         )
         if utils.sum_balances(
@@ -1469,16 +1505,12 @@ def _get_delinquency_notification(account_id: str) -> list[AccountNotificationDi
 def _get_loc_and_loan_supervisee_vault_objects(
     vault: SupervisorContractVault,
 ) -> tuple[Optional[SuperviseeContractVault], list[SuperviseeContractVault]]:
-    loc_vault = _get_loc_vault(vault=vault)
-    loan_vaults = supervisor_utils.get_supervisees_for_alias(vault=vault, alias=DRAWDOWN_LOAN_ALIAS)
-    return loc_vault, loan_vaults
-
-
-def _get_loc_vault(
-    vault: SupervisorContractVault,
-) -> Optional[SuperviseeContractVault]:
-    supervisees = supervisor_utils.get_supervisees_for_alias(vault=vault, alias=LOC_ALIAS)
-    return supervisees[0] if len(supervisees) == 1 else None
+    supervisees_by_alias = supervisor_utils.get_supervisees_by_alias(
+        vault=vault, aliases=[LOC_ALIAS, DRAWDOWN_LOAN_ALIAS]
+    )
+    loc_vaults = supervisees_by_alias[LOC_ALIAS]
+    loc_vault = loc_vaults[0] if len(loc_vaults) == 1 else None
+    return loc_vault, supervisees_by_alias[DRAWDOWN_LOAN_ALIAS]
 
 
 def _get_paid_off_loans_notification(
@@ -13,10 +13,7 @@ from library.line_of_credit.test.unit.test_line_of_credit_supervisor_common impo
 )
 
 # features
-from library.features.v4.common.test.mocks import (
-    mock_supervisor_get_supervisees_for_alias,
-    mock_utils_get_parameter,
-)
+from library.features.v4.common.test.mocks import mock_utils_get_parameter
 
 # contracts api
 from contracts_api import (
@@ -770,77 +767,49 @@ class GetLoansClosureNotificationDirectivesTest(LineOfCreditSupervisorTestBase):
         )
 
 
-@patch.object(line_of_credit_supervisor, "_get_loc_vault")
-@patch.object(line_of_credit_supervisor.supervisor_utils, "get_supervisees_for_alias")
+@patch.object(line_of_credit_supervisor.supervisor_utils, "get_supervisees_by_alias")
 class GetLocAndLoanSuperviseesTest(LineOfCreditSupervisorTestBase):
-    def test_all_supervisees_are_returned(
-        self, mock_get_supervisees_for_alias: MagicMock, mock_get_loc_vault: MagicMock
-    ):
-        mock_get_loc_vault.return_value = sentinel.dummy1
-        mock_get_supervisees_for_alias.side_effect = mock_supervisor_get_supervisees_for_alias(
-            supervisees={
-                line_of_credit_supervisor.LOC_ALIAS: [sentinel.dummy1],
-                line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
-            }
-        )
+    def test_all_supervisees_are_returned(self, mock_get_supervisees_by_alias: MagicMock):
+        mock_get_supervisees_by_alias.return_value = {
+            line_of_credit_supervisor.LOC_ALIAS: [sentinel.loc_vault],
+            line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
+        }
 
-        expected = sentinel.dummy1, [sentinel.dummy2, sentinel.dummy3]
+        expected = sentinel.loc_vault, [sentinel.dummy2, sentinel.dummy3]
 
         result = line_of_credit_supervisor._get_loc_and_loan_supervisee_vault_objects(
             sentinel.supervisor
         )
         self.assertEqual(result, expected)
-        mock_get_loc_vault.assert_called_once_with(vault=sentinel.supervisor)
-        mock_get_supervisees_for_alias.assert_called_once_with(
-            vault=sentinel.supervisor, alias=line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS
-        )
-
-
-@patch.object(line_of_credit_supervisor.supervisor_utils, "get_supervisees_for_alias")
-class GetLocVaultTest(LineOfCreditSupervisorTestBase):
-    def test_get_loc_vault_returns_loc_vault(self, mock_get_supervisees_for_alias: MagicMock):
-        mock_get_supervisees_for_alias.side_effect = mock_supervisor_get_supervisees_for_alias(
-            supervisees={
-                line_of_credit_supervisor.LOC_ALIAS: [sentinel.loc_vault],
-                line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
-            }
+        mock_get_supervisees_by_alias.assert_called_once_with(
+            vault=sentinel.supervisor,
+            aliases=[
+                line_of_credit_supervisor.LOC_ALIAS,
+                line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS,
+            ],
         )
 
-        expected = sentinel.loc_vault
+    def test_zero_loc_supervisees(self, mock_get_supervisees_by_alias: MagicMock):
+        mock_get_supervisees_by_alias.return_value = {
+            line_of_credit_supervisor.LOC_ALIAS: [],
+            line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
+        }
 
-        result = line_of_credit_supervisor._get_loc_vault(sentinel.supervisor)
-        self.assertEqual(result, expected)
-        mock_get_supervisees_for_alias.assert_called_once_with(
-            vault=sentinel.supervisor, alias=line_of_credit_supervisor.LOC_ALIAS
+        result = line_of_credit_supervisor._get_loc_and_loan_supervisee_vault_objects(
+            sentinel.supervisor
         )
+        self.assertEqual(result, (None, [sentinel.dummy2, sentinel.dummy3]))
 
-    def test_get_loc_vault_zero_supervisees(self, mock_get_supervisees_for_alias: MagicMock):
-        mock_get_supervisees_for_alias.side_effect = mock_supervisor_get_supervisees_for_alias(
-            supervisees={
-                line_of_credit_supervisor.LOC_ALIAS: [],
-                line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
-            }
-        )
-        result = line_of_credit_supervisor._get_loc_vault(sentinel.supervisor)
-        self.assertEqual(result, None)
-        mock_get_supervisees_for_alias.assert_called_once_with(
-            vault=sentinel.supervisor, alias=line_of_credit_supervisor.LOC_ALIAS
-        )
+    def test_multiple_loc_supervisees(self, mock_get_supervisees_by_alias: MagicMock):
+        mock_get_supervisees_by_alias.return_value = {
+            line_of_credit_supervisor.LOC_ALIAS: [sentinel.loc_vault_1, sentinel.loc_vault_2],
+            line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
+        }
 
-    def test_get_loc_vault_multiple_loc_supervisees(
-        self, mock_get_supervisees_for_alias: MagicMock
-    ):
-        mock_get_supervisees_for_alias.side_effect = mock_supervisor_get_supervisees_for_alias(
-            supervisees={
-                line_of_credit_supervisor.LOC_ALIAS: [sentinel.loc_vault_1, sentinel.loc_vault_2],
-                line_of_credit_supervisor.DRAWDOWN_LOAN_ALIAS: [sentinel.dummy2, sentinel.dummy3],
-            }
-        )
-        result = line_of_credit_supervisor._get_loc_vault(sentinel.supervisor)
-        self.assertEqual(result, None)
-        mock_get_supervisees_for_alias.assert_called_once_with(
-            vault=sentinel.supervisor, alias=line_of_credit_supervisor.LOC_ALIAS
+        result = line_of_credit_supervisor._get_loc_and_loan_supervisee_vault_objects(
+            sentinel.supervisor
         )
+        self.assertEqual(result, (None, [sentinel.dummy2, sentinel.dummy3]))
 
 
 @patch.object(line_of_credit_supervisor.close_loan, "does_repayment_fully_repay_loan")
@@ -40,6 +40,11 @@ from inception_sdk.test_framework.contracts.unit.contracts_v4.contracts_api_sent
     SentinelUpdatePlanEventTypeDirective,
 )
 
+# the hook creates one snapshot per execution, which the mocked handlers leave empty
+EMPTY_BALANCES_SNAPSHOT = (
+    line_of_credit_supervisor.supervisor_utils.create_supervisee_balances_snapshot()
+)
+
 
 @patch.object(line_of_credit_supervisor, "_get_loc_and_loan_supervisee_vault_objects")
 class DummyEventTest(LineOfCreditSupervisorTestBase):
@@ -223,6 +228,7 @@ class AccrualEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=sentinel.loc_vault,
             loan_vaults=[],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_loc_and_loan_supervisee_vault_objects.assert_called_once_with(vault=sentinel.vault)
         mock_is_interest_accrual_blocked.assert_called_once_with(
@@ -266,6 +272,7 @@ class AccrualEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=sentinel.loc_vault,
             loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_loc_and_loan_supervisee_vault_objects.assert_called_once_with(vault=sentinel.vault)
         mock_is_interest_accrual_blocked.assert_called_once_with(
@@ -325,6 +332,7 @@ class AccrualEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=sentinel.loc_vault,
             loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_loc_and_loan_supervisee_vault_objects.assert_called_once_with(vault=sentinel.vault)
         mock_is_interest_accrual_blocked.assert_called_once_with(
@@ -372,7 +380,10 @@ class DueAmountCalculationEventTest(LineOfCreditSupervisorTestBase):
         result = line_of_credit_supervisor.scheduled_event_hook(sentinel.vault, hook_arguments)
         self.assertIsNone(result)
         mock_get_due_amount_custom_instructions.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[sentinel.loan]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_repayment_due_notification.assert_called_once_with(
             loc_vault=sentinel.loc_vault,
@@ -427,7 +438,10 @@ class DueAmountCalculationEventTest(LineOfCreditSupervisorTestBase):
         result = line_of_credit_supervisor.scheduled_event_hook(sentinel.vault, hook_arguments)
         self.assertEqual(result, expected_result)
         mock_get_due_amount_custom_instructions.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[sentinel.loan]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_repayment_due_notification.assert_called_once_with(
             loc_vault=sentinel.loc_vault,
@@ -491,7 +505,10 @@ class DueAmountCalculationEventTest(LineOfCreditSupervisorTestBase):
         result = line_of_credit_supervisor.scheduled_event_hook(sentinel.vault, hook_arguments)
         self.assertEqual(result, expected_result)
         mock_get_due_amount_custom_instructions.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[sentinel.loan]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_repayment_due_notification.assert_called_once_with(
             loc_vault=sentinel.loc_vault,
@@ -578,7 +595,10 @@ class DueAmountCalculationEventTest(LineOfCreditSupervisorTestBase):
         result = line_of_credit_supervisor.scheduled_event_hook(sentinel.vault, hook_arguments)
         self.assertEqual(result, expected_result)
         mock_get_due_amount_custom_instructions.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[sentinel.loan]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[sentinel.loan],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_repayment_due_notification.assert_called_once_with(
             loc_vault=sentinel.loc_vault,
@@ -696,7 +716,10 @@ class CheckDelinquencyEventTest(LineOfCreditSupervisorTestBase):
         self.assertEqual(result, expected_result)
         mock_get_loc_and_loan_supervisee_vault_objects.assert_called_once_with(vault=sentinel.vault)
         mock_handle_delinquency.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_update_check_delinquency_schedule.assert_called_once_with(
             loc_vault=sentinel.loc_vault, hook_arguments=hook_arguments, grace_period=7, skip=True
@@ -733,7 +756,10 @@ class CheckDelinquencyEventTest(LineOfCreditSupervisorTestBase):
         self.assertEqual(result, expected_result)
         mock_get_loc_and_loan_supervisee_vault_objects.assert_called_once_with(vault=sentinel.vault)
         mock_handle_delinquency.assert_called_once_with(
-            hook_arguments=hook_arguments, loc_vault=sentinel.loc_vault, loan_vaults=[]
+            hook_arguments=hook_arguments,
+            loc_vault=sentinel.loc_vault,
+            loan_vaults=[],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_update_check_delinquency_schedule.assert_called_once_with(
             loc_vault=sentinel.loc_vault, hook_arguments=hook_arguments, grace_period=7, skip=True
@@ -835,6 +861,7 @@ class CheckOverdueEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=mock_loc_vault,
             loan_vaults=[],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_overdue_amounts_from_instructions.assert_called_once_with(
             loc_account_id=mock_loc_vault.account_id,
@@ -923,6 +950,7 @@ class CheckOverdueEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=mock_loc_vault,
             loan_vaults=[sentinel.loan_vault],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_overdue_amounts_from_instructions.assert_called_once_with(
             loc_account_id=mock_loc_vault.account_id,
@@ -1023,6 +1051,7 @@ class CheckOverdueEventTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=mock_loc_vault,
             loan_vaults=[sentinel.loan_vault],
+            balances_snapshot=EMPTY_BALANCES_SNAPSHOT,
         )
         mock_get_overdue_amounts_from_instructions.assert_called_once_with(
             loc_account_id=mock_loc_vault.account_id,
@@ -1961,12 +1990,14 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     vault=loan2,
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
@@ -1976,15 +2007,19 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     loan_vault=loan1,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     loan_vault=loan2,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
-        mock_get_balance_default_dict_from_mapping.assert_called_once_with(
+        # each loan's balances are derived once for both accruals, followed by the loc's balances
+        self.assertEqual(mock_get_balance_default_dict_from_mapping.call_count, 3)
+        mock_get_balance_default_dict_from_mapping.assert_called_with(
             mapping=sentinel.fetched_balances,
             effective_datetime=DEFAULT_DATETIME,
         )
@@ -2089,12 +2124,14 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     vault=loan2,
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
@@ -2104,15 +2141,19 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     loan_vault=loan1,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     loan_vault=loan2,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
-        mock_get_balance_default_dict_from_mapping.assert_called_once_with(
+        # each loan's balances are derived once for both accruals, followed by the loc's balances
+        self.assertEqual(mock_get_balance_default_dict_from_mapping.call_count, 3)
+        mock_get_balance_default_dict_from_mapping.assert_called_with(
             mapping=sentinel.fetched_balances,
             effective_datetime=DEFAULT_DATETIME,
         )
@@ -2155,6 +2196,7 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
         mock_get_actual_next_repayment_date.return_value = month_after_opening
         mock_get_standard_interest_accrual_custom_instructions.side_effect = [[], []]
         mock_get_penalty_interest_accrual_custom_instructions.return_value = []
+        mock_get_balance_default_dict_from_mapping.return_value = sentinel.default_dict
 
         hook_arguments = SupervisorScheduledEventHookArguments(
             effective_datetime=DEFAULT_DATETIME,
@@ -2177,12 +2219,14 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     vault=loan2,
                     hook_arguments=hook_arguments,
                     next_due_amount_calculation_datetime=month_after_opening,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
@@ -2192,15 +2236,18 @@ class HandleAccrueInterestTest(LineOfCreditSupervisorTestBase):
                     loan_vault=loan1,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
                 call(
                     loan_vault=loan2,
                     hook_arguments=hook_arguments,
                     denomination=sentinel.denomination,
+                    balances=sentinel.default_dict,
                 ),
             ]
         )
-        mock_get_balance_default_dict_from_mapping.assert_not_called()
+        # only the loans' balances are needed if there is nothing to aggregate
+        self.assertEqual(mock_get_balance_default_dict_from_mapping.call_count, 2)
         mock_create_aggregate_posting_instructions.assert_not_called()
         mock_get_application_precision_parameter.assert_not_called()
 
@@ -2595,13 +2642,13 @@ class GetUpdateCheckOverdueScheduleTest(LineOfCreditSupervisorTestBase):
 
 
 @patch.object(line_of_credit_supervisor.common_parameters, "get_denomination_parameter")
-@patch.object(line_of_credit_supervisor.utils, "get_balance_default_dict_from_mapping")
+@patch.object(line_of_credit_supervisor.supervisor_utils, "get_snapshot_balances")
 @patch.object(line_of_credit_supervisor.utils, "sum_balances")
 class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
     def test_handle_delinquency_when_overdue(
         self,
         mock_sum_balances: MagicMock,
-        mock_get_balance_default_dict_from_mapping: MagicMock,
+        mock_get_snapshot_balances: MagicMock,
         mock_get_denomination_parameter: MagicMock,
     ):
         loc_vault = self.create_supervisee_mock(
@@ -2617,7 +2664,7 @@ class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
             requires_fetched_balances=sentinel.fetched_balances,
         )
         mock_get_denomination_parameter.return_value = sentinel.denomination
-        mock_get_balance_default_dict_from_mapping.side_effect = [
+        mock_get_snapshot_balances.side_effect = [
             sentinel.loan_1_vault_balances,
             sentinel.loan_2_vault_balances,
         ]
@@ -2641,13 +2688,15 @@ class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=loc_vault,
             loan_vaults=[loan_vault_1, loan_vault_2],
+            balances_snapshot=sentinel.balances_snapshot,
         )
         self.assertDictEqual(result, expected)
         mock_get_denomination_parameter.assert_called_once_with(vault=loc_vault)
-        mock_get_balance_default_dict_from_mapping.assert_has_calls(
+        mock_get_snapshot_balances.assert_has_calls(
             calls=[
                 call(
-                    mapping=loan_vault_1.get_balances_timeseries(),
+                    snapshot=sentinel.balances_snapshot,
+                    supervisee=loan_vault_1,
                     effective_datetime=hook_arguments.effective_datetime,
                 ),
             ]
@@ -2665,7 +2714,7 @@ class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
     def test_handle_delinquency_nothing_overdue(
         self,
         mock_sum_balances: MagicMock,
-        mock_get_balance_default_dict_from_mapping: MagicMock,
+        mock_get_snapshot_balances: MagicMock,
         mock_get_denomination_parameter: MagicMock,
     ):
         loc_vault = self.create_supervisee_mock(
@@ -2681,7 +2730,7 @@ class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
             requires_fetched_balances=sentinel.fetched_balances,
         )
         mock_get_denomination_parameter.return_value = sentinel.denomination
-        mock_get_balance_default_dict_from_mapping.side_effect = [
+        mock_get_snapshot_balances.side_effect = [
             sentinel.loan_1_vault_balances,
             sentinel.loan_2_vault_balances,
         ]
@@ -2695,17 +2744,20 @@ class HandleDelinquencyTest(LineOfCreditSupervisorTestBase):
             hook_arguments=hook_arguments,
             loc_vault=loc_vault,
             loan_vaults=[loan_vault_1, loan_vault_2],
+            balances_snapshot=sentinel.balances_snapshot,
         )
         self.assertDictEqual(result, {})
         mock_get_denomination_parameter.assert_called_once_with(vault=loc_vault)
-        mock_get_balance_default_dict_from_mapping.assert_has_calls(
+        mock_get_snapshot_balances.assert_has_calls(
             calls=[
                 call(
-                    mapping=loan_vault_1.get_balances_timeseries(),
+                    snapshot=sentinel.balances_snapshot,
+                    supervisee=loan_vault_1,
                     effective_datetime=hook_arguments.effective_datetime,
                 ),
                 call(
-                    mapping=loan_vault_2.get_balances_timeseries(),
+                    snapshot=sentinel.balances_snapshot,
+                    supervisee=loan_vault_2,
                     effective_datetime=hook_arguments.effective_datetime,
                 ),
             ]
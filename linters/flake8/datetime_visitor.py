@@ -3,11 +3,12 @@ import ast
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR001 = "CTR001 Do not use datetime.now()/datetime.utcnow() inside contracts"
 
 
-class DatetimeVisitor(ast.NodeVisitor):
+class DatetimeVisitor(SinglePassVisitor):
     """
     Raise an error if datetime.now()/datetime.utcnow() is used within a contract.
     """
@@ -38,10 +39,8 @@ class DatetimeVisitor(ast.NodeVisitor):
             attribute_node = node.value.func
             # add uses in Parameter default_value to ignore list
             self.to_ignore.append((attribute_node.lineno, attribute_node.col_offset, ERRORS_CTR001))
-        self.generic_visit(node)
 
     def visit_Attribute(self, node: ast.Attribute):
         if self._attribute_is_datetime(node):
             # add all instances to the violation list
             self.all_violations.append((node.lineno, node.col_offset, ERRORS_CTR001))
-        self.generic_visit(node)
@@ -8,11 +8,12 @@ from linters.flake8.common import (
     SUPERVISOR_HOOK_V4_TYPEHINT_MAPPING,
     ErrorType,
 )
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR005 = "CTR005 do not add empty hooks to contracts"
 
 
-class EmptyHookVisitor(ast.NodeVisitor):
+class EmptyHookVisitor(SinglePassVisitor):
     """
     Raise an error if empty hooks are added to a contract/supervisor contract
     """
@@ -48,7 +49,6 @@ class EmptyHookVisitor(ast.NodeVisitor):
             else SUPERVISOR_HOOK_V4_TYPEHINT_MAPPING
         )
         self._generate_errors(node, hook_mapping, supervisor_mapping)
-        self.generic_visit(node)
 
     def _generate_errors(
         self, node: ast.FunctionDef, hook_mapping: dict, supervisor_mapping: dict
@@ -3,13 +3,14 @@ import ast
 from typing import Any
 
 from linters.flake8.common import HOOK_V3_FUNCTIONS, HOOK_V4_FUNCTIONS, ErrorType
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR002 = (
     "CTR002 List-type metadata objects should be extended using the unpacking operator (*)"
 )
 
 
-class ListMetadataVisitor(ast.NodeVisitor):
+class ListMetadataVisitor(SinglePassVisitor):
     """
     Raise an error if list-type metadata objects are extended not using the unpacking operator (*).
     This includes using .append(), .extend(), +=, list slicing, and modification within a root
@@ -61,28 +62,28 @@ class ListMetadataVisitor(ast.NodeVisitor):
             self.metadata_count[node.id] += 1
             if self.metadata_count[node.id] > 1:
                 self.violations.append((node.lineno, node.col_offset, ERRORS_CTR002))
-        self.generic_visit(node)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> Any:
         if node.name in self.non_hook_non_helper_funcs:
             # consider non-hook/non-helper functions as in the global space
-            self._non_global_logic(node, "global")
+            self.context.append("global")
         else:
-            self._non_global_logic(node, "function")
+            self.context.append("function")
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> Any:
-        self._non_global_logic(node, "async_function")
+        self.context.append("async_function")
 
     def visit_ClassDef(self, node: ast.ClassDef) -> Any:
-        self._non_global_logic(node, "class")
+        self.context.append("class")
 
     def visit_Lambda(self, node: ast.Lambda) -> Any:
-        self._non_global_logic(node, "lambda")
+        self.context.append("lambda")
 
     def visit_For(self, node: ast.For) -> Any:
-        self._non_global_logic(node, "for")
+        self.context.append("for")
 
-    def _non_global_logic(self, node, context: str) -> Any:
-        self.context.append(context)
-        self.generic_visit(node)
+    # each context ends once all of the node's children have been visited
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> Any:
         self.context.pop()
+
+    leave_AsyncFunctionDef = leave_ClassDef = leave_Lambda = leave_For = leave_FunctionDef
@@ -0,0 +1,58 @@
+# standard libs
+import ast
+from typing import Callable, Iterable
+
+Handler = Callable[[ast.AST], None]
+
+
+class SinglePassVisitor:
+    """
+    Base class for checks that share a single traversal of the tree with other checks.
+    Subclasses define `visit_<NodeType>` handlers, called before a node's children are visited,
+    and optionally `leave_<NodeType>` handlers, called after. Unlike ast.NodeVisitor, handlers
+    must not visit the node's children themselves, as MultiVisitor does this once for all checks.
+    """
+
+    def visit(self, node: ast.AST) -> None:
+        """
+        Run this check on its own
+        """
+        MultiVisitor([self]).visit(node)
+
+
+class MultiVisitor:
+    """
+    Walk a tree once, routing each node to the handlers of all registered checks. Nodes are visited
+    in the same order as ast.NodeVisitor.generic_visit, but iteratively
+    """
+
+    def __init__(self, visitors: Iterable[SinglePassVisitor]):
+        self.visitors = list(visitors)
+        self._handlers: dict[type, tuple[list[Handler], list[Handler]]] = {}
+
+    def _get_handlers(self, node_type: type) -> tuple[list[Handler], list[Handler]]:
+        if node_type not in self._handlers:
+            visit_method = f"visit_{node_type.__name__}"
+            leave_method = f"leave_{node_type.__name__}"
+            self._handlers[node_type] = (
+                [getattr(v, visit_method) for v in self.visitors if hasattr(v, visit_method)],
+                [getattr(v, leave_method) for v in self.visitors if hasattr(v, leave_method)],
+            )
+        return self._handlers[node_type]
+
+    def visit(self, tree: ast.AST) -> None:
+        # each entry is a node and whether its children have already been visited
+        stack: list[tuple[ast.AST, bool]] = [(tree, False)]
+        while stack:
+            node, leaving = stack.pop()
+            visit_handlers, leave_handlers = self._get_handlers(type(node))
+            if leaving:
+                for handler in leave_handlers:
+                    handler(node)
+                continue
+            for handler in visit_handlers:
+                handler(node)
+            if leave_handlers:
+                stack.append((node, True))
+            # reversed so that children are popped in field order
+            stack.extend((child, False) for child in reversed(list(ast.iter_child_nodes(node))))
@@ -4,12 +4,13 @@ import re
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR008 = "CTR008 Use Title Caps For Display Names"
 _RE_BRACKETS_STRIPPER = re.compile("\\s*(\\(.*\\))\\s*")
 
 
-class ParameterDisplayNameVisitor(ast.NodeVisitor):
+class ParameterDisplayNameVisitor(SinglePassVisitor):
     """
     Raise an error if the Parameter's display name string is not in title case
     """
@@ -27,7 +28,6 @@ class ParameterDisplayNameVisitor(ast.NodeVisitor):
                     and not self.check_title_caps(kw.value.value)
                 ):
                     self.violations.append((kw.lineno, kw.col_offset, ERRORS_CTR008))
-        self.generic_visit(node)
 
     @staticmethod
     def check_title_caps(string: str):
@@ -3,11 +3,12 @@ import ast
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR007 = "CTR007 Use PARAM_ constant for parameter names"
 
 
-class ParameterNameVisitor(ast.NodeVisitor):
+class ParameterNameVisitor(SinglePassVisitor):
     """
     Raise an error if a literal string value is passed into the 'name' argument for a
     Parameter definition rather than a PARAM_-prefixed constant.
@@ -30,4 +31,3 @@ class ParameterNameVisitor(ast.NodeVisitor):
                     and not (kw.value.id).startswith("PARAM_")
                 ):
                     self.violations.append((kw.lineno, kw.col_offset, ERRORS_CTR007))
-        self.generic_visit(node)
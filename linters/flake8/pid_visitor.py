@@ -3,11 +3,12 @@ import ast
 from typing import Any
 
 from linters.flake8.common import ErrorType
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR009 = "CTR009 set value_datetime on PID/PIB by default"
 
 
-class PidVisitor(ast.NodeVisitor):
+class PidVisitor(SinglePassVisitor):
     """
     Raise an error if PostingInstructionDirective (Contracts API 4.x) or
     PostingInstructionBatch (Contracts API 3.x) don't set value_datetime
@@ -23,4 +24,3 @@ class PidVisitor(ast.NodeVisitor):
         }:
             if not any(kw.arg == "value_datetime" for kw in node.keywords):
                 self.violations.append((node.lineno, node.col_offset, ERRORS_CTR009))
-        self.generic_visit(node)
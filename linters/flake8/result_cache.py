@@ -0,0 +1,98 @@
+# standard libs
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Optional
+
+from linters.flake8.common import ErrorType
+
+# Caching is opt-in, and only enabled if this is set to a directory
+CACHE_DIR_ENV_VAR = "FLAKE8_CONTRACTS_CACHE_DIR"
+# Oldest (least recently used) results are removed once the cache exceeds this many results
+MAX_CACHE_ENTRIES = 10000
+
+
+@cache
+def _get_linter_fingerprint(linter_version: str) -> str:
+    """
+    Hash the linter's version and own source, and the python version (which affects how files
+    are parsed), so that results are invalidated when any check changes
+    """
+    linters_dir = Path(__file__).parent.parent
+    digest = hashlib.sha256(f"{linter_version} {sys.version_info[:2]}".encode())
+    for source_path in sorted(
+        [*linters_dir.glob("flake8/*.py"), linters_dir / "flake8_contracts.py"]
+    ):
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+@cache
+def _prune(cache_dir: Path, max_entries: int) -> None:
+    """
+    Removes the least recently used results beyond `max_entries`. This is cached so that each
+    flake8 worker only prunes once per run, rather than listing the directory for every file
+    """
+    try:
+        results = [(entry.stat().st_mtime, entry) for entry in cache_dir.glob("*.json")]
+    except OSError:
+        return
+    for _, entry in sorted(results, key=lambda result: result[0])[: len(results) - max_entries]:
+        # another worker may have already removed it
+        entry.unlink(missing_ok=True)
+
+
+class ResultCache:
+    """
+    Violations per linted file, keyed by the file's content and name (which affects how the file is
+    linted) and by the linter itself. Each result is stored in its own file, so that flake8's
+    parallel workers can safely share the cache
+    """
+
+    def __init__(self, cache_dir: str, linter_version: str):
+        self.cache_dir = Path(cache_dir)
+        self.linter_version = linter_version
+
+    @classmethod
+    def from_environment(cls, linter_version: str) -> Optional["ResultCache"]:
+        """
+        :param linter_version: the version of the linter producing the results
+        :return: the cache in the directory configured via FLAKE8_CONTRACTS_CACHE_DIR, if any
+        """
+        cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+        return cls(cache_dir, linter_version) if cache_dir else None
+
+    def get_key(self, filename: str, lines: list[str]) -> str:
+        digest = hashlib.sha256(_get_linter_fingerprint(self.linter_version).encode())
+        digest.update(filename.encode())
+        digest.update("".join(lines).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[list[ErrorType]]:
+        result_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(result_path, "r", encoding="utf-8") as result_file:
+                violations = [tuple(violation) for violation in json.load(result_file)]
+            # mark the result as recently used so that it is pruned last
+            os.utime(result_path)
+        except (OSError, ValueError):
+            return None
+        return violations
+
+    def set(self, key: str, violations: list[ErrorType]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # write then rename so that other workers never read a partial result
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as result_file:
+                json.dump(violations, result_file)
+            os.replace(result_file.name, self.cache_dir / f"{key}.json")
+            _prune(self.cache_dir, MAX_CACHE_ENTRIES)
+        except OSError:
+            # caching is best effort and must never fail linting
+            pass
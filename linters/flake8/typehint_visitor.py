@@ -10,12 +10,13 @@ from linters.flake8.common import (
     SUPERVISOR_HOOK_V4_TYPEHINT_MAPPING,
     ErrorType,
 )
+from linters.flake8.multi_visitor import SinglePassVisitor
 
 ERRORS_CTR003 = "CTR003 Typehints should be used"
 ERRORS_CTR004 = f"{ERRORS_CTR003[:5]}4{ERRORS_CTR003[6:]}"
 
 
-class TypehintVisitor(ast.NodeVisitor):
+class TypehintVisitor(SinglePassVisitor):
     """
     Raise an error if typehints are missing
     """
@@ -51,7 +52,6 @@ class TypehintVisitor(ast.NodeVisitor):
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
         self._generate_errors(node, self.hook_mapping, self.supervisor_mapping)
-        self.generic_visit(node)
 
     def _generate_errors(
         self, node: ast.FunctionDef, hook_mapping: dict, supervisor_mapping: dict
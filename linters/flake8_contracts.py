@@ -1,14 +1,17 @@
 # standard libs
 import ast
-from typing import Any, Generator, Type
+from typing import Any, Generator, Optional, Type
 
+from linters.flake8.common import ErrorType
 from linters.flake8.datetime_visitor import DatetimeVisitor
 from linters.flake8.empty_hook_visitor import EmptyHookVisitor
 from linters.flake8.get_parameter_visitor import GetParameterVisitor
 from linters.flake8.list_metadata_visitor import ListMetadataVisitor
+from linters.flake8.multi_visitor import MultiVisitor, SinglePassVisitor
 from linters.flake8.parameter_display_name_visitor import ParameterDisplayNameVisitor
 from linters.flake8.parameter_name_visitor import ParameterNameVisitor
 from linters.flake8.pid_visitor import PidVisitor
+from linters.flake8.result_cache import ResultCache
 from linters.flake8.typehint_visitor import TypehintVisitor
 
 __version__ = "1.0"
@@ -18,24 +21,52 @@ class ContractLinter(object):
     name = "flake8_contracts"
     version = __version__
 
-    def __init__(self, tree, filename=""):
+    def __init__(self, tree, filename="", lines=None):
         self.tree: ast.Module = tree
         self.filename: str = filename
+        # flake8 provides the file's lines, which are used to cache results by content
+        self.lines: Optional[list[str]] = lines
         self._contract_version = ""
-
-    def _is_contract_file(self):
-        # For now we will just identify contracts and modules via the `api` metadata. It's not
-        # perfect, but it's the only thing in common across the different types
+        self._api_version: Optional[str] = None
+        self._supervisor_api_version: Optional[str] = None
+        self._has_imports = False
+        self._classify_file()
+
+    def _classify_file(self):
+        # All checks on the file's top-level statements are made in a single pass over the body.
+        # For now we will just identify contracts and modules via the `api` metadata, and
+        # supervisor contracts via `supervised_smart_contracts` metadata. It's not perfect, but
+        # it's the only thing in common across the different types. From 3.10+ the latter is an
+        # optional item of metadata
+        # TODO: figure out a new method of checking it's a supervisor
+        latest_api_version = ""
         for statement in self.tree.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                self._has_imports = True
             # setting metadata results in top-level Assign objects, whose targets should have
             # the name(s) we expect
-            if isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Constant):
-                for target in statement.targets:
-                    if isinstance(target, ast.Name):
-                        if target.id == "api":
-                            # contract version == 3/4
-                            self._contract_version = statement.value.value[0]
-                            return True
+            if not isinstance(statement, ast.Assign):
+                continue
+            target_names = {
+                target.id for target in statement.targets if isinstance(target, ast.Name)
+            }
+            if isinstance(statement.value, ast.Constant) and "api" in target_names:
+                # contract version == 3/4
+                latest_api_version = statement.value.value[0]
+                if self._api_version is None:
+                    self._api_version = latest_api_version
+            elif (
+                isinstance(statement.value, ast.List)
+                and "supervised_smart_contracts" in target_names
+                and self._supervisor_api_version is None
+            ):
+                # TODO: this only works if api is defined above supervised_smart_contracts
+                self._supervisor_api_version = latest_api_version
+
+    def _is_contract_file(self):
+        if self._api_version is not None:
+            self._contract_version = self._api_version
+            return True
         return False
 
     def _is_feature_file(self):
@@ -48,106 +79,80 @@ class ContractLinter(object):
         return False
 
     def _is_supervisor_file(self):
-        # For now we will just identify supervisor contracts `supervised_smart_contracts` metadata.
-        # It's not perfect, but it's the only thing in common across the different types.
-        # From 3.10+ this is an optional item of metadata
-        # TODO: figure out a new method of checking it's a supervisor
-        contract_version = ""
-        for statement in self.tree.body:
-            if isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Constant):
-                for target in statement.targets:
-                    if isinstance(target, ast.Name) and target.id == "api":
-                        # TODO: this only works if api is defined above supervised_smart_contracts
-                        contract_version = statement.value.value[0]
-            # setting metadata results in top-level Assign objects, whose targets should have
-            # the name(s) we expect
-            if isinstance(statement, ast.Assign) and isinstance(statement.value, ast.List):
-                for target in statement.targets:
-                    if isinstance(target, ast.Name):
-                        if target.id == "supervised_smart_contracts":
-                            self._contract_version = contract_version
-                            return True
+        if self._supervisor_api_version is not None:
+            self._contract_version = self._supervisor_api_version
+            return True
         return False
 
     def _is_template_file(self):
         # we are only developing V4 contracts with FLC
         if self._contract_version == "4":
             return True
-        for statement in self.tree.body:
-            # template files must be stored under the /template dir
-            # if imports are included, this is a template file and vault typehints can be used
-            if "/template/" in self.filename and (
-                isinstance(statement, ast.Import) or isinstance(statement, ast.ImportFrom)
-            ):
-                return True
-        return False
+        # template files must be stored under the /template dir
+        # if imports are included, this is a template file and vault typehints can be used
+        return "/template/" in self.filename and self._has_imports
 
-    def run(self) -> Generator[tuple[int, int, str, Type[Any]], None, None]:
-        # Check if this is looks like a contract file
-        if self._is_contract_file() or self._is_feature_file():
+    def _get_visitors(self) -> list[SinglePassVisitor]:
+        # The version is refined as the file is classified, so the order of these calls matters
+        visitors: list[SinglePassVisitor] = [
             # Checks for CTR001
-            datetime_visitor = DatetimeVisitor()
-            datetime_visitor.visit(self.tree)
-            for line, col, msg in datetime_visitor.violations:
-                yield line, col, msg, type(self)
-
+            DatetimeVisitor(),
             # Checks for CTR002
-            list_metadata_visitor = ListMetadataVisitor(
-                self.tree, contract_version=self._contract_version
-            )
-            list_metadata_visitor.visit(self.tree)
-            for line, col, msg in list_metadata_visitor.violations:
-                yield line, col, msg, type(self)
-
+            ListMetadataVisitor(self.tree, contract_version=self._contract_version),
             # Checks for CTR003-4
-            typehint_visitor = TypehintVisitor(
+            TypehintVisitor(
                 contract_version=self._contract_version,
                 is_supervisor=self._is_supervisor_file(),
                 is_template=self._is_template_file(),
                 is_feature=self._is_feature_file(),
-            )
-            typehint_visitor.visit(self.tree)
-            for line, col, msg in typehint_visitor.violations:
-                yield line, col, msg, type(self)
-
+            ),
             # Checks for CTR005
-            empty_hook_visitor = EmptyHookVisitor(
+            EmptyHookVisitor(
                 contract_version=self._contract_version,
                 is_supervisor=self._is_supervisor_file(),
                 is_template=self._is_template_file(),
                 is_feature=self._is_feature_file(),
                 filepath=self.filename,
-            )
-            empty_hook_visitor.visit(self.tree)
-            for line, col, msg in empty_hook_visitor.violations:
-                yield line, col, msg, type(self)
-
-            # Checks for CTR006
-            if (
-                self._contract_version == "4"
-                and self._is_contract_file()
-                and not self._is_supervisor_file()
-            ):
-                get_parameter_visitor = GetParameterVisitor()
-                get_parameter_visitor.visit(self.tree)
-                for line, col, msg in get_parameter_visitor.violations:
-                    yield line, col, msg, type(self)
-
-            # Checks for CTR007
-            if self._contract_version == "4":
-                parameter_name_visitor = ParameterNameVisitor()
-                parameter_name_visitor.visit(self.tree)
-                for line, col, msg in parameter_name_visitor.violations:
-                    yield line, col, msg, type(self)
-
-            # Checks for CTR008
-            parameter_display_name_visitor = ParameterDisplayNameVisitor()
-            parameter_display_name_visitor.visit(self.tree)
-            for line, col, msg in parameter_display_name_visitor.violations:
-                yield line, col, msg, type(self)
+            ),
+        ]
+        # Checks for CTR006
+        if (
+            self._contract_version == "4"
+            and self._is_contract_file()
+            and not self._is_supervisor_file()
+        ):
+            visitors.append(GetParameterVisitor())
+        # Checks for CTR007
+        if self._contract_version == "4":
+            visitors.append(ParameterNameVisitor())
+        # Checks for CTR008
+        visitors.append(ParameterDisplayNameVisitor())
+        # Checks for CTR009
+        visitors.append(PidVisitor())
+        return visitors
+
+    def _get_violations(self) -> list[ErrorType]:
+        # Check if this is looks like a contract file
+        if not (self._is_contract_file() or self._is_feature_file()):
+            return []
+        visitors = self._get_visitors()
+        # Walk the tree once for all checks
+        MultiVisitor(visitors).visit(self.tree)
+        return [violation for visitor in visitors for violation in visitor.violations]
 
-            # Checks for CTR009
-            pid_visitor = PidVisitor()
-            pid_visitor.visit(self.tree)
-            for line, col, msg in pid_visitor.violations:
-                yield line, col, msg, type(self)
+    def run(self) -> Generator[tuple[int, int, str, Type[Any]], None, None]:
+        result_cache = (
+            ResultCache.from_environment(linter_version=self.version)
+            if self.lines is not None
+            else None
+        )
+        violations = None
+        if result_cache:
+            cache_key = result_cache.get_key(self.filename, self.lines)
+            violations = result_cache.get(cache_key)
+        if violations is None:
+            violations = self._get_violations()
+            if result_cache:
+                result_cache.set(cache_key, violations)
+        for line, col, msg in violations:
+            yield line, col, msg, type(self)
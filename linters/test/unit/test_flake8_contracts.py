@@ -1,12 +1,18 @@
 # standard libs
 import ast
+import os
+import tempfile
 import unittest
 from collections import defaultdict
+from pathlib import Path
+from unittest import mock
 
 from linters.flake8.datetime_visitor import ERRORS_CTR001
 from linters.flake8.get_parameter_visitor import ERRORS_CTR006, ERRORS_CTR006B, GetParameterVisitor
 from linters.flake8.list_metadata_visitor import ERRORS_CTR002, ListMetadataVisitor
+from linters.flake8.multi_visitor import MultiVisitor, SinglePassVisitor
 from linters.flake8.pid_visitor import ERRORS_CTR009, PidVisitor
+from linters.flake8.result_cache import CACHE_DIR_ENV_VAR, ResultCache, _prune
 from linters.flake8.typehint_visitor import ERRORS_CTR003, ERRORS_CTR004
 from linters.flake8_contracts import ContractLinter
 
@@ -432,3 +438,116 @@ class PidVisitorTest(unittest.TestCase):
         ctr009_errors = self.outputs[ERRORS_CTR009]
         expected_errors = [{"line": 8, "col": 0}]
         self.assertListEqual(ctr009_errors, expected_errors)
+
+
+class RecordingVisitor(SinglePassVisitor):
+    def __init__(self, name: str, events: list[str]):
+        self.name = name
+        self.events = events
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.events.append(f"{self.name} visit {node.name}")
+
+    def leave_FunctionDef(self, node: ast.FunctionDef):
+        self.events.append(f"{self.name} leave {node.name}")
+
+    def visit_Call(self, node: ast.Call):
+        self.events.append(f"{self.name} call {ast.unparse(node.func)}")
+
+
+class MultiVisitorTest(unittest.TestCase):
+    def test_nodes_routed_to_all_visitors_in_generic_visit_order(self):
+        tree = ast.parse("def a():\n    b(c())\n    def d():\n        e()\nf()\n")
+        events: list[str] = []
+
+        MultiVisitor([RecordingVisitor("1", events), RecordingVisitor("2", events)]).visit(tree)
+
+        self.assertListEqual(
+            events,
+            [
+                "1 visit a",
+                "2 visit a",
+                "1 call b",
+                "2 call b",
+                "1 call c",
+                "2 call c",
+                "1 visit d",
+                "2 visit d",
+                "1 call e",
+                "2 call e",
+                "1 leave d",
+                "2 leave d",
+                "1 leave a",
+                "2 leave a",
+                "1 call f",
+                "2 call f",
+            ],
+        )
+
+    def test_single_visitor_visits_whole_tree(self):
+        events: list[str] = []
+
+        RecordingVisitor("1", events).visit(ast.parse("def a():\n    b()\n"))
+
+        self.assertListEqual(events, ["1 visit a", "1 call b", "1 leave a"])
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        env_patcher = mock.patch.dict(os.environ, {CACHE_DIR_ENV_VAR: self.cache_dir.name})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        self.lines = load_file_contents(CONTRACT_FILE).splitlines(keepends=True)
+        self.tree = ast.parse("".join(self.lines))
+
+    def _run(self, lines: list[str], filename: str = CONTRACT_FILE) -> list[tuple]:
+        return list(ContractLinter(self.tree, filename=filename, lines=lines).run())
+
+    def test_unchanged_file_not_relinted(self):
+        violations = self._run(self.lines)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 1)
+
+        with mock.patch.object(MultiVisitor, "visit") as mock_visit:
+            self.assertListEqual(self._run(self.lines), violations)
+            mock_visit.assert_not_called()
+
+    def test_changed_file_relinted(self):
+        self._run(self.lines)
+
+        with mock.patch.object(MultiVisitor, "visit") as mock_visit:
+            self._run(self.lines + ["# changed\n"])
+            self._run(self.lines, filename="library/features/v4/dummy_contract.py")
+
+        self.assertEqual(mock_visit.call_count, 2)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 3)
+
+    def test_cache_disabled_by_default(self):
+        with mock.patch.dict(os.environ):
+            del os.environ[CACHE_DIR_ENV_VAR]
+            self._run(self.lines)
+
+        self.assertListEqual(os.listdir(self.cache_dir.name), [])
+
+    def test_linter_version_changes_key(self):
+        key = ResultCache(self.cache_dir.name, linter_version="1.0").get_key(
+            CONTRACT_FILE, self.lines
+        )
+        other_version_key = ResultCache(self.cache_dir.name, linter_version="1.1").get_key(
+            CONTRACT_FILE, self.lines
+        )
+
+        self.assertNotEqual(key, other_version_key)
+
+    def test_least_recently_used_results_pruned(self):
+        result_cache = ResultCache(self.cache_dir.name, linter_version="1.0")
+        for mtime, key in enumerate(["a", "b", "c"]):
+            result_cache.set(key, [])
+            os.utime(Path(self.cache_dir.name, f"{key}.json"), (mtime, mtime))
+        # reading a result marks it as recently used
+        self.assertListEqual(result_cache.get("a"), [])
+
+        _prune(Path(self.cache_dir.name), 2)
+
+        self.assertListEqual(sorted(os.listdir(self.cache_dir.name)), ["a.json", "c.json"])
@@ -0,0 +1,95 @@
+"""
+Benchmark green day generation and YAML output for large ranges.  eg:
+$ python3 tools/green_days/green_day_calendar_benchmark.py --years 50 --calendars 5
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, List, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from tools.green_days.green_day_calendar_generator import (
+    CalendarManifestBuilder,
+    CalendarResourcesBuilder,
+    GreenDayDateGenerator,
+    YamlFileWriter,
+)
+
+
+def measure(function: Callable) -> Tuple[object, float, float]:
+    """
+    :return: the function's return value, the time taken in seconds and the peak memory allocated
+    in MiB while running it.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak / 2**20
+
+
+def get_holidays(start_year: int, end_year: int) -> Set[date]:
+    # Fixed-date holidays every year, plus a floating holiday on the first Monday of each quarter
+    holidays: Set[date] = set()
+    for year in range(start_year, end_year + 1):
+        holidays.update({date(year, 1, 1), date(year, 12, 25), date(year, 12, 26)})
+        for month in (1, 4, 7, 10):
+            first = date(year, month, 1)
+            holidays.add(first + timedelta(days=(7 - first.weekday()) % 7))
+    return holidays
+
+
+def run_benchmark(start_year: int, years: int, calendars: int, output_dir: str) -> None:
+    end_year = start_year + years - 1
+    holidays = get_holidays(start_year, end_year)
+    generator = GreenDayDateGenerator()
+    writer = YamlFileWriter()
+    for i in range(calendars):
+        calendar_id = f"benchmark_calendar_{i}"
+        green_days: List[date]
+        green_days, generate_time, generate_memory = measure(
+            lambda: generator.generate_green_days_for_range(start_year, end_year, holidays)
+        )
+        resources_builder = CalendarResourcesBuilder(
+            event_id_prefix=calendar_id,
+            calendar_id=calendar_id,
+            green_days=green_days,
+            zone=ZoneInfo("UTC"),
+        )
+        resources = resources_builder.build_calendar_resources()
+        manifest = CalendarManifestBuilder(
+            calendar_id=calendar_id,
+            calendar_events=[r.payload.calendar_event for r in resources.resources],
+        ).build_calendar_manifest()
+        _, write_time, write_memory = measure(
+            lambda: (
+                writer.write_yaml_to_file(
+                    resources, os.path.join(output_dir, f"{calendar_id}_events.resources.yaml")
+                ),
+                writer.write_yaml_to_file(
+                    manifest, os.path.join(output_dir, f"{calendar_id}.manifest.yaml")
+                ),
+            )
+        )
+        print(
+            f"{calendar_id}: {len(green_days)} green days over {years} years. "
+            f"Generated in {generate_time:.3f}s (peak {generate_memory:.1f} MiB), "
+            f"written in {write_time:.3f}s (peak {write_memory:.1f} MiB)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the green day calendar generator.")
+    parser.add_argument("--start-year", type=int, default=2000, help="Default is 2000.")
+    parser.add_argument("--years", type=int, default=50, help="Default is 50.")
+    parser.add_argument(
+        "--calendars", type=int, default=3, help="Number of calendars to generate. Default is 3."
+    )
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as output_dir:
+        run_benchmark(args.start_year, args.years, args.calendars, output_dir)
@@ -1,9 +1,9 @@
 import argparse
-import calendar
-from collections import defaultdict, deque
+from collections import deque
 from datetime import date, datetime, timedelta
+from itertools import islice
 from os.path import exists
-from typing import DefaultDict, Deque, List, Set
+from typing import Deque, Iterable, Iterator, List, Set
 import yaml
 from zoneinfo import ZoneInfo
 
@@ -23,17 +23,55 @@ class StringLiteral(str):
 
 
 def string_representer(dumper: yaml.Dumper, data: str):
-    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    # the libyaml emitter only accepts str, not subclasses
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style="|")
 
 
-yaml.add_representer(datetime, datetime_representer)
-yaml.add_representer(StringLiteral, string_representer)
+# The libyaml emitter produces identical output, several times faster, when it's available
+YamlDumper = yaml.CDumper if yaml.__with_libyaml__ else yaml.Dumper
+
+for dumper in {yaml.Dumper, YamlDumper}:
+    yaml.add_representer(datetime, datetime_representer, Dumper=dumper)
+    yaml.add_representer(StringLiteral, string_representer, Dumper=dumper)
+
+# Number of list items dumped at a time when streaming YAML
+YAML_STREAM_BATCH_SIZE = 1000
+# As per numpy.busday_offset, a 7 character string of 1s and 0s indicating valid days, Monday first
+WEEKDAYS_MASK = "1111100"
+
+
+def dump_yaml_sequence(
+    key: str, items: Iterable, batch_size=YAML_STREAM_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Dump a top-level mapping entry with a sequence value in batches, so that the whole sequence
+    doesn't need to be represented at once. The output is identical to dumping {key: items}.
+    :param key: the mapping key.
+    :param items: the sequence items, which may be lazily generated.
+    :param batch_size: the number of items to dump at a time.
+    """
+    items = iter(items)
+    batch = list(islice(items, batch_size))
+    if not batch:
+        yield yaml.dump({key: []}, sort_keys=False, Dumper=YamlDumper)
+        return
+    yield f"{key}:\n"
+    while batch:
+        yield yaml.dump(batch, sort_keys=False, Dumper=YamlDumper)
+        batch = list(islice(items, batch_size))
 
 
 class YamlObject:
     def to_yaml_dict(self) -> str:
         pass
 
+    def to_yaml_stream(self) -> Iterator[str]:
+        """
+        Yield the YAML representation of the object in chunks.  Objects with large sequences
+        override this to avoid representing the whole object at once.
+        """
+        yield yaml.dump(self.to_yaml_dict(), sort_keys=False, Dumper=YamlDumper)
+
 
 class CalendarEvent(YamlObject):
     def __init__(
@@ -89,7 +127,9 @@ class CalendarEventDefinition(YamlObject):
     def to_yaml_dict(self):
         return {
             **self.__dict__,
-            "payload": StringLiteral(yaml.dump(self.payload.to_yaml_dict(), sort_keys=False)),
+            "payload": StringLiteral(
+                yaml.dump(self.payload.to_yaml_dict(), sort_keys=False, Dumper=YamlDumper)
+            ),
         }
 
 
@@ -100,6 +140,9 @@ class CalendarResources(YamlObject):
     def to_yaml_dict(self):
         return {"resources": [r.to_yaml_dict() for r in self.resources]}
 
+    def to_yaml_stream(self) -> Iterator[str]:
+        yield from dump_yaml_sequence("resources", (r.to_yaml_dict() for r in self.resources))
+
 
 class CalendarResourcesBuilder:
     def __init__(
@@ -158,6 +201,41 @@ class GreenDayDateGenerator:
     def is_weekday(self, date) -> bool:
         return date.weekday() < 5
 
+    def generate_green_days_between(
+        self,
+        start: date,
+        end: date,
+        holidays: Set[date] = None,
+        weekmask: str = WEEKDAYS_MASK,
+    ) -> List[date]:
+        """
+        Generate the green days in a whole date range in one pass, in the style of
+        numpy.busdaycalendar: a day is green if the weekmask marks its weekday as valid and it
+        isn't a holiday.
+        :param start: the first date of the range.
+        :param end: the end of the range (exclusive).
+        :param holidays: the red days which should be excluded from the list of green days.
+        :param weekmask: 7 character string of 1s and 0s indicating the valid days of the week,
+        starting on Monday.  Default excludes weekends.
+        """
+        if len(weekmask) != 7 or set(weekmask) - {"0", "1"}:
+            raise ValueError(f"Argument 'weekmask' ({weekmask}) must be 7 characters of 0 or 1.")
+        start_ordinal = start.toordinal()
+        # date.fromordinal(1) is a Monday, so an ordinal's weekday is (ordinal - 1) % 7. The
+        # ordinals in the range are walked once per weekday, stepping by a week at a time
+        first_weekday = (start_ordinal - 1) % 7
+        green_weekday_offsets = [
+            offset for offset in range(7) if weekmask[(first_weekday + offset) % 7] == "1"
+        ]
+        holiday_ordinals = {holiday.toordinal() for holiday in holidays or ()}
+        green_day_ordinals = sorted(
+            ordinal
+            for offset in green_weekday_offsets
+            for ordinal in range(start_ordinal + offset, end.toordinal(), 7)
+            if ordinal not in holiday_ordinals
+        )
+        return [date.fromordinal(ordinal) for ordinal in green_day_ordinals]
+
     def generate_green_days_for(self, year: int, holidays: Set[date] = None) -> List[date]:
         """
         :param year: the year to for which to generate green days.
@@ -167,14 +245,7 @@ class GreenDayDateGenerator:
         """
         if year is None:
             raise ValueError("Argument 'year' cannot be None.")
-        start: date = date(year, 1, 1)
-        days_in_year: int = 366 if calendar.isleap(year) else 365
-
-        all_days: Set[date] = set(start + timedelta(days=i) for i in range(days_in_year))
-        holidays = holidays or set()
-        week_days = set(filter(self.is_weekday, all_days))
-        green_days = sorted(list(week_days - holidays))
-        return green_days
+        return self.generate_green_days_between(date(year, 1, 1), date(year + 1, 1, 1), holidays)
 
     def generate_green_days_for_range(
         self, start_year: int, end_year: int, holidays: Set[date] = None
@@ -196,19 +267,9 @@ class GreenDayDateGenerator:
                 + f"argument 'start-year' ({start_year})."
             )
 
-        years = list(range(start_year, end_year + 1))
-        # Create a map with years for keys, and the set of holidays for each year as values.
-        holidays_by_year: DefaultDict[int, Set[date]] = defaultdict(
-            lambda: None, {d.year: set() for d in holidays}
+        return self.generate_green_days_between(
+            date(start_year, 1, 1), date(end_year + 1, 1, 1), holidays
         )
-        for d in holidays:
-            holidays_by_year[d.year].add(d)
-
-        green_days = list()
-        for year in years:
-            green_days.extend(self.generate_green_days_for(year, holidays_by_year[year]))
-
-        return green_days
 
 
 class Calendar(YamlObject):
@@ -245,7 +306,9 @@ class CalendarDefinition(YamlObject):
     def to_yaml_dict(self):
         return {
             **self.__dict__,
-            "payload": StringLiteral(yaml.dump(self.payload.to_yaml_dict(), sort_keys=False)),
+            "payload": StringLiteral(
+                yaml.dump(self.payload.to_yaml_dict(), sort_keys=False, Dumper=YamlDumper)
+            ),
         }
 
 
@@ -282,6 +345,17 @@ class CalendarManifest(YamlObject):
     def to_yaml_dict(self):
         return self.__dict__
 
+    def to_yaml_stream(self) -> Iterator[str]:
+        yield yaml.dump(
+            {"pack_version": self.pack_version, "pack_name": self.pack_name},
+            sort_keys=False,
+            Dumper=YamlDumper,
+        )
+        if self.resource_ids is None:
+            yield yaml.dump({"resource_ids": None}, sort_keys=False, Dumper=YamlDumper)
+        else:
+            yield from dump_yaml_sequence("resource_ids", self.resource_ids)
+
 
 class CalendarManifestBuilder(YamlObject):
     def __init__(
@@ -421,11 +495,14 @@ class ArgumentParser:
 
 class YamlFileWriter:
     def write_yaml_to_file(self, yaml_object: YamlObject, file_name: str) -> None:
-        yaml_str = yaml.dump(yaml_object.to_yaml_dict(), sort_keys=False)
+        """
+        Stream the YAML representation of the object to a new file, so that large objects are
+        written incrementally.
+        """
         if exists(file_name):
             raise NameError(f"File {file_name} already exists!  Aborting.")
-        with open(file_name, "w") as f:
-            f.write(yaml_str)
+        with open(file_name, "x") as f:
+            f.writelines(yaml_object.to_yaml_stream())
             print(f"Wrote file {file_name}.")
 
 
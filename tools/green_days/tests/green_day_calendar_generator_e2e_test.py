@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from datetime import date
 from tools.green_days.green_day_calendar_generator import (
@@ -9,6 +11,8 @@ from tools.green_days.green_day_calendar_generator import (
     CalendarResources,
     CalendarResourcesBuilder,
     GreenDayDateGenerator,
+    YamlFileWriter,
+    dump_yaml_sequence,
 )
 from typing import Set, List
 import yaml
@@ -123,6 +127,21 @@ class TestGreenDayCalendarGenerator(unittest.TestCase):
         self.assertEqual(expected_manifest_yaml, actual_manifest_yaml)
         self.assertEqual(expected_resource_yaml, actual_resource_yaml)
 
+        # Streamed files are identical to dumping the objects in one go
+        yaml_writer = YamlFileWriter()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for yaml_object, expected_yaml in [
+                (resources, expected_events_yaml),
+                (manifest, expected_manifest_yaml),
+                (resource, expected_resource_yaml),
+            ]:
+                file_name = os.path.join(temp_dir, f"{type(yaml_object).__name__}.yaml")
+                yaml_writer.write_yaml_to_file(yaml_object, file_name)
+                with open(file_name) as f:
+                    self.assertEqual(expected_yaml, f.read())
+                with self.assertRaises(NameError):
+                    yaml_writer.write_yaml_to_file(yaml_object, file_name)
+
     def test_cal_events_unmerged_yaml_generator(self):
         self._generic_test_cal_events_yaml_generator(
             merge_consecutive_events=False,
@@ -139,6 +158,21 @@ class TestGreenDayCalendarGenerator(unittest.TestCase):
             expected_resource_file=EXPECTED_GREEN_DAYS_MERGED_RESOURCE_FILE,
         )
 
+    def test_streamed_yaml_in_batches(self):
+        resources_builder = CalendarResourcesBuilder(
+            event_id_prefix="nsw_calendar_event",
+            calendar_id="nsw_calendar_green_days",
+            green_days=GreenDayDateGenerator().generate_green_days_for(2022, self.holidays),
+            zone=ZoneInfo("Australia/Sydney"),
+        )
+        resources: CalendarResources = resources_builder.build_calendar_resources()
+
+        chunks = list(dump_yaml_sequence("resources", resources.to_yaml_dict()["resources"], 7))
+
+        self.assertEqual(len(chunks), 1 + (len(resources.resources) + 6) // 7)
+        self.assertEqual("".join(chunks), yaml.dump(resources.to_yaml_dict(), sort_keys=False))
+        self.assertEqual("".join(CalendarResources([]).to_yaml_stream()), "resources: []\n")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from datetime import date
+from datetime import date, timedelta
 from tools.green_days.green_day_calendar_generator import (
     GreenDayDateGenerator,
 )
@@ -95,3 +95,42 @@ class TestGreenDayCalendarGenerator(unittest.TestCase):
         for day in green_days:
             self.assertNotIn(day, self.holidays)
             self.assertLess(day.weekday(), 5)
+
+    def test_generate_green_days_for_multi_year_range(self):
+        calendar_generator = GreenDayDateGenerator()
+        green_days = calendar_generator.generate_green_days_for_range(2020, 2023, self.holidays)
+        all_days = [date(2020, 1, 1) + timedelta(days=i) for i in range(366 + 365 * 3)]
+        expected_green_days = [
+            day for day in all_days if day.weekday() < 5 and day not in self.holidays
+        ]
+        self.assertListEqual(green_days, expected_green_days)
+
+    def test_generate_green_days_between_with_weekmask(self):
+        calendar_generator = GreenDayDateGenerator()
+        # Sunday to Thursday working week, starting on a Saturday
+        green_days = calendar_generator.generate_green_days_between(
+            date(2022, 1, 1), date(2022, 1, 15), {date(2022, 1, 3)}, weekmask="1111001"
+        )
+        self.assertListEqual(
+            green_days,
+            [
+                date(2022, 1, 2),
+                date(2022, 1, 4),
+                date(2022, 1, 5),
+                date(2022, 1, 6),
+                date(2022, 1, 9),
+                date(2022, 1, 10),
+                date(2022, 1, 11),
+                date(2022, 1, 12),
+                date(2022, 1, 13),
+            ],
+        )
+
+    def test_generate_green_days_between_invalid_weekmask(self):
+        calendar_generator = GreenDayDateGenerator()
+        with self.assertRaises(ValueError) as ex:
+            calendar_generator.generate_green_days_between(
+                date(2022, 1, 1), date(2023, 1, 1), weekmask="11111"
+            )
+
+        self.assertTrue("Argument 'weekmask' (11111)" in str(ex.exception))